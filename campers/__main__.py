@@ -3,37 +3,117 @@
 
 from __future__ import annotations
 
+import contextlib
+import importlib
 import logging
 import os
 import queue
 import sys
 import threading
 import types
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from campers.cli.main import main  # noqa: E402
-from campers.constants import DEFAULT_PROVIDER, UPDATE_QUEUE_MAX_SIZE
+from campers.constants import (
+    COST_REPORT_WEEKS,
+    DEFAULT_PROVIDER,
+    PROFILE_DIR_NAME,
+    UPDATE_QUEUE_MAX_SIZE,
+)
 from campers.core.cleanup import CleanupManager
 from campers.core.config import ConfigLoader  # noqa: E402
+from campers.core.costs import log_costs
+from campers.core.history import log_stats
 from campers.core.interfaces import ComputeProvider
-from campers.core.run_executor import RunExecutor
 from campers.core.signals import SignalManager
+from campers.core.tracing import format_profile_summary, start_tracing, stop_tracing
 from campers.lifecycle import LifecycleManager
-from campers.providers import get_provider  # noqa: E402
-from campers.services.portforward import PortForwardManager  # noqa: E402
-from campers.services.ssh import (  # noqa: E402
-    SSHConnectionInfo,
-    SSHManager,
-    get_ssh_connection_info,
-)
+from campers.providers import get_provider, install_api_hooks  # noqa: E402
 from campers.services.sync import MutagenManager  # noqa: E402
 from campers.session import SessionManager  # noqa: E402
 from campers.templates import CONFIG_TEMPLATE  # noqa: E402
-from campers.tui import CampersTUI  # noqa: E402
 from campers.utils import get_user_identity, truncate_name  # noqa: E402
 
+if TYPE_CHECKING:
+    from campers.core.run_executor import RunExecutor
+    from campers.services.portforward import PortForwardManager
+    from campers.services.ssh import SSHManager
+
+_LAZY_IMPORTS = {
+    "RunExecutor": "campers.core.run_executor",
+    "PortForwardManager": "campers.services.portforward",
+    "SSHConnectionInfo": "campers.services.ssh",
+    "SSHManager": "campers.services.ssh",
+    "get_ssh_connection_info": "campers.services.ssh",
+    "CampersTUI": "campers.tui",
+}
+"""Names imported on first use; they pull in paramiko or Textual.
+
+Commands such as `campers list`, `validate` and `--help` never touch them, so
+importing them eagerly would only slow down CLI startup.
+"""
+
+
+def _lazy(name: str) -> Any:
+    """Return a name from _LAZY_IMPORTS, importing its module on first use.
+
+    The value is cached in the module namespace, so replacing the module
+    attribute (for example with unittest.mock.patch.object) takes effect.
+
+    Parameters
+    ----------
+    name : str
+        Key of _LAZY_IMPORTS
+
+    Returns
+    -------
+    Any
+        The imported class or function
+    """
+    namespace = globals()
+
+    if name not in namespace:
+        namespace[name] = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+
+    return namespace[name]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the names in _LAZY_IMPORTS on first module attribute access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return _lazy(name)
+
+
+def _create_ssh_manager(**kwargs: Any) -> SSHManager:
+    """Create an SSHManager, importing paramiko only once a command connects.
+
+    Parameters
+    ----------
+    **kwargs : Any
+        SSHManager constructor arguments
+
+    Returns
+    -------
+    SSHManager
+        New SSH manager
+    """
+    return _lazy("SSHManager")(**kwargs)
+
+
+def _create_portforward_manager() -> PortForwardManager:
+    """Create a PortForwardManager, importing paramiko only when ports are forwarded.
+
+    Returns
+    -------
+    PortForwardManager
+        New port forward manager
+    """
+    return _lazy("PortForwardManager")()
+
 
 class Campers:
     """Main CLI interface for campers."""
@@ -54,7 +134,7 @@ class Campers:
 
         self._compute_provider_factory_override = compute_provider_factory
 
-        self._ssh_manager_factory = ssh_manager_factory or SSHManager
+        self._ssh_manager_factory = ssh_manager_factory or _create_ssh_manager
 
         self._cleanup_manager = CleanupManager(
             resources_dict=self._resources,
@@ -65,7 +145,7 @@ class Campers:
         )
 
         self._mutagen_manager_factory = MutagenManager
-        self._portforward_manager_factory = PortForwardManager
+        self._portforward_manager_factory = _create_portforward_manager
 
         self._lifecycle_manager: LifecycleManager | None = None
 
@@ -114,7 +194,7 @@ class Campers:
     def _run_executor_prop(self) -> RunExecutor:
         """Get the run executor instance."""
         if self._run_executor is None:
-            self._run_executor = RunExecutor(
+            self._run_executor = _lazy("RunExecutor")(
                 config_loader=self._config_loader,
                 compute_provider_factory=self._compute_provider_factory,
                 ssh_manager_factory=self._ssh_manager_factory,
@@ -150,7 +230,7 @@ class Campers:
     def _merged_config_prop(self, value: dict[str, Any] | None) -> None:
         """Set the merged configuration on the run executor."""
         if self._run_executor is None:
-            self._run_executor = RunExecutor(
+            self._run_executor = _lazy("RunExecutor")(
                 config_loader=self._config_loader,
                 compute_provider_factory=self._compute_provider_factory,
                 ssh_manager_factory=self._ssh_manager_factory,
@@ -200,58 +280,113 @@ class Campers:
         json_output: bool = False,
         plain: bool = False,
         verbose: bool = False,
+        reprovision: bool = False,
+        rerun_setup: bool = False,
+        profile: bool | str = False,
     ) -> dict[str, Any] | str:
         """Launch cloud instance with file sync and command execution."""
-        is_tty = sys.stdout.isatty()
-        use_tui = is_tty and not (plain or json_output)
-
-        if use_tui:
-            run_kwargs = {
-                "camp_name": camp_name,
-                "command": command,
-                "instance_type": instance_type,
-                "disk_size": disk_size,
-                "region": region,
-                "port": port,
-                "include_vcs": include_vcs,
-                "ignore": ignore,
-                "json_output": json_output,
-            }
-            update_queue: queue.Queue = queue.Queue(maxsize=UPDATE_QUEUE_MAX_SIZE)
-            app = CampersTUI(
-                campers_instance=self, run_kwargs=run_kwargs, update_queue=update_queue
+        with self._profiling(profile, camp_name):
+            is_tty = sys.stdout.isatty()
+            use_tui = is_tty and not (plain or json_output)
+
+            if use_tui:
+                run_kwargs = {
+                    "camp_name": camp_name,
+                    "command": command,
+                    "instance_type": instance_type,
+                    "disk_size": disk_size,
+                    "region": region,
+                    "port": port,
+                    "include_vcs": include_vcs,
+                    "ignore": ignore,
+                    "json_output": json_output,
+                    "reprovision": reprovision,
+                    "rerun_setup": rerun_setup,
+                }
+                update_queue: queue.Queue = queue.Queue(maxsize=UPDATE_QUEUE_MAX_SIZE)
+                app = _lazy("CampersTUI")(
+                    campers_instance=self, run_kwargs=run_kwargs, update_queue=update_queue
+                )
+
+                exit_code = app.run()
+
+                has_instance = bool(self._resources.get("instance_details", {}).get("instance_id"))
+
+                if exit_code == 130 and self._abort_requested and has_instance:
+                    sys.stderr.write("Stopping instance, please wait...\n")
+                    sys.stderr.flush()
+
+                if app.fatal_error_message:
+                    sys.stderr.write(f"\nError: {app.fatal_error_message}\n")
+                    sys.stderr.flush()
+
+                return {
+                    "exit_code": exit_code if exit_code is not None else 0,
+                    "tui_mode": True,
+                    "message": "TUI session completed",
+                }
+
+            return self._execute_run(
+                camp_name=camp_name,
+                command=command,
+                instance_type=instance_type,
+                disk_size=disk_size,
+                region=region,
+                port=port,
+                include_vcs=include_vcs,
+                ignore=ignore,
+                json_output=json_output,
+                verbose=verbose,
+                reprovision=reprovision,
+                rerun_setup=rerun_setup,
             )
 
-            exit_code = app.run()
+    @contextlib.contextmanager
+    def _profiling(self, profile: bool | str, camp_name: str | None) -> Iterator[None]:
+        """Trace the enclosed run and report where its time went.
 
-            has_instance = bool(self._resources.get("instance_details", {}).get("instance_id"))
+        Parameters
+        ----------
+        profile : bool | str
+            False to disable tracing, True to write the trace under
+            CAMPERS_DIR/profiles, or a path to write it to
+        camp_name : str | None
+            Camp name used in the default trace file name
 
-            if exit_code == 130 and self._abort_requested and has_instance:
-                sys.stderr.write("Stopping instance, please wait...\n")
-                sys.stderr.flush()
+        Yields
+        ------
+        None
+            Control back to the run
+        """
+        if not profile:
+            yield
+            return
 
-            if app.fatal_error_message:
-                sys.stderr.write(f"\nError: {app.fatal_error_message}\n")
-                sys.stderr.flush()
+        tracer = start_tracing()
+        install_api_hooks()
 
-            return {
-                "exit_code": exit_code if exit_code is not None else 0,
-                "tui_mode": True,
-                "message": "TUI session completed",
-            }
+        try:
+            yield
+        finally:
+            stop_tracing()
 
-        return self._execute_run(
-            camp_name=camp_name,
-            command=command,
-            instance_type=instance_type,
-            disk_size=disk_size,
-            region=region,
-            port=port,
-            include_vcs=include_vcs,
-            ignore=ignore,
-            json_output=json_output,
-            verbose=verbose,
-        )
+            if isinstance(profile, str):
+                trace_path = Path(profile).expanduser()
+            else:
+                campers_dir = Path(os.environ.get("CAMPERS_DIR", str(Path.home() / ".campers")))
+                timestamp = tracer.started_at.strftime("%Y%m%d-%H%M%S")
+                trace_path = (
+                    campers_dir / PROFILE_DIR_NAME / f"{camp_name or 'run'}-{timestamp}.json"
+                )
+
+            try:
+                tracer.write(trace_path)
+                location = f"Trace written to {trace_path}"
+            except OSError as e:
+                location = f"Failed to write trace to {trace_path}: {e}"
+
+            sys.stderr.write(f"\n{format_profile_summary(tracer)}\n\n{location}\n")
+            sys.stderr.flush()
 
     def _execute_run(
         self,
@@ -267,6 +402,8 @@ class Campers:
         tui_mode: bool = False,
         update_queue: queue.Queue | None = None,
         verbose: bool = False,
+        reprovision: bool = False,
+        rerun_setup: bool = False,
     ) -> dict[str, Any] | str:
         return self._run_executor_prop.execute(
             camp_name=camp_name,
@@ -282,6 +419,8 @@ class Campers:
             update_queue=update_queue,
             verbose=verbose,
             cleanup_resources_callback=self._cleanup_resources,
+            reprovision=reprovision,
+            rerun_setup=rerun_setup,
         )
 
     def _get_or_create_instance(self, instance_name: str, config: dict[str, Any]) -> dict[str, Any]:
@@ -449,6 +588,89 @@ class Campers:
         """List all managed instances."""
         return self._lifecycle_manager_prop.list(region=region, show_all=show_all)
 
+    def stats(self, camp_name: str | None = None) -> None:
+        """Show run timing percentiles and regressions from the local run history."""
+        return log_stats(camp_name)
+
+    def costs(
+        self,
+        camp_name: str | None = None,
+        user: str | None = None,
+        weeks: int = COST_REPORT_WEEKS,
+    ) -> None:
+        """Show accrued instance costs per week, camp and user from the local ledger.
+
+        Parameters
+        ----------
+        camp_name : str | None
+            Only report this camp
+        user : str | None
+            Only report instances owned by this user
+        weeks : int
+            Number of most recent weeks to report
+        """
+        pricing_service = get_provider(DEFAULT_PROVIDER)["pricing_service"]()
+
+        def list_instances(region: str) -> list[dict[str, Any]]:
+            return self._compute_provider_factory(region).list_instances(region_filter=region)
+
+        try:
+            log_costs(
+                pricing_service,
+                camp_name=camp_name,
+                user=user,
+                weeks=weeks,
+                list_instances=list_instances,
+            )
+        finally:
+            pricing_service.close()
+
+    def pricing(
+        self,
+        action: str,
+        path: str | None = None,
+        region: str | None = None,
+        force: bool = False,
+    ) -> None:
+        """Manage the local price store and offline price snapshots.
+
+        Parameters
+        ----------
+        action : str
+            'prefetch' downloads the price index of the regions in use,
+            'export' writes the stored prices to a snapshot file at path and
+            'import' installs the snapshot file at path for offline use
+        path : str | None
+            Snapshot file for export and import
+        region : str | None
+            Only prefetch this region
+        force : bool
+            Prefetch even if stored prices are still fresh
+        """
+        lifecycle_manager = self._lifecycle_manager_prop
+
+        if action == "prefetch":
+            return lifecycle_manager.prefetch_pricing(region=region, force=force)
+
+        if action in ("export", "import") and path is None:
+            logging.error(
+                f"Usage: campers pricing {action} PATH",
+                extra={"stream": "stderr"},
+            )
+            sys.exit(1)
+
+        if action == "export":
+            return lifecycle_manager.export_pricing(path)
+
+        if action == "import":
+            return lifecycle_manager.import_pricing(path)
+
+        logging.error(
+            f"Unknown pricing action '{action}'. Available actions: prefetch, export, import",
+            extra={"stream": "stderr"},
+        )
+        sys.exit(1)
+
     def stop(self, name_or_id: str, region: str | None = None) -> None:
         """Stop a managed instance."""
         return self._lifecycle_manager_prop.stop(name_or_id=name_or_id, region=region)
@@ -541,7 +763,7 @@ class Campers:
         session = session_manager.get_alive_session(camp_or_instance)
 
         if session:
-            ssh_info = SSHConnectionInfo(
+            ssh_info = _lazy("SSHConnectionInfo")(
                 host=session.ssh_host,
                 port=session.ssh_port,
                 key_file=session.key_file,
@@ -549,7 +771,7 @@ class Campers:
             )
         else:
             instance = self._discover_running_instance(camp_or_instance, region, default_region)
-            ssh_info = get_ssh_connection_info(
+            ssh_info = _lazy("get_ssh_connection_info")(
                 instance["instance_id"],
                 instance["public_ip"],
                 instance["key_file"],
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from campers.cli.parsing import (
     apply_cli_overrides,
+    normalize_auto_forward_config,
     normalize_ports_config,
     parse_ignore_patterns,
     parse_include_vcs,
@@ -12,6 +13,7 @@ from campers.cli.parsing import (
 
 __all__ = [
     "apply_cli_overrides",
+    "normalize_auto_forward_config",
     "normalize_ports_config",
     "parse_port_parameter",
     "parse_include_vcs",
@@ -7,16 +7,19 @@ import os
 import re
 import sys
 from collections.abc import Callable
-from typing import Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import fire
-import paramiko
 
+from campers.core.api_stats import format_api_stats, start_api_accounting, stop_api_accounting
 from campers.core.interfaces import ComputeProvider
 from campers.logging import StreamFormatter, StreamRoutingFilter
-from campers.providers import ProviderAPIError, ProviderCredentialsError
+from campers.providers import ProviderAPIError, ProviderCredentialsError, install_api_hooks
 from campers.providers.aws.utils import get_aws_credentials_error_message
-from campers.services.ssh import SSHManager
+
+if TYPE_CHECKING:
+    from campers.services.ssh import SSHManager
 
 
 def get_campers_base_class() -> type:
@@ -94,6 +97,15 @@ class CampersCLI:
                         ssh_manager_factory=ssh_manager_factory,
                     )
 
+                def __dir__(self) -> list[str]:
+                    """List public members only.
+
+                    Fire inspects every listed member when rendering help, and
+                    evaluating the private executor and setup manager
+                    properties would import paramiko and boto3.
+                    """
+                    return [name for name in super().__dir__() if not name.startswith("_")]
+
                 def run(
                     self,
                     camp_name: str | None = None,
@@ -107,6 +119,9 @@ class CampersCLI:
                     json_output: bool = False,
                     plain: bool = False,
                     verbose: bool = False,
+                    reprovision: bool = False,
+                    rerun_setup: bool = False,
+                    profile: bool | str = False,
                 ) -> dict[str, Any] | str:
                     """Run Campers and handle TUI exit codes for CLI context.
 
@@ -132,6 +147,15 @@ class CampersCLI:
                         Output result as JSON
                     plain : bool
                         Disable TUI, use plain stderr logging
+                    verbose : bool
+                        Enable verbose logging
+                    reprovision : bool
+                        Run Ansible playbooks even if unchanged since their last run
+                    rerun_setup : bool
+                        Run setup_script even if unchanged since its last run
+                    profile : bool | str
+                        Record a Chrome trace of the run and print a timing summary;
+                        a string sets the trace file path
 
                     Returns
                     -------
@@ -154,6 +178,9 @@ class CampersCLI:
                             json_output=json_output,
                             plain=plain,
                             verbose=verbose,
+                            reprovision=reprovision,
+                            rerun_setup=rerun_setup,
+                            profile=profile,
                         )
 
                         if isinstance(result, dict) and result.get("tui_mode"):
@@ -335,6 +362,26 @@ def handle_api_error(error: ProviderAPIError, debug_mode: bool) -> None:
     sys.exit(1)
 
 
+def ssh_error_types() -> tuple[type[Exception], ...]:
+    """Return the exception types reported as SSH connectivity errors.
+
+    paramiko is only imported by commands that open SSH connections, and
+    its exceptions can only be raised once it is loaded, so it is looked up
+    in sys.modules instead of being imported at startup.
+
+    Returns
+    -------
+    tuple[type[Exception], ...]
+        OSError, plus paramiko's SSH errors if paramiko has been imported
+    """
+    paramiko = sys.modules.get("paramiko")
+
+    if paramiko is None:
+        return (OSError,)
+
+    return (OSError, paramiko.SSHException, paramiko.AuthenticationException)
+
+
 def handle_ssh_error(debug_mode: bool) -> None:
     """Handle SSH connectivity error.
 
@@ -391,6 +438,61 @@ def handle_runtime_error(error: RuntimeError, debug_mode: bool) -> None:
     sys.exit(1)
 
 
+def pop_api_stats_flag(argv: list[str]) -> bool | str:
+    """Remove the global --api-stats flag from argv.
+
+    Parameters
+    ----------
+    argv : list[str]
+        Command line, modified in place
+
+    Returns
+    -------
+    bool | str
+        False if the flag is absent, True for a bare --api-stats, or the path
+        given as --api-stats=PATH
+    """
+    for index, argument in enumerate(argv[1:], start=1):
+        if argument == "--api-stats":
+            del argv[index]
+            return True
+
+        if argument.startswith("--api-stats="):
+            del argv[index]
+            return argument.split("=", 1)[1] or True
+
+    return False
+
+
+def report_api_stats(api_stats: bool | str, command: str) -> None:
+    """Print the API call summary and optionally append it to a JSONL file.
+
+    Parameters
+    ----------
+    api_stats : bool | str
+        Value returned by pop_api_stats_flag
+    command : str
+        CLI command the calls were made by
+    """
+    recorder = stop_api_accounting()
+
+    if recorder is None:
+        return
+
+    sys.stderr.write(f"\n{format_api_stats(recorder)}\n")
+
+    if isinstance(api_stats, str):
+        path = Path(api_stats).expanduser()
+
+        try:
+            recorder.append_to(path, command)
+            sys.stderr.write(f"API call stats appended to {path}\n")
+        except OSError as e:
+            sys.stderr.write(f"Failed to write API call stats to {path}: {e}\n")
+
+    sys.stderr.flush()
+
+
 def main() -> None:
     """Entry point for Fire CLI with graceful error handling.
 
@@ -417,6 +519,11 @@ def main() -> None:
     )
 
     debug_mode = os.environ.get("CAMPERS_DEBUG") == "1"
+    api_stats = pop_api_stats_flag(sys.argv)
+
+    if api_stats:
+        start_api_accounting()
+        install_api_hooks()
 
     try:
         fire.Fire(CampersCLI())
@@ -426,7 +533,10 @@ def main() -> None:
         handle_value_error(e, debug_mode)
     except ProviderAPIError as e:
         handle_api_error(e, debug_mode)
-    except (OSError, paramiko.SSHException, paramiko.AuthenticationException):
+    except ssh_error_types():
         handle_ssh_error(debug_mode)
     except RuntimeError as e:
         handle_runtime_error(e, debug_mode)
+    finally:
+        if api_stats:
+            report_api_stats(api_stats, sys.argv[1] if len(sys.argv) > 1 else "")
@@ -168,6 +168,101 @@ def normalize_ports_config(
     return result
 
 
+def parse_port_range_spec(spec: int | str) -> tuple[int, int]:
+    """Parse a port or port range specification into inclusive bounds.
+
+    Parameters
+    ----------
+    spec : int | str
+        Single port (e.g., 8888) or range string (e.g., "8000-8999")
+
+    Returns
+    -------
+    tuple[int, int]
+        Tuple of (low, high) port bounds
+
+    Raises
+    ------
+    ValueError
+        If the specification is not numeric, reversed, or outside 1-65535
+    """
+    if isinstance(spec, bool) or not isinstance(spec, (int, str)):
+        raise ValueError(f"Invalid port range: {spec!r}. Expected a port or 'low-high'")
+
+    if isinstance(spec, int):
+        low = high = spec
+    else:
+        parts = spec.strip().split("-")
+
+        if len(parts) > 2:
+            raise ValueError(f"Invalid port range: '{spec}'. Expected format 'low-high'")
+
+        try:
+            low, high = int(parts[0]), int(parts[-1])
+        except ValueError:
+            raise ValueError(f"Invalid port range: '{spec}'. Ports must be numeric") from None
+
+    validate_port_range(low)
+    validate_port_range(high)
+
+    if low > high:
+        raise ValueError(f"Invalid port range: '{spec}'. Lower bound exceeds upper bound")
+
+    return (low, high)
+
+
+def normalize_auto_forward_config(value: Any) -> dict[str, Any] | None:
+    """Normalize auto_forward configuration into allow and deny range lists.
+
+    Parameters
+    ----------
+    value : Any
+        Raw auto_forward value - can be:
+        - Boolean: enable (True) or disable (False) discovery
+        - Dictionary with optional 'allow' and 'deny' lists of ports or ranges
+
+    Returns
+    -------
+    dict[str, Any] | None
+        None when disabled, otherwise a dictionary with 'allow' (list of
+        (low, high) tuples, or None to allow every unprivileged port) and
+        'deny' (list of (low, high) tuples)
+
+    Raises
+    ------
+    ValueError
+        If the value has an unexpected type, unknown keys, or invalid ranges
+    """
+    if value is None or value is False:
+        return None
+
+    if value is True:
+        value = {}
+
+    if not isinstance(value, dict):
+        raise ValueError("auto_forward must be a boolean or a dictionary with 'allow'/'deny'")
+
+    unknown = set(value) - {"allow", "deny"}
+
+    if unknown:
+        raise ValueError(f"Unknown auto_forward keys: {', '.join(sorted(unknown))}")
+
+    rules: dict[str, Any] = {"allow": None, "deny": []}
+
+    for key in ("allow", "deny"):
+        specs = value.get(key)
+
+        if specs is None:
+            continue
+
+        if not isinstance(specs, list):
+            raise ValueError(f"auto_forward {key} must be a list of ports or port ranges")
+
+        rules[key] = [parse_port_range_spec(spec) for spec in specs]
+
+    return rules
+
+
 def parse_include_vcs(include_vcs: str | bool) -> bool:
     """Parse include_vcs parameter into boolean.
 
@@ -275,6 +370,8 @@ __all__ = [
     "validate_port_range",
     "parse_port_parameter",
     "normalize_ports_config",
+    "parse_port_range_spec",
+    "normalize_auto_forward_config",
     "parse_include_vcs",
     "parse_ignore_patterns",
     "apply_cli_overrides",
@@ -39,6 +39,68 @@ Two minutes allows time for Mutagen to establish connections and
 perform initial configuration without timing out on slower networks.
 """
 
+PULL_SCAN_INTERVAL_SECONDS = 30
+"""Default interval in seconds between remote scans of a pull_paths session.
+
+Output directories are polled at low frequency instead of being watched, which
+keeps large checkpoint and log trees from competing with the code sync.
+"""
+
+SYNC_FLUSH_TIMEOUT_SECONDS = 60
+"""Upper bound in seconds for a Mutagen flush barrier across all sessions.
+
+A flush normally completes in well under a second; the bound keeps a stalled
+session from blocking script or command execution indefinitely.
+"""
+
+DATASET_CONCURRENCY = 8
+"""Default number of parallel object and part downloads when staging datasets."""
+
+DATASET_PART_SIZE_BYTES = 64 * 1024 * 1024
+"""Default size in bytes of each ranged request when staging large objects.
+
+Objects larger than one part are fetched as concurrent ranged requests, which
+is how S3 reaches full bandwidth for multi-gigabyte files.
+"""
+
+DEFAULT_CACHE_VOLUME_MOUNT = "/mnt/cache"
+"""Default mount point of the cache volume on the instance."""
+
+CACHE_VOLUME_MOUNT_TIMEOUT_SECONDS = 300
+"""Time in seconds the mount script waits for the cache volume to appear.
+
+The volume is attached only after the instance reaches the running state,
+while the mount script starts during boot.
+"""
+
+MUTAGEN_CONTROL_TIMEOUT_SECONDS = 30
+"""Timeout in seconds for Mutagen pause and resume operations.
+
+Resuming reconnects both endpoints, which can take longer than a status check
+while a freshly started instance finishes booting its SSH daemon.
+"""
+
+MUTAGEN_HOST_LABEL = "campers-host"
+"""Mutagen session label key holding the SSH host alias of the instance.
+
+Lets every session belonging to one instance be paused, resumed, or
+terminated together with a single label selector.
+"""
+
+MUTAGEN_ENDPOINTS_LABEL = "campers-endpoints"
+"""Mutagen session label key holding a fingerprint of the session endpoints.
+
+A paused session is only resumed when the fingerprint of the current
+configuration matches, so changed paths or options recreate the session.
+"""
+
+SSH_HOST_ALIAS_PREFIX = "campers"
+"""Prefix of the stable SSH host alias written to the campers SSH config.
+
+Instances are addressed as ``campers-<unique_id>`` so that a restart with a
+new public IP only rewrites the alias ``HostName`` instead of the session URL.
+"""
+
 ANSIBLE_PLAYBOOK_TIMEOUT_SECONDS = 3600
 """Timeout in seconds for Ansible playbook execution.
 
@@ -46,6 +108,54 @@ One hour allows sufficient time for complex provisioning playbooks
 involving software installation, compilation, and configuration.
 """
 
+ANSIBLE_STRATEGIES = ("linear", "free")
+"""Ansible strategies accepted in the ansible camp section.
+
+linear runs each task on every host before moving on; free lets each host run
+through the play as fast as it can.
+"""
+
+ANSIBLE_DEFAULT_SETTINGS = {
+    "strategy": "linear",
+    "forks": 5,
+    "pipelining": True,
+    "fact_caching": True,
+    "control_persist": 60,
+}
+"""Default values of the ansible camp section.
+
+Pipelining runs modules over the SSH session's stdin instead of copying them
+first, fact caching avoids gathering facts on every run, and control_persist
+keeps an SSH master connection open for this many seconds so consecutive tasks
+and playbooks skip the SSH handshake. A control_persist of 0 disables it.
+"""
+
+ANSIBLE_FACT_CACHE_TIMEOUT_SECONDS = 86400
+"""Lifetime in seconds of cached Ansible facts for an instance."""
+
+SETUP_SCRIPT_MARKER_FILE = "~/.campers/setup_script.json"
+"""Remote file recording the hash and duration of the last successful setup_script.
+
+Like ANSIBLE_MARKER_FILE it lives on the instance's root volume, so a restarted
+instance skips the setup script while a new instance runs it.
+"""
+
+ANSIBLE_EVENT_PREFIX = "CAMPERS_EVENT "
+"""Prefix of the JSON event lines printed by the campers_events callback plugin.
+
+Lines without it, such as Ansible warnings and errors, are logged verbatim.
+"""
+
+ANSIBLE_SLOWEST_TASKS_COUNT = 5
+"""Number of tasks listed in the slowest tasks summary after provisioning."""
+
+ANSIBLE_MARKER_FILE = "~/.campers/playbooks.json"
+"""Remote file recording the content hash of each successfully applied playbook.
+
+It lives on the instance's root volume, so it survives stop/start cycles and
+disappears together with the instance.
+"""
+
 UPTIME_UPDATE_INTERVAL_SECONDS = 1.0
 """Interval in seconds for uptime update polling in TUI.
 
@@ -60,6 +170,68 @@ Ports below this value (0-1023) require elevated privileges on Unix systems.
 Used by port forwarding to detect when privilege elevation might be needed.
 """
 
+PORTFORWARD_CONNECT_RETRIES = 3
+"""Number of attempts to open the SSH transport shared by forwarded ports.
+
+The instance already accepted an SSH connection earlier in the run, so a
+short retry budget is enough to ride out a transient failure.
+"""
+
+PORTFORWARD_BUFFER_SIZE = 64 * 1024
+"""Maximum number of bytes read from a forwarded socket or channel at once."""
+
+PORTFORWARD_MAX_BUFFERED_BYTES = 1024 * 1024
+"""Bytes buffered per direction before the forwarder stops reading a peer.
+
+Bounds memory when one side of a forwarded connection is slower than the
+other, pushing back on the fast side instead of queueing without limit.
+"""
+
+PORTFORWARD_SEND_POLL_SECONDS = 0.01
+"""Event loop timeout in seconds while data waits for SSH window space.
+
+Channel send windows are not selectable, so the loop wakes up at this
+interval while a connection has bytes queued for the remote side.
+"""
+
+PORTFORWARD_IDLE_POLL_SECONDS = 0.5
+"""Event loop timeout in seconds when no forwarded data is pending."""
+
+PORTFORWARD_CHANNEL_OPEN_TIMEOUT_SECONDS = 10
+"""Timeout in seconds for opening a forwarded channel on the SSH transport."""
+
+PORTFORWARD_CHANNEL_OPEN_WORKERS = 4
+"""Threads opening forwarded channels so a slow open never stalls the event loop."""
+
+PORTFORWARD_STATS_INTERVAL_SECONDS = 2.0
+"""Interval in seconds between port forwarding statistics updates to the TUI."""
+
+PORTFORWARD_HEALTH_PROBE_INTERVAL_SECONDS = 10.0
+"""Interval in seconds between active health probes of forwarded remote ports.
+
+Each probe opens and immediately closes a channel to the remote port, which
+shows whether a service is listening behind the tunnel.
+"""
+
+PORTFORWARD_KEEPALIVE_INTERVAL_SECONDS = 15
+"""Interval in seconds between SSH keepalive messages on the forwarding transport.
+
+Keepalives stop NAT gateways and firewalls from dropping an idle connection.
+"""
+
+PORTFORWARD_LIVENESS_TIMEOUT_SECONDS = 5
+"""Timeout in seconds for the server to answer a forwarding transport liveness check."""
+
+AUTO_FORWARD_POLL_INTERVAL_SECONDS = 5.0
+"""Interval in seconds between scans for new remote listening ports.
+
+The scan reads /proc/net/tcp over the existing SSH connection, so it needs no
+extra tooling on the instance.
+"""
+
+AUTO_FORWARD_COMMAND_TIMEOUT_SECONDS = 10
+"""Timeout in seconds for reading the remote socket tables during a scan."""
+
 SYNC_STATUS_POLL_INTERVAL_SECONDS = 2
 """Interval in seconds for polling sync status.
 
@@ -193,6 +365,74 @@ Used by run executor to wait for cleanup manager to begin shutdown
 when SSH connection is skipped.
 """
 
+PHASE_POLL_INTERVAL_SECONDS = 0.1
+"""Interval in seconds at which the phase scheduler checks for cancellation.
+
+While phases run in worker threads, the scheduler wakes up this often to see
+whether cleanup has started, so no new phase is launched after a Ctrl+C.
+"""
+
+PHASE_STOP_TIMEOUT_SECONDS = 30
+"""Time in seconds the phase scheduler waits for running phases to stop.
+
+When a phase fails or the run is cancelled, the scheduler asks the phases
+still running in worker threads to stop and waits this long for them, so
+cleanup does not tear down the instance underneath them.
+"""
+
+PROFILE_DIR_NAME = "profiles"
+"""Subdirectory of CAMPERS_DIR where `campers run --profile` writes traces.
+
+Each profiled run writes one Chrome trace JSON file named after the camp and
+the start time, which can be opened in Perfetto or chrome://tracing.
+"""
+
+PROFILE_SUMMARY_TOP_SPANS = 10
+"""Number of slowest non-phase spans listed in the profile summary table."""
+
+RUN_HISTORY_FILE = "history/runs.jsonl"
+"""Path under CAMPERS_DIR of the run history read by `campers stats`.
+
+Every `campers run` that got as far as an instance appends one JSON line with
+its camp, instance type, region, AMI and milestone timings.
+"""
+
+RUN_MILESTONES = (
+    "launch",
+    "running",
+    "ssh_ready",
+    "sync_watching",
+    "ansible_done",
+    "command_start",
+)
+"""Run milestones recorded in the history, in the order they are reached.
+
+Each is stored as seconds since the run started; milestones a run never
+reaches (no sync paths, no playbooks, no command) are omitted.
+"""
+
+STATS_REGRESSION_FACTOR = 1.5
+"""Slowdown ratio at which `campers stats` reports a milestone as regressed."""
+
+STATS_MIN_SAMPLES = 3
+"""Runs needed on each side of a comparison before `campers stats` reports it."""
+
+STATS_RECENT_RUNS = 5
+"""Number of latest runs compared with older ones for the recent trend."""
+
+COST_LEDGER_FILE = "history/costs.jsonl"
+"""Path under CAMPERS_DIR of the cost ledger read by `campers costs`.
+
+Every launch, restart, stop and termination done by campers appends one JSON
+line with the instance, its new state and when it changed.
+"""
+
+COST_HOURS_PER_MONTH = 24 * 30
+"""Hours over which a monthly storage price accrues, as in monthly estimates."""
+
+COST_REPORT_WEEKS = 4
+"""Number of most recent weeks shown by `campers costs` by default."""
+
 DEFAULT_PROVIDER = "aws"
 """Default cloud provider for resource provisioning.
 
@@ -283,6 +523,23 @@ DEFAULT_DISK_SIZE = 50
 Provides sufficient space for typical development/testing codebases and dependencies.
 """
 
+MARKETS = ("on-demand", "spot", "spot-with-fallback")
+"""Purchase options accepted by the market camp option.
+
+spot-with-fallback requests spot capacity and launches on-demand when no
+spot capacity is available.
+"""
+
+DEFAULT_MARKET = "on-demand"
+"""Purchase option used when a camp does not set market."""
+
+SPOT_INTERRUPTION_POLL_SECONDS = 5
+"""Interval in seconds at which a spot instance checks for an interruption notice.
+
+AWS gives two minutes of notice, so polling every few seconds leaves nearly
+all of it for flushing file sync before the instance is reclaimed.
+"""
+
 STATUS_IN_PROGRESS = "in_progress"
 """Status value indicating cleanup operation is in progress."""
 
@@ -0,0 +1,232 @@
+"""Accounting of cloud API calls made by a CLI command."""
+
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+
+@dataclass
+class ApiCall:
+    """A single completed cloud API call.
+
+    Attributes
+    ----------
+    service : str
+        Service name, e.g. 'ec2' or 'pricing'
+    operation : str
+        Operation name, e.g. 'DescribeInstances'
+    region : str
+        Region the client was created for
+    seconds : float
+        Wall time including retries
+    retries : int
+        Retry attempts made after the first request
+    throttles : int
+        Attempts rejected with a throttling error
+    error : str
+        Error code of the final response, empty on success
+    """
+
+    service: str
+    operation: str
+    region: str
+    seconds: float
+    retries: int = 0
+    throttles: int = 0
+    error: str = ""
+
+
+@dataclass
+class ApiCallStats:
+    """Aggregated calls of one operation in one region.
+
+    Attributes
+    ----------
+    service : str
+        Service name
+    operation : str
+        Operation name
+    region : str
+        Region
+    calls : int
+        Number of calls
+    seconds : float
+        Total wall time of the calls
+    max_seconds : float
+        Slowest call
+    retries : int
+        Total retry attempts
+    throttles : int
+        Total throttled attempts
+    errors : int
+        Calls whose final response was an error
+    """
+
+    service: str
+    operation: str
+    region: str
+    calls: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+    retries: int = 0
+    throttles: int = 0
+    errors: int = 0
+
+
+class ApiCallRecorder:
+    """Thread-safe collector of API calls.
+
+    Attributes
+    ----------
+    started_at : datetime
+        Wall-clock time the recorder was created
+    calls : list[ApiCall]
+        Calls in completion order
+    """
+
+    def __init__(self) -> None:
+        self.started_at = datetime.now()
+        self.calls: list[ApiCall] = []
+        self._lock = threading.Lock()
+
+    def record(self, call: ApiCall) -> None:
+        """Add a completed call.
+
+        Parameters
+        ----------
+        call : ApiCall
+            The call to record
+        """
+        with self._lock:
+            self.calls.append(call)
+
+    def summary(self) -> list[ApiCallStats]:
+        """Aggregate calls per service, operation and region.
+
+        Returns
+        -------
+        list[ApiCallStats]
+            One entry per operation and region, slowest total first
+        """
+        stats: dict[tuple[str, str, str], ApiCallStats] = {}
+
+        with self._lock:
+            calls = list(self.calls)
+
+        for call in calls:
+            key = (call.service, call.operation, call.region)
+            entry = stats.setdefault(key, ApiCallStats(*key))
+            entry.calls += 1
+            entry.seconds += call.seconds
+            entry.max_seconds = max(entry.max_seconds, call.seconds)
+            entry.retries += call.retries
+            entry.throttles += call.throttles
+            entry.errors += bool(call.error)
+
+        return sorted(stats.values(), key=lambda entry: entry.seconds, reverse=True)
+
+    def to_record(self, command: str) -> dict[str, Any]:
+        """Return the summary as a JSON-serialisable history record.
+
+        Parameters
+        ----------
+        command : str
+            CLI command the calls were made by
+
+        Returns
+        -------
+        dict[str, Any]
+            Record with the command, start time and per-operation stats
+        """
+        return {
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "command": command,
+            "operations": [
+                {**asdict(entry), "seconds": round(entry.seconds, 3)} for entry in self.summary()
+            ],
+        }
+
+    def append_to(self, path: Path, command: str) -> None:
+        """Append the summary as one JSON line to path.
+
+        Parameters
+        ----------
+        path : Path
+            JSONL file, created with its parent directories if missing
+        command : str
+            CLI command the calls were made by
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with path.open("a") as f:
+            f.write(json.dumps(self.to_record(command)) + "\n")
+
+
+def format_api_stats(recorder: ApiCallRecorder) -> str:
+    """Format the recorded calls as a terminal table.
+
+    Parameters
+    ----------
+    recorder : ApiCallRecorder
+        Recorder holding the calls of a command
+
+    Returns
+    -------
+    str
+        Totals line followed by one row per operation and region
+    """
+    stats = recorder.summary()
+
+    if not stats:
+        return "API calls: none"
+
+    total_calls = sum(entry.calls for entry in stats)
+    total_seconds = sum(entry.seconds for entry in stats)
+    total_retries = sum(entry.retries for entry in stats)
+    total_throttles = sum(entry.throttles for entry in stats)
+    names = [f"{entry.service}.{entry.operation}" for entry in stats]
+    name_width = max(len("Operation"), *(len(name) for name in names)) + 2
+    region_width = max(len("Region"), *(len(entry.region) for entry in stats)) + 2
+
+    lines = [
+        f"API calls: {total_calls} calls, {total_seconds:.1f}s, "
+        f"{total_retries} retries, {total_throttles} throttled",
+        f"{'Operation':<{name_width}}{'Region':<{region_width}}"
+        f"{'Calls':>6}{'Total':>9}{'Max':>8}{'Retries':>9}{'Throttled':>11}{'Errors':>8}",
+    ]
+
+    for name, entry in zip(names, stats, strict=True):
+        lines.append(
+            f"{name:<{name_width}}{entry.region:<{region_width}}"
+            f"{entry.calls:>6}{entry.seconds:>8.2f}s{entry.max_seconds:>7.2f}s"
+            f"{entry.retries:>9}{entry.throttles:>11}{entry.errors:>8}"
+        )
+
+    return "\n".join(lines)
+
+
+_active_recorder: ApiCallRecorder | None = None
+
+
+def start_api_accounting() -> ApiCallRecorder:
+    """Install a new process-wide API call recorder and return it."""
+    global _active_recorder
+    _active_recorder = ApiCallRecorder()
+    return _active_recorder
+
+
+def stop_api_accounting() -> ApiCallRecorder | None:
+    """Uninstall the process-wide recorder and return it, if any."""
+    global _active_recorder
+    recorder, _active_recorder = _active_recorder, None
+    return recorder
+
+
+def get_api_recorder() -> ApiCallRecorder | None:
+    """Return the active recorder, or None when accounting is off."""
+    return _active_recorder
@@ -12,12 +12,12 @@ import types
 from pathlib import Path
 from typing import Any
 
-import paramiko
-
 from campers.constants import TUI_STATUS_UPDATE_PROCESSING_DELAY
+from campers.core.costs import record_transition
 from campers.core.interfaces import PricingProvider
 from campers.core.utils import get_instance_id, get_volume_size_or_default
 from campers.providers.exceptions import ProviderAPIError
+from campers.services.sync import build_host_alias
 from campers.utils import status_spinner
 
 
@@ -201,6 +201,8 @@ class CleanupManager:
             logging.info("Skipping SSH connection closure - harness will manage SSH lifecycle")
             return
 
+        import paramiko
+
         resources["ssh_manager"].abort_active_command()
 
         logging.info("Closing SSH connection...")
@@ -284,21 +286,32 @@ class CleanupManager:
 
             self._emit_cleanup_event("stop_tunnels", "failed")
 
-    def cleanup_mutagen_session(self, resources: dict[str, Any], errors: list[Exception]) -> None:
-        """Terminate Mutagen sync sessions.
+    def cleanup_mutagen_session(
+        self,
+        resources: dict[str, Any],
+        errors: list[Exception],
+        preserve: bool = False,
+    ) -> None:
+        """Terminate or pause Mutagen sync sessions.
 
         Parameters
         ----------
         resources : dict[str, Any]
-            Resources dictionary containing mutagen_mgr and mutagen_session_names
+            Resources dictionary containing mutagen_mgr, mutagen_session_names
+            and mutagen_pull_session_names
         errors : list[Exception]
             List to accumulate errors during cleanup
+        preserve : bool
+            Pause sessions instead of terminating them, keeping their cached
+            state and SSH host alias so the next start can resume them
 
         Notes
         -----
         Errors are logged and added to errors list but do not halt cleanup.
         """
-        session_names = resources.get("mutagen_session_names")
+        session_names = list(resources.get("mutagen_session_names") or []) + list(
+            resources.get("mutagen_pull_session_names") or []
+        )
 
         if not session_names:
             if "mutagen_session_name" not in resources:
@@ -306,33 +319,46 @@ class CleanupManager:
                 return
             session_names = [resources["mutagen_session_name"]]
 
-        logging.info("Stopping Mutagen sessions...")
+        if preserve:
+            logging.info("Pausing Mutagen sessions...")
+            event_step = "pause_mutagen"
+        else:
+            logging.info("Stopping Mutagen sessions...")
+            event_step = "terminate_mutagen"
 
-        self._emit_cleanup_event("terminate_mutagen", "in_progress")
+        self._emit_cleanup_event(event_step, "in_progress")
 
         campers_dir = os.environ.get("CAMPERS_DIR", str(Path.home() / ".campers"))
-        instance_details = resources.get("instance_details")
-        host = instance_details.get("public_ip") if instance_details else None
+        instance_details = resources.get("instance_details") or {}
+
+        if instance_details.get("unique_id"):
+            host = build_host_alias(instance_details["unique_id"])
+        else:
+            host = instance_details.get("public_ip")
 
         cleanup_errors = []
 
         for session_name in session_names:
             try:
-                resources["mutagen_mgr"].terminate_session(
-                    session_name,
-                    ssh_wrapper_dir=campers_dir,
-                    host=host,
-                )
-                logging.info("Mutagen session %s stopped successfully", session_name)
+                if preserve:
+                    resources["mutagen_mgr"].pause_session(session_name)
+                    logging.info("Mutagen session %s paused successfully", session_name)
+                else:
+                    resources["mutagen_mgr"].terminate_session(
+                        session_name,
+                        ssh_wrapper_dir=campers_dir,
+                        host=host,
+                    )
+                    logging.info("Mutagen session %s stopped successfully", session_name)
             except (OSError, subprocess.SubprocessError, RuntimeError, TimeoutError) as e:
                 logging.error("Error stopping Mutagen session %s: %s", session_name, e)
                 errors.append(e)
                 cleanup_errors.append(e)
 
         if not cleanup_errors:
-            self._emit_cleanup_event("terminate_mutagen", "completed")
+            self._emit_cleanup_event(event_step, "completed")
         else:
-            self._emit_cleanup_event("terminate_mutagen", "failed")
+            self._emit_cleanup_event(event_step, "failed")
 
     def _cleanup_instance_helper(
         self,
@@ -404,6 +430,7 @@ class CleanupManager:
                     spinner_msg = f"Stopping instance {instance_id}"
                     with status_spinner(spinner_msg, use_logging=use_logging):
                         compute_provider.stop_instance(instance_id)
+                    record_transition(instance_id, "stopped")
                     logging.info("Cloud instance stopped successfully")
                     volume_size = get_volume_size_or_default(compute_provider, instance_id)
                     storage_rate = self._get_storage_rate(compute_provider.region)
@@ -417,6 +444,7 @@ class CleanupManager:
                     spinner_msg = f"Terminating instance {instance_id}"
                     with status_spinner(spinner_msg, use_logging=use_logging):
                         compute_provider.terminate_instance(instance_id)
+                    record_transition(instance_id, "terminated")
                     logging.info("Cloud instance terminated successfully")
 
                 self._emit_cleanup_event(event_action, "completed")
@@ -446,7 +474,7 @@ class CleanupManager:
         Thread-safe, idempotent cleanup that preserves instance for restart.
         Cleanup order is critical:
         1. Port forwarding first (releases network resources)
-        2. Mutagen session second (stops file synchronization)
+        2. Mutagen session second (pauses file synchronization for resume)
         3. SSH connection third (closes remote connection)
         4. Cloud instance fourth (stops instance, preserving data)
 
@@ -471,7 +499,7 @@ class CleanupManager:
                 resources_to_clean["ssh_manager"].abort_active_command()
 
             self.cleanup_port_forwarding(resources_to_clean, errors)
-            self.cleanup_mutagen_session(resources_to_clean, errors)
+            self.cleanup_mutagen_session(resources_to_clean, errors, preserve=True)
             self.cleanup_ssh_connections(resources_to_clean, errors)
             self.cleanup_session_file(resources_to_clean, errors)
 
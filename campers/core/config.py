@@ -5,12 +5,14 @@ import re
 from pathlib import Path
 from typing import Any
 
-import yaml
-from dotenv import load_dotenv
-from omegaconf import OmegaConf
-from omegaconf.errors import InterpolationResolutionError
-
-from campers.constants import DEFAULT_DISK_SIZE, DEFAULT_PROVIDER
+from campers.cli.parsing import normalize_auto_forward_config
+from campers.constants import (
+    ANSIBLE_DEFAULT_SETTINGS,
+    ANSIBLE_STRATEGIES,
+    DEFAULT_DISK_SIZE,
+    DEFAULT_PROVIDER,
+    MARKETS,
+)
 from campers.providers import get_default_region, get_provider_defaults, list_providers
 
 logger = logging.getLogger(__name__)
@@ -65,6 +67,11 @@ class ConfigLoader:
         Automatically loads .env file from the config file's directory if present.
         Environment variables from .env are available via ${oc.env:VAR_NAME} syntax.
         """
+        import yaml
+        from dotenv import load_dotenv
+        from omegaconf import OmegaConf
+        from omegaconf.errors import InterpolationResolutionError
+
         if config_path is None:
             config_path = os.environ.get("CAMPERS_CONFIG", "campers.yaml")
 
@@ -173,9 +180,16 @@ class ConfigLoader:
         self._validate_required_fields(config)
         self._validate_optional_fields(config)
         self._validate_ports(config)
+        self._validate_reverse_ports(config)
+        self._validate_socks_proxy(config)
         self._validate_public_ports(config)
+        self._validate_auto_forward(config)
         self._validate_sync_paths(config)
+        self._validate_pull_paths(config)
+        self._validate_datasets(config)
+        self._validate_cache_volume(config)
         self._validate_ansible_config(config)
+        self._validate_ansible_settings(config)
 
     def _validate_required_fields(self, config: dict[str, Any]) -> None:
         """Validate required configuration fields.
@@ -271,6 +285,9 @@ class ConfigLoader:
                     f"and hyphens, and be 1-32 characters long."
                 )
 
+        if "market" in config and config["market"] not in MARKETS:
+            raise ValueError(f"market must be one of: {', '.join(MARKETS)}")
+
     def _validate_ports(self, config: dict[str, Any]) -> None:
         """Validate port configuration.
 
@@ -306,6 +323,69 @@ class ConfigLoader:
             for port in config["ports"]:
                 self._validate_single_port_entry(port, is_port_singular=False)
 
+    def _validate_reverse_ports(self, config: dict[str, Any]) -> None:
+        """Validate reverse port forwarding configuration.
+
+        Parameters
+        ----------
+        config : dict[str, Any]
+            Configuration to validate
+
+        Raises
+        ------
+        ValueError
+            If reverse_ports is not a list of valid port entries
+
+        Notes
+        -----
+        Entries use the same formats as ports, also in 'remote:local' order.
+        """
+        if "reverse_ports" not in config:
+            return
+
+        if not isinstance(config["reverse_ports"], list):
+            raise ValueError("reverse_ports must be a list")
+
+        for port in config["reverse_ports"]:
+            self._validate_single_port_entry(port, is_port_singular=False)
+
+    def _validate_socks_proxy(self, config: dict[str, Any]) -> None:
+        """Validate SOCKS proxy configuration.
+
+        Parameters
+        ----------
+        config : dict[str, Any]
+            Configuration to validate
+
+        Raises
+        ------
+        ValueError
+            If socks_proxy is not a valid local port number
+        """
+        if config.get("socks_proxy") is None:
+            return
+
+        port = config["socks_proxy"]
+
+        if isinstance(port, bool) or not isinstance(port, int) or not (1 <= port <= 65535):
+            raise ValueError("socks_proxy must be a local port number between 1 and 65535")
+
+    def _validate_auto_forward(self, config: dict[str, Any]) -> None:
+        """Validate auto_forward configuration.
+
+        Parameters
+        ----------
+        config : dict[str, Any]
+            Configuration to validate
+
+        Raises
+        ------
+        ValueError
+            If auto_forward is not a boolean or valid allow/deny dictionary
+        """
+        if "auto_forward" in config:
+            normalize_auto_forward_config(config["auto_forward"])
+
     def _validate_single_port_entry(
         self, port: int | str | tuple[int, int], is_port_singular: bool = True
     ) -> None:
@@ -412,6 +492,123 @@ class ConfigLoader:
             if "local" not in sync_path or "remote" not in sync_path:
                 raise ValueError("sync_paths entry must have both 'local' and 'remote' keys")
 
+    def _validate_pull_paths(self, config: dict[str, Any]) -> None:
+        """Validate pull_paths configuration.
+
+        Parameters
+        ----------
+        config : dict[str, Any]
+            Configuration to validate
+
+        Raises
+        ------
+        ValueError
+            If pull_paths configuration is invalid
+        """
+        if "pull_paths" not in config:
+            return
+
+        if not isinstance(config["pull_paths"], list):
+            raise ValueError("pull_paths must be a list")
+
+        for pull_path in config["pull_paths"]:
+            if not isinstance(pull_path, dict):
+                raise ValueError("pull_paths entries must be dictionaries")
+
+            if "local" not in pull_path or "remote" not in pull_path:
+                raise ValueError("pull_paths entry must have both 'local' and 'remote' keys")
+
+            ignore = pull_path.get("ignore")
+            if ignore is not None and (
+                not isinstance(ignore, list) or not all(isinstance(p, str) for p in ignore)
+            ):
+                raise ValueError("pull_paths ignore must be a list of strings")
+
+            max_file_size = pull_path.get("max_file_size")
+            if max_file_size is not None and (
+                isinstance(max_file_size, bool)
+                or not isinstance(max_file_size, (str, int))
+                or not re.match(r"^\d+\s*[kKmMgGtT]?i?[bB]?$", str(max_file_size))
+            ):
+                raise ValueError(
+                    "pull_paths max_file_size must be a size such as 500MB or a byte count"
+                )
+
+            scan_interval = pull_path.get("scan_interval")
+            if scan_interval is not None and (
+                isinstance(scan_interval, bool)
+                or not isinstance(scan_interval, int)
+                or scan_interval < 1
+            ):
+                raise ValueError("pull_paths scan_interval must be a positive integer")
+
+    def _validate_datasets(self, config: dict[str, Any]) -> None:
+        """Validate datasets configuration.
+
+        Parameters
+        ----------
+        config : dict[str, Any]
+            Configuration to validate
+
+        Raises
+        ------
+        ValueError
+            If datasets configuration is invalid
+        """
+        if "dataset_concurrency" in config:
+            concurrency = config["dataset_concurrency"]
+            if isinstance(concurrency, bool) or not isinstance(concurrency, int) or concurrency < 1:
+                raise ValueError("dataset_concurrency must be a positive integer")
+
+        if "datasets" not in config:
+            return
+
+        if not isinstance(config["datasets"], list):
+            raise ValueError("datasets must be a list")
+
+        for dataset in config["datasets"]:
+            if not isinstance(dataset, dict):
+                raise ValueError("datasets entries must be dictionaries")
+
+            if "source" not in dataset or "target" not in dataset:
+                raise ValueError("datasets entry must have both 'source' and 'target' keys")
+
+            source = dataset["source"]
+            if not isinstance(source, str) or not re.match(r"^s3://[^/]+", source):
+                raise ValueError(f"datasets source must be an s3:// URI, got '{source}'")
+
+            if not isinstance(dataset["target"], str) or not dataset["target"]:
+                raise ValueError("datasets target must be a non-empty string")
+
+    def _validate_cache_volume(self, config: dict[str, Any]) -> None:
+        """Validate cache_volume configuration.
+
+        Parameters
+        ----------
+        config : dict[str, Any]
+            Configuration to validate
+
+        Raises
+        ------
+        ValueError
+            If cache_volume configuration is invalid
+        """
+        if "cache_volume" not in config:
+            return
+
+        cache_volume = config["cache_volume"]
+        size = cache_volume.get("size") if isinstance(cache_volume, dict) else cache_volume
+
+        if isinstance(size, bool) or not isinstance(size, int) or size < 1:
+            raise ValueError(
+                "cache_volume must be a size in GB or a dictionary with a positive 'size'"
+            )
+
+        if isinstance(cache_volume, dict):
+            mount = cache_volume.get("mount")
+            if mount is not None and (not isinstance(mount, str) or not mount.startswith("/")):
+                raise ValueError("cache_volume mount must be an absolute path")
+
     def _validate_ansible_config(self, config: dict[str, Any]) -> None:
         """Validate Ansible configuration.
 
@@ -450,6 +647,45 @@ class ConfigLoader:
                     f"got {type(playbook_content).__name__}"
                 )
 
+    def _validate_ansible_settings(self, config: dict[str, Any]) -> None:
+        """Validate the ansible speed profile section.
+
+        Parameters
+        ----------
+        config : dict[str, Any]
+            Configuration to validate
+
+        Raises
+        ------
+        ValueError
+            If the ansible section has unknown keys or invalid values
+        """
+        if "ansible" not in config:
+            return
+
+        settings = config["ansible"]
+
+        if not isinstance(settings, dict):
+            raise ValueError("ansible must be a dictionary")
+
+        unknown = set(settings) - set(ANSIBLE_DEFAULT_SETTINGS)
+
+        if unknown:
+            raise ValueError(f"Unknown ansible settings: {', '.join(sorted(unknown))}")
+
+        if "strategy" in settings and settings["strategy"] not in ANSIBLE_STRATEGIES:
+            raise ValueError(f"ansible strategy must be one of: {', '.join(ANSIBLE_STRATEGIES)}")
+
+        for key in ("pipelining", "fact_caching"):
+            if key in settings and not isinstance(settings[key], bool):
+                raise ValueError(f"ansible {key} must be a boolean")
+
+        for key, minimum in (("forks", 1), ("control_persist", 0)):
+            value = settings.get(key, minimum)
+
+            if isinstance(value, bool) or not isinstance(value, int) or value < minimum:
+                raise ValueError(f"ansible {key} must be an integer >= {minimum}")
+
     def _validate_public_ports(self, config: dict[str, Any]) -> None:
         """Validate public_ports configuration.
 
@@ -0,0 +1,590 @@
+"""Cost accrual over instance running and stopped intervals, and the local cost ledger.
+
+Monthly estimates assume an instance keeps its current state all month. The
+ledger instead records every state change campers makes, so what an instance
+actually cost can be integrated over the hours it spent running (compute and
+storage) and stopped (storage only). State changes made outside campers are
+not recorded, so the latest state of each instance is checked against the
+provider before it is billed up to now.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from campers.constants import COST_HOURS_PER_MONTH, COST_LEDGER_FILE, COST_REPORT_WEEKS
+from campers.core.interfaces import PricingProvider
+from campers.providers.exceptions import ProviderError
+
+logger = logging.getLogger(__name__)
+
+LEDGER_ATTRIBUTES = ("camp", "owner", "region", "instance_type", "volume_size_gb", "market")
+"""Instance attributes a transition may carry; later ones inherit earlier values."""
+
+BILLED_STATES = ("running", "stopped")
+"""States that accrue cost; any other recorded state ends accrual."""
+
+PROVIDER_STATES = {"pending": "running", "stopping": "stopped", "shutting-down": "terminated"}
+"""Transitional provider instance states mapped to the ledger state they lead to."""
+
+
+def get_ledger_path() -> Path:
+    """Return the cost ledger file under CAMPERS_DIR.
+
+    Returns
+    -------
+    Path
+        Path to the JSONL ledger
+    """
+    campers_dir = Path(os.environ.get("CAMPERS_DIR", str(Path.home() / ".campers")))
+    return campers_dir / COST_LEDGER_FILE
+
+
+def _as_utc(moment: datetime) -> datetime:
+    """Return moment as an aware UTC datetime, treating naive values as UTC."""
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=UTC)
+
+    return moment.astimezone(UTC)
+
+
+def record_transition(
+    instance_id: str,
+    state: str,
+    at: datetime | None = None,
+    path: Path | None = None,
+    **attributes: Any,
+) -> None:
+    """Append an instance state change to the cost ledger.
+
+    Does nothing when CAMPERS_DISABLE_COST_LEDGER=1. Write failures are logged
+    and never interrupt the command that changed the state.
+
+    Parameters
+    ----------
+    instance_id : str
+        Instance whose state changed
+    state : str
+        New state: 'running', 'stopped' or 'terminated'
+    at : datetime | None
+        When the state changed, defaults to now
+    path : Path | None
+        Ledger file, defaults to get_ledger_path()
+    **attributes : Any
+        Any of LEDGER_ATTRIBUTES; None values are omitted
+    """
+    if os.environ.get("CAMPERS_DISABLE_COST_LEDGER") == "1":
+        return
+
+    record = {
+        "instance_id": instance_id,
+        "state": state,
+        "at": _as_utc(at or datetime.now(UTC)).isoformat(timespec="seconds"),
+        **{
+            key: value
+            for key, value in attributes.items()
+            if key in LEDGER_ATTRIBUTES and value is not None
+        },
+    }
+    path = path or get_ledger_path()
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with path.open("a") as f:
+            f.write(json.dumps(record) + "\n")
+    except OSError as e:
+        logger.warning("Failed to record cost ledger entry: %s", e)
+
+
+def load_transitions(path: Path | None = None) -> list[dict[str, Any]]:
+    """Load ledger transitions in file order.
+
+    Parameters
+    ----------
+    path : Path | None
+        Ledger file, defaults to get_ledger_path()
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        Transitions with 'at' parsed to aware datetimes; unreadable lines
+        are skipped
+    """
+    path = path or get_ledger_path()
+
+    if not path.exists():
+        return []
+
+    transitions = []
+
+    for line in path.read_text().splitlines():
+        try:
+            record = json.loads(line)
+            record["at"] = _as_utc(datetime.fromisoformat(record["at"]))
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            logger.debug("Skipping malformed cost ledger line: %s", line[:80])
+            continue
+
+        transitions.append(record)
+
+    return transitions
+
+
+@dataclass(frozen=True)
+class Interval:
+    """A span of time an instance spent in one billed state.
+
+    Attributes
+    ----------
+    instance_id : str
+        Instance the interval belongs to
+    state : str
+        'running' or 'stopped'
+    start : datetime
+        Interval start, aware UTC
+    end : datetime
+        Interval end, aware UTC
+    attributes : dict[str, Any]
+        LEDGER_ATTRIBUTES known for the instance at the interval start
+    verified : bool
+        False for a latest interval whose state the provider no longer
+        reports, so its actual end is unknown
+    """
+
+    instance_id: str
+    state: str
+    start: datetime
+    end: datetime
+    attributes: dict[str, Any]
+    verified: bool = True
+
+    @property
+    def hours(self) -> float:
+        """Length of the interval in hours."""
+        return (self.end - self.start).total_seconds() / 3600
+
+
+def current_states(
+    transitions: list[dict[str, Any]],
+    list_instances: Callable[[str], list[dict[str, Any]]],
+) -> dict[str, str]:
+    """Look up the actual state of instances the ledger leaves running or stopped.
+
+    Parameters
+    ----------
+    transitions : list[dict[str, Any]]
+        Transitions as returned by load_transitions
+    list_instances : Callable[[str], list[dict[str, Any]]]
+        Returns the instances of a region with their instance_id and state,
+        as ComputeProvider.list_instances does
+
+    Returns
+    -------
+    dict[str, str]
+        Ledger state of every looked-up instance, 'terminated' for instances
+        the provider no longer lists
+    """
+    latest: dict[str, dict[str, Any]] = {}
+    region: dict[str, str] = {}
+
+    for transition in sorted(transitions, key=lambda event: event["at"]):
+        latest[transition["instance_id"]] = transition
+
+        if transition.get("region"):
+            region[transition["instance_id"]] = transition["region"]
+
+    open_instances = {
+        instance_id
+        for instance_id, event in latest.items()
+        if event["state"] in BILLED_STATES and instance_id in region
+    }
+    states = {}
+
+    for name in sorted({region[instance_id] for instance_id in open_instances}):
+        listed = {
+            instance["instance_id"]: PROVIDER_STATES.get(instance["state"], instance["state"])
+            for instance in list_instances(name)
+        }
+
+        for instance_id in open_instances:
+            if region[instance_id] == name:
+                states[instance_id] = listed.get(instance_id, "terminated")
+
+    return states
+
+
+def build_intervals(
+    transitions: list[dict[str, Any]],
+    until: datetime,
+    states: dict[str, str] | None = None,
+) -> list[Interval]:
+    """Turn ledger transitions into billed intervals.
+
+    Each transition's state lasts until the next transition of the same
+    instance, or until `until` for its latest one. A latest state that
+    disagrees with the actual state of the instance is marked unverified.
+
+    Parameters
+    ----------
+    transitions : list[dict[str, Any]]
+        Transitions as returned by load_transitions
+    until : datetime
+        End of the latest open interval of every instance
+    states : dict[str, str] | None
+        Actual states from current_states; instances missing from it are
+        trusted to still be in their latest recorded state
+
+    Returns
+    -------
+    list[Interval]
+        Running and stopped intervals, grouped by instance and in time order
+    """
+    until = _as_utc(until)
+    by_instance: dict[str, list[dict[str, Any]]] = {}
+
+    for transition in transitions:
+        by_instance.setdefault(transition["instance_id"], []).append(transition)
+
+    intervals = []
+
+    for instance_id, events in by_instance.items():
+        events.sort(key=lambda event: event["at"])
+        attributes: dict[str, Any] = {}
+
+        for index, event in enumerate(events):
+            attributes = {
+                **attributes,
+                **{key: event[key] for key in LEDGER_ATTRIBUTES if key in event},
+            }
+            latest = index + 1 == len(events)
+            end = until if latest else events[index + 1]["at"]
+            verified = (
+                not latest or (states or {}).get(instance_id, event["state"]) == event["state"]
+            )
+
+            if event["state"] in BILLED_STATES and end > event["at"]:
+                intervals.append(
+                    Interval(instance_id, event["state"], event["at"], end, attributes, verified)
+                )
+
+    return intervals
+
+
+def week_start(moment: datetime) -> date:
+    """Return the Monday (UTC) of the week containing moment."""
+    day = _as_utc(moment).date()
+    return day - timedelta(days=day.weekday())
+
+
+def split_by_week(interval: Interval) -> list[Interval]:
+    """Split an interval at Monday 00:00 UTC boundaries.
+
+    Parameters
+    ----------
+    interval : Interval
+        Interval to split
+
+    Returns
+    -------
+    list[Interval]
+        Consecutive intervals, each within one week
+    """
+    pieces = []
+    start = interval.start
+
+    while start < interval.end:
+        next_week = datetime.combine(
+            week_start(start) + timedelta(days=7), datetime.min.time(), UTC
+        )
+        end = min(next_week, interval.end)
+        pieces.append(replace(interval, start=start, end=end))
+        start = end
+
+    return pieces
+
+
+def accrued_cost(
+    state: str,
+    hours: float,
+    hourly_rate: float | None,
+    storage_rate: float | None,
+    volume_size_gb: float,
+) -> float | None:
+    """Return the cost of spending hours in a state.
+
+    Parameters
+    ----------
+    state : str
+        'running' (compute and storage) or 'stopped' (storage only)
+    hours : float
+        Time spent in the state
+    hourly_rate : float | None
+        Instance price in USD per hour
+    storage_rate : float | None
+        Volume price in USD per GB-month
+    volume_size_gb : float
+        Root volume size
+
+    Returns
+    -------
+    float | None
+        Cost in USD, or None if a needed rate is unknown
+    """
+    if storage_rate is None or (state == "running" and hourly_rate is None):
+        return None
+
+    per_hour = volume_size_gb * storage_rate / COST_HOURS_PER_MONTH
+
+    if state == "running":
+        per_hour += hourly_rate
+
+    return per_hour * hours
+
+
+class CostMeter:
+    """Live cost of an instance since it started running.
+
+    Parameters
+    ----------
+    running_since : datetime
+        When the instance entered the running state
+    hourly_rate : float | None
+        Instance price in USD per hour
+    storage_rate : float | None
+        Volume price in USD per GB-month
+    volume_size_gb : float
+        Root volume size
+    """
+
+    def __init__(
+        self,
+        running_since: datetime,
+        hourly_rate: float | None,
+        storage_rate: float | None,
+        volume_size_gb: float,
+    ) -> None:
+        self.running_since = _as_utc(running_since)
+        self.hourly_rate = hourly_rate
+        self.storage_rate = storage_rate
+        self.volume_size_gb = volume_size_gb
+
+    def cost(self, now: datetime | None = None) -> float | None:
+        """Return the cost accrued so far.
+
+        Parameters
+        ----------
+        now : datetime | None
+            Time to accrue up to, defaults to now
+
+        Returns
+        -------
+        float | None
+            Cost in USD, or None if a rate is unknown
+        """
+        elapsed = _as_utc(now or datetime.now(UTC)) - self.running_since
+        hours = max(elapsed.total_seconds(), 0) / 3600
+        return accrued_cost(
+            "running", hours, self.hourly_rate, self.storage_rate, self.volume_size_gb
+        )
+
+
+def summarize_costs(
+    intervals: list[Interval],
+    pricing_provider: PricingProvider | None,
+    camp_name: str | None = None,
+    user: str | None = None,
+    since: date | None = None,
+) -> dict[tuple[date, str, str], dict[str, Any]]:
+    """Total hours and cost per week, camp and user.
+
+    Parameters
+    ----------
+    intervals : list[Interval]
+        Intervals from build_intervals; unverified ones are not billed
+    pricing_provider : PricingProvider | None
+        Source of instance and storage rates; costs are None without one.
+        Spot hours are priced at the current spot rate, as past spot prices
+        are not recorded
+    camp_name : str | None
+        Only include this camp
+    user : str | None
+        Only include instances owned by this user
+    since : date | None
+        Only include weeks starting on or after this Monday
+
+    Returns
+    -------
+    dict[tuple[date, str, str], dict[str, Any]]
+        Rows keyed by (week start, camp, user) with 'running_hours',
+        'stopped_hours', 'cost', 'complete' (False if some interval could
+        not be priced) and 'verified' (False if an interval starting that
+        week was left out because its actual end is unknown)
+    """
+    rates: dict[tuple[str, str | None], float | None] = {}
+
+    def rate(kind: str, region: str | None, instance_type: str | None = None) -> float | None:
+        key = (f"{kind}:{instance_type or ''}", region)
+
+        if key not in rates:
+            if pricing_provider is None or region is None:
+                rates[key] = None
+            elif kind == "ec2":
+                rates[key] = (
+                    pricing_provider.get_instance_price(instance_type, region)
+                    if instance_type
+                    else None
+                )
+            elif kind == "spot":
+                rates[key] = (
+                    pricing_provider.get_spot_price(instance_type, region)
+                    if instance_type
+                    else None
+                )
+            else:
+                rates[key] = pricing_provider.get_storage_price(region)
+
+        return rates[key]
+
+    rows: dict[tuple[date, str, str], dict[str, Any]] = {}
+
+    for interval in intervals:
+        camp = interval.attributes.get("camp") or "ad-hoc"
+        owner = interval.attributes.get("owner") or "unknown"
+
+        if camp_name not in (None, camp) or user not in (None, owner):
+            continue
+
+        region = interval.attributes.get("region")
+        hourly_rate = rate(
+            "spot" if interval.attributes.get("market") == "spot" else "ec2",
+            region,
+            interval.attributes.get("instance_type"),
+        )
+        storage_rate = rate("ebs", region)
+
+        pieces = split_by_week(interval) if interval.verified else [interval]
+
+        for piece in pieces:
+            week = week_start(piece.start)
+
+            if since is not None and week < since:
+                continue
+
+            row = rows.setdefault(
+                (week, camp, owner),
+                {
+                    "running_hours": 0.0,
+                    "stopped_hours": 0.0,
+                    "cost": 0.0,
+                    "complete": True,
+                    "verified": True,
+                },
+            )
+
+            if not piece.verified:
+                row["verified"] = False
+                continue
+
+            row[f"{piece.state}_hours"] += piece.hours
+            cost = accrued_cost(
+                piece.state,
+                piece.hours,
+                hourly_rate,
+                storage_rate,
+                interval.attributes.get("volume_size_gb") or 0,
+            )
+
+            if cost is None:
+                row["complete"] = False
+            else:
+                row["cost"] += cost
+
+    return rows
+
+
+def log_costs(
+    pricing_provider: PricingProvider | None,
+    camp_name: str | None = None,
+    user: str | None = None,
+    weeks: int = COST_REPORT_WEEKS,
+    path: Path | None = None,
+    list_instances: Callable[[str], list[dict[str, Any]]] | None = None,
+) -> None:
+    """Log accrued hours and cost per week, camp and user from the ledger.
+
+    Parameters
+    ----------
+    pricing_provider : PricingProvider | None
+        Source of instance and storage rates
+    camp_name : str | None
+        Only report this camp
+    user : str | None
+        Only report instances owned by this user
+    weeks : int
+        Number of most recent weeks to report
+    path : Path | None
+        Ledger file, defaults to get_ledger_path()
+    list_instances : Callable[[str], list[dict[str, Any]]] | None
+        Lists the instances of a region to check the latest recorded states
+        against; without it, or if it fails, they are trusted
+    """
+    now = datetime.now(UTC)
+    since = week_start(now) - timedelta(weeks=weeks - 1)
+    transitions = load_transitions(path)
+    states = None
+
+    if list_instances is not None:
+        try:
+            states = current_states(transitions, list_instances)
+        except ProviderError as e:
+            logger.warning("Could not check instance states, trusting the ledger: %s", e)
+
+    intervals = build_intervals(transitions, until=now, states=states)
+    rows = summarize_costs(intervals, pricing_provider, camp_name, user, since)
+
+    if not rows:
+        logging.info("No recorded instance costs found", extra={"stream": "stdout"})
+        return
+
+    logging.info(
+        f"{'Week':<12}{'Camp':<20}{'User':<25}{'Running':>10}{'Stopped':>10}{'Cost':>12}",
+        extra={"stream": "stdout"},
+    )
+    total = 0.0
+    complete = True
+    verified = True
+
+    for (week, camp, owner), row in sorted(rows.items()):
+        cost = (
+            f"${row['cost']:.2f}"
+            + ("" if row["complete"] else "*")
+            + ("" if row["verified"] else "?")
+        )
+        total += row["cost"]
+        complete = complete and row["complete"]
+        verified = verified and row["verified"]
+        logging.info(
+            f"{week.isoformat():<12}{camp[:19]:<20}{owner[:24]:<25}"
+            f"{row['running_hours']:>9.1f}h{row['stopped_hours']:>9.1f}h{cost:>12}",
+            extra={"stream": "stdout"},
+        )
+
+    logging.info(f"Total: ${total:.2f}", extra={"stream": "stdout"})
+
+    if not complete:
+        logging.info("* some hours could not be priced", extra={"stream": "stdout"})
+
+    if not verified:
+        logging.info(
+            "? some instances changed state outside campers; "
+            "hours since their last recorded change are not billed",
+            extra={"stream": "stdout"},
+        )
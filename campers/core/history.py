@@ -0,0 +1,314 @@
+"""Local history of run milestones and the statistics behind `campers stats`."""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from campers.constants import (
+    RUN_HISTORY_FILE,
+    RUN_MILESTONES,
+    STATS_MIN_SAMPLES,
+    STATS_RECENT_RUNS,
+    STATS_REGRESSION_FACTOR,
+)
+
+logger = logging.getLogger(__name__)
+
+CHANGE_DIMENSIONS = ("ami", "instance_type", "region")
+"""Run attributes whose change is checked as the cause of a regression."""
+
+
+def get_history_path() -> Path:
+    """Return the run history file under CAMPERS_DIR.
+
+    Returns
+    -------
+    Path
+        Path to the JSONL history file
+    """
+    campers_dir = Path(os.environ.get("CAMPERS_DIR", str(Path.home() / ".campers")))
+    return campers_dir / RUN_HISTORY_FILE
+
+
+def append_run(record: dict[str, Any], path: Path | None = None) -> None:
+    """Append one run record to the history.
+
+    Parameters
+    ----------
+    record : dict[str, Any]
+        Run record with camp, instance_type, region, ami, reused, outcome,
+        started_at, total and milestones keys
+    path : Path | None
+        History file, defaults to get_history_path()
+    """
+    path = path or get_history_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with path.open("a") as f:
+        f.write(json.dumps(record, default=str) + "\n")
+
+
+def load_runs(camp_name: str | None = None, path: Path | None = None) -> list[dict[str, Any]]:
+    """Load run records, oldest first.
+
+    Parameters
+    ----------
+    camp_name : str | None
+        Only return runs of this camp
+    path : Path | None
+        History file, defaults to get_history_path()
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        Run records; unreadable lines are skipped
+    """
+    path = path or get_history_path()
+
+    if not path.exists():
+        return []
+
+    runs = []
+
+    for line in path.read_text().splitlines():
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            logger.debug("Skipping malformed run history line: %s", line[:80])
+            continue
+
+        if isinstance(record, dict) and camp_name in (None, record.get("camp")):
+            runs.append(record)
+
+    return sorted(runs, key=_started_at)
+
+
+def _started_at(record: dict[str, Any]) -> datetime:
+    """Return when a run started as an aware datetime for ordering.
+
+    Records written before start times were stored in UTC hold naive local
+    times, which are read as local time.
+    """
+    try:
+        started_at = datetime.fromisoformat(record["started_at"])
+    except (KeyError, TypeError, ValueError):
+        return datetime.min.replace(tzinfo=UTC)
+
+    return started_at if started_at.tzinfo else started_at.astimezone()
+
+
+def percentile(values: Iterable[float], pct: float) -> float:
+    """Return the pct-th percentile using linear interpolation.
+
+    Parameters
+    ----------
+    values : Iterable[float]
+        Sample values, at least one
+    pct : float
+        Percentile between 0 and 100
+
+    Returns
+    -------
+    float
+        Interpolated percentile
+    """
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def _milestone_values(runs: list[dict[str, Any]], milestone: str) -> list[float]:
+    """Return a milestone's timings across runs that reached it."""
+    return [run["milestones"][milestone] for run in runs if milestone in run.get("milestones", {})]
+
+
+def find_regressions(
+    runs: list[dict[str, Any]],
+    factor: float = STATS_REGRESSION_FACTOR,
+    min_samples: int = STATS_MIN_SAMPLES,
+    recent: int = STATS_RECENT_RUNS,
+) -> list[str]:
+    """Describe milestones that became markedly slower.
+
+    For each of CHANGE_DIMENSIONS, runs are split at the latest change of
+    that attribute and p90 timings before and after are compared. Milestones
+    not explained by such a change are checked for a recent trend by
+    comparing the median of the last `recent` runs with the earlier ones.
+
+    Parameters
+    ----------
+    runs : list[dict[str, Any]]
+        Runs of one camp and launch kind, oldest first
+    factor : float
+        Slowdown ratio that counts as a regression
+    min_samples : int
+        Runs needed on each side of a comparison
+    recent : int
+        Number of latest runs forming the recent window
+
+    Returns
+    -------
+    list[str]
+        One sentence per regression
+    """
+    findings = []
+    explained: set[str] = set()
+
+    for dimension in CHANGE_DIMENSIONS:
+        change = next(
+            (
+                index
+                for index in range(len(runs) - 1, 0, -1)
+                if runs[index].get(dimension) != runs[index - 1].get(dimension)
+            ),
+            None,
+        )
+
+        if change is None:
+            continue
+
+        before, after = runs[:change], runs[change:]
+        old, new = before[-1].get(dimension), after[0].get(dimension)
+
+        for milestone in RUN_MILESTONES:
+            old_values = _milestone_values(before, milestone)
+            new_values = _milestone_values(after, milestone)
+
+            if len(old_values) < min_samples or len(new_values) < min_samples:
+                continue
+
+            old_p90, new_p90 = percentile(old_values, 90), percentile(new_values, 90)
+
+            if old_p90 > 0 and new_p90 / old_p90 >= factor:
+                explained.add(milestone)
+                findings.append(
+                    f"time to {milestone} p90 {new_p90 / old_p90:.1f}x slower since "
+                    f"{dimension} changed ({old} -> {new}): {old_p90:.0f}s -> {new_p90:.0f}s"
+                )
+
+    for milestone in RUN_MILESTONES:
+        if milestone in explained:
+            continue
+
+        old_values = _milestone_values(runs[:-recent], milestone)
+        new_values = _milestone_values(runs[-recent:], milestone)
+
+        if len(old_values) < min_samples or len(new_values) < min_samples:
+            continue
+
+        old_p50, new_p50 = percentile(old_values, 50), percentile(new_values, 50)
+
+        if old_p50 > 0 and new_p50 / old_p50 >= factor:
+            findings.append(
+                f"time to {milestone} p50 {new_p50 / old_p50:.1f}x slower over the last "
+                f"{recent} runs: {old_p50:.0f}s -> {new_p50:.0f}s"
+            )
+
+    return findings
+
+
+def format_stats(runs: list[dict[str, Any]], recent: int = STATS_RECENT_RUNS) -> list[str]:
+    """Format milestone percentiles for one group of runs.
+
+    Parameters
+    ----------
+    runs : list[dict[str, Any]]
+        Runs of one camp and launch kind, oldest first
+    recent : int
+        Number of latest runs summarised in the 'Recent p50' column
+
+    Returns
+    -------
+    list[str]
+        Table lines, one row per milestone that any run reached
+    """
+    lines = [f"{'Milestone':<16}{'Runs':>6}{'p50':>9}{'p90':>9}{'Max':>9}{'Recent p50':>12}"]
+
+    for milestone in (*RUN_MILESTONES, "total"):
+        if milestone == "total":
+            values = [run["total"] for run in runs if run.get("total") is not None]
+            latest = [run["total"] for run in runs[-recent:] if run.get("total") is not None]
+        else:
+            values = _milestone_values(runs, milestone)
+            latest = _milestone_values(runs[-recent:], milestone)
+
+        if not values:
+            continue
+
+        recent_p50 = f"{percentile(latest, 50):.1f}s" if latest else "-"
+        lines.append(
+            f"{milestone:<16}{len(values):>6}{percentile(values, 50):>8.1f}s"
+            f"{percentile(values, 90):>8.1f}s{max(values):>8.1f}s{recent_p50:>12}"
+        )
+
+    return lines
+
+
+def group_runs(runs: list[dict[str, Any]]) -> dict[tuple[str, bool], list[dict[str, Any]]]:
+    """Group runs by camp and by whether the instance was reused.
+
+    Restarting a stopped instance and launching a new one have very different
+    timings, so they are never compared with each other.
+
+    Parameters
+    ----------
+    runs : list[dict[str, Any]]
+        Run records, oldest first
+
+    Returns
+    -------
+    dict[tuple[str, bool], list[dict[str, Any]]]
+        Runs keyed by (camp, reused), each list oldest first
+    """
+    groups: dict[tuple[str, bool], list[dict[str, Any]]] = {}
+
+    for run in runs:
+        key = (run.get("camp") or "ad-hoc", bool(run.get("reused")))
+        groups.setdefault(key, []).append(run)
+
+    return groups
+
+
+def log_stats(camp_name: str | None = None, path: Path | None = None) -> None:
+    """Log milestone percentiles and regressions for each camp.
+
+    Parameters
+    ----------
+    camp_name : str | None
+        Only report this camp
+    path : Path | None
+        History file, defaults to get_history_path()
+    """
+    runs = load_runs(camp_name, path)
+
+    if not runs:
+        target = f" for camp '{camp_name}'" if camp_name else ""
+        logging.info(f"No run history found{target}", extra={"stream": "stdout"})
+        return
+
+    for (camp, reused), group in sorted(group_runs(runs).items()):
+        latest = group[-1]
+        kind = "restarted instance" if reused else "new instance"
+        logging.info(f"{camp} ({kind}, {len(group)} runs)", extra={"stream": "stdout"})
+        logging.info(
+            f"Latest: {latest.get('instance_type')} in {latest.get('region')}, "
+            f"AMI {latest.get('ami') or 'unknown'}, {latest.get('started_at')}",
+            extra={"stream": "stdout"},
+        )
+
+        for line in format_stats(group):
+            logging.info(line, extra={"stream": "stdout"})
+
+        for finding in find_regressions(group):
+            logging.info(f"Regression: {finding}", extra={"stream": "stdout"})
+
+        logging.info("", extra={"stream": "stdout"})
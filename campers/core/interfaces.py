@@ -51,6 +51,17 @@ class ComputeProvider(Protocol):
         """
         ...
 
+    def interruption_watch_command(self) -> str:
+        """Return the command that waits on a spot instance for an interruption notice.
+
+        Returns
+        -------
+        str
+            Shell command run on the instance that prints the provider's
+            interruption notice as JSON and exits once one is issued
+        """
+        ...
+
     def stop_instance(self, instance_id: str) -> None:
         """Stop a running compute instance without terminating it.
 
@@ -91,6 +102,21 @@ class ComputeProvider(Protocol):
         """
         ...
 
+    def list_cache_volumes(self, region_filter: str | None = None) -> list[dict[str, Any]]:
+        """List persistent cache volumes that outlive instances.
+
+        Parameters
+        ----------
+        region_filter : str | None
+            Optional region to filter results
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            List of cache volume dictionaries
+        """
+        ...
+
     def find_instances_by_name_or_id(
         self, name_or_id: str, region_filter: str | None = None
     ) -> list[dict[str, Any]]:
@@ -206,6 +232,27 @@ class PricingProvider(Protocol):
         """
         ...
 
+    def get_spot_price(
+        self, instance_type: str, region: str, availability_zone: str | None = None
+    ) -> float | None:
+        """Get the current spot hourly price for an instance type.
+
+        Parameters
+        ----------
+        instance_type : str
+            Instance type identifier (e.g., 't3.micro')
+        region : str
+            Region identifier
+        availability_zone : str | None
+            Zone the instance runs in; the lowest price in the region if None
+
+        Returns
+        -------
+        float | None
+            Hourly price in USD, or None if not available
+        """
+        ...
+
     def get_storage_price(self, region: str) -> float:
         """Get monthly price per GB for storage in a region.
 
@@ -1,35 +1,108 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
 import queue
+import re
 import shlex
 import threading
 import time
 from collections.abc import Callable
-from datetime import datetime
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from campers.cli import apply_cli_overrides, normalize_ports_config
+import paramiko
+
+from campers.cli import (
+    apply_cli_overrides,
+    normalize_auto_forward_config,
+    normalize_ports_config,
+)
 from campers.constants import (
+    CACHE_VOLUME_MOUNT_TIMEOUT_SECONDS,
     CLEANUP_TIMEOUT_SECONDS,
+    DATASET_CONCURRENCY,
+    DATASET_PART_SIZE_BYTES,
+    DEFAULT_MARKET,
+    DEFAULT_PROVIDER,
     DEFAULT_SSH_USERNAME,
+    PULL_SCAN_INTERVAL_SECONDS,
+    SETUP_SCRIPT_MARKER_FILE,
+    SYNC_FLUSH_TIMEOUT_SECONDS,
     SYNC_STATUS_POLL_INTERVAL_SECONDS,
     SYNC_TIMEOUT,
 )
 from campers.core.config import ConfigLoader
+from campers.core.costs import record_transition
+from campers.core.history import append_run
 from campers.core.interfaces import ComputeProvider
+from campers.core.scheduler import Phase, PhaseScheduler, format_critical_path
+from campers.core.tracing import PHASE_CATEGORY, span
+from campers.core.utils import normalize_cache_volume_config
+from campers.providers import get_provider
 from campers.services.ansible import AnsibleManager
+from campers.services.datasets import DatasetManager
 from campers.services.portforward import PortForwardManager, PortInUseError, is_port_in_use
-from campers.services.ssh import SSHManager, get_ssh_connection_info
-from campers.services.sync import MutagenManager
+from campers.services.ssh import (
+    SSHManager,
+    get_ssh_connection_info,
+    read_remote_json,
+    write_remote_json,
+)
+from campers.services.sync import MutagenManager, build_host_alias, build_session_fingerprint
 from campers.session import SessionInfo, SessionManager
-from campers.utils import generate_instance_name, status_spinner
+from campers.utils import generate_instance_name, get_user_identity, status_spinner
 
 logger = logging.getLogger(__name__)
 
+ENV_REFERENCE_PATTERN = re.compile(r"\$\{?([A-Za-z_][A-Za-z0-9_]*)")
+
+
+def setup_script_hash(script: str, env_vars: dict[str, str]) -> str:
+    """Compute the hash deciding whether setup_script must run again.
+
+    Parameters
+    ----------
+    script : str
+        Setup script with config variables already interpolated
+    env_vars : dict[str, str]
+        Environment variables forwarded to the instance
+
+    Returns
+    -------
+    str
+        Hex SHA-256 digest of the script and of the forwarded values of the
+        environment variables it references as $NAME or ${NAME}
+    """
+    referenced = sorted(set(ENV_REFERENCE_PATTERN.findall(script)))
+    payload = json.dumps([script, [[name, env_vars.get(name)] for name in referenced]])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def parse_interruption_notice(output: str) -> dict[str, Any] | None:
+    """Parse the notice printed by a compute provider's interruption watch command.
+
+    Parameters
+    ----------
+    output : str
+        Output of ComputeProvider.interruption_watch_command
+
+    Returns
+    -------
+    dict[str, Any] | None
+        Dictionary with 'action' (e.g. 'stop' or 'terminate') and 'time'
+        (aware datetime), or None if the output holds no valid notice
+    """
+    try:
+        notice = json.loads(output)
+        at = datetime.fromisoformat(notice["time"]).astimezone(UTC)
+        return {"action": notice["action"], "time": at}
+    except (ValueError, TypeError, KeyError, AttributeError):
+        return None
+
 
 class RunExecutor:
     """Orchestrates the run command execution flow.
@@ -85,6 +158,108 @@ class RunExecutor:
         self.mutagen_manager_factory = mutagen_manager_factory or MutagenManager
         self.portforward_manager_factory = portforward_manager_factory or PortForwardManager
         self.merged_config: dict[str, Any] | None = None
+        self.milestones: dict[str, float] = {}
+        self._run_started: float | None = None
+        self._run_started_at: datetime | None = None
+        self._scheduler: PhaseScheduler | None = None
+        self._ansible_mgr: AnsibleManager | None = None
+
+    def _stop_requested(self) -> bool:
+        """Return whether running phases should stop.
+
+        Returns
+        -------
+        bool
+            True once cleanup started or another phase of the run failed
+        """
+        if self.cleanup_in_progress_getter():
+            return True
+
+        return self._scheduler is not None and self._scheduler.stopping.is_set()
+
+    def _stop_ansible(self) -> None:
+        """Terminate the playbook of a running Ansible phase."""
+        if self._ansible_mgr is not None:
+            self._ansible_mgr.stop()
+
+    def _mark_milestone(self, name: str) -> None:
+        """Record the first time the current run reaches a milestone.
+
+        Parameters
+        ----------
+        name : str
+            One of RUN_MILESTONES
+        """
+        if self._run_started is not None:
+            self.milestones.setdefault(name, round(time.monotonic() - self._run_started, 2))
+
+    def _record_run_history(
+        self,
+        merged_config: dict[str, Any],
+        instance_details: dict[str, Any],
+        completed: bool,
+    ) -> None:
+        """Append the run's milestones to the local run history.
+
+        Parameters
+        ----------
+        merged_config : dict[str, Any]
+            Merged configuration of the run
+        instance_details : dict[str, Any]
+            Details of the instance the run used
+        completed : bool
+            Whether the run finished all its phases
+        """
+        if os.environ.get("CAMPERS_DISABLE_HISTORY") == "1" or self._run_started is None:
+            return
+
+        if completed:
+            outcome = "completed"
+        elif self.cleanup_in_progress_getter():
+            outcome = "cancelled"
+        else:
+            outcome = "failed"
+
+        record = {
+            "started_at": self._run_started_at.isoformat(timespec="seconds"),
+            "camp": merged_config.get("camp_name"),
+            "instance_type": merged_config.get("instance_type"),
+            "region": merged_config.get("region"),
+            "ami": instance_details.get("ami_id"),
+            "reused": bool(instance_details.get("reused")),
+            "outcome": outcome,
+            "total": round(time.monotonic() - self._run_started, 2) if completed else None,
+            "milestones": dict(self.milestones),
+        }
+
+        try:
+            append_run(record)
+        except OSError as e:
+            logging.warning("Failed to record run history: %s", e)
+
+    def _record_running_transition(
+        self, merged_config: dict[str, Any], instance_details: dict[str, Any]
+    ) -> None:
+        """Record in the cost ledger that the run's instance started running.
+
+        Parameters
+        ----------
+        merged_config : dict[str, Any]
+            Merged configuration of the run
+        instance_details : dict[str, Any]
+            Details of the launched or restarted instance
+        """
+        record_transition(
+            instance_details["instance_id"],
+            "running",
+            at=instance_details.get("launch_time"),
+            camp=merged_config.get("camp_name"),
+            owner=get_user_identity(),
+            region=merged_config.get("region"),
+            instance_type=merged_config.get("instance_type"),
+            volume_size_gb=merged_config.get("disk_size"),
+            market=instance_details.get("market"),
+        )
 
     def _send_queue_update(self, update_queue: queue.Queue | None, update_data: dict) -> None:
         """Send update to queue, handling overflow gracefully.
@@ -118,6 +293,8 @@ class RunExecutor:
         update_queue: queue.Queue | None = None,
         verbose: bool = False,
         cleanup_resources_callback: Any = None,
+        reprovision: bool = False,
+        rerun_setup: bool = False,
     ) -> dict[str, Any] | str:
         """Execute the run command with all orchestration logic.
 
@@ -149,12 +326,25 @@ class RunExecutor:
             Enable verbose logging
         cleanup_resources_callback : Any
             Callback function for cleanup
+        reprovision : bool
+            Run Ansible playbooks even if unchanged since their last run
+        rerun_setup : bool
+            Run setup_script even if unchanged since its last run
 
         Returns
         -------
         dict[str, Any] | str
             Instance details (dict or JSON string)
         """
+        self._run_started = time.monotonic()
+        self._run_started_at = datetime.now(UTC)
+        self._scheduler = None
+        self._ansible_mgr = None
+        self.milestones = {}
+        merged_config: dict[str, Any] | None = None
+        instance_details: dict[str, Any] | None = None
+        completed = False
+
         try:
             logging.debug(f"execute: starting with tui_mode={tui_mode}, camp_name={camp_name}")
             campers_config = os.environ.get("CAMPERS_CONFIG")
@@ -162,36 +352,42 @@ class RunExecutor:
             logging.debug(f"execute: env vars - CAMPERS_CONFIG={campers_config}")
             logging.debug(f"execute: env vars - AWS_ENDPOINT_URL={aws_endpoint}")
             logging.debug("execute: phase_config_validation starting")
-            merged_config = self._phase_config_validation(
-                verbose,
-                camp_name,
-                command,
-                instance_type,
-                disk_size,
-                region,
-                port,
-                include_vcs,
-                ignore,
-                update_queue,
-            )
+            with span("config", PHASE_CATEGORY):
+                merged_config = self._phase_config_validation(
+                    verbose,
+                    camp_name,
+                    command,
+                    instance_type,
+                    disk_size,
+                    region,
+                    port,
+                    include_vcs,
+                    ignore,
+                    update_queue,
+                )
             logging.debug("execute: phase_config_validation completed")
             self.merged_config = merged_config
 
             logging.debug("execute: phase_instance_provision starting")
             mutagen_mgr = self.mutagen_manager_factory()
-            instance_details, compute_provider = self._phase_instance_provision(
-                merged_config, mutagen_mgr, update_queue
-            )
+            with span("provision", PHASE_CATEGORY):
+                instance_details, compute_provider = self._phase_instance_provision(
+                    merged_config, mutagen_mgr, update_queue
+                )
             logging.debug("execute: phase_instance_provision completed")
+            self._mark_milestone("running")
+            self._record_running_transition(merged_config, instance_details)
 
             need_ssh = (
                 merged_config.get("setup_script")
                 or merged_config.get("startup_script")
                 or merged_config.get("command")
+                or merged_config.get("datasets")
             )
             logging.debug(f"execute: need_ssh={need_ssh}")
 
             if not need_ssh:
+                completed = True
                 return self._format_output(instance_details, json_output)
 
             skip_ssh = os.environ.get("CAMPERS_SKIP_SSH_CONNECTION") == "1"
@@ -207,48 +403,105 @@ class RunExecutor:
                         time.sleep(0.1)
                 return instance_details
 
-            logging.debug("execute: phase_ssh_connection starting")
-            ssh_manager, ssh_host, ssh_port = self._phase_ssh_connection(
-                instance_details, merged_config, update_queue
-            )
-            logging.debug("execute: phase_ssh_connection completed")
+            session: dict[str, Any] = {}
 
-            if ssh_manager is None:
-                logging.debug("Cleanup in progress, aborting further operations")
-                return instance_details
+            def connect() -> None:
+                ssh_manager, ssh_host, ssh_port = self._phase_ssh_connection(
+                    instance_details, merged_config, update_queue
+                )
 
-            env_vars = ssh_manager.filter_environment_variables(merged_config.get("env_filter"))
+                if ssh_manager is None:
+                    logging.debug("Cleanup in progress, aborting further operations")
+                    return
 
-            logging.info(f"Forwarding {len(env_vars)} environment variables")
+                env_vars = ssh_manager.filter_environment_variables(merged_config.get("env_filter"))
+                logging.info(f"Forwarding {len(env_vars)} environment variables")
+                session.update(
+                    ssh_manager=ssh_manager, host=ssh_host, port=ssh_port, env_vars=env_vars
+                )
+                self._start_interruption_watch(
+                    instance_details, compute_provider, ssh_manager, update_queue
+                )
 
-            disable_mutagen = os.environ.get("CAMPERS_DISABLE_MUTAGEN") == "1"
-            logging.debug("execute: phase_file_sync starting")
-            self._phase_file_sync(
-                merged_config,
-                instance_details,
-                mutagen_mgr,
-                ssh_host,
-                ssh_port,
-                disable_mutagen,
-                update_queue,
-            )
-            logging.debug("execute: phase_file_sync completed")
+            def stage_datasets() -> None:
+                staging = self._start_dataset_staging(merged_config, session["ssh_manager"])
+                self._wait_for_dataset_staging(staging)
+
+            def sync_files() -> None:
+                self._phase_file_sync(
+                    merged_config,
+                    instance_details,
+                    mutagen_mgr,
+                    session["host"],
+                    session["port"],
+                    os.environ.get("CAMPERS_DISABLE_MUTAGEN") == "1",
+                    update_queue,
+                )
 
-            logging.debug("execute: phase_ansible_provisioning starting")
-            self._phase_ansible_provisioning(merged_config, instance_details, ssh_port)
-            logging.debug("execute: phase_ansible_provisioning completed")
+            def run_setup_script() -> None:
+                self.flush_file_sync(update_queue)
+                self._phase_setup_script(
+                    merged_config, session["ssh_manager"], session["env_vars"], rerun_setup
+                )
 
-            logging.debug("execute: phase_script_execution starting")
-            self._phase_script_execution(merged_config, instance_details, ssh_manager, env_vars)
-            logging.debug("execute: phase_script_execution completed")
+            def run_command() -> None:
+                self.flush_file_sync(update_queue)
+                self._phase_command_execution(
+                    merged_config, instance_details, session["ssh_manager"], session["env_vars"]
+                )
 
-            logging.debug("execute: phase_command_execution starting")
-            self._phase_command_execution(merged_config, instance_details, ssh_manager, env_vars)
-            logging.debug("execute: phase_command_execution completed")
+            scheduler = self._scheduler = PhaseScheduler(
+                [
+                    Phase("ssh", connect),
+                    Phase(
+                        "cache_volume",
+                        lambda: self._wait_for_cache_volume(merged_config, session["ssh_manager"]),
+                        ("ssh",),
+                    ),
+                    Phase("datasets", stage_datasets, ("cache_volume",)),
+                    Phase("file_sync", sync_files, ("cache_volume",)),
+                    Phase(
+                        "ansible",
+                        lambda: self._phase_ansible_provisioning(
+                            merged_config,
+                            instance_details,
+                            session["port"],
+                            session["ssh_manager"],
+                            reprovision,
+                        ),
+                        ("cache_volume",),
+                        stop=self._stop_ansible,
+                    ),
+                    Phase(
+                        "port_forwarding",
+                        lambda: self._phase_port_forwarding(merged_config, instance_details),
+                        ("ssh",),
+                    ),
+                    Phase("setup_script", run_setup_script, ("datasets", "file_sync", "ansible")),
+                    Phase(
+                        "startup_script",
+                        lambda: self._phase_startup_script(
+                            merged_config, session["ssh_manager"], session["env_vars"]
+                        ),
+                        ("setup_script",),
+                    ),
+                    Phase("command", run_command, ("startup_script", "port_forwarding")),
+                ],
+                cancelled=self.cleanup_in_progress_getter,
+            )
+
+            if not scheduler.run():
+                return instance_details
+
+            logging.info("Critical path: %s", format_critical_path(scheduler.critical_path()))
+            completed = True
 
             return self._format_output(instance_details, json_output)
 
         finally:
+            if merged_config is not None and instance_details is not None:
+                self._record_run_history(merged_config, instance_details, completed)
+
             with self.resources_lock:
                 has_resources = bool(self.resources)
 
@@ -338,6 +591,10 @@ class RunExecutor:
             )
 
         merged_config["ports"] = normalize_ports_config(merged_config.get("ports"))
+        merged_config["reverse_ports"] = normalize_ports_config(merged_config.get("reverse_ports"))
+        merged_config["auto_forward"] = normalize_auto_forward_config(
+            merged_config.get("auto_forward")
+        )
 
         if os.environ.get("CAMPERS_HARNESS_MANAGED") != "1":
             self._validate_ports_available(merged_config.get("ports"))
@@ -369,16 +626,16 @@ class RunExecutor:
         tuple[dict[str, Any], Any]
             Instance details and compute provider
         """
-        if self.cleanup_in_progress_getter():
+        if self._stop_requested():
             logging.info("No instance was created. Exiting Campers.")
             raise SystemExit(0)
 
         logging.info("Initializing cloud provider...")
 
-        if merged_config.get("sync_paths"):
+        if merged_config.get("sync_paths") or merged_config.get("pull_paths"):
             mutagen_mgr.check_mutagen_installed()
 
-        if self.cleanup_in_progress_getter():
+        if self._stop_requested():
             logging.info("No instance was created. Exiting Campers.")
             raise SystemExit(0)
 
@@ -446,12 +703,13 @@ class RunExecutor:
         try:
             ssh_manager.connect(max_retries=10)
             logging.info("SSH connection established")
+            self._mark_milestone("ssh_ready")
         except ConnectionError as e:
             error_msg = f"Failed to establish SSH connection after 10 attempts: {str(e)}"
             logging.error(error_msg)
             raise
 
-        if self.cleanup_in_progress_getter():
+        if self._stop_requested():
             logging.debug("Cleanup in progress, aborting further operations")
             return None, None, None
 
@@ -509,16 +767,30 @@ class RunExecutor:
         update_queue : queue.Queue | None
             TUI update queue
         """
-        sync_paths = merged_config.get("sync_paths")
-
-        if sync_paths:
-            for index in range(len(sync_paths)):
-                session_name = f"campers-{instance_details['unique_id']}-{index}"
-                mutagen_mgr.cleanup_orphaned_session(session_name)
+        sync_paths = merged_config.get("sync_paths") or []
+        pull_paths = merged_config.get("pull_paths") or []
+        host_alias = build_host_alias(instance_details["unique_id"])
+        resumable_sessions: set[str] = set()
+
+        if sync_paths or pull_paths:
+            candidate_names = [
+                f"campers-{instance_details['unique_id']}-{index}"
+                for index in range(len(sync_paths))
+            ] + [
+                f"campers-{instance_details['unique_id']}-pull-{index}"
+                for index in range(len(pull_paths))
+            ]
+
+            for session_name in candidate_names:
+                if instance_details.get("reused") and mutagen_mgr.session_exists(session_name):
+                    resumable_sessions.add(session_name)
+                else:
+                    mutagen_mgr.cleanup_orphaned_session(session_name)
 
             with self.resources_lock:
                 self.resources["mutagen_mgr"] = mutagen_mgr
                 self.resources["mutagen_session_names"] = []
+                self.resources["mutagen_pull_session_names"] = []
         else:
             self._send_queue_update(
                 update_queue,
@@ -554,7 +826,7 @@ class RunExecutor:
                 },
             )
         else:
-            if self.cleanup_in_progress_getter():
+            if self._stop_requested():
                 logging.debug("Cleanup in progress, aborting Mutagen sync")
                 return
 
@@ -571,11 +843,21 @@ class RunExecutor:
             session_names = []
 
             for index, sync_config in enumerate(sync_paths):
-                if self.cleanup_in_progress_getter():
+                if self._stop_requested():
                     logging.debug("Cleanup in progress, aborting Mutagen sync")
                     break
 
                 session_name = f"campers-{instance_details['unique_id']}-{index}"
+                username = merged_config.get("ssh_username", DEFAULT_SSH_USERNAME)
+                fingerprint = build_session_fingerprint(
+                    mode="sync",
+                    local=str(Path(sync_config["local"]).expanduser().resolve()),
+                    remote=sync_config["remote"],
+                    username=username,
+                    ssh_port=ssh_port,
+                    ignore=merged_config.get("ignore"),
+                    include_vcs=merged_config.get("include_vcs", False),
+                )
 
                 logging.debug(
                     "Mutagen sync details - local: %s, remote: %s, host: %s",
@@ -584,20 +866,27 @@ class RunExecutor:
                     instance_details["public_ip"],
                 )
 
-                logging.debug("Creating Mutagen sync session: %s", session_name)
-
-                mutagen_mgr.create_sync_session(
-                    session_name=session_name,
-                    local_path=sync_config["local"],
-                    remote_path=sync_config["remote"],
-                    host=ssh_host,
-                    key_file=instance_details["key_file"],
-                    username=merged_config.get("ssh_username", DEFAULT_SSH_USERNAME),
-                    ignore_patterns=merged_config.get("ignore"),
-                    include_vcs=merged_config.get("include_vcs", False),
-                    ssh_wrapper_dir=campers_dir,
-                    ssh_port=ssh_port,
-                )
+                if session_name in resumable_sessions and self._resume_sync_session(
+                    mutagen_mgr, session_name, host_alias, ssh_host, fingerprint
+                ):
+                    logging.info("Resumed existing Mutagen sync session: %s", session_name)
+                else:
+                    logging.debug("Creating Mutagen sync session: %s", session_name)
+
+                    mutagen_mgr.create_sync_session(
+                        session_name=session_name,
+                        local_path=sync_config["local"],
+                        remote_path=sync_config["remote"],
+                        host=ssh_host,
+                        key_file=instance_details["key_file"],
+                        username=username,
+                        ignore_patterns=merged_config.get("ignore"),
+                        include_vcs=merged_config.get("include_vcs", False),
+                        ssh_wrapper_dir=campers_dir,
+                        ssh_port=ssh_port,
+                        host_alias=host_alias,
+                        fingerprint=fingerprint,
+                    )
 
                 logging.info(
                     "Waiting for Mutagen sync session %s to reach watching state...", session_name
@@ -607,7 +896,7 @@ class RunExecutor:
                 sync_complete = False
 
                 while time.time() - start_time < SYNC_TIMEOUT and not sync_complete:
-                    if self.cleanup_in_progress_getter():
+                    if self._stop_requested():
                         logging.info("Cleanup requested, aborting file sync polling")
                         break
 
@@ -627,7 +916,7 @@ class RunExecutor:
                 if sync_complete:
                     logging.info("Mutagen sync session %s reached watching state", session_name)
                     session_names.append(session_name)
-                elif self.cleanup_in_progress_getter():
+                elif self._stop_requested():
                     logging.debug("Cleanup in progress, skipping remaining sync sessions")
                     break
                 else:
@@ -639,16 +928,456 @@ class RunExecutor:
             with self.resources_lock:
                 self.resources["mutagen_session_names"] = session_names
 
+            if session_names:
+                self._mark_milestone("sync_watching")
+
+            if pull_paths and not self._stop_requested():
+                self._start_pull_sessions(
+                    merged_config,
+                    instance_details,
+                    mutagen_mgr,
+                    ssh_host,
+                    ssh_port,
+                    host_alias,
+                    resumable_sessions,
+                )
+
             self._send_queue_update(
                 update_queue,
                 {"type": "mutagen_status", "payload": {"status_text": "idle"}},
             )
 
+    def _start_pull_sessions(
+        self,
+        merged_config: dict[str, Any],
+        instance_details: dict[str, Any],
+        mutagen_mgr: MutagenManager,
+        ssh_host: str,
+        ssh_port: int,
+        host_alias: str,
+        resumable_sessions: set[str],
+    ) -> None:
+        """Start one-way sessions pulling remote output directories back locally.
+
+        Parameters
+        ----------
+        merged_config : dict[str, Any]
+            Merged configuration containing pull_paths
+        instance_details : dict[str, Any]
+            Instance details
+        mutagen_mgr : MutagenManager
+            Mutagen manager instance
+        ssh_host : str
+            SSH host address
+        ssh_port : int
+            SSH port
+        host_alias : str
+            Stable SSH host alias of the instance
+        resumable_sessions : set[str]
+            Names of paused sessions that can be resumed
+
+        Notes
+        -----
+        Pull sessions are not waited on: they replicate in the background so
+        large output directories never delay scripts or commands.
+        """
+        campers_dir = os.environ.get("CAMPERS_DIR", str(Path.home() / ".campers"))
+
+        for index, pull_config in enumerate(merged_config["pull_paths"]):
+            if self._stop_requested():
+                logging.debug("Cleanup in progress, aborting Mutagen pull sessions")
+                break
+
+            session_name = f"campers-{instance_details['unique_id']}-pull-{index}"
+            username = merged_config.get("ssh_username", DEFAULT_SSH_USERNAME)
+            scan_interval = pull_config.get("scan_interval", PULL_SCAN_INTERVAL_SECONDS)
+            fingerprint = build_session_fingerprint(
+                mode="pull",
+                local=str(Path(pull_config["local"]).expanduser().resolve()),
+                remote=pull_config["remote"],
+                username=username,
+                ssh_port=ssh_port,
+                ignore=pull_config.get("ignore"),
+                max_file_size=pull_config.get("max_file_size"),
+                scan_interval=scan_interval,
+            )
+
+            if session_name in resumable_sessions and self._resume_sync_session(
+                mutagen_mgr, session_name, host_alias, ssh_host, fingerprint
+            ):
+                logging.info("Resumed existing Mutagen pull session: %s", session_name)
+            else:
+                logging.debug("Creating Mutagen pull session: %s", session_name)
+
+                mutagen_mgr.create_pull_session(
+                    session_name=session_name,
+                    remote_path=pull_config["remote"],
+                    local_path=pull_config["local"],
+                    host=ssh_host,
+                    key_file=instance_details["key_file"],
+                    username=username,
+                    ignore_patterns=pull_config.get("ignore"),
+                    max_file_size=pull_config.get("max_file_size"),
+                    scan_interval=scan_interval,
+                    ssh_wrapper_dir=campers_dir,
+                    ssh_port=ssh_port,
+                    host_alias=host_alias,
+                    fingerprint=fingerprint,
+                )
+
+            logging.info(
+                "Pulling %s back to %s in the background",
+                pull_config["remote"],
+                pull_config["local"],
+            )
+
+            with self.resources_lock:
+                self.resources.setdefault("mutagen_pull_session_names", []).append(session_name)
+
+    def flush_file_sync(self, update_queue: queue.Queue | None = None) -> float | None:
+        """Wait until all local changes have reached the remote instance.
+
+        Acts as a barrier before running scripts or commands so they always
+        see the latest local tree. Also triggered on demand from the TUI.
+
+        Parameters
+        ----------
+        update_queue : queue.Queue | None
+            TUI update queue, defaults to the executor's queue
+
+        Returns
+        -------
+        float | None
+            Time in seconds spent flushing, or None if no sessions are active
+
+        Notes
+        -----
+        The total wait is bounded by SYNC_FLUSH_TIMEOUT_SECONDS. A session that
+        fails to flush is logged and skipped rather than aborting the run.
+        """
+        if update_queue is None:
+            update_queue = self.update_queue
+
+        with self.resources_lock:
+            mutagen_mgr = self.resources.get("mutagen_mgr")
+            session_names = list(self.resources.get("mutagen_session_names") or [])
+
+        if mutagen_mgr is None or not session_names or self.cleanup_in_progress_getter():
+            return None
+
+        self._send_queue_update(
+            update_queue,
+            {"type": "mutagen_status", "payload": {"status_text": "flushing"}},
+        )
+
+        start_time = time.monotonic()
+        deadline = start_time + SYNC_FLUSH_TIMEOUT_SECONDS
+
+        for session_name in session_names:
+            remaining = deadline - time.monotonic()
+
+            if remaining <= 0:
+                logging.warning(
+                    "Mutagen flush exceeded %s seconds, continuing without full barrier",
+                    SYNC_FLUSH_TIMEOUT_SECONDS,
+                )
+                break
+
+            try:
+                mutagen_mgr.flush_session(session_name, timeout=remaining)
+            except RuntimeError as e:
+                logging.warning("Mutagen flush failed for %s: %s", session_name, e)
+
+        elapsed = time.monotonic() - start_time
+        logging.info("File sync flushed in %.2fs", elapsed)
+
+        self._send_queue_update(
+            update_queue,
+            {
+                "type": "mutagen_status",
+                "payload": {
+                    "status_text": f"idle (flushed in {elapsed:.2f}s)",
+                    "flush_seconds": elapsed,
+                },
+            },
+        )
+
+        return elapsed
+
+    def _start_interruption_watch(
+        self,
+        instance_details: dict[str, Any],
+        compute_provider: ComputeProvider,
+        ssh_manager: Any,
+        update_queue: queue.Queue | None,
+    ) -> threading.Thread | None:
+        """Wait in a daemon thread for a spot instance's interruption notice.
+
+        The watch command polls for the notice on the instance itself, so the
+        thread holds one idle SSH channel instead of issuing a remote call per
+        poll. It ends with the SSH connection.
+
+        Parameters
+        ----------
+        instance_details : dict[str, Any]
+            Details of the launched or restarted instance
+        compute_provider : ComputeProvider
+            Compute provider supplying the watch command
+        ssh_manager : Any
+            Connected SSH manager
+        update_queue : queue.Queue | None
+            Queue for TUI updates
+
+        Returns
+        -------
+        threading.Thread | None
+            The watch thread, or None for instances that cannot be interrupted
+        """
+        if instance_details.get("market") != "spot":
+            return None
+
+        command = compute_provider.interruption_watch_command()
+
+        def watch() -> None:
+            try:
+                _exit_code, output = ssh_manager.execute_with_input(
+                    command, "", line_callback=lambda _line: None
+                )
+            except (RuntimeError, OSError, EOFError, paramiko.SSHException) as e:
+                logging.debug("Spot interruption watch ended: %s", e)
+                return
+
+            notice = parse_interruption_notice(output)
+
+            if notice is not None and not self.cleanup_in_progress_getter():
+                self._handle_interruption_notice(notice, update_queue)
+
+        thread = threading.Thread(target=watch, name="spot-interruption-watch", daemon=True)
+        thread.start()
+        return thread
+
+    def _handle_interruption_notice(
+        self, notice: dict[str, Any], update_queue: queue.Queue | None
+    ) -> None:
+        """Warn about an upcoming spot interruption and flush file sync.
+
+        Parameters
+        ----------
+        notice : dict[str, Any]
+            Notice from parse_interruption_notice
+        update_queue : queue.Queue | None
+            Queue for TUI updates
+        """
+        at = notice["time"].astimezone().strftime("%H:%M:%S")
+        message = f"Spot interruption: instance will {notice['action']} at {at}"
+        logging.warning("%s, flushing file sync", message)
+        self._send_queue_update(
+            update_queue,
+            {
+                "type": "status_update",
+                "payload": {"status": f"interrupted at {at}", "notification": message},
+            },
+        )
+        self.flush_file_sync(update_queue)
+
+    def _resume_sync_session(
+        self,
+        mutagen_mgr: MutagenManager,
+        session_name: str,
+        host_alias: str,
+        ssh_host: str,
+        fingerprint: str,
+    ) -> bool:
+        """Resume a sync session paused when the instance was last stopped.
+
+        Parameters
+        ----------
+        mutagen_mgr : MutagenManager
+            Mutagen manager instance
+        session_name : str
+            Name of the paused sync session
+        host_alias : str
+            Stable SSH host alias the session was created with
+        ssh_host : str
+            Current SSH host address of the instance
+        fingerprint : str
+            Fingerprint of the endpoints the session should have
+
+        Returns
+        -------
+        bool
+            True if the session was resumed, False if it must be recreated
+
+        Notes
+        -----
+        Only the alias HostName is rewritten, so Mutagen keeps its cached
+        scan state and reconciles just the changes made while stopped. A
+        session whose endpoints no longer match the configuration, or that
+        cannot be resumed, is terminated so that a fresh one can be created
+        in its place.
+        """
+        if not mutagen_mgr.session_matches(session_name, fingerprint):
+            logging.info("Sync configuration of %s changed, recreating it", session_name)
+            mutagen_mgr.cleanup_orphaned_session(session_name)
+            return False
+
+        if not mutagen_mgr.update_host_address(host_alias, ssh_host):
+            logging.debug("SSH alias %s missing, recreating %s", host_alias, session_name)
+            mutagen_mgr.cleanup_orphaned_session(session_name)
+            return False
+
+        try:
+            mutagen_mgr.resume_session(session_name)
+        except RuntimeError as e:
+            logging.warning("Could not resume Mutagen session %s: %s", session_name, e)
+            mutagen_mgr.cleanup_orphaned_session(session_name)
+            return False
+
+        return True
+
+    def _wait_for_cache_volume(
+        self, merged_config: dict[str, Any], ssh_manager: SSHManager
+    ) -> None:
+        """Wait until the persistent cache volume is mounted on the instance.
+
+        The volume is attached after launch and mounted by the instance's boot
+        script, which may still be running when SSH first becomes available.
+
+        Parameters
+        ----------
+        merged_config : dict[str, Any]
+            Merged configuration containing cache_volume
+        ssh_manager : SSHManager
+            Connected SSH manager
+        """
+        cache_config = normalize_cache_volume_config(merged_config.get("cache_volume"))
+
+        if not cache_config or self._stop_requested():
+            return
+
+        mount_point = cache_config["mount"]
+        wait_loop = f"until mountpoint -q {shlex.quote(mount_point)}; do sleep 1; done"
+        exit_code = ssh_manager.execute_command(
+            f"timeout {CACHE_VOLUME_MOUNT_TIMEOUT_SECONDS} sh -c {shlex.quote(wait_loop)}"
+        )
+
+        if exit_code == 0:
+            logging.info("Cache volume mounted at %s", mount_point)
+        else:
+            logging.warning("Cache volume is not mounted at %s, continuing without it", mount_point)
+
+    def _start_dataset_staging(
+        self,
+        merged_config: dict[str, Any],
+        ssh_manager: SSHManager,
+    ) -> dict[str, Any] | None:
+        """Start downloading configured datasets on the instance in the background.
+
+        Staging uses its own SSH connection so it runs concurrently with file
+        sync and Ansible provisioning instead of delaying them.
+
+        Parameters
+        ----------
+        merged_config : dict[str, Any]
+            Merged configuration containing datasets
+        ssh_manager : SSHManager
+            Connected SSH manager whose connection parameters are reused
+
+        Returns
+        -------
+        dict[str, Any] | None
+            Staging state with thread, ssh_manager, summary and error keys, or
+            None if no datasets are configured
+        """
+        datasets = merged_config.get("datasets")
+
+        if not datasets or self._stop_requested():
+            return None
+
+        provider = get_provider(merged_config.get("provider", DEFAULT_PROVIDER))
+        planner_class = provider["dataset_planner"]()
+        dataset_mgr = DatasetManager(planner_class(region=merged_config["region"]))
+
+        staging_ssh = self.ssh_manager_factory(
+            host=ssh_manager.host,
+            key_file=ssh_manager.key_file,
+            username=ssh_manager.username,
+            port=ssh_manager.port,
+        )
+        staging: dict[str, Any] = {"ssh_manager": staging_ssh, "summary": None, "error": None}
+
+        def run_staging() -> None:
+            try:
+                staging_ssh.connect(max_retries=3)
+                staging["summary"] = dataset_mgr.stage(
+                    staging_ssh,
+                    datasets,
+                    concurrency=merged_config.get("dataset_concurrency", DATASET_CONCURRENCY),
+                    part_size=DATASET_PART_SIZE_BYTES,
+                )
+            except Exception as e:
+                staging["error"] = e
+            finally:
+                staging_ssh.close()
+
+        logging.info("Staging %d dataset(s) on the instance in the background", len(datasets))
+        staging["thread"] = threading.Thread(
+            target=run_staging, name="campers-datasets", daemon=True
+        )
+        staging["thread"].start()
+
+        return staging
+
+    def _wait_for_dataset_staging(self, staging: dict[str, Any] | None) -> None:
+        """Wait for background dataset staging before scripts run.
+
+        Parameters
+        ----------
+        staging : dict[str, Any] | None
+            Staging state returned by _start_dataset_staging
+
+        Raises
+        ------
+        RuntimeError
+            If any dataset failed to stage
+        """
+        if staging is None:
+            return
+
+        thread = staging["thread"]
+
+        while thread.is_alive():
+            if self._stop_requested():
+                logging.debug("Cleanup in progress, aborting dataset staging")
+                staging["ssh_manager"].close()
+                return
+
+            thread.join(timeout=SYNC_STATUS_POLL_INTERVAL_SECONDS)
+
+        error = staging["error"]
+
+        if error is not None:
+            if self._stop_requested():
+                return
+
+            raise RuntimeError(f"Dataset staging failed: {error}") from error
+
+        summary = staging["summary"]
+        logging.info(
+            "Datasets staged: %d downloaded (%.1f MB), %d unchanged, in %.1fs",
+            summary["downloaded"],
+            summary["bytes"] / (1024 * 1024),
+            summary["skipped"],
+            summary["seconds"],
+        )
+
     def _phase_ansible_provisioning(
         self,
         merged_config: dict[str, Any],
         instance_details: dict[str, Any],
         ssh_port: int,
+        ssh_manager: Any = None,
+        reprovision: bool = False,
     ) -> None:
         """Phase 5: Execute Ansible playbooks.
 
@@ -660,12 +1389,16 @@ class RunExecutor:
             Instance details
         ssh_port : int
             SSH port
+        ssh_manager : Any
+            SSH manager used to read and record playbook markers
+        reprovision : bool
+            Run playbooks even if unchanged since their last run
         """
         playbook_refs = self._get_playbook_references(merged_config)
         if not playbook_refs:
             return
 
-        if self.cleanup_in_progress_getter():
+        if self._stop_requested():
             logging.debug("Cleanup in progress, aborting Ansible playbooks")
             return
 
@@ -678,17 +1411,45 @@ class RunExecutor:
 
         logging.info(f"Running Ansible playbook(s): {', '.join(playbook_refs)}")
 
-        ansible_mgr = AnsibleManager()
+        ansible_mgr = self._ansible_mgr = AnsibleManager()
         try:
-            ansible_mgr.execute_playbooks(
+            summary = ansible_mgr.execute_playbooks(
                 playbook_names=playbook_refs,
                 playbooks_config=playbooks_config,
                 instance_ip=instance_details["public_ip"],
                 ssh_key_file=instance_details["key_file"],
                 ssh_username=merged_config.get("ssh_username", DEFAULT_SSH_USERNAME),
                 ssh_port=ssh_port if ssh_port else 22,
+                ssh_manager=ssh_manager,
+                reprovision=reprovision,
+                ansible_settings=merged_config.get("ansible"),
+                cache_key=instance_details.get("instance_id"),
+                progress_callback=lambda progress: self._send_queue_update(
+                    self.update_queue, {"type": "ansible_progress", "payload": progress}
+                ),
             )
+
+            if summary["skipped"]:
+                logging.info(
+                    "Skipped unchanged playbook(s): %s (saved ~%.0fs, use --reprovision to rerun)",
+                    ", ".join(summary["skipped"]),
+                    summary["seconds_saved"],
+                )
+
+            if summary["slowest_tasks"]:
+                logging.info("Slowest Ansible tasks:")
+
+                for timing in summary["slowest_tasks"]:
+                    logging.info(
+                        "  %6.1fs  %s: %s [%s]",
+                        timing.seconds,
+                        timing.playbook,
+                        timing.task,
+                        timing.host,
+                    )
+
             logging.info("Ansible playbook(s) completed successfully")
+            self._mark_milestone("ansible_done")
         except RuntimeError as e:
             logging.error(f"Ansible execution failed: {e}")
             raise
@@ -696,45 +1457,96 @@ class RunExecutor:
             logging.error(f"Ansible execution failed: {e}")
             raise RuntimeError(f"Ansible playbook execution failed: {e}") from e
 
-    def _phase_script_execution(
+    def _phase_setup_script(
         self,
         merged_config: dict[str, Any],
-        instance_details: dict[str, Any],
         ssh_manager: Any,
         env_vars: dict[str, str],
+        rerun_setup: bool = False,
     ) -> None:
-        """Phase 6: Execute setup and startup scripts.
+        """Phase 6: Execute the setup script.
+
+        The setup script is skipped when the marker recorded on the instance
+        after its last successful run matches setup_script_hash().
 
         Parameters
         ----------
         merged_config : dict[str, Any]
             Merged configuration
-        instance_details : dict[str, Any]
-            Instance details
         ssh_manager : Any
             SSH manager instance
         env_vars : dict[str, str]
             Environment variables to forward
+        rerun_setup : bool
+            Run setup_script even if unchanged since its last run
         """
-        if merged_config.get("setup_script", "").strip():
-            if self.cleanup_in_progress_getter():
-                logging.debug("Cleanup in progress, aborting setup_script")
-                return
+        if not merged_config.get("setup_script", "").strip():
+            return
 
-            logging.info("Running setup_script...")
+        if self._stop_requested():
+            logging.debug("Cleanup in progress, aborting setup_script")
+            return
 
-            setup_with_env = ssh_manager.build_command_with_env(
-                merged_config["setup_script"], env_vars
+        script = merged_config["setup_script"]
+        content_hash = setup_script_hash(script, env_vars)
+        marker = read_remote_json(
+            ssh_manager,
+            SETUP_SCRIPT_MARKER_FILE,
+            "Could not read setup_script marker, running it",
+        )
+
+        if not rerun_setup and marker.get("hash") == content_hash:
+            logging.info(
+                "Setup script unchanged since last run, skipping "
+                "(saved ~%.0fs, use --rerun-setup to rerun)",
+                marker.get("seconds", 0.0),
             )
-            exit_code = ssh_manager.execute_command(setup_with_env)
+            return
 
-            if exit_code != 0:
-                raise RuntimeError(f"Setup script failed with exit code: {exit_code}")
+        logging.info("Running setup_script...")
+
+        start = time.monotonic()
+        setup_with_env = ssh_manager.build_command_with_env(script, env_vars)
+        exit_code = ssh_manager.execute_command(setup_with_env)
+
+        if exit_code != 0:
+            raise RuntimeError(f"Setup script failed with exit code: {exit_code}")
 
-            logging.info("Setup script completed successfully")
+        seconds = time.monotonic() - start
+        write_remote_json(
+            ssh_manager,
+            SETUP_SCRIPT_MARKER_FILE,
+            {"hash": content_hash, "seconds": round(seconds, 1)},
+            "Could not record setup_script marker",
+        )
+        logging.info("Setup script completed successfully in %.1fs", seconds)
 
-        if merged_config.get("ports"):
-            if self.cleanup_in_progress_getter():
+    def _phase_port_forwarding(
+        self,
+        merged_config: dict[str, Any],
+        instance_details: dict[str, Any],
+    ) -> None:
+        """Phase 7: Start forwarding ports over a dedicated SSH connection.
+
+        Parameters
+        ----------
+        merged_config : dict[str, Any]
+            Merged configuration
+        instance_details : dict[str, Any]
+            Instance details
+
+        Raises
+        ------
+        RuntimeError
+            If port forwarding is configured but cannot be started
+        """
+        if (
+            merged_config.get("ports")
+            or merged_config.get("reverse_ports")
+            or merged_config.get("socks_proxy")
+            or merged_config.get("auto_forward")
+        ):
+            if self._stop_requested():
                 logging.debug("Cleanup in progress, aborting port forwarding")
                 return
 
@@ -750,19 +1562,34 @@ class RunExecutor:
                     instance_details["key_file"],
                 )
 
+                ports = merged_config["ports"]
+
+                def publish_status(payload: dict[str, Any]) -> None:
+                    self._send_queue_update(
+                        self.update_queue,
+                        {
+                            "type": "portforward_status",
+                            "payload": {"ports": list(portforward_mgr.ports), **payload},
+                        },
+                    )
+
                 portforward_mgr.create_tunnels(
-                    ports=merged_config["ports"],
+                    ports=ports,
                     host=pf_info.host,
                     key_file=pf_info.key_file,
                     username=merged_config.get("ssh_username", DEFAULT_SSH_USERNAME),
                     ssh_port=pf_info.port,
+                    status_callback=publish_status,
+                    auto_forward=merged_config.get("auto_forward"),
+                    reverse_ports=merged_config["reverse_ports"],
+                    socks_proxy=merged_config.get("socks_proxy"),
                 )
 
                 self._send_queue_update(
                     self.update_queue,
                     {
                         "type": "portforward_status",
-                        "payload": {"ports": merged_config["ports"], "status": "active"},
+                        "payload": {"ports": ports, "status": "active"},
                     },
                 )
             except RuntimeError as e:
@@ -771,8 +1598,25 @@ class RunExecutor:
                     self.resources.pop("portforward_mgr", None)
                 raise RuntimeError(f"Port forwarding is configured but failed: {e}") from e
 
+    def _phase_startup_script(
+        self,
+        merged_config: dict[str, Any],
+        ssh_manager: Any,
+        env_vars: dict[str, str],
+    ) -> None:
+        """Phase 8: Execute the startup script in the first synced directory.
+
+        Parameters
+        ----------
+        merged_config : dict[str, Any]
+            Merged configuration
+        ssh_manager : Any
+            SSH manager instance
+        env_vars : dict[str, str]
+            Environment variables to forward
+        """
         if merged_config.get("startup_script"):
-            if self.cleanup_in_progress_getter():
+            if self._stop_requested():
                 logging.debug("Cleanup in progress, aborting startup_script")
                 return
 
@@ -802,7 +1646,7 @@ class RunExecutor:
         ssh_manager: Any,
         env_vars: dict[str, str],
     ) -> None:
-        """Phase 7: Execute final command.
+        """Phase 9: Execute final command.
 
         Parameters
         ----------
@@ -818,12 +1662,13 @@ class RunExecutor:
         if not merged_config.get("command"):
             return
 
-        if self.cleanup_in_progress_getter():
+        if self._stop_requested():
             logging.debug("Cleanup in progress, aborting command execution")
             return
 
         cmd = merged_config["command"]
         logging.info("Executing command: %s", cmd)
+        self._mark_milestone("command_start")
 
         if merged_config.get("sync_paths"):
             working_dir = merged_config["sync_paths"][0]["remote"]
@@ -911,6 +1756,16 @@ class RunExecutor:
             except Exception as e:
                 logger.debug("Failed to get volume size for drift check: %s", e)
 
+        configured_market = config.get("market", DEFAULT_MARKET)
+        actual_market = existing_instance.get("market")
+
+        if (
+            actual_market
+            and configured_market != "spot-with-fallback"
+            and configured_market != actual_market
+        ):
+            drifts.append(f"market: config={configured_market}, actual={actual_market}")
+
         if drifts:
             drift_details = ", ".join(drifts)
             logging.warning(
@@ -997,6 +1852,7 @@ class RunExecutor:
             if state == "stopped":
                 logging.info("Found stopped instance %s, starting...", instance_id)
 
+                self._mark_milestone("launch")
                 started_details = compute_provider.start_instance(instance_id)
                 new_ip = started_details.get("public_ip")
                 logger.info(f"Instance started. New IP: {new_ip}")
@@ -1026,6 +1882,7 @@ class RunExecutor:
 
         logging.info("Creating new instance: %s", instance_name)
 
+        self._mark_milestone("launch")
         instance_details = compute_provider.launch_instance(
             config=config, instance_name=instance_name
         )
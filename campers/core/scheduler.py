@@ -0,0 +1,311 @@
+"""Run interdependent phases concurrently in dependency order."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from campers.constants import PHASE_POLL_INTERVAL_SECONDS, PHASE_STOP_TIMEOUT_SECONDS
+from campers.core.tracing import PHASE_CATEGORY, span
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Phase:
+    """A unit of work scheduled by PhaseScheduler.
+
+    Attributes
+    ----------
+    name : str
+        Unique phase name
+    run : Callable[[], None]
+        Work to perform; an exception aborts the whole schedule
+    depends_on : tuple[str, ...]
+        Names of the phases that must complete before this one starts
+    stop : Callable[[], None] | None
+        Called from the scheduler thread to interrupt the phase while it is
+        running, for work that does not check PhaseScheduler.stopping
+    """
+
+    name: str
+    run: Callable[[], None]
+    depends_on: tuple[str, ...] = ()
+    stop: Callable[[], None] | None = None
+
+
+@dataclass
+class PhaseTiming:
+    """Start and end of a completed phase.
+
+    Attributes
+    ----------
+    name : str
+        Phase name
+    start : float
+        Seconds since the schedule started
+    end : float
+        Seconds since the schedule started
+    """
+
+    name: str
+    start: float
+    end: float
+
+    @property
+    def duration(self) -> float:
+        """Return the phase wall time in seconds."""
+        return self.end - self.start
+
+
+class PhaseScheduler:
+    """Run phases as soon as all of their dependencies have completed.
+
+    Phases whose dependencies are met run concurrently in worker threads. A
+    phase that is the only one runnable while nothing else is running runs in
+    the calling thread, so a purely sequential graph behaves like plain calls.
+    Once a phase fails or the schedule is cancelled, the phases still running
+    are stopped and joined before run() returns or raises.
+
+    Parameters
+    ----------
+    phases : list[Phase]
+        Phases forming a directed acyclic graph
+    cancelled : Callable[[], bool]
+        Polled before starting phases and while waiting for them; once it
+        returns True no further phase is started
+
+    Attributes
+    ----------
+    timings : dict[str, PhaseTiming]
+        Timing of every completed phase
+    stopping : threading.Event
+        Set once a phase failed or the schedule was cancelled; running
+        phases check it to stop early
+
+    Raises
+    ------
+    ValueError
+        If phase names repeat, a dependency is unknown or the graph has a cycle
+    """
+
+    def __init__(self, phases: list[Phase], cancelled: Callable[[], bool]) -> None:
+        self.phases: dict[str, Phase] = {}
+
+        for phase in phases:
+            if phase.name in self.phases:
+                raise ValueError(f"Duplicate phase: {phase.name}")
+            self.phases[phase.name] = phase
+
+        for phase in phases:
+            unknown = [name for name in phase.depends_on if name not in self.phases]
+
+            if unknown:
+                raise ValueError(f"Phase '{phase.name}' depends on unknown phase(s): {unknown}")
+
+        self._check_acyclic()
+        self.cancelled = cancelled
+        self.timings: dict[str, PhaseTiming] = {}
+        self.stopping = threading.Event()
+        self._origin = 0.0
+
+    def _check_acyclic(self) -> None:
+        """Raise ValueError if the dependency graph contains a cycle."""
+        remaining = {name: set(phase.depends_on) for name, phase in self.phases.items()}
+
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps & remaining.keys()]
+
+            if not ready:
+                raise ValueError(f"Phase dependency cycle among: {sorted(remaining)}")
+
+            for name in ready:
+                del remaining[name]
+
+    def run(self) -> bool:
+        """Run every phase, respecting dependencies.
+
+        Returns
+        -------
+        bool
+            True if all phases completed, False if cancelled first
+
+        Raises
+        ------
+        BaseException
+            The first exception raised by a phase
+
+        Notes
+        -----
+        Before failing or returning False, the scheduler sets `stopping`,
+        calls the stop hook of every phase still running and waits up to
+        PHASE_STOP_TIMEOUT_SECONDS for them, so the caller's cleanup does not
+        run while they still use the instance.
+        """
+        self._origin = time.monotonic()
+        done: queue.Queue[tuple[str, BaseException | None]] = queue.Queue()
+        started: set[str] = set()
+        completed: set[str] = set()
+        workers: dict[str, threading.Thread] = {}
+
+        try:
+            return self._schedule(done, started, completed, workers)
+        except BaseException:
+            self._stop_running(workers, completed)
+            raise
+
+    def _schedule(
+        self,
+        done: queue.Queue,
+        started: set[str],
+        completed: set[str],
+        workers: dict[str, threading.Thread],
+    ) -> bool:
+        """Start phases as their dependencies complete until all are done."""
+        while len(completed) < len(self.phases):
+            if self.cancelled():
+                logger.debug(
+                    "Cancelled, not starting phases: %s", sorted(self.phases.keys() - started)
+                )
+                self._stop_running(workers, completed)
+                return False
+
+            ready = [
+                phase
+                for name, phase in self.phases.items()
+                if name not in started and completed.issuperset(phase.depends_on)
+            ]
+            running = len(started) - len(completed)
+
+            if len(ready) == 1 and running == 0:
+                started.add(ready[0].name)
+                self._run_phase(ready[0], done)
+            else:
+                for phase in ready:
+                    started.add(phase.name)
+                    workers[phase.name] = threading.Thread(
+                        target=self._run_phase,
+                        args=(phase, done),
+                        name=f"campers-phase-{phase.name}",
+                        daemon=True,
+                    )
+                    workers[phase.name].start()
+
+            name, error = self._wait_for_phase(done)
+
+            if name is None:
+                self._stop_running(workers, completed)
+                return False
+
+            completed.add(name)
+
+            if error is not None:
+                raise error
+
+        return True
+
+    def _stop_running(self, workers: dict[str, threading.Thread], completed: set[str]) -> None:
+        """Ask running phases to stop and wait a bounded time for them."""
+        self.stopping.set()
+        running = {
+            name: thread
+            for name, thread in workers.items()
+            if name not in completed and thread.is_alive()
+        }
+
+        for name in running:
+            stop = self.phases[name].stop
+
+            if stop is not None:
+                try:
+                    stop()
+                except Exception as e:
+                    logger.warning("Failed to stop phase %s: %s", name, e)
+
+        deadline = time.monotonic() + PHASE_STOP_TIMEOUT_SECONDS
+
+        for name, thread in running.items():
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
+
+            if thread.is_alive():
+                logger.warning(
+                    "Phase %s still running after %ss, continuing without it",
+                    name,
+                    PHASE_STOP_TIMEOUT_SECONDS,
+                )
+
+    def _run_phase(self, phase: Phase, done: queue.Queue) -> None:
+        """Run one phase, record its timing and report completion."""
+        logger.debug("Phase %s starting", phase.name)
+        start = time.monotonic() - self._origin
+        error: BaseException | None = None
+
+        try:
+            with span(phase.name, PHASE_CATEGORY):
+                phase.run()
+        except BaseException as e:
+            error = e
+
+        self.timings[phase.name] = PhaseTiming(phase.name, start, time.monotonic() - self._origin)
+        logger.debug("Phase %s finished in %.1fs", phase.name, self.timings[phase.name].duration)
+        done.put((phase.name, error))
+
+    def _wait_for_phase(self, done: queue.Queue) -> tuple[str | None, BaseException | None]:
+        """Wait for the next phase to finish, or for cancellation."""
+        while True:
+            try:
+                return done.get(timeout=PHASE_POLL_INTERVAL_SECONDS)
+            except queue.Empty:
+                if self.cancelled():
+                    return None, None
+
+    def critical_path(self) -> list[PhaseTiming]:
+        """Return the chain of phases that determined the total run time.
+
+        Starting from the phase that finished last, each step goes back to
+        the dependency that finished last, since that one gated the start.
+
+        Returns
+        -------
+        list[PhaseTiming]
+            Timings along the critical path in execution order
+        """
+        if not self.timings:
+            return []
+
+        current = max(self.timings.values(), key=lambda timing: timing.end)
+        path = [current]
+
+        while dependencies := [
+            self.timings[name]
+            for name in self.phases[current.name].depends_on
+            if name in self.timings
+        ]:
+            current = max(dependencies, key=lambda timing: timing.end)
+            path.append(current)
+
+        return path[::-1]
+
+
+def format_critical_path(path: list[PhaseTiming]) -> str:
+    """Format a critical path for logging.
+
+    Parameters
+    ----------
+    path : list[PhaseTiming]
+        Result of PhaseScheduler.critical_path()
+
+    Returns
+    -------
+    str
+        Summary such as 'ssh 3.1s -> ansible 95.0s -> command 0.4s (98.5s)'
+    """
+    if not path:
+        return "no phases completed"
+
+    steps = " -> ".join(f"{timing.name} {timing.duration:.1f}s" for timing in path)
+    return f"{steps} ({path[-1].end - path[0].start:.1f}s)"
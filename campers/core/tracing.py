@@ -0,0 +1,383 @@
+"""Lightweight span tracing with Chrome trace export.
+
+Spans are recorded only while a tracer is active (`campers run --profile`);
+otherwise `span()` and `traced()` cost a single global lookup.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, TypeVar
+
+from campers.constants import PROFILE_SUMMARY_TOP_SPANS
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+PHASE_CATEGORY = "phase"
+"""Category of the spans listed in the per-phase summary table."""
+
+
+@dataclass
+class Span:
+    """A completed span.
+
+    Attributes
+    ----------
+    name : str
+        Span name, e.g. 'ec2.DescribeInstances' or 'ansible'
+    category : str
+        Span category, e.g. 'phase', 'aws', 'ssh', 'mutagen', 'ansible'
+    start : float
+        Seconds since the tracer started
+    end : float
+        Seconds since the tracer started
+    thread_id : int
+        Identifier of the thread that recorded the span
+    args : dict[str, Any]
+        Extra details shown in the trace viewer
+    """
+
+    name: str
+    category: str
+    start: float
+    end: float
+    thread_id: int
+    args: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        """Return the span wall time in seconds."""
+        return self.end - self.start
+
+
+class Tracer:
+    """Collect spans from any thread and export them as a Chrome trace.
+
+    Attributes
+    ----------
+    started_at : datetime
+        Wall-clock time the tracer was created
+    spans : list[Span]
+        Completed spans in completion order
+    """
+
+    def __init__(self) -> None:
+        self.started_at = datetime.now()
+        self.spans: list[Span] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._thread_names: dict[int, str] = {}
+
+    def begin(self, name: str, category: str, **args: Any) -> dict[str, Any]:
+        """Open a span that is closed later by end().
+
+        Used where the start and end happen in different callbacks, such as
+        botocore event hooks.
+
+        Parameters
+        ----------
+        name : str
+            Span name
+        category : str
+            Span category
+        **args : Any
+            Extra details attached to the span
+
+        Returns
+        -------
+        dict[str, Any]
+            Token to pass to end()
+        """
+        return {
+            "name": name,
+            "category": category,
+            "start": time.perf_counter() - self._origin,
+            "args": args,
+        }
+
+    def end(self, token: dict[str, Any], **args: Any) -> Span:
+        """Close a span opened by begin().
+
+        Parameters
+        ----------
+        token : dict[str, Any]
+            Token returned by begin()
+        **args : Any
+            Extra details merged into the span's args
+
+        Returns
+        -------
+        Span
+            The recorded span
+        """
+        thread = threading.current_thread()
+        recorded = Span(
+            name=token["name"],
+            category=token["category"],
+            start=token["start"],
+            end=time.perf_counter() - self._origin,
+            thread_id=thread.ident or 0,
+            args={**token["args"], **args},
+        )
+
+        with self._lock:
+            self.spans.append(recorded)
+            self._thread_names.setdefault(recorded.thread_id, thread.name)
+
+        return recorded
+
+    @contextmanager
+    def span(self, name: str, category: str, **args: Any) -> Iterator[dict[str, Any]]:
+        """Record the enclosed block as a span.
+
+        Parameters
+        ----------
+        name : str
+            Span name
+        category : str
+            Span category
+        **args : Any
+            Extra details attached to the span
+
+        Yields
+        ------
+        dict[str, Any]
+            The span's args, which the block may extend
+        """
+        token = self.begin(name, category, **args)
+
+        try:
+            yield token["args"]
+        except BaseException as e:
+            token["args"]["error"] = type(e).__name__
+            raise
+        finally:
+            self.end(token)
+
+    def snapshot(self) -> list[Span]:
+        """Return a copy of the completed spans, safe while threads still record.
+
+        Returns
+        -------
+        list[Span]
+            Completed spans in completion order
+        """
+        with self._lock:
+            return list(self.spans)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Return the spans in Chrome trace event format.
+
+        The result loads in Perfetto (ui.perfetto.dev) and chrome://tracing.
+        Spans become complete ('X') events with microsecond timestamps, and
+        each thread is named with a metadata ('M') event.
+
+        Returns
+        -------
+        dict[str, Any]
+            Trace object with a 'traceEvents' list
+        """
+        pid = os.getpid()
+
+        with self._lock:
+            spans = list(self.spans)
+            thread_names = dict(self._thread_names)
+
+        events: list[dict[str, Any]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": thread_id,
+                "args": {"name": thread_name},
+            }
+            for thread_id, thread_name in thread_names.items()
+        ]
+        events.extend(
+            {
+                "name": recorded.name,
+                "cat": recorded.category,
+                "ph": "X",
+                "ts": round(recorded.start * 1_000_000),
+                "dur": round(recorded.duration * 1_000_000),
+                "pid": pid,
+                "tid": recorded.thread_id,
+                "args": {key: str(value) for key, value in recorded.args.items()},
+            }
+            for recorded in sorted(spans, key=lambda s: s.start)
+        )
+
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"started_at": self.started_at.isoformat(timespec="seconds")},
+        }
+
+    def write(self, path: Path) -> Path:
+        """Write the Chrome trace JSON to path, creating parent directories.
+
+        Parameters
+        ----------
+        path : Path
+            Destination file
+
+        Returns
+        -------
+        Path
+            The written file
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_chrome_trace()))
+        return path
+
+
+_active_tracer: Tracer | None = None
+
+
+def start_tracing() -> Tracer:
+    """Install a new process-wide tracer and return it."""
+    global _active_tracer
+    _active_tracer = Tracer()
+    return _active_tracer
+
+
+def stop_tracing() -> Tracer | None:
+    """Uninstall the process-wide tracer and return it, if any."""
+    global _active_tracer
+    tracer, _active_tracer = _active_tracer, None
+    return tracer
+
+
+def get_tracer() -> Tracer | None:
+    """Return the active tracer, or None when tracing is off."""
+    return _active_tracer
+
+
+@contextmanager
+def span(name: str, category: str, **args: Any) -> Iterator[dict[str, Any]]:
+    """Record the enclosed block on the active tracer, if any.
+
+    Parameters
+    ----------
+    name : str
+        Span name
+    category : str
+        Span category
+    **args : Any
+        Extra details attached to the span
+
+    Yields
+    ------
+    dict[str, Any]
+        The span's args; a throwaway dict when tracing is off
+    """
+    tracer = _active_tracer
+
+    if tracer is None:
+        yield {}
+        return
+
+    with tracer.span(name, category, **args) as span_args:
+        yield span_args
+
+
+def traced(name: str, category: str) -> Callable[[F], F]:
+    """Decorate a function so each call is recorded as a span.
+
+    Parameters
+    ----------
+    name : str
+        Span name
+    category : str
+        Span category
+
+    Returns
+    -------
+    Callable[[F], F]
+        Decorator
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _active_tracer is None:
+                return func(*args, **kwargs)
+
+            with span(name, category):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def format_profile_summary(tracer: Tracer, top: int = PROFILE_SUMMARY_TOP_SPANS) -> str:
+    """Format the recorded spans as a terminal summary.
+
+    Parameters
+    ----------
+    tracer : Tracer
+        Tracer holding the spans of a run
+    top : int
+        Number of slowest non-phase spans to list
+
+    Returns
+    -------
+    str
+        Table of wall time per phase, totals per category and the slowest
+        individual spans
+    """
+    spans = sorted(tracer.snapshot(), key=lambda s: s.start)
+
+    if not spans:
+        return "No spans recorded"
+
+    total = max(s.end for s in spans) - min(s.start for s in spans)
+    phases = [s for s in spans if s.category == PHASE_CATEGORY]
+    name_width = max([len("Phase"), *(len(s.name) for s in spans)]) + 2
+
+    lines = [f"{'Phase':<{name_width}}{'Start':>9}{'Wall':>10}{'Share':>8}"]
+
+    for phase in phases:
+        share = phase.duration / total * 100 if total else 0.0
+        lines.append(
+            f"{phase.name:<{name_width}}{phase.start:>8.1f}s{phase.duration:>9.1f}s{share:>7.0f}%"
+        )
+
+    lines.append(f"{'Total':<{name_width}}{'':>9}{total:>9.1f}s")
+
+    categories: dict[str, list[Span]] = {}
+
+    for recorded in spans:
+        if recorded.category != PHASE_CATEGORY:
+            categories.setdefault(recorded.category, []).append(recorded)
+
+    if categories:
+        lines.extend(["", f"{'Category':<{name_width}}{'Spans':>9}{'Time':>10}"])
+
+        for category, members in sorted(categories.items()):
+            busy = sum(s.duration for s in members)
+            lines.append(f"{category:<{name_width}}{len(members):>9}{busy:>9.1f}s")
+
+        slowest = sorted(
+            (s for s in spans if s.category != PHASE_CATEGORY),
+            key=lambda s: s.duration,
+            reverse=True,
+        )[:top]
+        lines.extend(["", f"{'Slowest spans':<{name_width}}{'Start':>9}{'Wall':>10}"])
+
+        for recorded in slowest:
+            lines.append(
+                f"{recorded.name:<{name_width}}{recorded.start:>8.1f}s{recorded.duration:>9.1f}s"
+            )
+
+    return "\n".join(lines)
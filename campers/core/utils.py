@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from campers.constants import DEFAULT_CACHE_VOLUME_MOUNT
+
 if TYPE_CHECKING:
     from campers.core.interfaces import ComputeProvider
 
@@ -54,3 +56,25 @@ def get_volume_size_or_default(
     """
     volume_size = regional_manager.get_volume_size(instance_id)
     return volume_size if volume_size is not None else default
+
+
+def normalize_cache_volume_config(value: Any) -> dict[str, Any] | None:
+    """Normalize the cache_volume option to a dictionary.
+
+    Parameters
+    ----------
+    value : Any
+        Either a size in GB or a dict with 'size' and optional 'mount'
+
+    Returns
+    -------
+    dict[str, Any] | None
+        Dictionary with 'size' and 'mount' keys, or None if not configured
+    """
+    if not value:
+        return None
+
+    if isinstance(value, int):
+        return {"size": value, "mount": DEFAULT_CACHE_VOLUME_MOUNT}
+
+    return {"size": value["size"], "mount": value.get("mount", DEFAULT_CACHE_VOLUME_MOUNT)}
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 import logging
+import os
 import sys
 from collections.abc import Callable
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 
+from campers.constants import DEFAULT_MARKET
 from campers.core.config import ConfigLoader
+from campers.core.costs import record_transition
 from campers.core.interfaces import ComputeProvider
 from campers.core.utils import get_volume_size_or_default
 from campers.providers import get_provider
 from campers.providers.exceptions import ProviderAPIError, ProviderCredentialsError
+from campers.services.sync import MutagenManager, build_host_alias
 from campers.utils import format_time_ago, get_user_identity, status_spinner
 
 
@@ -156,6 +161,37 @@ class LifecycleManager:
 
         return row
 
+    def _log_cache_volumes(self, cache_volumes: list[dict[str, Any]], show_all: bool) -> None:
+        """Print the table of persistent cache volumes.
+
+        Parameters
+        ----------
+        cache_volumes : list[dict[str, Any]]
+            Volumes from list_cache_volumes with cost_str set
+        show_all : bool
+            Whether to include the owner column
+        """
+        owner_header = f"{'OWNER':<25} " if show_all else ""
+        header = (
+            f"{'CAMP':<20} {'VOLUME-ID':<22} {'STATUS':<12} {owner_header}"
+            f"{'ZONE':<15} {'SIZE':<8} {'COST/MONTH':<21}"
+        )
+
+        logging.info("", extra={"stream": "stdout"})
+        logging.info("Cache volumes:", extra={"stream": "stdout"})
+        logging.info(header, extra={"stream": "stdout"})
+        logging.info("-" * len(header.rstrip()), extra={"stream": "stdout"})
+
+        for volume in cache_volumes:
+            name = self.truncate_name(volume["camp_config"])
+            owner = f"{volume.get('owner', 'unknown'):<25} " if show_all else ""
+            size = f"{volume['size']}GB"
+            logging.info(
+                f"{name:<20} {volume['volume_id']:<22} {volume['state']:<12} {owner}"
+                f"{volume['availability_zone']:<15} {size:<8} {volume.get('cost_str', ''):<21}",
+                extra={"stream": "stdout"},
+            )
+
     def _validate_region(self, region: str) -> None:
         """Validate that a region is valid using the compute provider.
 
@@ -173,6 +209,16 @@ class LifecycleManager:
         compute_provider = self.compute_provider_factory(region=default_region)
         compute_provider.validate_region(region)
 
+    def _ledger_attributes(self, instance: dict[str, Any]) -> dict[str, Any]:
+        """Return the cost ledger attributes of an instance from list_instances."""
+        return {
+            "camp": instance.get("camp_config"),
+            "owner": instance.get("owner"),
+            "region": instance.get("region"),
+            "instance_type": instance.get("instance_type"),
+            "market": instance.get("market"),
+        }
+
     def _find_and_validate_instance(
         self, name_or_id: str, region: str | None, operation_name: str
     ) -> dict[str, Any] | None:
@@ -256,13 +302,15 @@ class LifecycleManager:
 
             with status_spinner("Fetching instances"):
                 instances = compute_provider.list_instances(region_filter=region)
+                cache_volumes = list(compute_provider.list_cache_volumes(region_filter=region))
 
             current_user = get_user_identity()
 
             if not show_all:
                 instances = [i for i in instances if i.get("owner") == current_user]
+                cache_volumes = [v for v in cache_volumes if v.get("owner") == current_user]
 
-            if not instances:
+            if not instances and not cache_volumes:
                 logging.info("No campers-managed instances found", extra={"stream": "stdout"})
                 return
 
@@ -280,9 +328,16 @@ class LifecycleManager:
                 total_monthly_cost = 0.0
                 costs_available = False
 
+                regional_managers: dict[str, ComputeProvider] = {}
+
                 with status_spinner("Calculating costs"):
                     for inst in instances:
-                        regional_manager = self.compute_provider_factory(region=inst["region"])
+                        if inst["region"] not in regional_managers:
+                            regional_managers[inst["region"]] = self.compute_provider_factory(
+                                region=inst["region"]
+                            )
+
+                        regional_manager = regional_managers[inst["region"]]
                         volume_size = regional_manager.get_volume_size(inst["instance_id"])
 
                         if volume_size is None:
@@ -294,6 +349,8 @@ class LifecycleManager:
                             state=inst["state"],
                             volume_size_gb=volume_size,
                             pricing_service=pricing_service,
+                            market=inst.get("market", DEFAULT_MARKET),
+                            availability_zone=inst.get("availability_zone"),
                         )
 
                         if monthly_cost is not None:
@@ -304,19 +361,38 @@ class LifecycleManager:
                         inst["volume_size"] = volume_size
                         inst["cost_str"] = format_cost(monthly_cost)
 
-                if not show_all:
-                    logging.info(
-                        f"Instances for {current_user}:",
-                        extra={"stream": "stdout"},
-                    )
+                        if inst.get("market") == "spot":
+                            inst["cost_str"] += " (spot)"
+
+                    for volume in cache_volumes:
+                        storage_rate = pricing_service.get_ebs_storage_rate(volume["region"])
+                        monthly_cost = (
+                            volume["size"] * storage_rate if storage_rate is not None else None
+                        )
+
+                        if monthly_cost is not None:
+                            total_monthly_cost += monthly_cost
+                            costs_available = True
+
+                        volume["cost_str"] = format_cost(monthly_cost)
 
-                header, separator_width = self._build_list_header(show_all, region)
-                logging.info(header, extra={"stream": "stdout"})
-                logging.info("-" * separator_width, extra={"stream": "stdout"})
+                if instances:
+                    if not show_all:
+                        logging.info(
+                            f"Instances for {current_user}:",
+                            extra={"stream": "stdout"},
+                        )
+
+                    header, separator_width = self._build_list_header(show_all, region)
+                    logging.info(header, extra={"stream": "stdout"})
+                    logging.info("-" * separator_width, extra={"stream": "stdout"})
+
+                    for inst in instances:
+                        row = self._build_list_row(inst, show_all, region)
+                        logging.info(row, extra={"stream": "stdout"})
 
-                for inst in instances:
-                    row = self._build_list_row(inst, show_all, region)
-                    logging.info(row, extra={"stream": "stdout"})
+                if cache_volumes:
+                    self._log_cache_volumes(cache_volumes, show_all)
 
                 if costs_available:
                     logging.info(
@@ -424,6 +500,8 @@ class LifecycleManager:
                     state="running",
                     volume_size_gb=volume_size,
                     pricing_service=pricing_service,
+                    market=target.get("market", DEFAULT_MARKET),
+                    availability_zone=target.get("availability_zone"),
                 )
 
                 stopped_cost = calculate_monthly_cost(
@@ -437,6 +515,13 @@ class LifecycleManager:
                 with status_spinner("Stopping instance"):
                     regional_manager.stop_instance(instance_id)
 
+                record_transition(
+                    instance_id,
+                    "stopped",
+                    volume_size_gb=volume_size,
+                    **self._ledger_attributes(target),
+                )
+
                 logging.info(
                     f"Instance {instance_id} has been successfully stopped.",
                     extra={"stream": "stdout"},
@@ -598,11 +683,21 @@ class LifecycleManager:
                     state="running",
                     volume_size_gb=volume_size,
                     pricing_service=pricing_service,
+                    market=target.get("market", DEFAULT_MARKET),
+                    availability_zone=target.get("availability_zone"),
                 )
 
                 with status_spinner("Starting instance"):
                     instance_details = regional_manager.start_instance(instance_id)
 
+                record_transition(
+                    instance_id,
+                    "running",
+                    at=instance_details.get("launch_time"),
+                    volume_size_gb=volume_size,
+                    **self._ledger_attributes(target),
+                )
+
                 new_ip = instance_details.get("public_ip", "N/A")
                 logging.info(
                     f"Instance {instance_id} has been successfully started.",
@@ -668,6 +763,123 @@ class LifecycleManager:
             )
             sys.exit(1)
 
+    def _configured_regions(self) -> list[str]:
+        """Return the default region and every camp region of the config, in order."""
+        config = self.config_loader.load_config()
+        default_region = (config.get("defaults") or {}).get(
+            "region", self.config_loader.BUILT_IN_DEFAULTS["region"]
+        )
+        regions = [default_region]
+
+        for camp in (config.get("camps") or {}).values():
+            camp_region = (camp or {}).get("region")
+
+            if camp_region and camp_region not in regions:
+                regions.append(camp_region)
+
+        return regions
+
+    def prefetch_pricing(self, region: str | None = None, force: bool = False) -> None:
+        """Download the on-demand EC2 and EBS price index of the regions in use.
+
+        Parameters
+        ----------
+        region : str | None
+            Only prefetch this region; defaults to the regions of the config
+        force : bool
+            Prefetch regions whose stored prices are still fresh
+
+        Raises
+        ------
+        ValueError
+            If provided region is not a valid cloud region
+        ProviderAPIError
+            If the pricing API rejects a request
+        """
+        if region is not None:
+            self._validate_region(region)
+
+        regions = [region] if region else self._configured_regions()
+        PricingService, _, _ = self._get_pricing_service_and_functions()
+        pricing_service = PricingService()
+
+        try:
+            if pricing_service.pricing_client is None or pricing_service.store is None:
+                logging.info("ℹ️  Pricing unavailable", extra={"stream": "stdout"})
+                return
+
+            if not force:
+                regions = pricing_service.store.stale_regions(regions)
+
+            if not regions:
+                logging.info("Stored prices are up to date", extra={"stream": "stdout"})
+                return
+
+            with status_spinner(f"Prefetching prices for {', '.join(regions)}"):
+                counts = pricing_service.prefetch(regions)
+
+            for prefetched_region, count in counts.items():
+                logging.info(
+                    f"{prefetched_region}: {count} prices stored", extra={"stream": "stdout"}
+                )
+        finally:
+            pricing_service.close()
+
+    def export_pricing(self, path: str) -> None:
+        """Write the stored prices to a snapshot file for offline hosts.
+
+        Parameters
+        ----------
+        path : str
+            Snapshot file to create or replace
+
+        Raises
+        ------
+        ValueError
+            If there are no stored prices to export
+        """
+        PricingService, _, _ = self._get_pricing_service_and_functions()
+        pricing_service = PricingService()
+
+        try:
+            count = pricing_service.export_snapshot(Path(path).expanduser())
+        finally:
+            pricing_service.close()
+
+        logging.info(f"Exported {count} prices to {path}", extra={"stream": "stdout"})
+
+    def import_pricing(self, path: str) -> None:
+        """Install a price snapshot used when the pricing API is unavailable.
+
+        Parameters
+        ----------
+        path : str
+            Snapshot file written by `campers pricing export`
+
+        Raises
+        ------
+        SystemExit
+            If the snapshot file does not exist
+        ValueError
+            If the file is not a supported price snapshot
+        """
+        PricingService, _, _ = self._get_pricing_service_and_functions()
+
+        try:
+            snapshot = PricingService.import_snapshot(Path(path).expanduser())
+        except FileNotFoundError as e:
+            logging.error(str(e), extra={"stream": "stderr"})
+            sys.exit(1)
+
+        try:
+            exported = datetime.fromtimestamp(snapshot.created_at, UTC)
+            logging.info(
+                f"Imported {snapshot.price_count} prices exported {format_time_ago(exported)}",
+                extra={"stream": "stdout"},
+            )
+        finally:
+            snapshot.close()
+
     def info(self, name_or_id: str, region: str | None = None) -> None:
         """Display detailed information about a campers-managed cloud instance.
 
@@ -854,6 +1066,14 @@ class LifecycleManager:
             with status_spinner("Terminating instance"):
                 regional_manager.terminate_instance(target["instance_id"])
 
+            record_transition(target["instance_id"], "terminated")
+
+            if target.get("unique_id"):
+                MutagenManager().terminate_host_sessions(
+                    build_host_alias(target["unique_id"]),
+                    ssh_wrapper_dir=os.environ.get("CAMPERS_DIR", str(Path.home() / ".campers")),
+                )
+
             logging.info(
                 f"Instance {target['instance_id']} has been successfully terminated.",
                 extra={"stream": "stdout"},
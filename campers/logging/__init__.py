@@ -1,8 +1,15 @@
 """Logging infrastructure for campers."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from campers.logging.filters import StreamRoutingFilter
 from campers.logging.formatters import StreamFormatter
-from campers.logging.handlers import TuiLogHandler, TuiLogMessage
+
+if TYPE_CHECKING:
+    from campers.logging.handlers import TuiLogHandler, TuiLogMessage
 
 __all__ = [
     "StreamFormatter",
@@ -10,3 +17,11 @@ __all__ = [
     "TuiLogHandler",
     "TuiLogMessage",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the Textual-based TUI handlers on first access."""
+    if name not in ("TuiLogHandler", "TuiLogMessage"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(importlib.import_module("campers.logging.handlers"), name)
@@ -6,17 +6,15 @@ multiple cloud providers (AWS, GCP, Azure, etc.) through a common interface.
 
 from __future__ import annotations
 
+import importlib
+from typing import Any
+
 from campers.constants import DEFAULT_SSH_USERNAME
 from campers.core.interfaces import ComputeProvider, PricingProvider
-from campers.providers.aws import EC2Manager, PricingService
 from campers.providers.aws.constants import (
     DEFAULT_INSTANCE_TYPE,
     DEFAULT_REGION,
 )
-from campers.providers.aws.pricing import (
-    calculate_monthly_cost,
-    format_cost,
-)
 from campers.providers.exceptions import (
     ProviderAPIError,
     ProviderConnectionError,
@@ -24,7 +22,58 @@ from campers.providers.exceptions import (
     ProviderError,
 )
 
-_PROVIDERS: dict[str, dict[str, object]] = {}
+
+class LazyImport:
+    """Reference to a provider attribute that is imported on first access.
+
+    Provider implementations pull in their SDKs (boto3 for AWS), so the
+    registry stores references and only imports a provider's modules when a
+    command actually uses them.
+
+    Parameters
+    ----------
+    path : str
+        Import path in 'package.module:attribute' form
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def resolve(self) -> Any:
+        """Import the module and return the referenced attribute.
+
+        Returns
+        -------
+        Any
+            The referenced attribute
+        """
+        module_name, _, attribute = self.path.partition(":")
+        return getattr(importlib.import_module(module_name), attribute)
+
+    def __repr__(self) -> str:
+        return f"LazyImport({self.path!r})"
+
+
+class ProviderInfo(dict):
+    """Provider registry entry that resolves LazyImport values on access."""
+
+    def __getitem__(self, key: str) -> Any:
+        value = super().__getitem__(key)
+
+        if isinstance(value, LazyImport):
+            value = value.resolve()
+            self[key] = value
+
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+_PROVIDERS: dict[str, ProviderInfo] = {}
 
 
 def register_provider(
@@ -46,11 +95,11 @@ def register_provider(
     default_region : str | None
         Default region for this provider
     """
-    _PROVIDERS[name] = {
-        "compute": compute_class,
-        "pricing": pricing_class,
-        "default_region": default_region,
-    }
+    _PROVIDERS[name] = ProviderInfo(
+        compute=compute_class,
+        pricing=pricing_class,
+        default_region=default_region,
+    )
 
 
 def get_provider(name: str) -> dict[str, type[ComputeProvider] | type[PricingProvider]]:
@@ -146,12 +195,27 @@ def get_provider_defaults(provider_name: str) -> dict[str, object]:
     }
 
 
+def install_api_hooks() -> None:
+    """Install the API call tracing and accounting hooks of every provider.
+
+    Providers that support it register an 'install_api_hooks' entry whose
+    value lazily returns the installer function.
+    """
+    for provider_info in _PROVIDERS.values():
+        get_installer = provider_info.get("install_api_hooks")
+
+        if get_installer is not None:
+            get_installer()()
+
+
 __all__ = [
+    "LazyImport",
     "register_provider",
     "get_provider",
     "list_providers",
     "get_default_region",
     "get_provider_defaults",
+    "install_api_hooks",
     "ProviderError",
     "ProviderCredentialsError",
     "ProviderAPIError",
@@ -173,16 +237,38 @@ def _get_ssh_connection_info_func() -> object:
     return get_aws_ssh_connection_info
 
 
-_PROVIDERS["aws"] = {
-    "compute": EC2Manager,
-    "pricing": PricingService,
-    "pricing_service": PricingService,
-    "setup": _get_setup_manager,
-    "get_ssh_connection_info": _get_ssh_connection_info_func,
-    "calculate_monthly_cost": calculate_monthly_cost,
-    "format_cost": format_cost,
-    "default_region": DEFAULT_REGION,
-    "default_instance_type": DEFAULT_INSTANCE_TYPE,
-    "default_ssh_username": DEFAULT_SSH_USERNAME,
-    "env_filter": ["AWS_.*"],
-}
+def _get_dataset_planner() -> type:
+    """Lazily import the S3 dataset planner to avoid circular imports."""
+    from campers.providers.aws.datasets import S3DatasetPlanner
+
+    return S3DatasetPlanner
+
+
+def _get_api_hooks_installer() -> object:
+    """Lazily import the botocore API call hooks."""
+    from campers.providers.aws.instrumentation import install_api_hooks
+
+    return install_api_hooks
+
+
+_AWS_PRICING = "campers.providers.aws.pricing"
+
+_PROVIDERS["aws"] = ProviderInfo(
+    {
+        "compute": LazyImport("campers.providers.aws.compute:EC2Manager"),
+        "pricing": LazyImport(f"{_AWS_PRICING}:PricingService"),
+        "pricing_service": LazyImport(f"{_AWS_PRICING}:PricingService"),
+        "setup": _get_setup_manager,
+        "get_ssh_connection_info": _get_ssh_connection_info_func,
+        "dataset_planner": _get_dataset_planner,
+        "install_api_hooks": _get_api_hooks_installer,
+        "calculate_monthly_cost": LazyImport(
+            "campers.providers.aws.pricing:calculate_monthly_cost"
+        ),
+        "format_cost": LazyImport("campers.providers.aws.pricing:format_cost"),
+        "default_region": DEFAULT_REGION,
+        "default_instance_type": DEFAULT_INSTANCE_TYPE,
+        "default_ssh_username": DEFAULT_SSH_USERNAME,
+        "env_filter": ["AWS_.*"],
+    }
+)
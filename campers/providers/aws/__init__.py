@@ -2,7 +2,24 @@
 
 from __future__ import annotations
 
-from campers.providers.aws.compute import EC2Manager
-from campers.providers.aws.pricing import PricingService
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from campers.providers.aws.compute import EC2Manager
+    from campers.providers.aws.pricing import PricingService
+
+_LAZY_ATTRIBUTES = {
+    "EC2Manager": "campers.providers.aws.compute",
+    "PricingService": "campers.providers.aws.pricing",
+}
 
 __all__ = ["EC2Manager", "PricingService"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import EC2Manager and PricingService on first access, deferring boto3."""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
@@ -2,38 +2,93 @@
 
 from __future__ import annotations
 
+import os
+import threading
 from typing import Any
 
 import boto3
 from botocore.config import Config
 
+from campers.providers.aws.constants import (
+    BOTO3_CLIENT_CONNECT_TIMEOUT,
+    BOTO3_CLIENT_MAX_ATTEMPTS,
+    BOTO3_CLIENT_READ_TIMEOUT,
+    BOTO3_MAX_POOL_CONNECTIONS,
+)
+
+
+def default_client_config() -> Config:
+    """Return the botocore config used for every pooled client.
+
+    Returns
+    -------
+    Config
+        Timeouts, adaptive retries and a connection pool large enough for the
+        concurrent paths (multi-region listing, dataset staging)
+    """
+    return Config(
+        connect_timeout=BOTO3_CLIENT_CONNECT_TIMEOUT,
+        read_timeout=BOTO3_CLIENT_READ_TIMEOUT,
+        retries={"max_attempts": BOTO3_CLIENT_MAX_ATTEMPTS, "mode": "adaptive"},
+        max_pool_connections=BOTO3_MAX_POOL_CONNECTIONS,
+    )
+
 
 class AWSClientFactory:
-    """Factory for creating AWS boto3 clients and resources."""
+    """Process-wide pool of boto3 clients and resources.
+
+    All clients come from boto3's default session, so credentials are
+    resolved and service models loaded once, and the API call hooks installed
+    on that session apply to every client. Clients are cached per service,
+    region and endpoint URL; botocore clients are thread-safe, so a cached
+    client is shared by all threads. Resources are not thread-safe and are
+    cached per thread.
+
+    Callers passing their own ``config`` get a fresh, uncached client.
+    """
+
+    _lock = threading.Lock()
+    _clients: dict[tuple[str, str | None, str | None], Any] = {}
+    _resources: dict[tuple[str, str | None, str | None, int], Any] = {}
+
+    @staticmethod
+    def _cache_key(service_name: str, kwargs: dict[str, Any]) -> tuple[str, str | None, str | None]:
+        """Build the cache key from the service, region and endpoint URL."""
+        endpoint_url = kwargs.get("endpoint_url") or os.environ.get("AWS_ENDPOINT_URL")
+        return service_name, kwargs.get("region_name"), endpoint_url
 
     def get_client(self, service_name: str, **kwargs: Any) -> Any:
-        """Get a boto3 client for the specified service.
+        """Get a pooled boto3 client for the specified service.
 
         Parameters
         ----------
         service_name : str
             Name of the AWS service (e.g., 'ec2', 'pricing')
         **kwargs : Any
-            Additional arguments to pass to boto3.client()
+            Additional arguments to pass to boto3.client(), typically
+            region_name and endpoint_url
 
         Returns
         -------
         Any
             A boto3 service client
         """
-        if "config" not in kwargs:
-            kwargs["config"] = Config(
-                connect_timeout=5, read_timeout=30, retries={"max_attempts": 3, "mode": "adaptive"}
-            )
-        return boto3.client(service_name, **kwargs)
+        if "config" in kwargs:
+            return boto3.client(service_name, **kwargs)
+
+        key = self._cache_key(service_name, kwargs)
+
+        with self._lock:
+            client = self._clients.get(key)
+
+            if client is None:
+                client = boto3.client(service_name, config=default_client_config(), **kwargs)
+                self._clients[key] = client
+
+        return client
 
     def get_resource(self, service_name: str, **kwargs: Any) -> Any:
-        """Get a boto3 resource for the specified service.
+        """Get a boto3 resource for the specified service, cached per thread.
 
         Parameters
         ----------
@@ -47,11 +102,30 @@ class AWSClientFactory:
         Any
             A boto3 service resource
         """
-        if "config" not in kwargs:
-            kwargs["config"] = Config(
-                connect_timeout=5, read_timeout=30, retries={"max_attempts": 3, "mode": "adaptive"}
-            )
-        return boto3.resource(service_name, **kwargs)
+        if "config" in kwargs:
+            return boto3.resource(service_name, **kwargs)
+
+        key = (*self._cache_key(service_name, kwargs), threading.get_ident())
+
+        with self._lock:
+            resource = self._resources.get(key)
+
+            if resource is None:
+                resource = boto3.resource(service_name, config=default_client_config(), **kwargs)
+                self._resources[key] = resource
+
+        return resource
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop every pooled client and resource.
+
+        Later calls build new clients, picking up changed credentials or
+        environment variables.
+        """
+        with cls._lock:
+            cls._clients.clear()
+            cls._resources.clear()
 
 
 def create_aws_client_factory() -> AWSClientFactory:
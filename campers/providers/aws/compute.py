@@ -9,8 +9,6 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-import boto3
-from botocore.config import Config
 from botocore.exceptions import (
     ClientError,
     ConnectTimeoutError,
@@ -20,9 +18,17 @@ from botocore.exceptions import (
 )
 from tenacity import RetryError, retry, stop_after_attempt, wait_exponential
 
+from campers.constants import (
+    DEFAULT_MARKET,
+    DEFAULT_SSH_USERNAME,
+    SPOT_INTERRUPTION_POLL_SECONDS,
+)
+from campers.core.utils import normalize_cache_volume_config
 from campers.providers.aws.ami import AMIResolver
+from campers.providers.aws.client_factory import AWSClientFactory
 from campers.providers.aws.constants import (
     ACTIVE_INSTANCE_STATES,
+    SPOT_CAPACITY_ERROR_CODES,
     SSH_IP_RETRY_DELAY,
     SSH_IP_RETRY_MAX,
     UUID_SLICE_LENGTH,
@@ -34,15 +40,23 @@ from campers.providers.aws.constants import (
 from campers.providers.aws.errors import handle_aws_errors
 from campers.providers.aws.keypair import KeyPairInfo, KeyPairManager
 from campers.providers.aws.network import NetworkManager, delete_security_group_with_retry
+from campers.providers.aws.spot import (
+    SPOT_MARKET_OPTIONS,
+    build_interruption_watch_command,
+    instance_market,
+)
+from campers.providers.aws.ssh import forget_ssh_tags
 from campers.providers.aws.utils import (
     extract_instance_from_response,
     extract_tag_value,
     tags_to_dict,
 )
+from campers.providers.aws.volumes import CacheVolumeManager, build_mount_script
 from campers.providers.exceptions import (
     ProviderAPIError,
     ProviderConnectionError,
     ProviderCredentialsError,
+    ProviderError,
 )
 
 logger = logging.getLogger(__name__)
@@ -64,9 +78,11 @@ class EC2Manager:
         region : str
             AWS region for EC2 operations
         boto3_client_factory : Callable[..., Any] | None
-            Optional factory for creating boto3 clients. If None, uses boto3.client
+            Optional factory for creating boto3 clients. If None, uses the
+            shared client pool (AWSClientFactory.get_client)
         boto3_resource_factory : Callable[..., Any] | None
-            Optional factory for creating boto3 resources. If None, uses boto3.resource
+            Optional factory for creating boto3 resources. If None, uses the
+            shared client pool (AWSClientFactory.get_resource)
 
         Raises
         ------
@@ -75,14 +91,17 @@ class EC2Manager:
         """
         self._validate_region_format(region)
         self.region = region
-        self.boto3_client_factory = boto3_client_factory or boto3.client
-        self.boto3_resource_factory = boto3_resource_factory or boto3.resource
+        client_pool = AWSClientFactory()
+        self._uses_client_pool = boto3_client_factory is None
+        self.boto3_client_factory = boto3_client_factory or client_pool.get_client
+        self.boto3_resource_factory = boto3_resource_factory or client_pool.get_resource
         self.ec2_client = self.boto3_client_factory("ec2", region_name=region)
         self.ec2_resource = self.boto3_resource_factory("ec2", region_name=region)
 
         self.ami_resolver = AMIResolver(self.ec2_client, region)
         self.keypair_manager = KeyPairManager(self.ec2_client, region)
         self.network_manager = NetworkManager(self.ec2_client, region)
+        self.volume_manager = CacheVolumeManager(self.ec2_client, region)
 
     def __enter__(self) -> "EC2Manager":
         """Enter context manager.
@@ -112,8 +131,12 @@ class EC2Manager:
         """Close boto3 clients and release resources.
 
         This method safely closes both EC2 client and resource connections.
-        Errors during closing are logged but do not raise exceptions.
+        Errors during closing are logged but do not raise exceptions. Clients
+        from the shared pool are left open for the rest of the process.
         """
+        if getattr(self, "_uses_client_pool", False):
+            return
+
         try:
             if hasattr(self, "ec2_client") and self.ec2_client is not None:
                 self.ec2_client.close()
@@ -318,7 +341,7 @@ class EC2Manager:
         -------
         dict[str, Any]
             Instance details: {instance_id, public_ip, state, key_file, unique_id,
-            security_group_id}
+            security_group_id, cache_volume_id, market}
 
         Raises
         ------
@@ -346,7 +369,7 @@ class EC2Manager:
                     "AWS credentials not configured for EC2 instance launch"
                 ) from e
             raise ProviderAPIError(f"Failed to launch instance: {e}") from e
-        except RuntimeError:
+        except (RuntimeError, ProviderError):
             self._rollback_resources(resources)
             raise
 
@@ -444,7 +467,27 @@ class EC2Manager:
         dict[str, Any]
             Instance details dictionary
         """
-        instances = self.ec2_resource.create_instances(
+        cache_config = normalize_cache_volume_config(config.get("cache_volume"))
+        cache_volume = None
+        launch_options: dict[str, Any] = {}
+
+        if cache_config:
+            cache_volume = self._prepare_cache_volume(cache_config, resources)
+
+        if cache_volume:
+            launch_options["Placement"] = {"AvailabilityZone": cache_volume["availability_zone"]}
+            launch_options["UserData"] = build_mount_script(
+                cache_volume["volume_id"],
+                cache_config["mount"],
+                config.get("ssh_username", DEFAULT_SSH_USERNAME),
+            )
+
+        market = config.get("market", DEFAULT_MARKET)
+
+        if market != "on-demand":
+            launch_options["InstanceMarketOptions"] = SPOT_MARKET_OPTIONS
+
+        request = dict(
             ImageId=resources["ami_id"],
             InstanceType=resources["instance_type"],
             KeyName=resources["key_name"],
@@ -473,8 +516,26 @@ class EC2Manager:
                     ],
                 }
             ],
+            **launch_options,
         )
 
+        try:
+            instances = self.ec2_resource.create_instances(**request)
+        except ClientError as e:
+            if (
+                market != "spot-with-fallback"
+                or e.response.get("Error", {}).get("Code") not in SPOT_CAPACITY_ERROR_CODES
+            ):
+                raise
+
+            logger.warning(
+                "Spot capacity unavailable for %s (%s), launching on-demand",
+                resources["instance_type"],
+                e.response["Error"]["Code"],
+            )
+            del request["InstanceMarketOptions"]
+            instances = self.ec2_resource.create_instances(**request)
+
         if not instances:
             raise RuntimeError("No instances created by AWS")
 
@@ -492,6 +553,9 @@ class EC2Manager:
         )
         instance.reload()
 
+        if cache_volume:
+            self.volume_manager.attach_volume(cache_volume["volume_id"], instance_id)
+
         return {
             "instance_id": instance_id,
             "public_ip": instance.public_ip_address,
@@ -500,8 +564,74 @@ class EC2Manager:
             "security_group_id": resources["sg_id"],
             "unique_id": resources["unique_id"],
             "launch_time": instance.launch_time,
+            "ami_id": resources["ami_id"],
+            "cache_volume_id": cache_volume["volume_id"] if cache_volume else None,
+            "market": instance_market({"InstanceLifecycle": instance.instance_lifecycle}),
         }
 
+    def _prepare_cache_volume(
+        self, cache_config: dict[str, Any], resources: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Find or create the camp's cache volume before launch.
+
+        A detached volume left by a previous instance of the same camp is
+        reused, and the new instance is placed in that volume's availability
+        zone. Otherwise a new volume is created in a zone offering the
+        instance type.
+
+        Parameters
+        ----------
+        cache_config : dict[str, Any]
+            Normalized cache_volume configuration with 'size' and 'mount'
+        resources : dict[str, Any]
+            Prepared resources from _prepare_launch_resources
+
+        Returns
+        -------
+        dict[str, Any] | None
+            Volume with volume_id and availability_zone, or None if the camp's
+            volume is still attached to another instance
+        """
+        camp_name = resources["camp_name"]
+        owner = resources["owner"]
+        volumes = [v for v in self.volume_manager.find_volumes(camp_name) if v["owner"] == owner]
+        available = [v for v in volumes if v["state"] == "available"]
+
+        if available:
+            volume = max(available, key=lambda v: v["size"])
+
+            if volume["size"] < cache_config["size"]:
+                logger.warning(
+                    "Cache volume %s is %sGB, smaller than the configured %sGB",
+                    volume["volume_id"],
+                    volume["size"],
+                    cache_config["size"],
+                )
+
+            logger.info(
+                "Reusing cache volume %s in %s",
+                volume["volume_id"],
+                volume["availability_zone"],
+            )
+            return volume
+
+        if volumes:
+            logger.warning(
+                "Cache volume %s for camp '%s' is attached to %s, launching without it",
+                volumes[0]["volume_id"],
+                camp_name,
+                volumes[0]["instance_id"],
+            )
+            return None
+
+        availability_zone = self.volume_manager.select_availability_zone(resources["instance_type"])
+        volume = self.volume_manager.create_volume(
+            camp_name, owner, availability_zone, cache_config["size"]
+        )
+        resources["created_cache_volume_id"] = volume["volume_id"]
+
+        return volume
+
     def _rollback_resources(self, resources: dict[str, Any]) -> None:
         """Clean up resources after failed launch.
 
@@ -513,6 +643,7 @@ class EC2Manager:
         instance = resources.get("instance")
         if instance:
             try:
+                self._cancel_spot_request(instance.spot_instance_request_id)
                 instance.terminate()
                 logger.debug("Instance terminated successfully during rollback")
             except ClientError as cleanup_error:
@@ -521,6 +652,18 @@ class EC2Manager:
                     cleanup_error,
                 )
 
+        created_volume_id = resources.get("created_cache_volume_id")
+        if created_volume_id:
+            try:
+                self.volume_manager.delete_volume(created_volume_id)
+                logger.debug("Cache volume %s deleted during rollback", created_volume_id)
+            except (ProviderError, WaiterError) as cleanup_error:
+                logger.warning(
+                    "Failed to delete cache volume %s during rollback: %s",
+                    created_volume_id,
+                    cleanup_error,
+                )
+
         sg_id = resources.get("sg_id")
         if sg_id:
             if delete_security_group_with_retry(self.ec2_client, sg_id):
@@ -547,6 +690,44 @@ class EC2Manager:
             except OSError as cleanup_error:
                 logger.warning("Failed to delete key file during rollback: %s", cleanup_error)
 
+    def _cancel_spot_request(self, spot_request_id: str | None) -> None:
+        """Cancel the persistent spot request behind an instance.
+
+        Without this, terminating a spot instance would make EC2 fulfill the
+        request again with a new instance. A failed cancel is logged rather
+        than raised so callers still terminate the instance.
+
+        Parameters
+        ----------
+        spot_request_id : str | None
+            Spot instance request ID, or None for on-demand instances
+        """
+        if not spot_request_id:
+            return
+
+        try:
+            self.ec2_client.cancel_spot_instance_requests(SpotInstanceRequestIds=[spot_request_id])
+        except ClientError as e:
+            logger.warning(
+                "Failed to cancel spot request %s, EC2 may launch a replacement instance: %s",
+                spot_request_id,
+                e,
+            )
+            return
+
+        logger.debug("Spot request %s cancelled", spot_request_id)
+
+    def interruption_watch_command(self) -> str:
+        """Return the command that waits on a spot instance for an interruption notice.
+
+        Returns
+        -------
+        str
+            Shell command that prints the instance-action document and exits
+            once EC2 schedules the instance to be reclaimed
+        """
+        return build_interruption_watch_command(SPOT_INTERRUPTION_POLL_SECONDS)
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=1, max=10),
@@ -565,34 +746,22 @@ class EC2Manager:
             If describe_regions API call fails after all retries
         """
         ec2_client = self.boto3_client_factory("ec2", region_name=self.region)
-        try:
-            regions_response = ec2_client.describe_regions()
-            return [r["RegionName"] for r in regions_response["Regions"]]
-        finally:
-            ec2_client.close()
+        regions_response = ec2_client.describe_regions()
+        return [r["RegionName"] for r in regions_response["Regions"]]
 
-    def list_instances(self, region_filter: str | None = None) -> list[dict[str, Any]]:
-        """List all campers-managed instances across regions.
+    def _resolve_regions(self, region_filter: str | None) -> list[str]:
+        """Resolve the regions to query for campers-managed resources.
 
         Parameters
         ----------
         region_filter : str | None
-            Optional AWS region to filter results (e.g., "us-east-1")
-            If None, queries all regions
+            Optional AWS region to restrict the query to
 
         Returns
         -------
-        list[dict[str, Any]]
-            List of instance dictionaries with keys: instance_id, name, state,
-            region, instance_type, launch_time, camp_config
-
-        Notes
-        -----
-        When querying all regions (region_filter=None), this method performs
-        sequential API calls to each AWS region (N+1 pattern: 1 call to
-        describe_regions, then N calls to describe_instances per region).
-        With 20+ AWS regions, total latency may reach several seconds depending
-        on network conditions and number of instances per region.
+        list[str]
+            Region names, falling back to the manager's region when the region
+            list cannot be fetched
         """
         if region_filter:
             regions = [region_filter]
@@ -621,10 +790,37 @@ class EC2Manager:
                 )
                 regions = [self.region]
 
+        return regions
+
+    def list_instances(self, region_filter: str | None = None) -> list[dict[str, Any]]:
+        """List all campers-managed instances across regions.
+
+        Parameters
+        ----------
+        region_filter : str | None
+            Optional AWS region to filter results (e.g., "us-east-1")
+            If None, queries all regions
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            List of instance dictionaries with keys: instance_id, name, state,
+            region, availability_zone, instance_type, market, launch_time,
+            camp_config, owner, unique_id
+
+        Notes
+        -----
+        When querying all regions (region_filter=None), this method performs
+        sequential API calls to each AWS region (N+1 pattern: 1 call to
+        describe_regions, then N calls to describe_instances per region).
+        With 20+ AWS regions, total latency may reach several seconds depending
+        on network conditions and number of instances per region.
+        """
+        regions = self._resolve_regions(region_filter)
+
         instances = []
 
         for region in regions:
-            regional_ec2 = None
             try:
                 with handle_aws_errors():
                     regional_ec2 = self.boto3_client_factory("ec2", region_name=region)
@@ -651,10 +847,15 @@ class EC2Manager:
                                         "name": tags.get("Name", "N/A"),
                                         "state": instance["State"]["Name"],
                                         "region": region,
+                                        "availability_zone": instance.get("Placement", {}).get(
+                                            "AvailabilityZone"
+                                        ),
                                         "instance_type": instance["InstanceType"],
+                                        "market": instance_market(instance),
                                         "launch_time": instance["LaunchTime"],
                                         "camp_config": tags.get("MachineConfig", "ad-hoc"),
                                         "owner": tags.get("Owner", "unknown"),
+                                        "unique_id": tags.get("UniqueId"),
                                     }
                                 )
             except ProviderCredentialsError:
@@ -665,12 +866,6 @@ class EC2Manager:
             except ProviderConnectionError as e:
                 logger.warning("Failed to query region %s: %s", region, e)
                 continue
-            finally:
-                if regional_ec2 is not None:
-                    try:
-                        regional_ec2.close()
-                    except (AttributeError, OSError) as e:
-                        logger.debug("Failed to close regional EC2 client for %s: %s", region, e)
 
         seen = set()
         unique_instances = []
@@ -684,6 +879,35 @@ class EC2Manager:
 
         return unique_instances
 
+    def list_cache_volumes(self, region_filter: str | None = None) -> list[dict[str, Any]]:
+        """List persistent cache volumes across regions.
+
+        Parameters
+        ----------
+        region_filter : str | None
+            Optional AWS region to filter results
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Volumes with keys: volume_id, camp_config, owner, size, state,
+            availability_zone, region, instance_id
+        """
+        volumes = []
+
+        for region in self._resolve_regions(region_filter):
+            try:
+                with handle_aws_errors():
+                    regional_ec2 = self.boto3_client_factory("ec2", region_name=region)
+                volumes.extend(CacheVolumeManager(regional_ec2, region).find_volumes())
+            except ProviderCredentialsError:
+                raise
+            except (ProviderAPIError, ProviderConnectionError) as e:
+                logger.warning("Failed to query cache volumes in region %s: %s", region, e)
+                continue
+
+        return volumes
+
     def find_instances_by_name_or_id(
         self, name_or_id: str, region_filter: str | None = None
     ) -> list[dict[str, Any]]:
@@ -737,6 +961,7 @@ class EC2Manager:
         ProviderAPIError
             If AWS API call fails
         """
+        forget_ssh_tags(instance_id)
         logger.info("Stopping instance %s...", instance_id)
 
         with handle_aws_errors():
@@ -786,6 +1011,7 @@ class EC2Manager:
             If instance fails to reach running state within timeout or
             if instance is not in stopped state
         """
+        forget_ssh_tags(instance_id)
         logger.info("Starting instance %s...", instance_id)
 
         response = self.ec2_client.describe_instances(InstanceIds=[instance_id])
@@ -800,6 +1026,7 @@ class EC2Manager:
                 "private_ip": instance.get("PrivateIpAddress"),
                 "state": current_state,
                 "instance_type": instance.get("InstanceType"),
+                "market": instance_market(instance),
                 "launch_time": instance.get("LaunchTime"),
             }
 
@@ -854,6 +1081,8 @@ class EC2Manager:
             "unique_id": unique_id,
             "key_file": key_file,
             "launch_time": instance.get("LaunchTime"),
+            "ami_id": instance.get("ImageId"),
+            "market": instance_market(instance),
         }
 
     def get_volume_size(self, instance_id: str) -> int | None:
@@ -935,20 +1164,13 @@ class EC2Manager:
         bool
             True if region is valid, False otherwise
         """
-        ec2 = None
         try:
-            config = Config(
-                connect_timeout=5, read_timeout=30, retries={"max_attempts": 3, "mode": "adaptive"}
-            )
-            ec2 = boto3.client("ec2", region_name=region, config=config)
+            ec2 = self.boto3_client_factory("ec2", region_name=region)
             ec2.describe_regions(RegionNames=[region])
             return True
         except (ClientError, NoCredentialsError, EndpointConnectionError, ConnectTimeoutError) as e:
             logger.warning("Unable to validate region %s: %s", region, e)
             return False
-        finally:
-            if ec2:
-                ec2.close()
 
     def terminate_instance(self, instance_id: str) -> None:
         """Terminate instance and clean up resources.
@@ -963,12 +1185,16 @@ class EC2Manager:
         RuntimeError
             If instance fails to terminate within timeout
         """
+        forget_ssh_tags(instance_id)
         instance = self.ec2_resource.Instance(instance_id)
 
         unique_id = extract_tag_value(instance.tags or [], "UniqueId")
 
         sg_id = instance.security_groups[0]["GroupId"] if instance.security_groups else None
 
+        cache_volume_ids = self.volume_manager.find_attached_volume_ids(instance_id)
+
+        self._cancel_spot_request(instance.spot_instance_request_id)
         instance.terminate()
 
         try:
@@ -983,6 +1209,13 @@ class EC2Manager:
         except WaiterError as e:
             raise ProviderAPIError(f"Failed to terminate instance: {e}") from e
 
+        if cache_volume_ids:
+            try:
+                self.volume_manager.wait_until_detached(cache_volume_ids)
+                logger.info("Cache volume %s detached and kept", ", ".join(cache_volume_ids))
+            except (ProviderError, WaiterError) as e:
+                logger.warning("Cache volume did not detach cleanly: %s", e)
+
         if unique_id:
             try:
                 self.ec2_client.delete_key_pair(KeyName=f"campers-{unique_id}")
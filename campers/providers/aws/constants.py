@@ -177,6 +177,41 @@ Maps regional codes (e.g., 'us-east-1') to human-readable location
 descriptions used in pricing API responses and user-facing output.
 """
 
+PRICING_CACHE_FILE = "cache/pricing.json"
+"""Path under CAMPERS_DIR of the persistent EC2 and EBS price store."""
+
+PRICING_CACHE_VERSION = 1
+"""Format version of the price store; files with another version are ignored."""
+
+PRICING_CACHE_TTL_SECONDS = 7 * 24 * 3600
+"""Age after which a stored price is refreshed.
+
+On-demand prices change a few times a year at most, so a week keeps the store
+current while letting `campers list` run without Pricing API calls. Stale
+prices are still shown while a background refresh runs.
+"""
+
+PRICING_PREFETCH_PAGE_SIZE = 100
+"""Page size of the get_products calls made by `campers pricing prefetch`."""
+
+PRICING_REFRESH_JOIN_TIMEOUT = 5.0
+"""Seconds PricingService.close() waits for background price refreshes."""
+
+PRICING_SNAPSHOT_FILE = "cache/pricing.snapshot"
+"""Path under CAMPERS_DIR of the imported offline price snapshot."""
+
+PRICING_SNAPSHOT_MAGIC = b"CMPPRICE"
+"""Leading bytes identifying a campers price snapshot."""
+
+PRICING_SNAPSHOT_VERSION = 1
+"""Format version of price snapshots; other versions are rejected on import."""
+
+PRICING_SNAPSHOT_KEY_BYTES = 48
+"""Fixed width of the 'kind:region:type' key of a snapshot slot.
+
+The longest EC2 key today ('ec2:ap-southeast-4:u-24tb1.112xlarge') is 36 bytes.
+"""
+
 
 DEFAULT_INSTANCE_TYPE = "t3.medium"
 """Default EC2 instance type for new instances.
@@ -210,6 +245,13 @@ Controls how many times boto3 will retry failed API calls using adaptive
 retry strategy.
 """
 
+BOTO3_MAX_POOL_CONNECTIONS = 32
+"""Maximum pooled HTTP connections per shared boto3 client.
+
+botocore defaults to 10, which throttles concurrent callers sharing one
+client, such as dataset staging workers and per-region listing threads.
+"""
+
 BOTO3_PAGINATION_MAX_RESULTS_SMALL = 5
 """Max results for pagination queries returning small result sets.
 
@@ -223,6 +265,64 @@ BOTO3_PAGINATION_MAX_RESULTS_SINGLE = 1
 Used for pricing API queries where we only need the first/best result.
 """
 
+CACHE_VOLUME_DEVICE_NAME = "/dev/sdf"
+"""Block device name used when attaching a camp's cache volume.
+
+On Nitro instances the volume appears as an NVMe device instead; the mount
+script locates it through its /dev/disk/by-id serial.
+"""
+
+CACHE_VOLUME_TAG = "CacheVolume"
+"""Tag key holding the camp name on persistent cache volumes."""
+
+DATASET_URL_EXPIRY_SECONDS = 6 * 3600
+"""Lifetime in seconds of the pre-signed URLs handed to the instance.
+
+Six hours covers multi-terabyte downloads on slower instance types; the
+instance never receives long-lived credentials.
+"""
+
+SPOT_CAPACITY_ERROR_CODES = frozenset(
+    [
+        "InsufficientInstanceCapacity",
+        "SpotMaxPriceTooLow",
+        "MaxSpotInstanceCountExceeded",
+        "UnfulfillableCapacity",
+    ]
+)
+"""EC2 error codes after which spot-with-fallback launches on-demand instead."""
+
+SPOT_PRODUCT_DESCRIPTION = "Linux/UNIX"
+"""Product description used to look up current spot prices."""
+
+SPOT_PRICE_CACHE_TTL_HOURS = 1
+"""Hours current spot prices are reused in memory.
+
+Spot prices change over time, so unlike on-demand prices they are not kept
+in the price store.
+"""
+
+THROTTLING_ERROR_CODES = frozenset(
+    [
+        "Throttling",
+        "ThrottlingException",
+        "ThrottledException",
+        "RequestThrottled",
+        "RequestThrottledException",
+        "RequestLimitExceeded",
+        "TooManyRequestsException",
+        "ProvisionedThroughputExceededException",
+        "BandwidthLimitExceeded",
+        "SlowDown",
+        "EC2ThrottledException",
+        "PriorRequestNotComplete",
+    ]
+)
+"""AWS error codes counted as throttled attempts in API call accounting.
+
+Mirrors the codes botocore's retry handlers treat as throttling.
+"""
+
 
 class InstanceState(str, Enum):
     """EC2 instance state values."""
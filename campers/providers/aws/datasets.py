@@ -0,0 +1,177 @@
+"""S3 dataset planning for on-instance staging."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from campers.providers.aws.client_factory import AWSClientFactory
+from campers.providers.aws.constants import DATASET_URL_EXPIRY_SECONDS
+from campers.providers.aws.errors import handle_aws_errors
+
+logger = logging.getLogger(__name__)
+
+
+def parse_s3_uri(uri: str) -> tuple[str, str]:
+    """Split an S3 URI into bucket and key prefix.
+
+    Parameters
+    ----------
+    uri : str
+        URI such as ``s3://bucket/path/to/prefix``
+
+    Returns
+    -------
+    tuple[str, str]
+        Bucket name and key (or prefix), without a leading slash
+
+    Raises
+    ------
+    ValueError
+        If the URI does not use the s3:// scheme or lacks a bucket
+    """
+    if not uri.startswith("s3://"):
+        raise ValueError(f"Dataset source must be an s3:// URI: {uri}")
+
+    bucket, _, key = uri[len("s3://") :].partition("/")
+
+    if not bucket:
+        raise ValueError(f"Dataset source is missing a bucket name: {uri}")
+
+    return bucket, key
+
+
+class S3DatasetPlanner:
+    """Build staging plans that let the instance download S3 objects directly.
+
+    Objects are listed locally and handed to the instance as pre-signed URLs,
+    so the instance needs neither AWS credentials nor the AWS CLI.
+
+    Parameters
+    ----------
+    region : str
+        AWS region used for the S3 client
+    client_factory : Callable[..., Any] | None
+        Factory returning a boto3 client (default: AWSClientFactory.get_client)
+    """
+
+    def __init__(
+        self,
+        region: str,
+        client_factory: Callable[..., Any] | None = None,
+    ) -> None:
+        if client_factory is None:
+            client_factory = AWSClientFactory().get_client
+
+        self.region = region
+        self.s3_client = client_factory("s3", region_name=region)
+
+    def list_objects(self, source: str) -> list[dict[str, Any]]:
+        """List objects under an S3 URI.
+
+        Parameters
+        ----------
+        source : str
+            S3 URI of a single object or a prefix
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Objects with bucket, key, path (relative to the prefix), size and etag
+
+        Raises
+        ------
+        ValueError
+            If the URI is invalid or matches no objects
+        """
+        bucket, key = parse_s3_uri(source)
+        prefix = key if not key or key.endswith("/") else f"{key}/"
+        objects = []
+
+        with handle_aws_errors():
+            paginator = self.s3_client.get_paginator("list_objects_v2")
+
+            for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+                for item in page.get("Contents", []):
+                    if item["Key"].endswith("/"):
+                        continue
+
+                    objects.append(
+                        {
+                            "bucket": bucket,
+                            "key": item["Key"],
+                            "path": item["Key"][len(prefix) :],
+                            "size": item["Size"],
+                            "etag": item["ETag"].strip('"'),
+                        }
+                    )
+
+            if not objects and key and not key.endswith("/"):
+                head = self.s3_client.head_object(Bucket=bucket, Key=key)
+                objects.append(
+                    {
+                        "bucket": bucket,
+                        "key": key,
+                        "path": key.rsplit("/", 1)[-1],
+                        "size": head["ContentLength"],
+                        "etag": head["ETag"].strip('"'),
+                    }
+                )
+
+        if not objects:
+            raise ValueError(f"No objects found for dataset source {source}")
+
+        return objects
+
+    def build_plan(
+        self,
+        datasets: list[dict[str, Any]],
+        concurrency: int,
+        part_size: int,
+    ) -> dict[str, Any]:
+        """Build the staging plan consumed by the remote dataset stager.
+
+        Parameters
+        ----------
+        datasets : list[dict[str, Any]]
+            Dataset entries with 'source' (S3 URI) and 'target' (remote path)
+        concurrency : int
+            Number of parallel downloads on the instance
+        part_size : int
+            Size in bytes of each ranged request for large objects
+
+        Returns
+        -------
+        dict[str, Any]
+            Plan with pre-signed object URLs grouped by target directory
+        """
+        plan_datasets = []
+
+        for dataset in datasets:
+            objects = self.list_objects(dataset["source"])
+
+            with handle_aws_errors():
+                plan_objects = [
+                    {
+                        "path": obj["path"],
+                        "size": obj["size"],
+                        "etag": obj["etag"],
+                        "url": self.s3_client.generate_presigned_url(
+                            "get_object",
+                            Params={"Bucket": obj["bucket"], "Key": obj["key"]},
+                            ExpiresIn=DATASET_URL_EXPIRY_SECONDS,
+                        ),
+                    }
+                    for obj in objects
+                ]
+
+            logger.debug(
+                "Planned %d objects from %s to %s",
+                len(plan_objects),
+                dataset["source"],
+                dataset["target"],
+            )
+            plan_datasets.append({"target": dataset["target"], "objects": plan_objects})
+
+        return {"concurrency": concurrency, "part_size": part_size, "datasets": plan_datasets}
@@ -0,0 +1,135 @@
+"""botocore event hooks that trace and account for AWS API calls.
+
+The hooks are registered once on a boto3 session and do nothing unless a
+tracer (`campers run --profile`) or an API call recorder (`--api-stats`) is
+active.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import boto3
+
+from campers.core.api_stats import ApiCall, get_api_recorder
+from campers.core.tracing import get_tracer
+from campers.providers.aws.constants import THROTTLING_ERROR_CODES
+
+AWS_SPAN_CATEGORY = "aws"
+"""Category of the spans recorded for AWS API calls."""
+
+_CONTEXT_KEY = "campers_call"
+
+
+def _before_call(model: Any, context: dict[str, Any], **kwargs: Any) -> None:
+    """Start timing an API call when tracing or accounting is active."""
+    tracer = get_tracer()
+
+    if tracer is None and get_api_recorder() is None:
+        return
+
+    service = model.service_model.service_name
+    region = context.get("client_region") or ""
+    context[_CONTEXT_KEY] = {
+        "service": service,
+        "operation": model.name,
+        "region": region,
+        "start": time.perf_counter(),
+        "attempts": 1,
+        "throttles": 0,
+        "span": (
+            tracer.begin(f"{service}.{model.name}", AWS_SPAN_CATEGORY, region=region)
+            if tracer is not None
+            else None
+        ),
+    }
+
+
+def _needs_retry(
+    request_dict: dict[str, Any],
+    response: tuple[Any, dict[str, Any]] | None,
+    attempts: int,
+    **kwargs: Any,
+) -> None:
+    """Count attempts, and those rejected with a throttling error.
+
+    Emitted after every attempt, including ones botocore retries internally
+    and connection errors, which never reach after-call.
+    """
+    call = request_dict.get("context", {}).get(_CONTEXT_KEY)
+
+    if call is None:
+        return
+
+    call["attempts"] = attempts
+
+    if response is not None and response[1].get("Error", {}).get("Code") in THROTTLING_ERROR_CODES:
+        call["throttles"] += 1
+
+
+def _after_call(context: dict[str, Any], parsed: dict[str, Any], **kwargs: Any) -> None:
+    """Finish an API call that got a response."""
+    error = parsed.get("Error", {}).get("Code", "")
+    status = getattr(kwargs.get("http_response"), "status_code", "")
+    _finish_call(context, error=error, status=status)
+
+
+def _after_call_error(context: dict[str, Any], exception: Exception, **kwargs: Any) -> None:
+    """Finish an API call that failed without a response."""
+    _finish_call(context, error=type(exception).__name__)
+
+
+def _finish_call(context: dict[str, Any], error: str, **span_args: Any) -> None:
+    """Close the call's span and record it on the active recorder."""
+    call = context.pop(_CONTEXT_KEY, None)
+
+    if call is None:
+        return
+
+    seconds = time.perf_counter() - call["start"]
+    retries = call["attempts"] - 1
+    tracer = get_tracer()
+    recorder = get_api_recorder()
+
+    if call["span"] is not None and tracer is not None:
+        details = {"retries": retries, "throttles": call["throttles"], **span_args}
+
+        if error:
+            details["error"] = error
+
+        tracer.end(call["span"], **details)
+
+    if recorder is not None:
+        recorder.record(
+            ApiCall(
+                service=call["service"],
+                operation=call["operation"],
+                region=call["region"],
+                seconds=seconds,
+                retries=retries,
+                throttles=call["throttles"],
+                error=error,
+            )
+        )
+
+
+def install_api_hooks(session: boto3.Session | None = None) -> None:
+    """Register the tracing and accounting hooks on a boto3 session.
+
+    EC2Manager, PricingService, AWSClientFactory and the SSH helpers all
+    create their clients from boto3's default session. Clients copy the
+    session's event handlers when they are created, so the hooks must be
+    installed before a command creates its clients. Registering again is a
+    no-op.
+
+    Parameters
+    ----------
+    session : boto3.Session | None
+        Session to instrument, defaults to boto3's default session
+    """
+    events = (session or boto3._get_default_session()).events
+    events.register("before-call", _before_call, unique_id="campers-api-before-call")
+    events.register("needs-retry", _needs_retry, unique_id="campers-api-needs-retry")
+    events.register("after-call", _after_call, unique_id="campers-api-after-call")
+    events.register("after-call-error", _after_call_error, unique_id="campers-api-after-call-error")
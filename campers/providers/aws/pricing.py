@@ -1,24 +1,41 @@
 """AWS Pricing service for EC2 and EBS cost calculations.
 
 This module provides pricing information retrieval from AWS Price List API
-with in-memory caching to minimize API calls.
+with in-memory caching and a persistent price store to minimize API calls.
 """
 
 import json
 import logging
 import threading
-from datetime import datetime, timedelta
+import time
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from typing import Any
 
-import boto3
-from botocore.config import Config
-from botocore.exceptions import ClientError, NoCredentialsError
+from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
 
+from campers.providers.aws.client_factory import AWSClientFactory
 from campers.providers.aws.constants import (
     PRICING_API_REGION,
+    PRICING_PREFETCH_PAGE_SIZE,
+    PRICING_REFRESH_JOIN_TIMEOUT,
     REGION_TO_LOCATION,
+    SPOT_PRICE_CACHE_TTL_HOURS,
+    SPOT_PRODUCT_DESCRIPTION,
 )
-from campers.providers.aws.pricing_parsers import parse_ebs_pricing, parse_ec2_pricing
+from campers.providers.aws.pricing_parsers import (
+    parse_ebs_pricing,
+    parse_ec2_pricing,
+    parse_price_item,
+)
+from campers.providers.aws.pricing_snapshot import (
+    PricingSnapshot,
+    import_snapshot,
+    write_snapshot,
+)
+from campers.providers.aws.pricing_store import PricingStore, pricing_store_enabled
+from campers.providers.exceptions import ProviderAPIError
 
 logger = logging.getLogger(__name__)
 
@@ -87,12 +104,20 @@ class PricingService:
     Parameters
     ----------
     use_cache : bool, default=True
-        Enable in-memory caching with 24-hour TTL
+        Enable in-memory caching with 24-hour TTL and the persistent price
+        store
+    store : PricingStore | None
+        Price store to use, defaults to the one under CAMPERS_DIR unless
+        CAMPERS_DISABLE_PRICING_CACHE=1
+    snapshot : PricingSnapshot | None
+        Offline price snapshot to fall back to, defaults to the one imported
+        with `campers pricing import` unless CAMPERS_DISABLE_PRICING_CACHE=1
 
     Attributes
     ----------
     pricing_available : bool
-        True if AWS Pricing API is accessible, False otherwise
+        True if AWS Pricing API is accessible or a price snapshot is
+        imported, False otherwise
 
     Notes
     -----
@@ -101,30 +126,51 @@ class PricingService:
     handles environments where Pricing API is unavailable (e.g., LocalStack).
     Thread-safe initialization using lock to prevent race conditions when
     multiple threads access pricing_available during initialization.
+
+    Stored prices are returned without an API call. Stale ones are still
+    returned while a background thread refreshes them, so lookups only wait
+    on the Pricing API for types that were never fetched. Prices the API
+    cannot provide, e.g. in air-gapped or LocalStack environments, are read
+    from the snapshot.
     """
 
     _init_lock = threading.Lock()
 
-    def __init__(self, use_cache: bool = True) -> None:
+    def __init__(
+        self,
+        use_cache: bool = True,
+        store: PricingStore | None = None,
+        snapshot: PricingSnapshot | None = None,
+    ) -> None:
         self.cache = PricingCache() if use_cache else None
+        self.spot_cache = PricingCache(SPOT_PRICE_CACHE_TTL_HOURS) if use_cache else None
+
+        if store is None and use_cache and pricing_store_enabled():
+            store = PricingStore()
+
+        if snapshot is None and pricing_store_enabled():
+            try:
+                snapshot = PricingSnapshot.open()
+            except (OSError, ValueError) as e:
+                logger.warning("Ignoring imported price snapshot: %s", e)
+
+        self.store = store
+        self.snapshot = snapshot
         self.pricing_available = False
         self.pricing_client = None
+        self._refresh_threads: list[threading.Thread] = []
 
         with self._init_lock:
             try:
-                config = Config(
-                    connect_timeout=5,
-                    read_timeout=30,
-                    retries={"max_attempts": 3, "mode": "adaptive"},
-                )
-                self.pricing_client = boto3.client(
-                    "pricing", region_name=PRICING_API_REGION, config=config
+                self.pricing_client = AWSClientFactory().get_client(
+                    "pricing", region_name=PRICING_API_REGION
                 )
                 self.pricing_available = True
                 logger.debug("AWS Pricing API initialized successfully")
             except (ClientError, NoCredentialsError) as e:
                 logger.debug("Failed to initialize AWS Pricing API: %s", e)
                 self.pricing_client = None
+                self.pricing_available = self.snapshot is not None
 
     def get_ec2_hourly_rate(
         self,
@@ -150,30 +196,20 @@ class PricingService:
 
         Notes
         -----
-        Results are cached with 24-hour TTL to minimize API calls.
-        Returns None for unsupported regions or when API is unavailable.
+        Results are cached in memory and in the price store to minimize API
+        calls. Returns None for unsupported regions or when API is unavailable.
         """
         if not self.pricing_available:
             return None
 
-        cache_key = f"ec2_{instance_type}_{region}_{operating_system}"
-
-        if self.cache:
-            cached = self.cache.get(cache_key)
-
-            if cached is not None:
-                return cached
-
-        try:
-            rate = self._fetch_ec2_rate_from_api(instance_type, region, operating_system)
-
-            if self.cache and rate is not None:
-                self.cache.set(cache_key, rate)
-
-            return rate
-        except (ClientError, json.JSONDecodeError, TypeError, ValueError, KeyError) as e:
-            logger.error("Failed to fetch EC2 pricing: %s", e)
-            return None
+        return self._get_rate(
+            kind="ec2",
+            region=region,
+            key=instance_type if operating_system == "Linux" else None,
+            cache_key=f"ec2_{instance_type}_{region}_{operating_system}",
+            fetch=lambda: self._fetch_ec2_rate_from_api(instance_type, region, operating_system),
+            label="EC2",
+        )
 
     def _fetch_ec2_rate_from_api(
         self,
@@ -209,15 +245,7 @@ class PricingService:
             ServiceCode="AmazonEC2",
             Filters=[
                 {"Type": "TERM_MATCH", "Field": "instanceType", "Value": instance_type},
-                {"Type": "TERM_MATCH", "Field": "location", "Value": location},
-                {
-                    "Type": "TERM_MATCH",
-                    "Field": "operatingSystem",
-                    "Value": operating_system,
-                },
-                {"Type": "TERM_MATCH", "Field": "preInstalledSw", "Value": "NA"},
-                {"Type": "TERM_MATCH", "Field": "tenancy", "Value": "Shared"},
-                {"Type": "TERM_MATCH", "Field": "capacitystatus", "Value": "Used"},
+                *_ec2_filters(location, operating_system),
             ],
             MaxResults=1,
         )
@@ -248,30 +276,20 @@ class PricingService:
 
         Notes
         -----
-        Results are cached with 24-hour TTL to minimize API calls.
-        Returns None for unsupported regions or when API is unavailable.
+        Results are cached in memory and in the price store to minimize API
+        calls. Returns None for unsupported regions or when API is unavailable.
         """
         if not self.pricing_available:
             return None
 
-        cache_key = f"ebs_{region}_{volume_type}"
-
-        if self.cache:
-            cached = self.cache.get(cache_key)
-
-            if cached is not None:
-                return cached
-
-        try:
-            rate = self._fetch_ebs_rate_from_api(region, volume_type)
-
-            if self.cache and rate is not None:
-                self.cache.set(cache_key, rate)
-
-            return rate
-        except (ClientError, json.JSONDecodeError, TypeError, ValueError, KeyError) as e:
-            logger.error("Failed to fetch EBS pricing: %s", e)
-            return None
+        return self._get_rate(
+            kind="ebs",
+            region=region,
+            key=volume_type,
+            cache_key=f"ebs_{region}_{volume_type}",
+            fetch=lambda: self._fetch_ebs_rate_from_api(region, volume_type),
+            label="EBS",
+        )
 
     def _fetch_ebs_rate_from_api(
         self,
@@ -303,8 +321,7 @@ class PricingService:
         response = self.pricing_client.get_products(
             ServiceCode="AmazonEC2",
             Filters=[
-                {"Type": "TERM_MATCH", "Field": "productFamily", "Value": "Storage"},
-                {"Type": "TERM_MATCH", "Field": "location", "Value": location},
+                *_ebs_filters(location),
                 {"Type": "TERM_MATCH", "Field": "volumeApiName", "Value": volume_type},
             ],
             MaxResults=1,
@@ -315,6 +332,299 @@ class PricingService:
 
         return parse_ebs_pricing(response["PriceList"][0])
 
+    def get_spot_hourly_rate(
+        self,
+        instance_type: str,
+        region: str,
+        availability_zone: str | None = None,
+    ) -> float | None:
+        """Fetch the current Linux spot hourly rate from EC2 spot price history.
+
+        Parameters
+        ----------
+        instance_type : str
+            EC2 instance type (e.g., "t3.medium", "g5.2xlarge")
+        region : str
+            AWS region code (e.g., "us-east-1")
+        availability_zone : str | None
+            Zone the instance runs in; the lowest price across the region's
+            zones if None, which is where new spot requests usually land
+
+        Returns
+        -------
+        float or None
+            Hourly rate in USD, or None if no spot price is published
+
+        Notes
+        -----
+        Spot prices come from the regional EC2 API rather than the Pricing
+        API, so they are available wherever EC2 is. They are cached in memory
+        for SPOT_PRICE_CACHE_TTL_HOURS and never kept in the price store.
+        """
+        cache_key = f"spot_{instance_type}_{region}_{availability_zone or ''}"
+
+        if self.spot_cache:
+            cached = self.spot_cache.get(cache_key)
+
+            if cached is not None:
+                return cached
+
+        zone_filter = {"AvailabilityZone": availability_zone} if availability_zone else {}
+
+        try:
+            ec2_client = AWSClientFactory().get_client("ec2", region_name=region)
+            response = ec2_client.describe_spot_price_history(
+                InstanceTypes=[instance_type],
+                ProductDescriptions=[SPOT_PRODUCT_DESCRIPTION],
+                StartTime=datetime.now(UTC),
+                **zone_filter,
+            )
+            prices = [float(entry["SpotPrice"]) for entry in response["SpotPriceHistory"]]
+        except (ClientError, BotoCoreError, KeyError, ValueError) as e:
+            logger.debug("Failed to fetch spot price: %s", e)
+            return None
+
+        if not prices:
+            return None
+
+        rate = min(prices)
+
+        if self.spot_cache:
+            self.spot_cache.set(cache_key, rate)
+
+        return rate
+
+    def _get_rate(
+        self,
+        kind: str,
+        region: str,
+        key: str | None,
+        cache_key: str,
+        fetch: Callable[[], float | None],
+        label: str,
+    ) -> float | None:
+        """Return a rate from memory, the price store, or the Pricing API.
+
+        Parameters
+        ----------
+        kind : str
+            Price store kind, 'ec2' or 'ebs'
+        region : str
+            AWS region code
+        key : str | None
+            Price store and snapshot key, or None for prices they do not hold
+        cache_key : str
+            In-memory cache key
+        fetch : Callable[[], float | None]
+            Fetches the rate from the Pricing API
+        label : str
+            Price name used in error messages
+
+        Returns
+        -------
+        float or None
+            Rate in USD, or None if unavailable
+        """
+        if self.cache:
+            cached = self.cache.get(cache_key)
+
+            if cached is not None:
+                return cached
+
+        stored = self.store.lookup(kind, region, key) if self.store and key else None
+
+        if stored is not None:
+            if not stored.fresh:
+                thread = threading.Thread(
+                    target=self._fetch_and_store,
+                    args=(kind, region, key, fetch, label),
+                    daemon=True,
+                )
+                thread.start()
+                self._refresh_threads.append(thread)
+
+            if self.cache and stored.rate is not None:
+                self.cache.set(cache_key, stored.rate)
+
+            return stored.rate
+
+        rate = self._fetch_and_store(kind, region, key, fetch, label)
+
+        if rate is None and self.snapshot is not None and key:
+            rate = self.snapshot.lookup(kind, region, key)
+
+        if self.cache and rate is not None:
+            self.cache.set(cache_key, rate)
+
+        return rate
+
+    def _fetch_and_store(
+        self,
+        kind: str,
+        region: str,
+        key: str | None,
+        fetch: Callable[[], float | None],
+        label: str,
+    ) -> float | None:
+        """Fetch a rate from the Pricing API and record it in the price store.
+
+        Any API failure, including an unreachable endpoint or missing
+        credentials, yields None so the caller can fall back to the snapshot.
+        """
+        try:
+            rate = fetch()
+        except (
+            ClientError,
+            BotoCoreError,
+            json.JSONDecodeError,
+            TypeError,
+            ValueError,
+            KeyError,
+        ) as e:
+            log = logger.debug if self.snapshot is not None else logger.error
+            log("Failed to fetch %s pricing: %s", label, e)
+            return None
+
+        if self.store and key and rate is not None:
+            self.store.put(kind, region, key, rate)
+
+        return rate
+
+    def prefetch(self, regions: Iterable[str]) -> dict[str, int]:
+        """Store every Linux on-demand EC2 rate and EBS rate of the given regions.
+
+        Pages through the Pricing API once per region and price kind, so later
+        lookups for any instance or volume type in these regions are answered
+        from the price store.
+
+        Parameters
+        ----------
+        regions : Iterable[str]
+            AWS region codes
+
+        Returns
+        -------
+        dict[str, int]
+            Number of prices stored per region; regions without a known
+            pricing location are skipped
+
+        Raises
+        ------
+        ProviderAPIError
+            If the Pricing API rejects a request
+        """
+        counts: dict[str, int] = {}
+
+        if self.pricing_client is None or self.store is None:
+            return counts
+
+        for region in regions:
+            location = REGION_TO_LOCATION.get(region)
+
+            if location is None:
+                logger.debug("No pricing location for region %s", region)
+                continue
+
+            try:
+                rates = {
+                    "ec2": self._fetch_all_rates(_ec2_filters(location, "Linux"), "instanceType"),
+                    "ebs": self._fetch_all_rates(_ebs_filters(location), "volumeApiName"),
+                }
+            except ClientError as e:
+                raise ProviderAPIError(
+                    f"Failed to prefetch pricing for {region}: {e}",
+                    error_code=e.response.get("Error", {}).get("Code"),
+                    original_exception=e,
+                ) from e
+
+            self.store.put_region(region, rates)
+            counts[region] = sum(len(kind_rates) for kind_rates in rates.values())
+
+        return counts
+
+    def export_snapshot(self, path: Path) -> int:
+        """Write every stored price to an offline snapshot file.
+
+        Parameters
+        ----------
+        path : Path
+            Snapshot file to create or replace
+
+        Returns
+        -------
+        int
+            Number of prices written
+
+        Raises
+        ------
+        ValueError
+            If the price store is disabled or empty
+        """
+        prices = self.store.prices() if self.store else []
+
+        if not prices:
+            raise ValueError(
+                "No stored prices to export. Fetch them first with: campers pricing prefetch"
+            )
+
+        return write_snapshot(prices, path)
+
+    @staticmethod
+    def import_snapshot(source: Path) -> PricingSnapshot:
+        """Install an offline snapshot used when the Pricing API is unavailable.
+
+        Parameters
+        ----------
+        source : Path
+            Snapshot file written by export_snapshot
+
+        Returns
+        -------
+        PricingSnapshot
+            The installed snapshot, mapped; the caller closes it
+
+        Raises
+        ------
+        FileNotFoundError
+            If source does not exist
+        ValueError
+            If source is not a snapshot of a supported version
+        """
+        return import_snapshot(source)
+
+    def _fetch_all_rates(self, filters: list[dict[str, str]], attribute: str) -> dict[str, float]:
+        """Page through get_products and index rates by a product attribute.
+
+        Parameters
+        ----------
+        filters : list[dict[str, str]]
+            get_products filters
+        attribute : str
+            Product attribute naming each rate, e.g. 'instanceType'
+
+        Returns
+        -------
+        dict[str, float]
+            Rates by attribute value; the first product of each value wins,
+            as with single lookups
+        """
+        paginator = self.pricing_client.get_paginator("get_products")
+        rates: dict[str, float] = {}
+
+        for page in paginator.paginate(
+            ServiceCode="AmazonEC2",
+            Filters=filters,
+            PaginationConfig={"PageSize": PRICING_PREFETCH_PAGE_SIZE},
+        ):
+            for item in page.get("PriceList", []):
+                attributes, rate = parse_price_item(item)
+                name = attributes.get(attribute)
+
+                if name and rate is not None:
+                    rates.setdefault(name, rate)
+
+        return rates
+
     def get_instance_price(self, instance_type: str, region: str) -> float | None:
         """Get hourly price for an instance type in a region.
 
@@ -334,6 +644,29 @@ class PricingService:
         """
         return self.get_ec2_hourly_rate(instance_type, region)
 
+    def get_spot_price(
+        self, instance_type: str, region: str, availability_zone: str | None = None
+    ) -> float | None:
+        """Get the current spot hourly price for an instance type.
+
+        This method implements the PricingProvider protocol interface.
+
+        Parameters
+        ----------
+        instance_type : str
+            Instance type identifier (e.g., 't3.micro')
+        region : str
+            Region identifier
+        availability_zone : str | None
+            Zone the instance runs in; the lowest price in the region if None
+
+        Returns
+        -------
+        float or None
+            Hourly price in USD, or None if not available
+        """
+        return self.get_spot_hourly_rate(instance_type, region, availability_zone)
+
     def get_storage_price(self, region: str) -> float:
         """Get monthly price per GB for storage in a region.
 
@@ -353,19 +686,45 @@ class PricingService:
         return rate if rate is not None else 0.0
 
     def close(self) -> None:
-        """Close the pricing service and clean up boto3 client.
+        """Close the pricing service.
 
-        This method ensures proper cleanup of AWS API client resources
-        when the pricing service is no longer needed.
+        Waits up to PRICING_REFRESH_JOIN_TIMEOUT for background refreshes of
+        stale prices. The pricing client belongs to the shared client pool and
+        stays open for other pricing services in the process; this service
+        only drops its reference.
         """
-        if self.pricing_client is not None:
-            try:
-                self.pricing_client.close()
-            except (AttributeError, OSError) as e:
-                logger.debug("Failed to close pricing client: %s", e)
-            finally:
-                self.pricing_client = None
-                self.pricing_available = False
+        deadline = time.monotonic() + PRICING_REFRESH_JOIN_TIMEOUT
+
+        for thread in self._refresh_threads:
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
+
+        self._refresh_threads.clear()
+        self.pricing_client = None
+
+        if self.snapshot is not None:
+            self.snapshot.close()
+            self.snapshot = None
+
+        self.pricing_available = False
+
+
+def _ec2_filters(location: str, operating_system: str) -> list[dict[str, str]]:
+    """Return get_products filters for shared-tenancy on-demand instances."""
+    return [
+        {"Type": "TERM_MATCH", "Field": "location", "Value": location},
+        {"Type": "TERM_MATCH", "Field": "operatingSystem", "Value": operating_system},
+        {"Type": "TERM_MATCH", "Field": "preInstalledSw", "Value": "NA"},
+        {"Type": "TERM_MATCH", "Field": "tenancy", "Value": "Shared"},
+        {"Type": "TERM_MATCH", "Field": "capacitystatus", "Value": "Used"},
+    ]
+
+
+def _ebs_filters(location: str) -> list[dict[str, str]]:
+    """Return get_products filters for EBS storage."""
+    return [
+        {"Type": "TERM_MATCH", "Field": "productFamily", "Value": "Storage"},
+        {"Type": "TERM_MATCH", "Field": "location", "Value": location},
+    ]
 
 
 def calculate_monthly_cost(
@@ -374,6 +733,8 @@ def calculate_monthly_cost(
     state: str,
     volume_size_gb: int,
     pricing_service: PricingService | None = None,
+    market: str = "on-demand",
+    availability_zone: str | None = None,
 ) -> float | None:
     """Calculate estimated monthly cost for an EC2 instance.
 
@@ -389,6 +750,10 @@ def calculate_monthly_cost(
         Root volume size in GB
     pricing_service : PricingService or None, default=None
         Optional pricing service instance for reuse across multiple calls
+    market : str, default="on-demand"
+        "spot" prices running instances at the current spot rate
+    availability_zone : str or None, default=None
+        Zone of a spot instance, used to look up its spot rate
 
     Returns
     -------
@@ -397,7 +762,8 @@ def calculate_monthly_cost(
 
     Notes
     -----
-    For running instances, calculates: hourly_rate × 24 × 30
+    For running instances, calculates: hourly_rate × 24 × 30, where spot
+    instances use the current spot rate as if it held for the month
     For stopped instances, calculates: volume_size_gb × ebs_storage_rate
     Returns None when pricing data cannot be retrieved.
     """
@@ -405,7 +771,12 @@ def calculate_monthly_cost(
         pricing_service = PricingService()
 
     if state == "running":
-        hourly_rate = pricing_service.get_ec2_hourly_rate(instance_type, region)
+        if market == "spot":
+            hourly_rate = pricing_service.get_spot_hourly_rate(
+                instance_type, region, availability_zone
+            )
+        else:
+            hourly_rate = pricing_service.get_ec2_hourly_rate(instance_type, region)
 
         if hourly_rate is None:
             return None
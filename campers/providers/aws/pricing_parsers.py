@@ -23,8 +23,40 @@ def parse_aws_pricing_response(price_item_json: str) -> float | None:
     float or None
         USD rate for EC2 (hourly) or EBS (per GB-month), or None if parsing fails
     """
+    try:
+        return _on_demand_usd(json.loads(price_item_json))
+    except json.JSONDecodeError:
+        return None
+
+
+def parse_price_item(price_item_json: str) -> tuple[dict[str, str], float | None]:
+    """Extract product attributes and on-demand USD rate from a price list item.
+
+    Used when paging through every product of a region, where the attributes
+    tell which instance type or volume type the rate belongs to.
+
+    Parameters
+    ----------
+    price_item_json : str
+        JSON string from AWS Price List API response
+
+    Returns
+    -------
+    tuple[dict[str, str], float | None]
+        Product attributes (empty if unparseable) and the USD rate, or None
+    """
     try:
         data = json.loads(price_item_json)
+    except json.JSONDecodeError:
+        return {}, None
+
+    attributes = data.get("product", {}).get("attributes", {})
+    return attributes, _on_demand_usd(data)
+
+
+def _on_demand_usd(data: dict) -> float | None:
+    """Return the first on-demand USD price of a decoded price list item."""
+    try:
         terms = data.get("terms", {})
         on_demand = terms.get("OnDemand", {})
 
@@ -41,7 +73,7 @@ def parse_aws_pricing_response(price_item_json: str) -> float | None:
         usd_price = dimension.get("pricePerUnit", {}).get("USD")
 
         return float(usd_price) if usd_price is not None else None
-    except (json.JSONDecodeError, KeyError, ValueError, StopIteration):
+    except (KeyError, ValueError, StopIteration, AttributeError):
         return None
 
 
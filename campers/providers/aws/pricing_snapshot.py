@@ -0,0 +1,315 @@
+"""Offline snapshots of AWS EC2 and EBS prices for hosts without the Pricing API.
+
+A snapshot is a single binary file: a fixed header followed by an open
+addressing hash table of fixed-size slots, each holding a NUL-padded
+'kind:region:type' key and a little-endian float64 USD rate. The table has a
+power-of-two slot count at most half full, so a lookup hashes the key with
+CRC-32 and probes a few adjacent slots of the memory-mapped file without
+parsing or loading it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+import time
+import zlib
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import IO
+
+from campers.providers.aws.constants import (
+    PRICING_SNAPSHOT_FILE,
+    PRICING_SNAPSHOT_KEY_BYTES,
+    PRICING_SNAPSHOT_MAGIC,
+    PRICING_SNAPSHOT_VERSION,
+)
+
+logger = logging.getLogger(__name__)
+
+HEADER = struct.Struct("<8sHHIId")
+"""Magic, version, key width, slot count, price count, creation time."""
+
+RATE = struct.Struct("<d")
+"""USD rate stored after each slot key."""
+
+SLOT_SIZE = PRICING_SNAPSHOT_KEY_BYTES + RATE.size
+"""Bytes per hash table slot."""
+
+
+def get_snapshot_path() -> Path:
+    """Return the imported price snapshot under CAMPERS_DIR.
+
+    Returns
+    -------
+    Path
+        Path to the snapshot file
+    """
+    campers_dir = Path(os.environ.get("CAMPERS_DIR", str(Path.home() / ".campers")))
+    return campers_dir / PRICING_SNAPSHOT_FILE
+
+
+def _snapshot_key(kind: str, region: str, key: str) -> bytes:
+    """Encode a price's slot key."""
+    return f"{kind}:{region}:{key}".encode()
+
+
+def _slot_count(prices: int) -> int:
+    """Return the smallest power of two keeping the table at most half full."""
+    slots = 1
+
+    while slots < prices * 2:
+        slots *= 2
+
+    return slots
+
+
+def write_snapshot(prices: Iterable[tuple[str, str, str, float]], path: Path) -> int:
+    """Write prices to a snapshot file.
+
+    Parameters
+    ----------
+    prices : Iterable[tuple[str, str, str, float]]
+        (kind, region, type, rate) tuples; keys longer than
+        PRICING_SNAPSHOT_KEY_BYTES are skipped
+    path : Path
+        Snapshot file to create or replace
+
+    Returns
+    -------
+    int
+        Number of prices written
+    """
+    entries: dict[bytes, float] = {}
+
+    for kind, region, key, rate in prices:
+        encoded = _snapshot_key(kind, region, key)
+
+        if len(encoded) > PRICING_SNAPSHOT_KEY_BYTES:
+            logger.debug("Skipping price with oversized snapshot key %r", encoded)
+            continue
+
+        entries[encoded] = rate
+
+    slots = _slot_count(len(entries))
+    table = bytearray(slots * SLOT_SIZE)
+
+    for encoded, rate in entries.items():
+        slot = zlib.crc32(encoded) & (slots - 1)
+
+        while table[slot * SLOT_SIZE] != 0:
+            slot = (slot + 1) & (slots - 1)
+
+        offset = slot * SLOT_SIZE
+        table[offset : offset + len(encoded)] = encoded
+        RATE.pack_into(table, offset + PRICING_SNAPSHOT_KEY_BYTES, rate)
+
+    header = HEADER.pack(
+        PRICING_SNAPSHOT_MAGIC,
+        PRICING_SNAPSHOT_VERSION,
+        PRICING_SNAPSHOT_KEY_BYTES,
+        slots,
+        len(entries),
+        time.time(),
+    )
+
+    def write(f: IO[bytes]) -> None:
+        f.write(header)
+        f.write(table)
+
+    _replace_file(path, write)
+    return len(entries)
+
+
+def _replace_file(path: Path, write: Callable[[IO[bytes]], None]) -> None:
+    """Write a temporary file next to path and atomically move it into place.
+
+    The temporary file is removed if writing or replacing fails.
+
+    Parameters
+    ----------
+    path : Path
+        File to create or replace
+    write : Callable[[IO[bytes]], None]
+        Writes the new content to the open temporary file
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_name = None
+
+    try:
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=path.parent, prefix=".snapshot-", delete=False
+        ) as f:
+            tmp_name = f.name
+            write(f)
+
+        os.replace(tmp_name, path)
+    except BaseException:
+        if tmp_name is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+
+        raise
+
+
+class PricingSnapshot:
+    """Read-only, memory-mapped view of a price snapshot.
+
+    Use ``PricingSnapshot.open`` to map a file; instances hold the mapping
+    until ``close`` is called.
+
+    Parameters
+    ----------
+    data : mmap.mmap
+        Mapped snapshot file, header included
+
+    Attributes
+    ----------
+    created_at : float
+        Unix time the snapshot was exported
+    price_count : int
+        Number of prices in the snapshot
+    """
+
+    def __init__(self, data: mmap.mmap) -> None:
+        magic, version, key_bytes, slots, prices, created_at = HEADER.unpack_from(data)
+
+        if magic != PRICING_SNAPSHOT_MAGIC:
+            raise ValueError("Not a campers price snapshot")
+
+        if version != PRICING_SNAPSHOT_VERSION or key_bytes != PRICING_SNAPSHOT_KEY_BYTES:
+            raise ValueError(
+                f"Unsupported price snapshot version {version}, expected {PRICING_SNAPSHOT_VERSION}"
+            )
+
+        if slots & (slots - 1) or len(data) != HEADER.size + slots * SLOT_SIZE:
+            raise ValueError("Price snapshot is truncated or corrupt")
+
+        self._data = data
+        self._slots = slots
+        self.price_count = prices
+        self.created_at = created_at
+
+    @classmethod
+    def open(cls, path: Path | None = None) -> PricingSnapshot | None:
+        """Map a snapshot file.
+
+        Parameters
+        ----------
+        path : Path | None
+            Snapshot file, defaults to get_snapshot_path()
+
+        Returns
+        -------
+        PricingSnapshot | None
+            The mapped snapshot, or None if the file does not exist
+
+        Raises
+        ------
+        OSError
+            If the file exists but cannot be read
+        ValueError
+            If the file is not a snapshot of a supported version
+        """
+        path = path or get_snapshot_path()
+
+        try:
+            with path.open("rb") as f:
+                if os.fstat(f.fileno()).st_size < HEADER.size:
+                    raise ValueError("Price snapshot is truncated or corrupt")
+
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+
+        try:
+            return cls(data)
+        except ValueError:
+            data.close()
+            raise
+
+    def lookup(self, kind: str, region: str, key: str) -> float | None:
+        """Look up a price.
+
+        Parameters
+        ----------
+        kind : str
+            'ec2' or 'ebs'
+        region : str
+            AWS region code
+        key : str
+            Instance type for 'ec2', volume type for 'ebs'
+
+        Returns
+        -------
+        float | None
+            USD rate, or None if the snapshot has no such price
+        """
+        encoded = _snapshot_key(kind, region, key)
+
+        if len(encoded) > PRICING_SNAPSHOT_KEY_BYTES:
+            return None
+
+        padded = encoded.ljust(PRICING_SNAPSHOT_KEY_BYTES, b"\0")
+        slot = zlib.crc32(encoded) & (self._slots - 1)
+
+        for _ in range(self._slots):
+            offset = HEADER.size + slot * SLOT_SIZE
+            stored = self._data[offset : offset + PRICING_SNAPSHOT_KEY_BYTES]
+
+            if stored[0] == 0:
+                return None
+
+            if stored == padded:
+                return RATE.unpack_from(self._data, offset + PRICING_SNAPSHOT_KEY_BYTES)[0]
+
+            slot = (slot + 1) & (self._slots - 1)
+
+        return None
+
+    def close(self) -> None:
+        """Unmap the snapshot file."""
+        self._data.close()
+
+
+def import_snapshot(source: Path, path: Path | None = None) -> PricingSnapshot:
+    """Validate a snapshot file and install it as the offline price source.
+
+    Parameters
+    ----------
+    source : Path
+        Snapshot file produced by `campers pricing export`
+    path : Path | None
+        Install location, defaults to get_snapshot_path()
+
+    Returns
+    -------
+    PricingSnapshot
+        The installed snapshot, mapped; the caller closes it
+
+    Raises
+    ------
+    FileNotFoundError
+        If source does not exist
+    ValueError
+        If source is not a snapshot of a supported version
+    """
+    snapshot = PricingSnapshot.open(source)
+
+    if snapshot is None:
+        raise FileNotFoundError(f"Price snapshot not found: {source}")
+
+    snapshot.close()
+    path = path or get_snapshot_path()
+
+    def copy(f: IO[bytes]) -> None:
+        with source.open("rb") as src:
+            shutil.copyfileobj(src, f)
+
+    _replace_file(path, copy)
+    return PricingSnapshot.open(path)
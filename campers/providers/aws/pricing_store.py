@@ -0,0 +1,277 @@
+"""Persistent store of AWS EC2 and EBS prices under CAMPERS_DIR.
+
+Prices are kept in one JSON index keyed by region, then by kind ('ec2' for
+hourly instance rates, 'ebs' for GB-month storage rates), then by instance or
+volume type. Each entry holds the rate and the time it was fetched. A region
+that was bulk prefetched also records when, so a type missing from a fresh
+prefetch is known to have no price instead of needing an API call.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from campers.providers.aws.constants import (
+    PRICING_CACHE_FILE,
+    PRICING_CACHE_TTL_SECONDS,
+    PRICING_CACHE_VERSION,
+)
+
+logger = logging.getLogger(__name__)
+
+PRICE_KINDS = ("ec2", "ebs")
+"""Kinds of price held per region."""
+
+
+@dataclass(frozen=True)
+class StoredRate:
+    """A price found in the store.
+
+    Attributes
+    ----------
+    rate : float | None
+        USD rate, or None if a prefetch found no price for the type
+    fresh : bool
+        False once the entry is older than the store's TTL
+    """
+
+    rate: float | None
+    fresh: bool
+
+
+def get_pricing_store_path() -> Path:
+    """Return the price store file under CAMPERS_DIR.
+
+    Returns
+    -------
+    Path
+        Path to the JSON price index
+    """
+    campers_dir = Path(os.environ.get("CAMPERS_DIR", str(Path.home() / ".campers")))
+    return campers_dir / PRICING_CACHE_FILE
+
+
+def pricing_store_enabled() -> bool:
+    """Return whether the persistent price store may be used.
+
+    Returns
+    -------
+    bool
+        False when CAMPERS_DISABLE_PRICING_CACHE=1
+    """
+    return os.environ.get("CAMPERS_DISABLE_PRICING_CACHE") != "1"
+
+
+class PricingStore:
+    """On-disk price index shared by every campers process.
+
+    The file is read once and kept in memory. Writes hold an exclusive lock
+    on a sidecar lock file while they re-read the file, merge into it and
+    atomically replace it, so concurrent processes keep each other's entries.
+
+    Parameters
+    ----------
+    path : Path | None
+        Index file, defaults to get_pricing_store_path()
+    ttl_seconds : float
+        Age after which entries are reported as stale
+    """
+
+    def __init__(
+        self, path: Path | None = None, ttl_seconds: float = PRICING_CACHE_TTL_SECONDS
+    ) -> None:
+        self.path = path or get_pricing_store_path()
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._regions: dict[str, dict[str, Any]] = self._read()
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        """Load the region index from disk, ignoring unreadable files."""
+        try:
+            data = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.debug("Ignoring unreadable price store %s: %s", self.path, e)
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != PRICING_CACHE_VERSION:
+            logger.debug("Ignoring price store %s with unsupported version", self.path)
+            return {}
+
+        return data.get("regions", {})
+
+    @contextlib.contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Hold an exclusive lock shared with other processes using the store.
+
+        If the lock file cannot be created the body runs unlocked; the write
+        that follows fails the same way and is logged there.
+        """
+        with contextlib.ExitStack() as stack:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                lock_file = stack.enter_context(open(self.path.with_suffix(".lock"), "w"))
+            except OSError as e:
+                logger.debug("Failed to lock price store %s: %s", self.path, e)
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                stack.callback(fcntl.flock, lock_file.fileno(), fcntl.LOCK_UN)
+
+            yield
+
+    def _write(self) -> None:
+        """Atomically replace the index file with the in-memory index."""
+        payload = json.dumps(
+            {"version": PRICING_CACHE_VERSION, "regions": self._regions},
+            separators=(",", ":"),
+        )
+        tmp_name = None
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.path.parent, prefix=".pricing-", delete=False
+            ) as f:
+                tmp_name = f.name
+                f.write(payload)
+
+            os.replace(tmp_name, self.path)
+        except OSError as e:
+            logger.debug("Failed to write price store %s: %s", self.path, e)
+
+            if tmp_name is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_name)
+
+    def _is_fresh(self, fetched_at: float) -> bool:
+        """Return whether a timestamp is within the TTL."""
+        return time.time() - fetched_at < self.ttl_seconds
+
+    def lookup(self, kind: str, region: str, key: str) -> StoredRate | None:
+        """Look up a stored price.
+
+        Parameters
+        ----------
+        kind : str
+            'ec2' or 'ebs'
+        region : str
+            AWS region code
+        key : str
+            Instance type for 'ec2', volume type for 'ebs'
+
+        Returns
+        -------
+        StoredRate | None
+            The stored rate, or None if nothing is known about the type
+        """
+        with self._lock:
+            region_index = self._regions.get(region, {})
+            entry = region_index.get(kind, {}).get(key)
+            prefetched_at = region_index.get("prefetched_at")
+
+        if entry is not None:
+            rate, fetched_at = entry
+            return StoredRate(rate, self._is_fresh(fetched_at))
+
+        if prefetched_at is not None and self._is_fresh(prefetched_at):
+            return StoredRate(None, True)
+
+        return None
+
+    def put(self, kind: str, region: str, key: str, rate: float) -> None:
+        """Store one price fetched now.
+
+        Parameters
+        ----------
+        kind : str
+            'ec2' or 'ebs'
+        region : str
+            AWS region code
+        key : str
+            Instance type for 'ec2', volume type for 'ebs'
+        rate : float
+            USD rate
+        """
+        with self._lock, self._file_lock():
+            self._regions = self._read()
+            region_index = self._regions.setdefault(region, {})
+            region_index.setdefault(kind, {})[key] = [rate, time.time()]
+            self._write()
+
+    def put_region(self, region: str, rates: dict[str, dict[str, float]]) -> None:
+        """Replace a region's prices with a bulk prefetch result.
+
+        Parameters
+        ----------
+        region : str
+            AWS region code
+        rates : dict[str, dict[str, float]]
+            Rates by kind, then by instance or volume type
+        """
+        now = time.time()
+
+        with self._lock, self._file_lock():
+            self._regions = self._read()
+            self._regions[region] = {
+                "prefetched_at": now,
+                **{
+                    kind: {key: [rate, now] for key, rate in rates.get(kind, {}).items()}
+                    for kind in PRICE_KINDS
+                },
+            }
+            self._write()
+
+    def prices(self) -> list[tuple[str, str, str, float]]:
+        """Return every stored price, fresh or stale.
+
+        Returns
+        -------
+        list[tuple[str, str, str, float]]
+            (kind, region, type, rate) tuples
+        """
+        with self._lock:
+            self._regions = self._read()
+
+            return [
+                (kind, region, key, entry[0])
+                for region, region_index in self._regions.items()
+                for kind in PRICE_KINDS
+                for key, entry in region_index.get(kind, {}).items()
+            ]
+
+    def stale_regions(self, regions: list[str]) -> list[str]:
+        """Return the regions that were never prefetched or whose prefetch expired.
+
+        Parameters
+        ----------
+        regions : list[str]
+            Candidate AWS region codes
+
+        Returns
+        -------
+        list[str]
+            Regions needing a prefetch, in input order
+        """
+        with self._lock:
+            prefetched = {
+                region: index.get("prefetched_at") for region, index in self._regions.items()
+            }
+
+        return [
+            region
+            for region in regions
+            if prefetched.get(region) is None or not self._is_fresh(prefetched[region])
+        ]
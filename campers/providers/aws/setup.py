@@ -7,10 +7,10 @@ import sys
 from dataclasses import dataclass
 from typing import Any
 
-import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 
 from campers.core.config import ConfigLoader
+from campers.providers.aws.client_factory import AWSClientFactory
 
 logger = logging.getLogger(__name__)
 
@@ -91,9 +91,8 @@ class SetupManager:
         bool
             True if credentials are valid, False otherwise
         """
-        sts_client = None
         try:
-            sts_client = boto3.client("sts", region_name=effective_region)
+            sts_client = AWSClientFactory().get_client("sts", region_name=effective_region)
             sts_client.get_caller_identity()
             logger.info("AWS credentials found", extra={"stream": "stdout"})
             return True
@@ -105,9 +104,6 @@ class SetupManager:
         except ClientError:
             logger.info("AWS credentials found", extra={"stream": "stdout"})
             return True
-        finally:
-            if sts_client:
-                sts_client.close()
 
     def check_vpc_status(self, ec2_client: Any, effective_region: str) -> bool:
         """Check if default VPC exists in region.
@@ -309,71 +305,68 @@ class SetupManager:
         if not self.check_aws_credentials(effective_region):
             sys.exit(1)
 
-        ec2_client = boto3.client("ec2", region_name=effective_region)
+        ec2_client = AWSClientFactory().get_client("ec2", region_name=effective_region)
 
-        try:
-            check_result = self.check_infrastructure(ec2_client, effective_region)
+        check_result = self.check_infrastructure(ec2_client, effective_region)
 
-            if not check_result.vpc_exists:
-                logger.info(
-                    f"No default VPC found in {effective_region}",
-                    extra={"stream": "stdout"},
-                )
+        if not check_result.vpc_exists:
+            logger.info(
+                f"No default VPC found in {effective_region}",
+                extra={"stream": "stdout"},
+            )
 
-                response = input("Create default VPC now? (y/n): ")
+            response = input("Create default VPC now? (y/n): ")
 
-                if response.lower() == "y":
-                    try:
-                        ec2_client.create_default_vpc()
+            if response.lower() == "y":
+                try:
+                    ec2_client.create_default_vpc()
+                    logger.info(
+                        f"Default VPC created in {effective_region}",
+                        extra={"stream": "stdout"},
+                    )
+                except ClientError as e:
+                    error_code = e.response.get("Error", {}).get("Code", "")
+                    if error_code == "DefaultVpcAlreadyExists":
                         logger.info(
                             f"Default VPC created in {effective_region}",
                             extra={"stream": "stdout"},
                         )
-                    except ClientError as e:
-                        error_code = e.response.get("Error", {}).get("Code", "")
-                        if error_code == "DefaultVpcAlreadyExists":
-                            logger.info(
-                                f"Default VPC created in {effective_region}",
-                                extra={"stream": "stdout"},
-                            )
-                        else:
-                            logger.error(f"Failed to create VPC: {e}", extra={"stream": "stderr"})
-                            logger.error("Manual creation:", extra={"stream": "stderr"})
-                            logger.error(
-                                f"  aws ec2 create-default-vpc --region {effective_region}",
-                                extra={"stream": "stderr"},
-                            )
-                            sys.exit(1)
-                else:
-                    logger.info("Skipping VPC creation.", extra={"stream": "stdout"})
-                    logger.info("You can create it later with:", extra={"stream": "stdout"})
-                    logger.info(
-                        f"  aws ec2 create-default-vpc --region {effective_region}",
-                        extra={"stream": "stdout"},
-                    )
-                    return
+                    else:
+                        logger.error(f"Failed to create VPC: {e}", extra={"stream": "stderr"})
+                        logger.error("Manual creation:", extra={"stream": "stderr"})
+                        logger.error(
+                            f"  aws ec2 create-default-vpc --region {effective_region}",
+                            extra={"stream": "stderr"},
+                        )
+                        sys.exit(1)
             else:
+                logger.info("Skipping VPC creation.", extra={"stream": "stdout"})
+                logger.info("You can create it later with:", extra={"stream": "stdout"})
                 logger.info(
-                    f"Default VPC exists in {effective_region}",
+                    f"  aws ec2 create-default-vpc --region {effective_region}",
                     extra={"stream": "stdout"},
                 )
+                return
+        else:
+            logger.info(
+                f"Default VPC exists in {effective_region}",
+                extra={"stream": "stdout"},
+            )
 
-            if check_result.missing_permissions:
-                missing_perms = ", ".join(check_result.missing_permissions)
-                logger.info(
-                    f"Missing IAM permissions: {missing_perms}",
-                    extra={"stream": "stdout"},
-                )
-                logger.info(
-                    "Some operations may fail without these permissions.",
-                    extra={"stream": "stdout"},
-                )
-            else:
-                logger.info("IAM permissions verified", extra={"stream": "stdout"})
+        if check_result.missing_permissions:
+            missing_perms = ", ".join(check_result.missing_permissions)
+            logger.info(
+                f"Missing IAM permissions: {missing_perms}",
+                extra={"stream": "stdout"},
+            )
+            logger.info(
+                "Some operations may fail without these permissions.",
+                extra={"stream": "stdout"},
+            )
+        else:
+            logger.info("IAM permissions verified", extra={"stream": "stdout"})
 
-            logger.info("Setup complete! Run: campers run", extra={"stream": "stdout"})
-        finally:
-            ec2_client.close()
+        logger.info("Setup complete! Run: campers run", extra={"stream": "stdout"})
 
     def doctor(self, region: str | None = None) -> None:
         """Diagnose AWS environment and report status.
@@ -395,41 +388,38 @@ class SetupManager:
         if not self.check_aws_credentials(effective_region):
             sys.exit(1)
 
-        ec2_client = boto3.client("ec2", region_name=effective_region)
+        ec2_client = AWSClientFactory().get_client("ec2", region_name=effective_region)
 
-        try:
-            check_result = self.check_infrastructure(ec2_client, effective_region)
-
-            if not check_result.vpc_exists:
-                message = f"No default VPC in {effective_region}"
-                logger.info(message, extra={"stream": "stdout"})
-                logger.info("Fix it:", extra={"stream": "stdout"})
-                logger.info("  campers setup", extra={"stream": "stdout"})
-                logger.info("Or manually:", extra={"stream": "stdout"})
-                logger.info(
-                    f"  aws ec2 create-default-vpc --region {effective_region}",
-                    extra={"stream": "stdout"},
-                )
-            else:
-                message = f"Default VPC exists in {effective_region}"
-                logger.info(message, extra={"stream": "stdout"})
+        check_result = self.check_infrastructure(ec2_client, effective_region)
 
-            if check_result.missing_permissions:
-                perms_str = ", ".join(check_result.missing_permissions)
-                logger.info(
-                    "Missing IAM permissions: %s",
-                    perms_str,
-                    extra={"stream": "stdout"},
-                )
-                logger.info("Required permissions:", extra={"stream": "stdout"})
-                for perm in check_result.missing_permissions:
-                    logger.info("  - %s", perm, extra={"stream": "stdout"})
-            else:
-                logger.info("IAM permissions verified", extra={"stream": "stdout"})
+        if not check_result.vpc_exists:
+            message = f"No default VPC in {effective_region}"
+            logger.info(message, extra={"stream": "stdout"})
+            logger.info("Fix it:", extra={"stream": "stdout"})
+            logger.info("  campers setup", extra={"stream": "stdout"})
+            logger.info("Or manually:", extra={"stream": "stdout"})
+            logger.info(
+                f"  aws ec2 create-default-vpc --region {effective_region}",
+                extra={"stream": "stdout"},
+            )
+        else:
+            message = f"Default VPC exists in {effective_region}"
+            logger.info(message, extra={"stream": "stdout"})
+
+        if check_result.missing_permissions:
+            perms_str = ", ".join(check_result.missing_permissions)
+            logger.info(
+                "Missing IAM permissions: %s",
+                perms_str,
+                extra={"stream": "stdout"},
+            )
+            logger.info("Required permissions:", extra={"stream": "stdout"})
+            for perm in check_result.missing_permissions:
+                logger.info("  - %s", perm, extra={"stream": "stdout"})
+        else:
+            logger.info("IAM permissions verified", extra={"stream": "stdout"})
 
-            self.check_service_quotas(ec2_client, effective_region)
-            self.check_regional_availability(ec2_client, effective_region)
+        self.check_service_quotas(ec2_client, effective_region)
+        self.check_regional_availability(ec2_client, effective_region)
 
-            logger.info("Diagnostics complete.", extra={"stream": "stdout"})
-        finally:
-            ec2_client.close()
+        logger.info("Diagnostics complete.", extra={"stream": "stdout"})
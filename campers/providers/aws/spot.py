@@ -0,0 +1,67 @@
+"""Spot capacity requests and interruption notices for EC2 instances."""
+
+from typing import Any
+
+SPOT_MARKET_OPTIONS = {
+    "MarketType": "spot",
+    "SpotOptions": {
+        "SpotInstanceType": "persistent",
+        "InstanceInterruptionBehavior": "stop",
+    },
+}
+"""Market options for spot launches.
+
+A persistent request that stops on interruption keeps the root volume, so the
+instance can be stopped and started like an on-demand one and resumes where
+it left off once spot capacity returns.
+"""
+
+INTERRUPTION_WATCH_TEMPLATE = """IMDS=http://169.254.169.254/latest
+ACTION=$IMDS/meta-data/spot/instance-action
+while kill -0 $PPID 2>/dev/null; do
+  TOKEN=$(curl -s -m 2 -X PUT -H 'X-aws-ec2-metadata-token-ttl-seconds: 300' "$IMDS/api/token")
+  if curl -sf -m 2 -H "X-aws-ec2-metadata-token: $TOKEN" "$ACTION"; then
+    echo
+    exit 0
+  fi
+  sleep {poll_seconds}
+done
+"""
+
+
+def instance_market(instance: dict[str, Any]) -> str:
+    """Return the market an instance was launched in.
+
+    Parameters
+    ----------
+    instance : dict[str, Any]
+        Instance description from describe_instances
+
+    Returns
+    -------
+    str
+        'spot' or 'on-demand'
+    """
+    return "spot" if instance.get("InstanceLifecycle") == "spot" else "on-demand"
+
+
+def build_interruption_watch_command(poll_seconds: int) -> str:
+    """Build the shell loop that waits on the instance for an interruption notice.
+
+    The loop runs on the instance and polls the instance metadata service
+    locally, so a single long-lived SSH command replaces a remote round trip
+    per poll. It prints the notice and exits once one is issued. Without a
+    PTY it gets no SIGHUP, so it also exits once its parent sshd session is
+    gone instead of outliving the connection.
+
+    Parameters
+    ----------
+    poll_seconds : int
+        Seconds between metadata checks
+
+    Returns
+    -------
+    str
+        Shell command printing the instance-action JSON document
+    """
+    return INTERRUPTION_WATCH_TEMPLATE.format(poll_seconds=poll_seconds)
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import TYPE_CHECKING
-
-import boto3
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
+from campers.providers.aws.client_factory import AWSClientFactory
 from campers.providers.aws.constants import TAG_FETCH_RETRY_DELAY, TAG_FETCH_RETRY_MAX
 
 if TYPE_CHECKING:
@@ -15,6 +17,48 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+SSH_TAG_KEYS = {
+    "host": "CampersSSHHost",
+    "port": "CampersSSHPort",
+    "username": "CampersSSHUsername",
+    "key_file": "CampersSSHKeyFile",
+}
+"""Instance tags the test harness uses to publish SSH connection details."""
+
+REQUIRED_SSH_TAGS = ("host", "port")
+"""SSHTags fields that must be present before the tags are usable."""
+
+
+@dataclass(frozen=True)
+class SSHTags:
+    """SSH connection details read from instance tags.
+
+    Attributes
+    ----------
+    host : str | None
+        Value of the CampersSSHHost tag
+    port : int | None
+        Parsed value of the CampersSSHPort tag
+    username : str | None
+        Value of the CampersSSHUsername tag
+    key_file : str | None
+        Value of the CampersSSHKeyFile tag
+    """
+
+    host: str | None = None
+    port: int | None = None
+    username: str | None = None
+    key_file: str | None = None
+
+    @property
+    def missing(self) -> list[str]:
+        """Required fields that are not set yet."""
+        return [field for field in REQUIRED_SSH_TAGS if getattr(self, field) is None]
+
+
+_cache_lock = threading.Lock()
+_tag_cache: dict[str, SSHTags] = {}
+
 
 def get_aws_ssh_connection_info(
     instance_id: str, public_ip: str, key_file: str
@@ -55,33 +99,24 @@ def get_aws_ssh_connection_info(
 
     endpoint_url = os.environ.get("AWS_ENDPOINT_URL")
 
-    if endpoint_url:
-        ssh_host = _get_ssh_host_from_tags(instance_id)
-        ssh_port = _get_ssh_port_from_tags(instance_id)
-        ssh_username = _get_ssh_username_from_tags(instance_id)
-        ssh_key_file = _get_ssh_key_file_from_tags(instance_id)
-    else:
-        ssh_host = None
-        ssh_port = None
-        ssh_username = None
-        ssh_key_file = None
-
-    if ssh_host is not None and ssh_port is not None:
-        effective_key_file = ssh_key_file if ssh_key_file else key_file
+    tags = resolve_ssh_tags(instance_id) if endpoint_url else SSHTags()
+
+    if tags.host is not None and tags.port is not None:
+        effective_key_file = tags.key_file if tags.key_file else key_file
         logger.info(
             "Using harness SSH config for %s: host=%s, port=%s, username=%s, key=%s",
             instance_id,
-            ssh_host,
-            ssh_port,
-            ssh_username,
+            tags.host,
+            tags.port,
+            tags.username,
             effective_key_file,
         )
         return SSHConnectionInfo(
-            host=ssh_host,
-            port=ssh_port,
+            host=tags.host,
+            port=tags.port,
             key_file=effective_key_file,
-            username=ssh_username,
-            tag_key_file=ssh_key_file,
+            username=tags.username,
+            tag_key_file=tags.key_file,
         )
 
     if public_ip:
@@ -95,35 +130,14 @@ def get_aws_ssh_connection_info(
     )
 
 
-def _get_ssh_host_from_tags(instance_id: str) -> str | None:
-    """Get SSH host from instance CampersSSHHost tag.
-
-    Parameters
-    ----------
-    instance_id : str
-        EC2 instance ID
-
-    Returns
-    -------
-    str | None
-        SSH host from tag, or None if not found
-    """
-    try:
-        host = _get_instance_tag_value(instance_id, "CampersSSHHost")
-        logger.debug("Retrieved CampersSSHHost tag for %s: %s", instance_id, host)
-        return host
-    except Exception as e:
-        logger.debug(
-            "Failed to retrieve CampersSSHHost tag for instance %s: %s",
-            instance_id,
-            e,
-            exc_info=True,
-        )
-        return None
-
+def resolve_ssh_tags(instance_id: str) -> SSHTags:
+    """Resolve all SSH connection tags of an instance with one lookup per attempt.
 
-def _get_ssh_port_from_tags(instance_id: str) -> int | None:
-    """Get SSH port from instance CampersSSHPort tag.
+    Each attempt issues a single describe_instances call and extracts every
+    SSH tag from it. Tags may appear some time after the instance is created,
+    so attempts repeat, up to TAG_FETCH_RETRY_MAX, only while a required tag
+    is still missing. Complete results are cached per instance ID until
+    forget_ssh_tags() is called.
 
     Parameters
     ----------
@@ -132,176 +146,122 @@ def _get_ssh_port_from_tags(instance_id: str) -> int | None:
 
     Returns
     -------
-    int | None
-        SSH port from tag, or None if not found or cannot be parsed
+    SSHTags
+        Tags found, with None for tags that never appeared or could not be
+        fetched
     """
-    try:
-        port_str = _get_instance_tag_value(instance_id, "CampersSSHPort")
-        logger.debug("Retrieved CampersSSHPort tag for %s: %s", instance_id, port_str)
-        if port_str is not None:
-            return int(port_str)
-    except (ValueError, TypeError) as e:
-        logger.debug(
-            "Failed to parse CampersSSHPort tag for instance %s: %s", instance_id, e, exc_info=True
-        )
-    except Exception as e:
-        logger.debug(
-            "Failed to retrieve CampersSSHPort tag for instance %s: %s",
-            instance_id,
-            e,
-            exc_info=True,
-        )
-    return None
-
-
-def _get_ssh_username_from_tags(instance_id: str) -> str | None:
-    """Get SSH username from instance CampersSSHUsername tag.
-
-    Parameters
-    ----------
-    instance_id : str
-        EC2 instance ID
-
-    Returns
-    -------
-    str | None
-        SSH username from tag, or None if not found
-    """
-    try:
-        username = _get_instance_tag_value(instance_id, "CampersSSHUsername")
-        logger.debug("Retrieved CampersSSHUsername tag for %s: %s", instance_id, username)
-        return username
-    except Exception as e:
-        logger.debug(
-            "Failed to retrieve CampersSSHUsername tag for instance %s: %s",
-            instance_id,
-            e,
-            exc_info=True,
-        )
-        return None
-
-
-def _get_ssh_key_file_from_tags(instance_id: str) -> str | None:
-    """Get SSH key file path from instance CampersSSHKeyFile tag.
-
-    Parameters
-    ----------
-    instance_id : str
-        EC2 instance ID
-
-    Returns
-    -------
-    str | None
-        SSH key file path from tag, or None if not found
-    """
-    try:
-        key_file = _get_instance_tag_value(instance_id, "CampersSSHKeyFile")
-        logger.debug("Retrieved CampersSSHKeyFile tag for %s: %s", instance_id, key_file)
-        return key_file
-    except Exception as e:
-        logger.debug(
-            "Failed to retrieve CampersSSHKeyFile tag for instance %s: %s",
-            instance_id,
-            e,
-            exc_info=True,
-        )
-        return None
-
+    with _cache_lock:
+        cached = _tag_cache.get(instance_id)
 
-def _get_instance_tag_value(instance_id: str, tag_key: str) -> str | None:
-    """Retrieve a specific tag value from an EC2 instance.
-
-    Includes automatic retry logic to handle eventual consistency in distributed systems
-    where tags may not be immediately available after instance creation or tagging.
-
-    Parameters
-    ----------
-    instance_id : str
-        EC2 instance ID
-    tag_key : str
-        Tag key to retrieve
-
-    Returns
-    -------
-    str | None
-        Tag value, or None if not found after retries
-
-    Raises
-    ------
-    Exception
-        If EC2 API call fails permanently
-    """
-    import time
+    if cached is not None:
+        logger.debug("Using cached SSH tags for %s: %s", instance_id, cached)
+        return cached
 
     endpoint_url = os.environ.get("AWS_ENDPOINT_URL")
     region = os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
 
     logger.debug(
-        "Fetching instance tags: endpoint=%s, region=%s, instance_id=%s, tag_key=%s",
+        "Fetching SSH tags: endpoint=%s, region=%s, instance_id=%s",
         endpoint_url,
         region,
         instance_id,
-        tag_key,
     )
 
-    ec2_client = boto3.client("ec2", endpoint_url=endpoint_url, region_name=region)
+    ec2_client = AWSClientFactory().get_client("ec2", endpoint_url=endpoint_url, region_name=region)
+    tags = SSHTags()
 
     for attempt in range(TAG_FETCH_RETRY_MAX):
         try:
             response = ec2_client.describe_instances(InstanceIds=[instance_id])
-
-            if not response["Reservations"]:
-                logger.debug("No reservations found for instance %s", instance_id)
-                return None
-
-            instance = response["Reservations"][0]["Instances"][0]
-            tags = instance.get("Tags", [])
-
+        except Exception as e:
             logger.debug(
-                "Instance %s has %d tags (attempt %d/%d): %s",
+                "Error fetching tags for instance %s on attempt %d/%d: %s",
                 instance_id,
-                len(tags),
                 attempt + 1,
                 TAG_FETCH_RETRY_MAX,
-                tags,
+                e,
+                exc_info=attempt == TAG_FETCH_RETRY_MAX - 1,
             )
+        else:
+            if not response["Reservations"]:
+                logger.debug("No reservations found for instance %s", instance_id)
+                return tags
 
-            for tag in tags:
-                if tag.get("Key") == tag_key:
-                    value = tag.get("Value")
-                    logger.debug("Found tag %s=%s for instance %s", tag_key, value, instance_id)
-                    return value
-
-            if attempt < TAG_FETCH_RETRY_MAX - 1:
-                logger.debug(
-                    "Tag %s not found for instance %s on attempt %d/%d; retrying in %.0fms",
-                    tag_key,
-                    instance_id,
-                    attempt + 1,
-                    TAG_FETCH_RETRY_MAX,
-                    TAG_FETCH_RETRY_DELAY * 1000,
-                )
-                time.sleep(TAG_FETCH_RETRY_DELAY)
-            else:
-                logger.debug(
-                    "Tag %s not found for instance %s after %d attempts",
-                    tag_key,
-                    instance_id,
-                    TAG_FETCH_RETRY_MAX,
-                )
-                return None
+            instance = response["Reservations"][0]["Instances"][0]
+            tags = _parse_ssh_tags(instance_id, instance.get("Tags", []))
+
+            if not tags.missing:
+                with _cache_lock:
+                    _tag_cache[instance_id] = tags
+
+                return tags
 
-        except Exception as e:
             logger.debug(
-                "Error fetching tags for instance %s on attempt %d/%d: %s",
+                "SSH tags %s not found for instance %s on attempt %d/%d",
+                ", ".join(SSH_TAG_KEYS[field] for field in tags.missing),
                 instance_id,
                 attempt + 1,
                 TAG_FETCH_RETRY_MAX,
-                e,
             )
-            if attempt < TAG_FETCH_RETRY_MAX - 1:
-                time.sleep(TAG_FETCH_RETRY_DELAY)
-            else:
-                raise
 
-    return None
+        if attempt < TAG_FETCH_RETRY_MAX - 1:
+            time.sleep(TAG_FETCH_RETRY_DELAY)
+
+    logger.debug(
+        "SSH tags for instance %s incomplete after %d attempts: %s",
+        instance_id,
+        TAG_FETCH_RETRY_MAX,
+        tags,
+    )
+    return tags
+
+
+def forget_ssh_tags(instance_id: str | None = None) -> None:
+    """Drop cached SSH tags.
+
+    Called when an instance is stopped, started or terminated, since the
+    harness may publish new connection details for it.
+
+    Parameters
+    ----------
+    instance_id : str | None
+        Instance whose tags to drop, or None to drop all
+    """
+    with _cache_lock:
+        if instance_id is None:
+            _tag_cache.clear()
+        else:
+            _tag_cache.pop(instance_id, None)
+
+
+def _parse_ssh_tags(instance_id: str, instance_tags: list[dict[str, Any]]) -> SSHTags:
+    """Extract the SSH tags from an instance's tag list.
+
+    Parameters
+    ----------
+    instance_id : str
+        EC2 instance ID, used for logging
+    instance_tags : list[dict[str, Any]]
+        Tags as returned by describe_instances
+
+    Returns
+    -------
+    SSHTags
+        Tags found; an unparseable port is treated as missing
+    """
+    values = {tag.get("Key"): tag.get("Value") for tag in instance_tags}
+    port_str = values.get(SSH_TAG_KEYS["port"])
+    port = None
+
+    if port_str is not None:
+        try:
+            port = int(port_str)
+        except (ValueError, TypeError) as e:
+            logger.debug("Failed to parse CampersSSHPort tag for instance %s: %s", instance_id, e)
+
+    return SSHTags(
+        host=values.get(SSH_TAG_KEYS["host"]),
+        port=port,
+        username=values.get(SSH_TAG_KEYS["username"]),
+        key_file=values.get(SSH_TAG_KEYS["key_file"]),
+    )
@@ -0,0 +1,304 @@
+"""Persistent EBS cache volumes that outlive individual instances."""
+
+import logging
+import shlex
+from typing import Any
+
+from campers.constants import CACHE_VOLUME_MOUNT_TIMEOUT_SECONDS
+from campers.providers.aws.constants import (
+    CACHE_VOLUME_DEVICE_NAME,
+    CACHE_VOLUME_TAG,
+    WAITER_DELAY_SECONDS,
+    WAITER_MAX_ATTEMPTS_SHORT,
+)
+from campers.providers.aws.errors import handle_aws_errors
+from campers.providers.aws.utils import tags_to_dict
+
+logger = logging.getLogger(__name__)
+
+MOUNT_SCRIPT_TEMPLATE = """#!/bin/bash
+set -u
+SERIAL={serial}
+MOUNT_POINT={mount_point}
+OWNER={owner}
+DEVICE=""
+for _ in $(seq 1 {timeout}); do
+  for candidate in "/dev/disk/by-id/nvme-Amazon_Elastic_Block_Store_$SERIAL" /dev/xvdf /dev/sdf; do
+    if [ -b "$candidate" ]; then
+      DEVICE=$(readlink -f "$candidate")
+      break 2
+    fi
+  done
+  sleep 1
+done
+if [ -z "$DEVICE" ]; then
+  echo "campers: cache volume did not attach" >&2
+  exit 1
+fi
+blkid "$DEVICE" >/dev/null 2>&1 || mkfs.ext4 -q -L campers-cache "$DEVICE"
+mkdir -p "$MOUNT_POINT"
+UUID=$(blkid -s UUID -o value "$DEVICE")
+grep -q "$UUID" /etc/fstab || echo "UUID=$UUID $MOUNT_POINT ext4 defaults,nofail 0 2" >> /etc/fstab
+mountpoint -q "$MOUNT_POINT" || mount "$MOUNT_POINT"
+chown "$OWNER:" "$MOUNT_POINT"
+"""
+
+
+def build_mount_script(volume_id: str, mount_point: str, owner: str) -> str:
+    """Build the user data script that formats and mounts the cache volume.
+
+    Parameters
+    ----------
+    volume_id : str
+        EBS volume ID, used to find the NVMe device by serial
+    mount_point : str
+        Absolute mount point on the instance
+    owner : str
+        SSH user that should own the mount point
+
+    Returns
+    -------
+    str
+        Bash script suitable for EC2 user data
+    """
+    return MOUNT_SCRIPT_TEMPLATE.format(
+        serial=shlex.quote(volume_id.replace("-", "")),
+        mount_point=shlex.quote(mount_point),
+        owner=shlex.quote(owner),
+        timeout=CACHE_VOLUME_MOUNT_TIMEOUT_SECONDS,
+    )
+
+
+class CacheVolumeManager:
+    """Manage persistent per-camp EBS cache volumes."""
+
+    def __init__(self, ec2_client: Any, region: str) -> None:
+        """Initialize CacheVolumeManager.
+
+        Parameters
+        ----------
+        ec2_client : Any
+            Boto3 EC2 client
+        region : str
+            AWS region name
+        """
+        self.ec2_client = ec2_client
+        self.region = region
+
+    def find_volumes(self, camp_name: str | None = None) -> list[dict[str, Any]]:
+        """Find campers cache volumes, optionally for one camp.
+
+        Parameters
+        ----------
+        camp_name : str | None
+            Camp name to filter on, or None for every cache volume
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Volumes with keys: volume_id, camp_config, owner, size, state,
+            availability_zone, region, instance_id
+        """
+        filters = [{"Name": "tag:ManagedBy", "Values": ["campers"]}]
+
+        if camp_name is None:
+            filters.append({"Name": "tag-key", "Values": [CACHE_VOLUME_TAG]})
+        else:
+            filters.append({"Name": f"tag:{CACHE_VOLUME_TAG}", "Values": [camp_name]})
+
+        volumes = []
+
+        with handle_aws_errors():
+            paginator = self.ec2_client.get_paginator("describe_volumes")
+
+            for page in paginator.paginate(Filters=filters):
+                for volume in page["Volumes"]:
+                    tags = tags_to_dict(volume.get("Tags", []))
+                    attachments = volume.get("Attachments", [])
+
+                    volumes.append(
+                        {
+                            "volume_id": volume["VolumeId"],
+                            "camp_config": tags.get(CACHE_VOLUME_TAG, "unknown"),
+                            "owner": tags.get("Owner", "unknown"),
+                            "size": volume["Size"],
+                            "state": volume["State"],
+                            "availability_zone": volume["AvailabilityZone"],
+                            "region": self.region,
+                            "instance_id": attachments[0]["InstanceId"] if attachments else None,
+                        }
+                    )
+
+        return volumes
+
+    def select_availability_zone(self, instance_type: str) -> str:
+        """Pick an availability zone offering the instance type.
+
+        Parameters
+        ----------
+        instance_type : str
+            Instance type that will be launched
+
+        Returns
+        -------
+        str
+            Availability zone name
+
+        Raises
+        ------
+        RuntimeError
+            If no availability zone in the region offers the instance type
+        """
+        with handle_aws_errors():
+            response = self.ec2_client.describe_instance_type_offerings(
+                LocationType="availability-zone",
+                Filters=[{"Name": "instance-type", "Values": [instance_type]}],
+            )
+
+        zones = sorted(offering["Location"] for offering in response["InstanceTypeOfferings"])
+
+        if not zones:
+            raise RuntimeError(f"No availability zone in {self.region} offers {instance_type}")
+
+        return zones[0]
+
+    def create_volume(
+        self, camp_name: str, owner: str, availability_zone: str, size: int
+    ) -> dict[str, Any]:
+        """Create a new cache volume for a camp.
+
+        Parameters
+        ----------
+        camp_name : str
+            Camp name the volume belongs to
+        owner : str
+            Owner identity for the Owner tag
+        availability_zone : str
+            Availability zone to create the volume in
+        size : int
+            Volume size in GB
+
+        Returns
+        -------
+        dict[str, Any]
+            Volume with volume_id, size and availability_zone keys
+        """
+        with handle_aws_errors():
+            response = self.ec2_client.create_volume(
+                AvailabilityZone=availability_zone,
+                Size=size,
+                VolumeType="gp3",
+                TagSpecifications=[
+                    {
+                        "ResourceType": "volume",
+                        "Tags": [
+                            {"Key": "ManagedBy", "Value": "campers"},
+                            {"Key": "Name", "Value": f"campers-cache-{camp_name}"},
+                            {"Key": CACHE_VOLUME_TAG, "Value": camp_name},
+                            {"Key": "Owner", "Value": owner},
+                        ],
+                    }
+                ],
+            )
+
+            self.ec2_client.get_waiter("volume_available").wait(
+                VolumeIds=[response["VolumeId"]],
+                WaiterConfig={
+                    "Delay": WAITER_DELAY_SECONDS,
+                    "MaxAttempts": WAITER_MAX_ATTEMPTS_SHORT,
+                },
+            )
+
+        logger.info(
+            "Created %sGB cache volume %s in %s",
+            size,
+            response["VolumeId"],
+            availability_zone,
+        )
+        return {
+            "volume_id": response["VolumeId"],
+            "size": size,
+            "availability_zone": availability_zone,
+        }
+
+    def attach_volume(self, volume_id: str, instance_id: str) -> None:
+        """Attach a cache volume to an instance and wait until it is in use.
+
+        The attachment keeps DeleteOnTermination disabled, so terminating the
+        instance detaches the volume instead of deleting it.
+
+        Parameters
+        ----------
+        volume_id : str
+            Cache volume ID
+        instance_id : str
+            Instance to attach to
+        """
+        with handle_aws_errors():
+            self.ec2_client.attach_volume(
+                VolumeId=volume_id,
+                InstanceId=instance_id,
+                Device=CACHE_VOLUME_DEVICE_NAME,
+            )
+            self.ec2_client.get_waiter("volume_in_use").wait(
+                VolumeIds=[volume_id],
+                WaiterConfig={
+                    "Delay": WAITER_DELAY_SECONDS,
+                    "MaxAttempts": WAITER_MAX_ATTEMPTS_SHORT,
+                },
+            )
+
+        logger.info("Attached cache volume %s to %s", volume_id, instance_id)
+
+    def find_attached_volume_ids(self, instance_id: str) -> list[str]:
+        """List cache volumes currently attached to an instance.
+
+        Parameters
+        ----------
+        instance_id : str
+            Instance ID
+
+        Returns
+        -------
+        list[str]
+            Attached cache volume IDs
+        """
+        with handle_aws_errors():
+            response = self.ec2_client.describe_volumes(
+                Filters=[
+                    {"Name": "attachment.instance-id", "Values": [instance_id]},
+                    {"Name": "tag-key", "Values": [CACHE_VOLUME_TAG]},
+                ]
+            )
+
+        return [volume["VolumeId"] for volume in response["Volumes"]]
+
+    def wait_until_detached(self, volume_ids: list[str]) -> None:
+        """Wait for cache volumes to become available for the next instance.
+
+        Parameters
+        ----------
+        volume_ids : list[str]
+            Cache volume IDs detached by instance termination
+        """
+        with handle_aws_errors():
+            self.ec2_client.get_waiter("volume_available").wait(
+                VolumeIds=volume_ids,
+                WaiterConfig={
+                    "Delay": WAITER_DELAY_SECONDS,
+                    "MaxAttempts": WAITER_MAX_ATTEMPTS_SHORT,
+                },
+            )
+
+    def delete_volume(self, volume_id: str) -> None:
+        """Delete a cache volume once it is detached.
+
+        Parameters
+        ----------
+        volume_id : str
+            Cache volume ID
+        """
+        self.wait_until_detached([volume_id])
+
+        with handle_aws_errors():
+            self.ec2_client.delete_volume(VolumeId=volume_id)
@@ -1,11 +1,29 @@
-"""Provider-agnostic services (SSH, sync, port forwarding, Ansible)."""
+"""Provider-agnostic services (SSH, sync, port forwarding, Ansible).
+
+The services are imported on first access: SSH, port forwarding and Ansible
+pull in paramiko, which commands like `campers list` never need.
+"""
 
 from __future__ import annotations
 
-from campers.services.ansible import AnsibleManager
-from campers.services.portforward import PortForwardManager, PortInUseError, is_port_in_use
-from campers.services.ssh import SSHManager, get_ssh_connection_info
-from campers.services.sync import MutagenManager
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from campers.services.ansible import AnsibleManager
+    from campers.services.portforward import PortForwardManager, PortInUseError, is_port_in_use
+    from campers.services.ssh import SSHManager, get_ssh_connection_info
+    from campers.services.sync import MutagenManager
+
+_LAZY_ATTRIBUTES = {
+    "SSHManager": "campers.services.ssh",
+    "get_ssh_connection_info": "campers.services.ssh",
+    "MutagenManager": "campers.services.sync",
+    "PortForwardManager": "campers.services.portforward",
+    "PortInUseError": "campers.services.portforward",
+    "is_port_in_use": "campers.services.portforward",
+    "AnsibleManager": "campers.services.ansible",
+}
 
 __all__ = [
     "SSHManager",
@@ -16,3 +34,11 @@ __all__ = [
     "is_port_in_use",
     "AnsibleManager",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a service class or function on first access."""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
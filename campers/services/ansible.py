@@ -1,15 +1,31 @@
 """Manage Ansible playbook execution in push mode."""
 
+import hashlib
+import json
 import logging
+import os
 import shutil
 import subprocess
 import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-from campers.constants import ANSIBLE_PLAYBOOK_TIMEOUT_SECONDS, DEFAULT_SSH_USERNAME
+from campers.constants import (
+    ANSIBLE_DEFAULT_SETTINGS,
+    ANSIBLE_EVENT_PREFIX,
+    ANSIBLE_FACT_CACHE_TIMEOUT_SECONDS,
+    ANSIBLE_MARKER_FILE,
+    ANSIBLE_PLAYBOOK_TIMEOUT_SECONDS,
+    ANSIBLE_SLOWEST_TASKS_COUNT,
+    DEFAULT_SSH_USERNAME,
+)
+from campers.core.tracing import span
+from campers.services.ssh import read_remote_json, write_remote_json
 from campers.services.validation import (
     validate_ansible_host,
     validate_ansible_user,
@@ -18,6 +34,168 @@ from campers.services.validation import (
 
 logger = logging.getLogger(__name__)
 
+CALLBACK_PLUGIN_DIR = Path(__file__).parent / "ansible_plugins"
+CALLBACK_PLUGIN_NAME = "campers_events"
+RESULT_STATUSES = ("ok", "changed", "failed", "ignored", "skipped", "unreachable")
+
+
+@dataclass
+class TaskTiming:
+    """Duration of one Ansible task on one host.
+
+    Attributes
+    ----------
+    playbook : str
+        Name of the playbook the task belongs to
+    task : str
+        Task name
+    host : str
+        Inventory host the task ran on
+    status : str
+        Result status, one of RESULT_STATUSES
+    seconds : float
+        Time from task start until this host's result arrived
+    """
+
+    playbook: str
+    task: str
+    host: str
+    status: str
+    seconds: float
+
+
+def parse_ansible_event(line: str) -> dict[str, Any] | None:
+    """Parse a line printed by the campers_events callback plugin.
+
+    Parameters
+    ----------
+    line : str
+        One line of ansible-playbook output
+
+    Returns
+    -------
+    dict[str, Any] | None
+        The event with its 'event' type, or None when the line is not an event
+    """
+    if not line.startswith(ANSIBLE_EVENT_PREFIX):
+        return None
+
+    try:
+        event = json.loads(line[len(ANSIBLE_EVENT_PREFIX) :])
+    except json.JSONDecodeError:
+        return None
+
+    return event if isinstance(event, dict) and "event" in event else None
+
+
+def format_ansible_event(event: dict[str, Any]) -> str | None:
+    """Render an Ansible event as a log line.
+
+    Parameters
+    ----------
+    event : dict[str, Any]
+        Event returned by parse_ansible_event()
+
+    Returns
+    -------
+    str | None
+        Log line, or None for events that are not logged
+    """
+    kind = event["event"]
+
+    if kind == "play_start":
+        return f"PLAY [{event.get('play', '')}]"
+
+    if kind == "task_start":
+        return f"TASK [{event.get('task', '')}]"
+
+    if kind == "task_result":
+        status = f"{event['status']} (ignored)" if event.get("ignored") else event["status"]
+        text = (
+            f"{status}: [{event['host']}] {event.get('task', '')} "
+            f"({event.get('duration', 0.0):.1f}s)"
+        )
+
+        if event.get("msg"):
+            text += f" {event['msg']}"
+
+        return text
+
+    if kind == "stats":
+        return "\n".join(
+            f"RECAP [{host}] ok={counts.get('ok', 0)} changed={counts.get('changed', 0)} "
+            f"failed={counts.get('failures', 0)} unreachable={counts.get('unreachable', 0)} "
+            f"skipped={counts.get('skipped', 0)}"
+            for host, counts in event.get("hosts", {}).items()
+        )
+
+    return None
+
+
+def slowest_tasks(
+    timings: list[TaskTiming], count: int = ANSIBLE_SLOWEST_TASKS_COUNT
+) -> list[TaskTiming]:
+    """Return the longest running tasks, slowest first.
+
+    Parameters
+    ----------
+    timings : list[TaskTiming]
+        Task timings collected while running playbooks
+    count : int
+        Maximum number of tasks to return
+
+    Returns
+    -------
+    list[TaskTiming]
+        Up to count timings sorted by descending duration
+    """
+    return sorted(timings, key=lambda timing: timing.seconds, reverse=True)[:count]
+
+
+def playbook_hash(playbook_yaml: list[dict]) -> str:
+    """Compute the content hash of a rendered playbook.
+
+    Parameters
+    ----------
+    playbook_yaml : list[dict]
+        Playbook content with variables already interpolated
+
+    Returns
+    -------
+    str
+        Hex SHA-256 digest of the playbook serialized with sorted keys
+    """
+    rendered = yaml.dump(playbook_yaml, default_flow_style=False, sort_keys=True)
+    return hashlib.sha256(rendered.encode("utf-8")).hexdigest()
+
+
+def get_ansible_dir() -> Path:
+    """Return the directory holding Ansible fact caches and SSH control sockets.
+
+    Returns
+    -------
+    Path
+        Path to ``$CAMPERS_DIR/ansible``
+    """
+    campers_dir = Path(os.environ.get("CAMPERS_DIR", str(Path.home() / ".campers")))
+    return campers_dir / "ansible"
+
+
+def resolve_ansible_settings(section: dict[str, Any] | None) -> dict[str, Any]:
+    """Merge the ansible camp section over the default speed profile.
+
+    Parameters
+    ----------
+    section : dict[str, Any] | None
+        The validated 'ansible' section of the camp configuration
+
+    Returns
+    -------
+    dict[str, Any]
+        Settings with every key of ANSIBLE_DEFAULT_SETTINGS present
+    """
+    return {**ANSIBLE_DEFAULT_SETTINGS, **(section or {})}
+
 
 class AnsibleManager:
     """Manage Ansible playbook execution in push mode."""
@@ -32,6 +210,22 @@ class AnsibleManager:
         after playbook completion.
         """
         self._temp_files: list[Path] = []
+        self.task_timings: list[TaskTiming] = []
+        self._process: subprocess.Popen | None = None
+        self._stopped = False
+
+    def stop(self) -> None:
+        """Stop provisioning from another thread.
+
+        Terminates the running ansible-playbook process, so the playbook
+        fails, and keeps any further playbook from starting.
+        """
+        self._stopped = True
+        process = self._process
+
+        if process is not None and process.poll() is None:
+            logger.info("Stopping ansible-playbook")
+            process.terminate()
 
     def check_ansible_installed(self) -> None:
         """Check if ansible-playbook is available locally.
@@ -60,8 +254,17 @@ class AnsibleManager:
         ssh_key_file: str,
         ssh_username: str = DEFAULT_SSH_USERNAME,
         ssh_port: int = 22,
-    ) -> None:
-        """Execute one or more Ansible playbooks.
+        ssh_manager: Any = None,
+        reprovision: bool = False,
+        ansible_settings: dict[str, Any] | None = None,
+        cache_key: str | None = None,
+        progress_callback: Callable[[dict[str, Any]], None] | None = None,
+    ) -> dict[str, Any]:
+        """Execute one or more Ansible playbooks, skipping unchanged ones.
+
+        After a playbook succeeds, its content hash and duration are recorded
+        in a marker file on the instance. Playbooks whose hash matches the
+        marker are skipped on later runs.
 
         Parameters
         ----------
@@ -77,6 +280,27 @@ class AnsibleManager:
             SSH username (default: ubuntu, can be ec2-user for Amazon Linux)
         ssh_port : int
             SSH port (default: 22)
+        ssh_manager : Any
+            Connected SSH manager used to read and write the marker file. When
+            None, every playbook runs and no markers are recorded.
+        reprovision : bool
+            Run every playbook even if its marker matches
+        ansible_settings : dict[str, Any] | None
+            The 'ansible' camp section; missing keys use ANSIBLE_DEFAULT_SETTINGS
+        cache_key : str | None
+            Name of the fact cache for this instance, such as its instance ID
+            (default: instance_ip)
+        progress_callback : Callable[[dict[str, Any]], None] | None
+            Called with a progress snapshot whenever a task starts or reports
+            a result, and once more when each playbook finishes
+
+        Returns
+        -------
+        dict[str, Any]
+            Summary with 'ran' and 'skipped' playbook names, 'seconds' spent
+            running playbooks, 'seconds_saved' by skipping, estimated from
+            the recorded duration of the skipped playbooks, and the
+            'slowest_tasks' as TaskTiming entries
 
         Raises
         ------
@@ -100,22 +324,70 @@ class AnsibleManager:
             key_file=ssh_key_file,
             port=ssh_port,
         )
+        ansible_cfg = self._generate_ansible_cfg(
+            settings=resolve_ansible_settings(ansible_settings),
+            cache_key=cache_key or instance_ip,
+        )
+
+        markers = (
+            read_remote_json(
+                ssh_manager,
+                ANSIBLE_MARKER_FILE,
+                "Could not read playbook markers, running all playbooks",
+            )
+            if ssh_manager is not None
+            else {}
+        )
+        summary: dict[str, Any] = {"ran": [], "skipped": [], "seconds": 0.0, "seconds_saved": 0.0}
+        self.task_timings = []
 
         try:
             for playbook_name in playbook_names:
+                if self._stopped:
+                    raise RuntimeError("Ansible provisioning stopped")
+
                 playbook_yaml = playbooks_config[playbook_name]
+                content_hash = playbook_hash(playbook_yaml)
+                marker = markers.get(playbook_name, {})
+
+                if not reprovision and marker.get("hash") == content_hash:
+                    logger.info("Playbook '%s' unchanged since last run, skipping", playbook_name)
+                    summary["skipped"].append(playbook_name)
+                    summary["seconds_saved"] += marker.get("seconds", 0.0)
+                    continue
+
                 playbook_file = self._write_playbook_to_file(
                     name=playbook_name,
                     playbook_yaml=playbook_yaml,
                 )
 
-                self._run_ansible_playbook(
-                    inventory=inventory_file,
-                    playbook=playbook_file,
-                )
+                start = time.monotonic()
+                with span(f"ansible.{playbook_name}", "ansible"):
+                    self._run_ansible_playbook(
+                        inventory=inventory_file,
+                        playbook=playbook_file,
+                        ansible_cfg=ansible_cfg,
+                        playbook_name=playbook_name,
+                        progress_callback=progress_callback,
+                    )
+                seconds = time.monotonic() - start
+                summary["ran"].append(playbook_name)
+                summary["seconds"] += seconds
+
+                if ssh_manager is not None:
+                    markers[playbook_name] = {"hash": content_hash, "seconds": round(seconds, 1)}
+                    write_remote_json(
+                        ssh_manager,
+                        ANSIBLE_MARKER_FILE,
+                        markers,
+                        "Could not record playbook markers",
+                    )
         finally:
             self._cleanup_temp_files()
 
+        summary["slowest_tasks"] = slowest_tasks(self.task_timings)
+        return summary
+
     def _generate_inventory(
         self,
         host: str,
@@ -169,6 +441,74 @@ class AnsibleManager:
         logger.debug("Generated inventory: %s", inventory_file)
         return inventory_file
 
+    def _generate_ansible_cfg(self, settings: dict[str, Any], cache_key: str) -> Path:
+        """Generate a managed ansible.cfg applying the speed profile.
+
+        Parameters
+        ----------
+        settings : dict[str, Any]
+            Settings from resolve_ansible_settings()
+        cache_key : str
+            Name of the fact cache directory for the target instance
+
+        Returns
+        -------
+        Path
+            Path to generated temporary ansible.cfg file
+
+        Notes
+        -----
+        Facts are cached per instance, so a replaced instance never reuses
+        facts gathered on another machine. SSH control sockets live under
+        the campers directory with short hashed names, which keeps them within
+        the Unix socket path length limit.
+        """
+        ansible_dir = get_ansible_dir()
+        lines = [
+            "[defaults]",
+            f"strategy = {settings['strategy']}",
+            f"forks = {settings['forks']}",
+            "retry_files_enabled = False",
+            f"stdout_callback = {CALLBACK_PLUGIN_NAME}",
+            f"callback_plugins = {CALLBACK_PLUGIN_DIR}",
+        ]
+
+        if settings["fact_caching"]:
+            lines += [
+                "gathering = smart",
+                "fact_caching = jsonfile",
+                f"fact_caching_connection = {ansible_dir / 'facts' / cache_key}",
+                f"fact_caching_timeout = {ANSIBLE_FACT_CACHE_TIMEOUT_SECONDS}",
+            ]
+
+        if settings["control_persist"]:
+            ssh_args = f"-C -o ControlMaster=auto -o ControlPersist={settings['control_persist']}s"
+        else:
+            ssh_args = "-C -o ControlMaster=no"
+
+        lines += [
+            "",
+            "[ssh_connection]",
+            f"pipelining = {settings['pipelining']}",
+            f"ssh_args = {ssh_args}",
+            f"control_path_dir = {ansible_dir / 'cp'}",
+            "control_path = %(directory)s/%%C",
+        ]
+
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            suffix=".cfg",
+            prefix="campers-ansible-",
+            delete=False,
+        ) as f:
+            f.write("\n".join(lines) + "\n")
+            ansible_cfg = Path(f.name)
+
+        self._temp_files.append(ansible_cfg)
+
+        logger.debug("Generated ansible.cfg: %s", ansible_cfg)
+        return ansible_cfg
+
     def _write_playbook_to_file(
         self,
         name: str,
@@ -205,15 +545,30 @@ class AnsibleManager:
         self,
         inventory: Path,
         playbook: Path,
+        ansible_cfg: Path | None = None,
+        playbook_name: str | None = None,
+        progress_callback: Callable[[dict[str, Any]], None] | None = None,
     ) -> None:
         """Execute Ansible playbook against target host.
 
+        Event lines from the campers_events callback are rendered as log lines
+        and recorded in task_timings; any other output is logged verbatim.
+
         Parameters
         ----------
         inventory : Path
             Path to Ansible inventory file
         playbook : Path
             Path to Ansible playbook file
+        ansible_cfg : Path | None
+            Managed ansible.cfg passed through ANSIBLE_CONFIG, or None to use
+            Ansible's own configuration lookup
+        playbook_name : str | None
+            Name reported in progress and timings (default: playbook file stem)
+        progress_callback : Callable[[dict[str, Any]], None] | None
+            Receives a progress snapshot with 'playbook', 'status' ('running',
+            'done' or 'failed'), current 'task', number of 'tasks' started,
+            result 'counts' per status and, once finished, 'seconds'
         """
         cmd = [
             "ansible-playbook",
@@ -225,20 +580,51 @@ class AnsibleManager:
 
         logger.info("Executing: %s", " ".join(cmd))
 
+        env = None
+
+        if ansible_cfg is not None:
+            env = {**os.environ, "ANSIBLE_CONFIG": str(ansible_cfg)}
+
         process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True,
             bufsize=1,
+            env=env,
         )
-
+        self._process = process
+
+        if self._stopped:
+            process.terminate()
+
+        progress: dict[str, Any] = {
+            "playbook": playbook_name or playbook.stem,
+            "status": "running",
+            "task": None,
+            "tasks": 0,
+            "counts": dict.fromkeys(RESULT_STATUSES, 0),
+        }
+        start = time.monotonic()
         output_lines: list[str] = []
         try:
             for line in process.stdout:
                 stripped_line = line.rstrip()
-                logger.info(stripped_line)
-                output_lines.append(stripped_line)
+                event = parse_ansible_event(stripped_line)
+
+                if event is None:
+                    logger.info(stripped_line)
+                    output_lines.append(stripped_line)
+                    continue
+
+                text = format_ansible_event(event)
+
+                if text:
+                    logger.info(text)
+                    output_lines.append(text)
+
+                if self._record_event(event, progress) and progress_callback is not None:
+                    progress_callback(dict(progress, counts=dict(progress["counts"])))
             process.wait(timeout=ANSIBLE_PLAYBOOK_TIMEOUT_SECONDS)
         except subprocess.TimeoutExpired as e:
             if process.stdout and hasattr(process.stdout, "close"):
@@ -250,6 +636,11 @@ class AnsibleManager:
             if process.stdout and hasattr(process.stdout, "close"):
                 process.stdout.close()
 
+        if progress_callback is not None:
+            progress["status"] = "done" if process.returncode == 0 else "failed"
+            progress["seconds"] = round(time.monotonic() - start, 1)
+            progress_callback(progress)
+
         if process.returncode != 0:
             last_lines = output_lines[-50:] if len(output_lines) > 50 else output_lines
             error_output = "\n".join(last_lines)
@@ -258,6 +649,45 @@ class AnsibleManager:
                 f"Ansible output:\n{error_output}"
             )
 
+    def _record_event(self, event: dict[str, Any], progress: dict[str, Any]) -> bool:
+        """Apply a task event to the progress snapshot and task timings.
+
+        Parameters
+        ----------
+        event : dict[str, Any]
+            Event returned by parse_ansible_event()
+        progress : dict[str, Any]
+            Progress snapshot of the running playbook, updated in place
+
+        Returns
+        -------
+        bool
+            True if the event changed the progress snapshot
+        """
+        if event["event"] == "task_start":
+            progress["task"] = event.get("task")
+            progress["tasks"] += 1
+            return True
+
+        if event["event"] != "task_result":
+            return False
+
+        status = "ignored" if event.get("ignored") else event.get("status")
+
+        if status in progress["counts"]:
+            progress["counts"][status] += 1
+
+        self.task_timings.append(
+            TaskTiming(
+                playbook=progress["playbook"],
+                task=event.get("task", ""),
+                host=event.get("host", ""),
+                status=status,
+                seconds=float(event.get("duration", 0.0)),
+            )
+        )
+        return True
+
     def _cleanup_temp_files(self) -> None:
         """Clean up temporary inventory and playbook files.
 
@@ -0,0 +1 @@
+"""Ansible plugins loaded by ansible-playbook through the managed ansible.cfg."""
@@ -0,0 +1,91 @@
+"""Ansible stdout callback emitting one JSON event per line for campers.
+
+The plugin runs inside ansible-playbook, which may use a different Python
+interpreter than campers, so it imports nothing from campers.
+"""
+
+import json
+import os
+import time
+from typing import Any
+
+from ansible.plugins.callback import CallbackBase
+
+DOCUMENTATION = """
+    name: campers_events
+    type: stdout
+    short_description: JSON line events with per-task timing for campers
+    description:
+      - Prints one JSON event per line for play, task and result events.
+"""
+
+EVENT_PREFIX = "CAMPERS_EVENT "
+"""Must match campers.constants.ANSIBLE_EVENT_PREFIX."""
+
+MAX_MESSAGE_LENGTH = 2000
+
+
+class CallbackModule(CallbackBase):
+    """Print play, task and result events as prefixed JSON lines."""
+
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = "stdout"
+    CALLBACK_NAME = "campers_events"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._task_started: dict[str, float] = {}
+
+    def _emit(self, event: str, **fields: Any) -> None:
+        line = EVENT_PREFIX + json.dumps({"event": event, **fields}, default=str)
+        self._display.display(line)
+
+    def _emit_result(self, result: Any, status: str, **fields: Any) -> None:
+        task = result._task
+        started = self._task_started.get(task._uuid)
+        duration = time.monotonic() - started if started is not None else 0.0
+        self._emit(
+            "task_result",
+            task=task.get_name(),
+            host=result._host.get_name(),
+            status=status,
+            duration=round(duration, 3),
+            **fields,
+        )
+
+    def _failure_message(self, result: Any) -> str:
+        data = result._result
+        parts = [str(data.get(key)) for key in ("msg", "stderr") if data.get(key)]
+        return "\n".join(parts)[:MAX_MESSAGE_LENGTH]
+
+    def v2_playbook_on_start(self, playbook: Any) -> None:
+        self._emit("playbook_start", playbook=os.path.basename(playbook._file_name))
+
+    def v2_playbook_on_play_start(self, play: Any) -> None:
+        self._emit("play_start", play=play.get_name().strip())
+
+    def v2_playbook_on_task_start(self, task: Any, is_conditional: bool) -> None:
+        self._task_started[task._uuid] = time.monotonic()
+        self._emit("task_start", task=task.get_name())
+
+    def v2_playbook_on_handler_task_start(self, task: Any) -> None:
+        self.v2_playbook_on_task_start(task, False)
+
+    def v2_runner_on_ok(self, result: Any) -> None:
+        status = "changed" if result._result.get("changed") else "ok"
+        self._emit_result(result, status)
+
+    def v2_runner_on_failed(self, result: Any, ignore_errors: bool = False) -> None:
+        self._emit_result(
+            result, "failed", ignored=ignore_errors, msg=self._failure_message(result)
+        )
+
+    def v2_runner_on_unreachable(self, result: Any) -> None:
+        self._emit_result(result, "unreachable", msg=self._failure_message(result))
+
+    def v2_runner_on_skipped(self, result: Any) -> None:
+        self._emit_result(result, "skipped")
+
+    def v2_playbook_on_stats(self, stats: Any) -> None:
+        hosts = {host: stats.summarize(host) for host in sorted(stats.processed)}
+        self._emit("stats", hosts=hosts)
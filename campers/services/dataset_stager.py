@@ -0,0 +1,317 @@
+"""Dataset stager executed on the remote instance.
+
+This module is sent to the instance verbatim and run with ``python3 -c``, so
+it must only depend on the Python standard library and run on the older
+Python 3 releases shipped by common AMIs. It reads a staging plan
+as JSON from stdin, downloads every object over its pre-signed URL and prints
+a single summary line prefixed with SUMMARY_PREFIX.
+
+Plan format::
+
+    {
+        "concurrency": 8,
+        "part_size": 67108864,
+        "datasets": [
+            {
+                "target": "~/data/imagenet",
+                "objects": [
+                    {"path": "train/0001.tar", "url": "...", "size": 123, "etag": "..."}
+                ]
+            }
+        ]
+    }
+"""
+
+import hashlib
+import http.client
+import json
+import os
+import re
+import sys
+import time
+import urllib.request
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+
+MANIFEST_NAME = ".campers-datasets.json"
+"""Manifest file written into each dataset target directory."""
+
+SUMMARY_PREFIX = "CAMPERS_DATASETS_SUMMARY "
+"""Prefix of the stdout line carrying the JSON staging summary."""
+
+DOWNLOAD_ATTEMPTS = 3
+"""Number of attempts for each object or part download."""
+
+READ_CHUNK_SIZE = 1024 * 1024
+"""Size in bytes of each read from an HTTP response."""
+
+_MD5_ETAG = re.compile(r"^[0-9a-f]{32}$")
+
+
+def load_manifest(target: str) -> dict:
+    """Load the manifest of previously staged objects.
+
+    Parameters
+    ----------
+    target : str
+        Dataset target directory
+
+    Returns
+    -------
+    dict
+        Mapping of relative path to {"etag", "size"}, empty if none exists
+    """
+    try:
+        with open(os.path.join(target, MANIFEST_NAME)) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def save_manifest(target: str, manifest: dict) -> None:
+    """Atomically write the manifest of staged objects.
+
+    Parameters
+    ----------
+    target : str
+        Dataset target directory
+    manifest : dict
+        Mapping of relative path to {"etag", "size"}
+    """
+    path = os.path.join(target, MANIFEST_NAME)
+    tmp_path = f"{path}.tmp"
+
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+
+    os.replace(tmp_path, path)
+
+
+def is_unchanged(obj: dict, manifest: dict, dest: str) -> bool:
+    """Check whether an object was already staged and is still intact.
+
+    Parameters
+    ----------
+    obj : dict
+        Object entry from the plan
+    manifest : dict
+        Manifest loaded from the target directory
+    dest : str
+        Local destination path of the object
+
+    Returns
+    -------
+    bool
+        True if the manifest records the same ETag and the file size matches
+    """
+    entry = manifest.get(obj["path"])
+
+    if not entry or entry.get("etag") != obj["etag"] or entry.get("size") != obj["size"]:
+        return False
+
+    try:
+        return os.path.getsize(dest) == obj["size"]
+    except OSError:
+        return False
+
+
+def _fetch_range(url: str, fd: int, start: int, end: int) -> None:
+    """Download an inclusive byte range into an open file descriptor.
+
+    Parameters
+    ----------
+    url : str
+        Pre-signed object URL
+    fd : int
+        File descriptor opened for writing
+    start : int
+        First byte offset
+    end : int
+        Last byte offset (inclusive)
+    """
+    last_error = None
+
+    for attempt in range(DOWNLOAD_ATTEMPTS):
+        request = urllib.request.Request(url, headers={"Range": f"bytes={start}-{end}"})
+        offset = start
+
+        try:
+            with urllib.request.urlopen(request, timeout=60) as response:
+                while True:
+                    chunk = response.read(READ_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    os.pwrite(fd, chunk, offset)
+                    offset += len(chunk)
+
+            if offset != end + 1:
+                raise OSError(f"short read: got {offset - start} of {end - start + 1} bytes")
+            return
+        except (OSError, http.client.HTTPException) as e:
+            last_error = e
+            time.sleep(2**attempt)
+
+    raise OSError(f"range {start}-{end} failed: {last_error}")
+
+
+def _file_md5(path: str) -> str:
+    """Compute the MD5 hex digest of a file.
+
+    Parameters
+    ----------
+    path : str
+        File to hash
+
+    Returns
+    -------
+    str
+        MD5 hex digest
+    """
+    digest = hashlib.md5()
+
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def download_object(obj: dict, dest: str, part_size: int, part_pool: ThreadPoolExecutor) -> None:
+    """Download one object with parallel ranged requests and verify it.
+
+    Parameters
+    ----------
+    obj : dict
+        Object entry from the plan
+    dest : str
+        Local destination path
+    part_size : int
+        Size in bytes of each ranged request
+    part_pool : ThreadPoolExecutor
+        Pool used to fetch parts of large objects concurrently
+
+    Raises
+    ------
+    OSError
+        If a download fails or the checksum does not match
+    """
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    tmp_path = f"{dest}.campers-part"
+    size = obj["size"]
+
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.ftruncate(fd, size)
+        ranges = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+        futures = [part_pool.submit(_fetch_range, obj["url"], fd, s, e) for s, e in ranges]
+        _, pending = wait(futures, return_when=FIRST_EXCEPTION)
+
+        if pending:
+            # A range failed; fd must outlive every part still writing to it,
+            # or a concurrent download reusing the descriptor gets corrupted.
+            for future in pending:
+                future.cancel()
+            wait(pending)
+
+        for future in futures:
+            if not future.cancelled():
+                future.result()
+    finally:
+        os.close(fd)
+
+    if os.path.getsize(tmp_path) != size:
+        os.unlink(tmp_path)
+        raise OSError(f"size mismatch for {obj['path']}")
+
+    etag = obj["etag"]
+    if _MD5_ETAG.match(etag) and _file_md5(tmp_path) != etag:
+        os.unlink(tmp_path)
+        raise OSError(f"checksum mismatch for {obj['path']}")
+
+    os.replace(tmp_path, dest)
+
+
+def stage(plan: dict) -> dict:
+    """Stage every dataset in the plan, skipping unchanged objects.
+
+    Parameters
+    ----------
+    plan : dict
+        Staging plan (see module docstring)
+
+    Returns
+    -------
+    dict
+        Summary with downloaded, skipped, bytes, failed and seconds keys
+    """
+    start_time = time.monotonic()
+    concurrency = max(1, int(plan.get("concurrency", 8)))
+    part_size = max(1, int(plan.get("part_size", 64 * 1024 * 1024)))
+    summary = {"downloaded": 0, "skipped": 0, "bytes": 0, "failed": []}
+
+    object_pool = ThreadPoolExecutor(max_workers=concurrency)
+    part_pool = ThreadPoolExecutor(max_workers=concurrency)
+
+    try:
+        for dataset in plan.get("datasets", []):
+            target = os.path.expanduser(dataset["target"])
+            os.makedirs(target, exist_ok=True)
+            manifest = load_manifest(target)
+            pending = {}
+
+            for obj in dataset.get("objects", []):
+                dest = os.path.normpath(os.path.join(target, obj["path"]))
+
+                if not dest.startswith(os.path.normpath(target) + os.sep):
+                    summary["failed"].append(obj["path"])
+                    print(f"failed {obj['path']}: path escapes target", flush=True)
+                    continue
+
+                if is_unchanged(obj, manifest, dest):
+                    summary["skipped"] += 1
+                    continue
+
+                manifest.pop(obj["path"], None)
+                pending[obj["path"]] = (
+                    obj,
+                    object_pool.submit(download_object, obj, dest, part_size, part_pool),
+                )
+
+            for path, (obj, future) in pending.items():
+                try:
+                    future.result()
+                except OSError as e:
+                    summary["failed"].append(path)
+                    print(f"failed {path}: {e}", flush=True)
+                    continue
+
+                manifest[path] = {"etag": obj["etag"], "size": obj["size"]}
+                summary["downloaded"] += 1
+                summary["bytes"] += obj["size"]
+                print(f"staged {path} ({obj['size']} bytes)", flush=True)
+
+            save_manifest(target, manifest)
+    finally:
+        object_pool.shutdown()
+        part_pool.shutdown()
+
+    summary["seconds"] = round(time.monotonic() - start_time, 3)
+    return summary
+
+
+def main() -> int:
+    """Read a plan from stdin, stage it and print the summary line.
+
+    Returns
+    -------
+    int
+        0 if every object was staged, 1 otherwise
+    """
+    summary = stage(json.load(sys.stdin))
+    print(SUMMARY_PREFIX + json.dumps(summary), flush=True)
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
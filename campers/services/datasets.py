@@ -0,0 +1,119 @@
+"""Stage S3 datasets directly on the remote instance."""
+
+import json
+import logging
+import shlex
+from pathlib import Path
+from typing import Any
+
+from campers.constants import DATASET_CONCURRENCY, DATASET_PART_SIZE_BYTES
+from campers.services import dataset_stager
+from campers.services.dataset_stager import SUMMARY_PREFIX
+
+logger = logging.getLogger(__name__)
+
+
+def parse_stager_summary(output: str) -> dict[str, Any] | None:
+    """Extract the JSON summary printed by the remote dataset stager.
+
+    Parameters
+    ----------
+    output : str
+        Complete stdout of the stager
+
+    Returns
+    -------
+    dict[str, Any] | None
+        Parsed summary, or None if no valid summary line was printed
+    """
+    for line in reversed(output.splitlines()):
+        if line.startswith(SUMMARY_PREFIX):
+            try:
+                return json.loads(line[len(SUMMARY_PREFIX) :])
+            except json.JSONDecodeError:
+                return None
+
+    return None
+
+
+class DatasetManager:
+    """Stage datasets on the instance from a provider-specific plan.
+
+    The planner lists objects and builds download URLs locally; the stager
+    script then runs on the instance and pulls the data straight from object
+    storage, so dataset bytes never pass through the local machine.
+
+    Parameters
+    ----------
+    planner : Any
+        Provider planner exposing build_plan(datasets, concurrency, part_size)
+    """
+
+    def __init__(self, planner: Any) -> None:
+        self.planner = planner
+
+    def build_command(self) -> str:
+        """Build the remote command running the stager script.
+
+        Returns
+        -------
+        str
+            Shell command executing the stager with python3
+        """
+        source = Path(dataset_stager.__file__).read_text()
+        return f"python3 -c {shlex.quote(source)}"
+
+    def stage(
+        self,
+        ssh_manager: Any,
+        datasets: list[dict[str, Any]],
+        concurrency: int = DATASET_CONCURRENCY,
+        part_size: int = DATASET_PART_SIZE_BYTES,
+    ) -> dict[str, Any]:
+        """Download every dataset to its target path on the instance.
+
+        Parameters
+        ----------
+        ssh_manager : Any
+            Connected SSHManager for the instance
+        datasets : list[dict[str, Any]]
+            Dataset entries with 'source' and 'target'
+        concurrency : int
+            Number of parallel downloads on the instance
+        part_size : int
+            Size in bytes of each ranged request
+
+        Returns
+        -------
+        dict[str, Any]
+            Summary with downloaded, skipped, bytes, failed and seconds keys
+
+        Raises
+        ------
+        RuntimeError
+            If the stager did not report a summary or any object failed
+        """
+        plan = self.planner.build_plan(datasets, concurrency, part_size)
+
+        def log_line(line: str) -> None:
+            if not line.startswith(SUMMARY_PREFIX):
+                logger.info("[datasets] %s", line)
+
+        exit_code, output = ssh_manager.execute_with_input(
+            self.build_command(), json.dumps(plan), line_callback=log_line
+        )
+        summary = parse_stager_summary(output)
+
+        if summary is None:
+            raise RuntimeError(
+                f"Dataset staging did not complete (exit code {exit_code}); "
+                "check that python3 is available on the instance"
+            )
+
+        if summary["failed"]:
+            failed = ", ".join(summary["failed"][:5])
+            raise RuntimeError(
+                f"Dataset staging failed for {len(summary['failed'])} object(s): {failed}"
+            )
+
+        return summary
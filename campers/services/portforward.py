@@ -1,39 +1,129 @@
-"""SSH port forwarding management using sshtunnel library.
+"""SSH port forwarding over a single shared paramiko transport.
 
-This module provides a manager class for creating and managing SSH port forwarding
-tunnels using the sshtunnel library. It handles multiple concurrent tunnels and
-ensures proper cleanup on errors.
+This module provides a manager class that forwards local ports to ports on the
+remote instance, remote ports to local ports, and runs a local SOCKS5 proxy
+that connects through the instance. All of them share one authenticated SSH
+transport and all connections are relayed by a single selector-based event
+loop, so hundreds of connections cost one thread instead of one thread each.
 
 Classes
 -------
+PortStats
+    Per-port connection, traffic, latency and health counters
 PortForwardManager
     Manager for SSH port forwarding tunnels
 
 Examples
 --------
 >>> manager = PortForwardManager()
->>> manager.create_tunnels([8888, 8080], "10.0.1.50", "/path/to/key.pem")
+>>> manager.create_tunnels([(8888, 8888)], "10.0.1.50", "/path/to/key.pem")
+>>> manager.get_stats()
 >>> manager.stop_all_tunnels()
 
 Notes
 -----
-Uses sshtunnel.BaseSSHTunnelForwarderError and paramiko.SSHException for
-specific exception handling. Falls back to OSError for port binding issues.
+Channels are opened with the ``direct-tcpip`` request, the same mechanism used
+by ``ssh -L``. Paramiko channels expose a selectable file descriptor for
+incoming data, which lets them share one selector with the local sockets.
 """
 
+import contextlib
 import logging
 import os
+import selectors
 import socket
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
+from typing import Any
 
 import paramiko
-from sshtunnel import BaseSSHTunnelForwarderError, SSHTunnelForwarder
 
-from campers.constants import DEFAULT_SSH_PORT, DEFAULT_SSH_USERNAME, PRIVILEGED_PORT_THRESHOLD
+from campers.constants import (
+    AUTO_FORWARD_COMMAND_TIMEOUT_SECONDS,
+    AUTO_FORWARD_POLL_INTERVAL_SECONDS,
+    DEFAULT_SSH_PORT,
+    DEFAULT_SSH_USERNAME,
+    PORTFORWARD_BUFFER_SIZE,
+    PORTFORWARD_CHANNEL_OPEN_TIMEOUT_SECONDS,
+    PORTFORWARD_CHANNEL_OPEN_WORKERS,
+    PORTFORWARD_CONNECT_RETRIES,
+    PORTFORWARD_HEALTH_PROBE_INTERVAL_SECONDS,
+    PORTFORWARD_IDLE_POLL_SECONDS,
+    PORTFORWARD_KEEPALIVE_INTERVAL_SECONDS,
+    PORTFORWARD_LIVENESS_TIMEOUT_SECONDS,
+    PORTFORWARD_MAX_BUFFERED_BYTES,
+    PORTFORWARD_SEND_POLL_SECONDS,
+    PORTFORWARD_STATS_INTERVAL_SECONDS,
+    PRIVILEGED_PORT_THRESHOLD,
+    SSH_RETRY_DELAYS,
+)
+from campers.services.ssh import SSHManager
 from campers.services.validation import validate_port
 
 logger = logging.getLogger(__name__)
 
+HEALTH_UNKNOWN = "unknown"
+"""Health state before the first probe of a remote port completes."""
+
+HEALTH_UP = "up"
+"""Health state when a service accepts connections on the remote port."""
+
+HEALTH_DOWN = "down"
+"""Health state when nothing accepts connections on the remote port."""
+
+LISTENING_PORTS_COMMAND = "cat /proc/net/tcp /proc/net/tcp6 2>/dev/null"
+"""Remote command listing TCP sockets, cheap enough to poll every few seconds."""
+
+TCP_LISTEN_STATE = "0A"
+"""Socket state of a listening TCP socket in /proc/net/tcp."""
+
+FORWARDABLE_LISTEN_ADDRESSES = {
+    "00000000",
+    "0100007F",
+    "00000000000000000000000000000000",
+    "00000000000000000000000001000000",
+    "0000000000000000FFFF00000100007F",
+}
+"""Wildcard and loopback addresses, as written in /proc/net/tcp and tcp6."""
+
+SOCKS_VERSION = 5
+"""SOCKS protocol version spoken by the proxy (RFC 1928)."""
+
+SOCKS_NO_AUTH = 0x00
+"""SOCKS authentication method: none. The proxy only listens on localhost."""
+
+SOCKS_NO_ACCEPTABLE_METHODS = 0xFF
+"""SOCKS method selection reply when the client offers no supported method."""
+
+SOCKS_CMD_CONNECT = 0x01
+"""SOCKS command opening a TCP connection, the only one supported."""
+
+SOCKS_ATYP_IPV4 = 0x01
+"""SOCKS address type of a 4-byte IPv4 address."""
+
+SOCKS_ATYP_DOMAIN = 0x03
+"""SOCKS address type of a length-prefixed domain name."""
+
+SOCKS_ATYP_IPV6 = 0x04
+"""SOCKS address type of a 16-byte IPv6 address."""
+
+SOCKS_REPLY_SUCCEEDED = 0x00
+"""SOCKS reply code for an established connection."""
+
+SOCKS_REPLY_HOST_UNREACHABLE = 0x04
+"""SOCKS reply code used when the instance cannot open the connection."""
+
+SOCKS_REPLY_COMMAND_NOT_SUPPORTED = 0x07
+"""SOCKS reply code for BIND and UDP ASSOCIATE requests."""
+
+SOCKS_REPLY_ADDRESS_TYPE_NOT_SUPPORTED = 0x08
+"""SOCKS reply code for unknown address types."""
+
 
 class PortInUseError(RuntimeError):
     """Raised when a local port is already in use by another process."""
@@ -67,15 +157,898 @@ def is_port_in_use(port: int, host: str = "localhost") -> bool:
         return result == 0
 
 
+def parse_listening_ports(proc_net_tcp: str) -> set[int]:
+    """Extract forwardable listening ports from /proc/net/tcp and tcp6 content.
+
+    Only sockets bound to a wildcard or loopback address are returned, since
+    forwarded channels connect to localhost on the instance.
+
+    Parameters
+    ----------
+    proc_net_tcp : str
+        Concatenated content of /proc/net/tcp and /proc/net/tcp6
+
+    Returns
+    -------
+    set[int]
+        Listening TCP port numbers
+    """
+    ports = set()
+
+    for line in proc_net_tcp.splitlines():
+        fields = line.split()
+
+        if len(fields) < 4 or fields[3] != TCP_LISTEN_STATE:
+            continue
+
+        address, _, port_hex = fields[1].rpartition(":")
+
+        if address.upper() in FORWARDABLE_LISTEN_ADDRESSES:
+            ports.add(int(port_hex, 16))
+
+    return ports
+
+
+def is_auto_forward_allowed(port: int, rules: dict[str, Any]) -> bool:
+    """Check whether a discovered remote port may be forwarded automatically.
+
+    Deny ranges always win. With an allow list, only ports inside it are
+    forwarded; without one, every unprivileged port is. The SSH port is never
+    forwarded.
+
+    Parameters
+    ----------
+    port : int
+        Remote port that started listening
+    rules : dict[str, Any]
+        Rules from normalize_auto_forward_config()
+
+    Returns
+    -------
+    bool
+        True if the port should be forwarded
+    """
+    if port == DEFAULT_SSH_PORT or any(low <= port <= high for low, high in rules["deny"]):
+        return False
+
+    if rules["allow"] is not None:
+        return any(low <= port <= high for low, high in rules["allow"])
+
+    return port >= PRIVILEGED_PORT_THRESHOLD
+
+
+def parse_socks_greeting(buffer: bytes | bytearray) -> tuple[set[int], int] | None:
+    """Parse a SOCKS5 method selection message.
+
+    Parameters
+    ----------
+    buffer : bytes | bytearray
+        Bytes received from the client so far
+
+    Returns
+    -------
+    tuple[set[int], int] | None
+        Offered authentication methods and the number of bytes consumed, or
+        None if the message is not complete yet
+
+    Raises
+    ------
+    ValueError
+        If the client does not speak SOCKS5
+    """
+    if len(buffer) < 2:
+        return None
+
+    if buffer[0] != SOCKS_VERSION:
+        raise ValueError(f"Unsupported SOCKS version: {buffer[0]}")
+
+    end = 2 + buffer[1]
+
+    if len(buffer) < end:
+        return None
+
+    return set(buffer[2:end]), end
+
+
+def parse_socks_request(buffer: bytes | bytearray) -> tuple[int, int, str, int, int] | None:
+    """Parse a SOCKS5 request message.
+
+    Parameters
+    ----------
+    buffer : bytes | bytearray
+        Bytes received from the client after the method selection
+
+    Returns
+    -------
+    tuple[int, int, str, int, int] | None
+        Command, address type, destination host, destination port and the
+        number of bytes consumed, or None if the message is not complete yet.
+        The host is empty for unsupported address types.
+
+    Raises
+    ------
+    ValueError
+        If the request does not use SOCKS5
+    """
+    if len(buffer) < 5:
+        return None
+
+    if buffer[0] != SOCKS_VERSION:
+        raise ValueError(f"Unsupported SOCKS version: {buffer[0]}")
+
+    command, address_type = buffer[1], buffer[3]
+
+    if address_type == SOCKS_ATYP_IPV4:
+        start, end = 4, 8
+    elif address_type == SOCKS_ATYP_IPV6:
+        start, end = 4, 20
+    elif address_type == SOCKS_ATYP_DOMAIN:
+        start, end = 5, 5 + buffer[4]
+    else:
+        return command, address_type, "", 0, len(buffer)
+
+    if len(buffer) < end + 2:
+        return None
+
+    raw_host = bytes(buffer[start:end])
+
+    if address_type == SOCKS_ATYP_IPV4:
+        host = socket.inet_ntop(socket.AF_INET, raw_host)
+    elif address_type == SOCKS_ATYP_IPV6:
+        host = socket.inet_ntop(socket.AF_INET6, raw_host)
+    else:
+        host = raw_host.decode("idna")
+
+    port = int.from_bytes(buffer[end : end + 2], "big")
+    return command, address_type, host, port, end + 2
+
+
+def socks_reply(code: int) -> bytes:
+    """Build a SOCKS5 reply with an unspecified bound address.
+
+    Parameters
+    ----------
+    code : int
+        SOCKS reply code
+
+    Returns
+    -------
+    bytes
+        Reply message
+    """
+    return bytes([SOCKS_VERSION, code, 0, SOCKS_ATYP_IPV4, 0, 0, 0, 0, 0, 0])
+
+
+@dataclass
+class PortStats:
+    """Counters for one forwarded port.
+
+    Attributes
+    ----------
+    remote_port : int
+        Port on the remote instance
+    local_port : int
+        Port on the local machine
+    connections : int
+        Total number of accepted connections, local or, for reverse
+        forwards, remote
+    active_connections : int
+        Number of connections currently being relayed
+    failed_connections : int
+        Connections whose other end could not be reached
+    bytes_in : int
+        Bytes relayed from the instance to the local machine
+    bytes_out : int
+        Bytes relayed from the local machine to the instance
+    first_byte_latency_ms : float | None
+        Time from accepting the most recent connection to its first byte from
+        the remote side, in milliseconds. Not measured for reverse forwards.
+    health : str
+        Result of the last active probe: unknown, up, or down
+    auto : bool
+        True if the port was forwarded by auto_forward discovery
+    reverse : bool
+        True if connections to remote_port on the instance are forwarded to
+        local_port on the local machine
+    socks : bool
+        True for the SOCKS5 proxy on local_port, which has no fixed remote port
+    """
+
+    remote_port: int
+    local_port: int
+    connections: int = 0
+    active_connections: int = 0
+    failed_connections: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    first_byte_latency_ms: float | None = None
+    health: str = HEALTH_UNKNOWN
+    auto: bool = False
+    reverse: bool = False
+    socks: bool = False
+
+
+@dataclass
+class _Listener:
+    """Listening socket of one forwarded port."""
+
+    sock: socket.socket
+    stats: PortStats
+
+
+@dataclass(eq=False)
+class _SocksClient:
+    """Local SOCKS client whose handshake is still in progress."""
+
+    sock: socket.socket
+    stats: PortStats
+    accepted_at: float
+    buffer: bytearray = field(default_factory=bytearray)
+    greeted: bool = False
+
+
+@dataclass(eq=False)
+class _Connection:
+    """One connection relayed between a local socket and a remote channel."""
+
+    sock: socket.socket
+    channel: paramiko.Channel
+    stats: PortStats
+    accepted_at: float
+    to_remote: bytearray = field(default_factory=bytearray)
+    to_local: bytearray = field(default_factory=bytearray)
+    local_eof: bool = False
+    remote_eof: bool = False
+    write_shutdown_sent: bool = False
+    local_shutdown_sent: bool = False
+    first_byte_seen: bool = False
+    local_events: int = 0
+    remote_events: int = 0
+
+
+class _ForwardingLoop:
+    """Selector-based relay between local sockets and SSH channels.
+
+    All selector and channel I/O happens on the loop thread. Other threads hand
+    work to it through ``call_soon``, which wakes the selector via a socket pair.
+
+    Parameters
+    ----------
+    transport : paramiko.Transport
+        Authenticated transport to open channels on
+    stats_lock : threading.Lock
+        Lock guarding every PortStats instance
+
+    Attributes
+    ----------
+    error : Exception | None
+        Exception that ended the loop thread, after which every listener is
+        closed and the loop has to be replaced
+    """
+
+    def __init__(self, transport: paramiko.Transport, stats_lock: threading.Lock) -> None:
+        self.transport = transport
+        self.stats_lock = stats_lock
+        self.selector = selectors.DefaultSelector()
+        self._wake_reader, self._wake_writer = socket.socketpair()
+        self._wake_reader.setblocking(False)
+        self._wake_writer.setblocking(False)
+        self.selector.register(self._wake_reader, selectors.EVENT_READ, None)
+        self._pending_calls: deque[Callable[[], None]] = deque()
+        self._listeners: list[_Listener] = []
+        self._connections: set[_Connection] = set()
+        self._socks_clients: set[_SocksClient] = set()
+        self._suspended = False
+        self._stop_event = threading.Event()
+        self._executor = ThreadPoolExecutor(
+            max_workers=PORTFORWARD_CHANNEL_OPEN_WORKERS,
+            thread_name_prefix="campers-portforward-open",
+        )
+        self._thread: threading.Thread | None = None
+        self.error: Exception | None = None
+
+    def start(self) -> None:
+        """Start the event loop thread."""
+        self._thread = threading.Thread(target=self._run, name="campers-portforward", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the event loop and close every listener and connection."""
+        self._stop_event.set()
+        self._wake()
+
+        if self._thread is not None:
+            self._thread.join(timeout=PORTFORWARD_CHANNEL_OPEN_TIMEOUT_SECONDS)
+            self._thread = None
+        else:
+            while self._pending_calls:
+                self._pending_calls.popleft()()
+
+            self._close_all()
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def add_forward(self, stats: PortStats) -> None:
+        """Bind the local port of a forward and start accepting on it.
+
+        Binding happens on the calling thread so that errors surface to the
+        caller; registration with the selector happens on the loop thread.
+
+        Parameters
+        ----------
+        stats : PortStats
+            Counters of the forward, also carrying its local and remote port.
+            A local port of 0 binds any free port and records it in the stats.
+
+        Raises
+        ------
+        OSError
+            If the local port cannot be bound
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind(("localhost", stats.local_port))
+            sock.listen(socket.SOMAXCONN)
+            sock.setblocking(False)
+        except OSError:
+            sock.close()
+            raise
+
+        stats.local_port = sock.getsockname()[1]
+        listener = _Listener(sock=sock, stats=stats)
+        self.call_soon(lambda: self._register_listener(listener))
+
+    def remove_forward(self, stats: PortStats) -> None:
+        """Stop accepting on a forward and close its open connections.
+
+        Parameters
+        ----------
+        stats : PortStats
+            Counters of the forward passed to add_forward()
+        """
+        self.call_soon(lambda: self._unregister_listener(stats))
+
+    def add_reverse_connection(self, channel: paramiko.Channel, stats: PortStats) -> None:
+        """Relay a channel opened by the server for a reverse forward.
+
+        The local connection is made on a worker thread, so this may be called
+        from the transport thread.
+
+        Parameters
+        ----------
+        channel : paramiko.Channel
+            Channel for a connection to the remote port on the instance
+        stats : PortStats
+            Counters of the reverse forward, carrying the local port to connect to
+        """
+        accepted_at = time.monotonic()
+
+        with self.stats_lock:
+            stats.connections += 1
+            stats.active_connections += 1
+
+        future = self._executor.submit(
+            socket.create_connection,
+            ("localhost", stats.local_port),
+            timeout=PORTFORWARD_CHANNEL_OPEN_TIMEOUT_SECONDS,
+        )
+        future.add_done_callback(
+            lambda done: self.call_soon(
+                lambda: self._local_connected(channel, stats, accepted_at, done)
+            )
+        )
+
+    def suspend(self) -> None:
+        """Stop accepting connections and drop the ones relayed over a dead transport.
+
+        Local ports stay bound, so clients connecting meanwhile wait in the
+        listen backlog until resume() is called.
+        """
+        self.call_soon(self._suspend)
+
+    def resume(self, transport: paramiko.Transport) -> None:
+        """Accept connections again, opening channels on a new transport.
+
+        Parameters
+        ----------
+        transport : paramiko.Transport
+            Authenticated transport replacing the lost one
+        """
+        self.call_soon(lambda: self._resume(transport))
+
+    def call_soon(self, callback: Callable[[], None]) -> None:
+        """Schedule a callback to run on the loop thread.
+
+        Parameters
+        ----------
+        callback : Callable[[], None]
+            Function to run on the next loop iteration
+        """
+        self._pending_calls.append(callback)
+        self._wake()
+
+    def _wake(self) -> None:
+        with contextlib.suppress(OSError):
+            self._wake_writer.send(b"\0")
+
+    def _register_listener(self, listener: _Listener) -> None:
+        self._listeners.append(listener)
+
+        if not self._suspended:
+            self.selector.register(listener.sock, selectors.EVENT_READ, listener)
+
+    def _unregister_listener(self, stats: PortStats) -> None:
+        for listener in [lst for lst in self._listeners if lst.stats is stats]:
+            self._listeners.remove(listener)
+
+            if not self._suspended:
+                self.selector.unregister(listener.sock)
+
+            listener.sock.close()
+
+        for conn in [conn for conn in self._connections if conn.stats is stats]:
+            self._close(conn)
+
+    def _suspend(self) -> None:
+        if self._suspended:
+            return
+
+        self._suspended = True
+
+        for listener in self._listeners:
+            self.selector.unregister(listener.sock)
+
+        for conn in list(self._connections):
+            self._close(conn)
+
+        for client in list(self._socks_clients):
+            self._drop_socks_client(client)
+
+    def _resume(self, transport: paramiko.Transport) -> None:
+        self.transport = transport
+
+        if not self._suspended:
+            return
+
+        self._suspended = False
+
+        for listener in self._listeners:
+            self.selector.register(listener.sock, selectors.EVENT_READ, listener)
+
+    def _run(self) -> None:
+        try:
+            while not self._stop_event.is_set():
+                waiting_for_window = any(conn.to_remote for conn in self._connections)
+                timeout = (
+                    PORTFORWARD_SEND_POLL_SECONDS
+                    if waiting_for_window
+                    else PORTFORWARD_IDLE_POLL_SECONDS
+                )
+
+                for key, events in self.selector.select(timeout):
+                    self._dispatch(key, events)
+
+                while self._pending_calls:
+                    self._pending_calls.popleft()()
+
+                for conn in list(self._connections):
+                    if conn.to_remote or conn.local_eof:
+                        self._flush_to_remote(conn)
+                    self._update(conn)
+        except Exception as e:
+            logger.error("Port forwarding event loop failed: %s", e)
+            self.error = e
+        finally:
+            self._close_all()
+
+    def _dispatch(self, key: selectors.SelectorKey, events: int) -> None:
+        if key.data is None:
+            try:
+                while self._wake_reader.recv(PORTFORWARD_BUFFER_SIZE):
+                    pass
+            except BlockingIOError:
+                pass
+            return
+
+        if isinstance(key.data, _Listener):
+            self._accept(key.data)
+            return
+
+        if isinstance(key.data, _SocksClient):
+            self._read_socks(key.data)
+            return
+
+        conn, side = key.data
+
+        if conn not in self._connections:
+            return
+
+        if side == "local":
+            if events & selectors.EVENT_WRITE:
+                self._flush_to_local(conn)
+            if events & selectors.EVENT_READ:
+                self._read_local(conn)
+        else:
+            self._read_remote(conn)
+
+        self._update(conn)
+
+    def _accept(self, listener: _Listener) -> None:
+        try:
+            sock, address = listener.sock.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+
+        sock.setblocking(False)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        accepted_at = time.monotonic()
+
+        with self.stats_lock:
+            listener.stats.connections += 1
+            listener.stats.active_connections += 1
+
+        if listener.stats.socks:
+            client = _SocksClient(sock=sock, stats=listener.stats, accepted_at=accepted_at)
+            self._socks_clients.add(client)
+            self.selector.register(sock, selectors.EVENT_READ, client)
+            return
+
+        future = self._executor.submit(
+            self.transport.open_channel,
+            "direct-tcpip",
+            ("localhost", listener.stats.remote_port),
+            address,
+            timeout=PORTFORWARD_CHANNEL_OPEN_TIMEOUT_SECONDS,
+        )
+        future.add_done_callback(
+            lambda done: self.call_soon(
+                lambda: self._channel_opened(sock, listener.stats, accepted_at, done)
+            )
+        )
+
+    def _channel_opened(
+        self,
+        sock: socket.socket,
+        stats: PortStats,
+        accepted_at: float,
+        future: Future,
+    ) -> None:
+        try:
+            channel = future.result()
+        except Exception as e:
+            logger.debug("Could not open channel to remote port %s: %s", stats.remote_port, e)
+            sock.close()
+
+            with self.stats_lock:
+                stats.active_connections -= 1
+                stats.failed_connections += 1
+            return
+
+        self._start_relay(sock, channel, stats, accepted_at)
+
+    def _read_socks(self, client: _SocksClient) -> None:
+        try:
+            data = client.sock.recv(PORTFORWARD_BUFFER_SIZE)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b""
+
+        if not data:
+            self._drop_socks_client(client)
+            return
+
+        client.buffer += data
+
+        try:
+            if not client.greeted:
+                greeting = parse_socks_greeting(client.buffer)
+
+                if greeting is None:
+                    return
+
+                methods, consumed = greeting
+                del client.buffer[:consumed]
+
+                if SOCKS_NO_AUTH not in methods:
+                    self._drop_socks_client(
+                        client, bytes([SOCKS_VERSION, SOCKS_NO_ACCEPTABLE_METHODS])
+                    )
+                    return
+
+                client.sock.send(bytes([SOCKS_VERSION, SOCKS_NO_AUTH]))
+                client.greeted = True
+
+            request = parse_socks_request(client.buffer)
+        except (ValueError, OSError) as e:
+            logger.debug("Invalid SOCKS handshake: %s", e)
+            self._drop_socks_client(client)
+            return
+
+        if request is None:
+            return
+
+        command, _address_type, host, port, consumed = request
+        del client.buffer[:consumed]
+
+        if command != SOCKS_CMD_CONNECT:
+            self._drop_socks_client(client, socks_reply(SOCKS_REPLY_COMMAND_NOT_SUPPORTED))
+            return
+
+        if not host:
+            self._drop_socks_client(client, socks_reply(SOCKS_REPLY_ADDRESS_TYPE_NOT_SUPPORTED))
+            return
+
+        self._socks_clients.discard(client)
+        self.selector.unregister(client.sock)
+        future = self._executor.submit(
+            self.transport.open_channel,
+            "direct-tcpip",
+            (host, port),
+            client.sock.getpeername(),
+            timeout=PORTFORWARD_CHANNEL_OPEN_TIMEOUT_SECONDS,
+        )
+        future.add_done_callback(
+            lambda done: self.call_soon(lambda: self._socks_channel_opened(client, done))
+        )
+
+    def _socks_channel_opened(self, client: _SocksClient, future: Future) -> None:
+        try:
+            channel = future.result()
+        except Exception as e:
+            logger.debug("SOCKS proxy could not open channel: %s", e)
+            self._drop_socks_client(client, socks_reply(SOCKS_REPLY_HOST_UNREACHABLE))
+            return
+
+        try:
+            client.sock.send(socks_reply(SOCKS_REPLY_SUCCEEDED))
+        except OSError:
+            channel.close()
+            self._drop_socks_client(client)
+            return
+
+        self._start_relay(
+            client.sock, channel, client.stats, client.accepted_at, bytes(client.buffer)
+        )
+
+    def _drop_socks_client(self, client: _SocksClient, reply: bytes = b"") -> None:
+        if client in self._socks_clients:
+            self._socks_clients.discard(client)
+            self.selector.unregister(client.sock)
+
+        if reply:
+            with contextlib.suppress(OSError):
+                client.sock.send(reply)
+
+        client.sock.close()
+
+        with self.stats_lock:
+            client.stats.active_connections -= 1
+            client.stats.failed_connections += 1
+
+    def _local_connected(
+        self,
+        channel: paramiko.Channel,
+        stats: PortStats,
+        accepted_at: float,
+        future: Future,
+    ) -> None:
+        try:
+            sock = future.result()
+        except OSError as e:
+            logger.debug("Could not connect to local port %s: %s", stats.local_port, e)
+            channel.close()
+
+            with self.stats_lock:
+                stats.active_connections -= 1
+                stats.failed_connections += 1
+            return
+
+        sock.setblocking(False)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._start_relay(sock, channel, stats, accepted_at)
+
+    def _start_relay(
+        self,
+        sock: socket.socket,
+        channel: paramiko.Channel,
+        stats: PortStats,
+        accepted_at: float,
+        pending: bytes = b"",
+    ) -> None:
+        if self._stop_event.is_set() or self._suspended:
+            channel.close()
+            sock.close()
+
+            with self.stats_lock:
+                stats.active_connections -= 1
+            return
+
+        channel.settimeout(0.0)
+        conn = _Connection(
+            sock=sock,
+            channel=channel,
+            stats=stats,
+            accepted_at=accepted_at,
+            to_remote=bytearray(pending),
+            first_byte_seen=stats.reverse,
+        )
+        self._connections.add(conn)
+        self._update(conn)
+
+    def _read_local(self, conn: _Connection) -> None:
+        try:
+            data = conn.sock.recv(PORTFORWARD_BUFFER_SIZE)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            self._close(conn)
+            return
+
+        if data:
+            conn.to_remote += data
+            self._flush_to_remote(conn)
+        else:
+            conn.local_eof = True
+
+    def _read_remote(self, conn: _Connection) -> None:
+        try:
+            data = conn.channel.recv(PORTFORWARD_BUFFER_SIZE)
+        except TimeoutError:
+            return
+        except OSError:
+            self._close(conn)
+            return
+
+        if not data:
+            conn.remote_eof = True
+            return
+
+        with self.stats_lock:
+            conn.stats.bytes_in += len(data)
+
+            if not conn.first_byte_seen:
+                conn.stats.first_byte_latency_ms = (time.monotonic() - conn.accepted_at) * 1000
+
+        conn.first_byte_seen = True
+        conn.to_local += data
+        self._flush_to_local(conn)
+
+    def _flush_to_remote(self, conn: _Connection) -> None:
+        try:
+            while conn.to_remote and conn.channel.send_ready():
+                sent = conn.channel.send(bytes(conn.to_remote[:PORTFORWARD_BUFFER_SIZE]))
+                del conn.to_remote[:sent]
+
+                with self.stats_lock:
+                    conn.stats.bytes_out += sent
+
+            if conn.local_eof and not conn.to_remote and not conn.write_shutdown_sent:
+                conn.channel.shutdown_write()
+                conn.write_shutdown_sent = True
+        except TimeoutError:
+            return
+        except OSError:
+            self._close(conn)
+
+    def _flush_to_local(self, conn: _Connection) -> None:
+        try:
+            sent = conn.sock.send(conn.to_local)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            self._close(conn)
+            return
+
+        del conn.to_local[:sent]
+
+    def _update(self, conn: _Connection) -> None:
+        """Close a finished connection or refresh its selector interest."""
+        if conn not in self._connections:
+            return
+
+        remote_done = conn.remote_eof and not conn.to_local
+
+        if remote_done and (conn.local_eof or conn.channel.closed):
+            self._close(conn)
+            return
+
+        if remote_done and not conn.local_shutdown_sent:
+            conn.local_shutdown_sent = True
+
+            with contextlib.suppress(OSError):
+                conn.sock.shutdown(socket.SHUT_WR)
+
+        local_events = 0
+        if not conn.local_eof and len(conn.to_remote) < PORTFORWARD_MAX_BUFFERED_BYTES:
+            local_events |= selectors.EVENT_READ
+        if conn.to_local:
+            local_events |= selectors.EVENT_WRITE
+
+        remote_events = 0
+        if not conn.remote_eof and len(conn.to_local) < PORTFORWARD_MAX_BUFFERED_BYTES:
+            remote_events |= selectors.EVENT_READ
+
+        conn.local_events = self._set_interest(
+            conn.sock, conn.local_events, local_events, (conn, "local")
+        )
+        conn.remote_events = self._set_interest(
+            conn.channel, conn.remote_events, remote_events, (conn, "remote")
+        )
+
+    def _set_interest(self, fileobj: Any, current: int, desired: int, data: Any) -> int:
+        if current == desired:
+            return current
+
+        if not current:
+            self.selector.register(fileobj, desired, data)
+        elif not desired:
+            self.selector.unregister(fileobj)
+        else:
+            self.selector.modify(fileobj, desired, data)
+
+        return desired
+
+    def _close(self, conn: _Connection) -> None:
+        if conn not in self._connections:
+            return
+
+        self._connections.discard(conn)
+
+        for fileobj, events in ((conn.sock, conn.local_events), (conn.channel, conn.remote_events)):
+            if events:
+                with contextlib.suppress(KeyError, ValueError):
+                    self.selector.unregister(fileobj)
+
+        conn.channel.close()
+        conn.sock.close()
+
+        with self.stats_lock:
+            conn.stats.active_connections -= 1
+
+    def _close_all(self) -> None:
+        for conn in list(self._connections):
+            self._close(conn)
+
+        for client in list(self._socks_clients):
+            self._drop_socks_client(client)
+
+        for listener in self._listeners:
+            with contextlib.suppress(KeyError, ValueError):
+                self.selector.unregister(listener.sock)
+            listener.sock.close()
+
+        self._listeners = []
+        self.selector.close()
+        self._wake_reader.close()
+        self._wake_writer.close()
+
+
 class PortForwardManager:
-    """Manages SSH port forwarding tunnels using sshtunnel library.
+    """Manages SSH port forwarding over one shared transport.
 
     Attributes
     ----------
-    tunnel : SSHTunnelForwarder | None
-        Single SSH tunnel forwarder instance for all ports
+    ssh_manager : SSHManager | None
+        SSH connection whose transport carries every forwarded port
     ports : list[tuple[int, int]]
-        List of (remote_port, local_port) tuples managed by the forwarder
+        List of (remote_port, local_port) tuples managed by the forwarder,
+        including ports forwarded automatically
+    reverse_ports : list[tuple[int, int]]
+        List of (remote_port, local_port) tuples forwarded from the instance
+        to the local machine
+    socks_proxy : int | None
+        Local port of the SOCKS5 proxy, or None when it is not running
+    auto_forward : dict[str, Any] | None
+        Normalized auto_forward rules, or None when discovery is disabled
+    auto_ports : dict[int, int]
+        Automatically forwarded remote ports mapped to their local ports
+    status : str
+        Forwarding status published to the status callback: inactive, active,
+        reconnecting while a lost SSH connection is being re-established, or
+        failed when the forwarding loop died and is about to be restarted
     """
 
     def __init__(self) -> None:
@@ -84,8 +1057,19 @@ class PortForwardManager:
         Initializes the port forward manager with no active tunnels.
         Tunnels are created and managed through the create_tunnels() method.
         """
-        self.tunnel: SSHTunnelForwarder | None = None
+        self.ssh_manager: SSHManager | None = None
         self.ports: list[tuple[int, int]] = []
+        self.reverse_ports: list[tuple[int, int]] = []
+        self.socks_proxy: int | None = None
+        self.auto_forward: dict[str, Any] | None = None
+        self.auto_ports: dict[int, int] = {}
+        self.status = "inactive"
+        self._stats: list[PortStats] = []
+        self._stats_lock = threading.Lock()
+        self._loop: _ForwardingLoop | None = None
+        self._monitor_thread: threading.Thread | None = None
+        self._monitor_stop = threading.Event()
+        self._status_callback: Callable[[dict[str, Any]], None] | None = None
 
     def validate_key_file(self, key_file: str) -> None:
         """Validate SSH key file exists and is accessible.
@@ -120,8 +1104,12 @@ class PortForwardManager:
         key_file: str,
         username: str = DEFAULT_SSH_USERNAME,
         ssh_port: int = DEFAULT_SSH_PORT,
+        status_callback: Callable[[dict[str, Any]], None] | None = None,
+        auto_forward: dict[str, Any] | None = None,
+        reverse_ports: list[tuple[int, int]] | None = None,
+        socks_proxy: int | None = None,
     ) -> None:
-        """Create SSH tunnels for multiple ports using single SSHTunnelForwarder.
+        """Forward local ports to remote ports over a single SSH transport.
 
         Parameters
         ----------
@@ -136,6 +1124,20 @@ class PortForwardManager:
             SSH username (default: ubuntu)
         ssh_port : int
             SSH port on remote host (default: 22)
+        status_callback : Callable[[dict[str, Any]], None] | None
+            Called from a background thread with a payload holding 'status',
+            'stats' (the result of get_stats()) and, when a forward is opened
+            or closed automatically, a 'notification' message
+        auto_forward : dict[str, Any] | None
+            Rules from normalize_auto_forward_config(). When set, remote ports
+            that start listening are forwarded automatically.
+        reverse_ports : list[tuple[int, int]] | None
+            List of (remote_port, local_port) tuples to forward in the other
+            direction: connections to the remote port on the instance's
+            loopback interface reach the local port on the local machine.
+        socks_proxy : int | None
+            Local port for a SOCKS5 proxy whose connections are opened from the
+            instance, reaching any host the instance can reach
 
         Raises
         ------
@@ -150,9 +1152,17 @@ class PortForwardManager:
         created in mock mode for testing purposes. No actual SSH connections are
         established; instead, tunnel creation is simulated for test harness integration.
         """
-        if not ports:
+        reverse_ports = reverse_ports or []
+
+        if not ports and not auto_forward and not reverse_ports and not socks_proxy:
             return
 
+        local_ports = [local_port for _remote_port, local_port in ports]
+
+        if socks_proxy:
+            validate_port(socks_proxy)
+            local_ports.append(socks_proxy)
+
         for remote_port, local_port in ports:
             validate_port(remote_port)
             validate_port(local_port)
@@ -165,7 +1175,19 @@ class PortForwardManager:
                     PRIVILEGED_PORT_THRESHOLD,
                 )
 
-        for _remote_port, local_port in ports:
+        for remote_port, local_port in reverse_ports:
+            validate_port(remote_port)
+            validate_port(local_port)
+
+            if remote_port < PRIVILEGED_PORT_THRESHOLD:
+                logger.warning(
+                    "Remote port %s is a privileged port (< %s). "
+                    "The SSH server may refuse to listen on it for a non-root user.",
+                    remote_port,
+                    PRIVILEGED_PORT_THRESHOLD,
+                )
+
+        for local_port in local_ports:
             if is_port_in_use(local_port):
                 raise PortInUseError(local_port)
 
@@ -180,31 +1202,52 @@ class PortForwardManager:
                     remote_port,
                 )
 
-            self.ports = ports
+            for remote_port, local_port in reverse_ports:
+                logger.info(
+                    "Reverse SSH tunnel established: remote:%s -> localhost:%s",
+                    remote_port,
+                    local_port,
+                )
+
+            if socks_proxy:
+                logger.info("SOCKS5 proxy listening on localhost:%s", socks_proxy)
+
+            self.ports = list(ports)
+            self.reverse_ports = list(reverse_ports)
+            self.socks_proxy = socks_proxy
+            self._stats = [PortStats(remote_port, local_port) for remote_port, local_port in ports]
+            self._stats += [
+                PortStats(remote_port, local_port, reverse=True)
+                for remote_port, local_port in reverse_ports
+            ]
+
+            if socks_proxy:
+                self._stats.append(PortStats(0, socks_proxy, socks=True))
             return
 
         self.validate_key_file(key_file)
 
-        remote_binds = [("localhost", remote_port) for remote_port, _local_port in ports]
-        local_binds = [("localhost", local_port) for _remote_port, local_port in ports]
-
         try:
             for remote_port, _local_port in ports:
                 logger.info("Creating SSH tunnel for port %s...", remote_port)
 
-            tunnel = SSHTunnelForwarder(
-                ssh_address_or_host=(host, ssh_port),
-                ssh_username=username,
-                ssh_pkey=key_file,
-                remote_bind_addresses=remote_binds,
-                local_bind_addresses=local_binds,
-            )
-            tunnel.skip_tunnel_checkup = True
+            ssh_manager = SSHManager(host=host, key_file=key_file, username=username, port=ssh_port)
+            self.ssh_manager = ssh_manager
+            ssh_manager.connect(max_retries=PORTFORWARD_CONNECT_RETRIES)
+            transport = ssh_manager.client.get_transport()
+
+            if transport is None or not transport.is_active():
+                raise paramiko.SSHException("SSH transport is not active")
 
-            tunnel.start()
+            transport.set_keepalive(PORTFORWARD_KEEPALIVE_INTERVAL_SECONDS)
+            self._loop = _ForwardingLoop(transport, self._stats_lock)
+            self.ports = list(ports)
+            self._stats = [PortStats(remote_port, local_port) for remote_port, local_port in ports]
 
-            self.tunnel = tunnel
-            self.ports = ports
+            for stats in self._stats:
+                self._loop.add_forward(stats)
+
+            self._loop.start()
 
             for remote_port, local_port in ports:
                 logger.info(
@@ -213,24 +1256,404 @@ class PortForwardManager:
                     remote_port,
                 )
 
-        except (
-            BaseSSHTunnelForwarderError,
-            paramiko.SSHException,
-            OSError,
-        ) as e:
+            self.reverse_ports = list(reverse_ports)
+            self._stats += [
+                PortStats(remote_port, local_port, reverse=True)
+                for remote_port, local_port in reverse_ports
+            ]
+            self._request_reverse_forwards(transport)
+
+            for remote_port, local_port in reverse_ports:
+                logger.info(
+                    "Reverse SSH tunnel established: remote:%s -> localhost:%s",
+                    remote_port,
+                    local_port,
+                )
+
+            if socks_proxy:
+                socks_stats = PortStats(0, socks_proxy, socks=True)
+                self._loop.add_forward(socks_stats)
+                self._stats.append(socks_stats)
+                self.socks_proxy = socks_proxy
+                logger.info("SOCKS5 proxy listening on localhost:%s", socks_proxy)
+
+        except (ConnectionError, paramiko.SSHException, OSError) as e:
             self.stop_all_tunnels()
             raise RuntimeError(f"Failed to create SSH tunnels: {e}") from e
 
-    def stop_all_tunnels(self) -> None:
-        """Stop the SSH tunnel forwarder."""
-        if self.tunnel:
-            for remote_port, _local_port in self.ports:
-                logger.info("Stopping SSH tunnel for port %s...", remote_port)
+        if auto_forward:
+            logger.info("Forwarding remote ports automatically as services start listening")
+
+        self.status = "active"
+        self.auto_forward = auto_forward
+        self._status_callback = status_callback
+        self._monitor_stop.clear()
+        self._monitor_thread = threading.Thread(
+            target=self._monitor, name="campers-portforward-monitor", daemon=True
+        )
+        self._monitor_thread.start()
+
+    def get_stats(self) -> list[dict[str, Any]]:
+        """Return a snapshot of the counters of every forwarded port.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            One dictionary per forwarded port with the PortStats fields
+        """
+        with self._stats_lock:
+            return [asdict(stats) for stats in self._stats]
+
+    def probe_ports(self) -> None:
+        """Actively check that a service listens behind each forwarded port.
+
+        Opens a channel to every remote port and closes it right away; for
+        reverse forwards, connects to the local port instead. The result is
+        stored in the health field of the port statistics, and transitions are
+        logged.
+        """
+        transport = self._get_transport()
+
+        for stats in list(self._stats):
+            health = HEALTH_DOWN
+
+            if stats.reverse:
+                health = HEALTH_UP if is_port_in_use(stats.local_port) else HEALTH_DOWN
+            elif stats.socks:
+                health = HEALTH_UP if transport is not None else HEALTH_DOWN
+            elif transport is not None:
+                try:
+                    channel = transport.open_channel(
+                        "direct-tcpip",
+                        ("localhost", stats.remote_port),
+                        ("127.0.0.1", 0),
+                        timeout=PORTFORWARD_CHANNEL_OPEN_TIMEOUT_SECONDS,
+                    )
+                    channel.close()
+                    health = HEALTH_UP
+                except (paramiko.SSHException, OSError, EOFError):
+                    health = HEALTH_DOWN
+
+            with self._stats_lock:
+                previous = stats.health
+                stats.health = health
+
+            if previous == health or (previous == HEALTH_UNKNOWN and health == HEALTH_DOWN):
+                continue
+
+            if stats.reverse:
+                logger.info("Local port %s is %s", stats.local_port, health)
+            elif not stats.socks:
+                logger.info("Remote port %s is %s", stats.remote_port, health)
+
+    def check_liveness(self) -> bool:
+        """Check that the SSH server still answers on the forwarding transport.
+
+        Opens and closes a session channel. A refusal still proves the server
+        is reachable; only a closed transport or a timeout counts as dead.
+
+        Returns
+        -------
+        bool
+            True if the transport is alive
+        """
+        transport = self._get_transport()
+
+        if transport is None:
+            return False
+
+        try:
+            transport.open_channel("session", timeout=PORTFORWARD_LIVENESS_TIMEOUT_SECONDS).close()
+        except paramiko.ChannelException:
+            return True
+        except (paramiko.SSHException, OSError, EOFError):
+            return False
+
+        return True
+
+    def reconnect(self) -> bool:
+        """Re-establish the SSH connection and keep forwarding on the same local ports.
+
+        Local listeners stay bound while reconnecting, so clients keep using
+        the same ports. If the forwarding loop itself failed, its listeners are
+        gone and a new loop binds the same local ports again once connected.
+        Attempts back off following SSH_RETRY_DELAYS until the connection
+        succeeds or the tunnels are stopped.
+
+        Returns
+        -------
+        bool
+            True if forwarding resumed, False if the tunnels were stopped first
+        """
+        ssh_manager, loop = self.ssh_manager, self._loop
+        self.status = "reconnecting"
+        logger.warning("SSH connection for port forwarding lost, reconnecting...")
+        self._publish(notification="Port forwarding connection lost, reconnecting")
+
+        if loop.error is None:
+            loop.suspend()
+
+        with contextlib.suppress(paramiko.SSHException, OSError, EOFError):
+            ssh_manager.close()
+
+        attempt = 0
+
+        while not self._monitor_stop.is_set():
+            try:
+                ssh_manager.connect(max_retries=1)
+                transport = ssh_manager.client.get_transport()
+
+                if transport is None or not transport.is_active():
+                    raise paramiko.SSHException("SSH transport is not active")
+            except (ConnectionError, paramiko.SSHException, OSError, EOFError) as e:
+                delay = SSH_RETRY_DELAYS[min(attempt, len(SSH_RETRY_DELAYS) - 1)]
+                attempt += 1
+                logger.debug("Port forwarding reconnect attempt %s failed: %s", attempt, e)
+                self._monitor_stop.wait(delay)
+                continue
+
+            if self._monitor_stop.is_set():
+                ssh_manager.close()
+                break
+
+            transport.set_keepalive(PORTFORWARD_KEEPALIVE_INTERVAL_SECONDS)
+
+            if loop.error is None:
+                loop.resume(transport)
+            else:
+                self._restart_loop(transport)
+
+            try:
+                self._request_reverse_forwards(transport)
+            except paramiko.SSHException as e:
+                logger.warning("Could not restore reverse port forwarding: %s", e)
+
+            self.status = "active"
+            logger.info("Port forwarding reconnected")
+            self._publish(notification="Port forwarding reconnected")
+            return True
+
+        return False
+
+    def list_remote_listening_ports(self) -> set[int] | None:
+        """Read the TCP ports listening on the instance's loopback interface.
+
+        Returns
+        -------
+        set[int] | None
+            Listening ports, or None if the socket tables could not be read
+        """
+        if self._get_transport() is None:
+            return None
+
+        try:
+            _stdin, stdout, _stderr = self.ssh_manager.client.exec_command(
+                LISTENING_PORTS_COMMAND, timeout=AUTO_FORWARD_COMMAND_TIMEOUT_SECONDS
+            )
+            output = stdout.read().decode("utf-8", errors="replace")
+        except (paramiko.SSHException, OSError, EOFError) as e:
+            logger.debug("Could not read remote listening ports: %s", e)
+            return None
+
+        return parse_listening_ports(output)
+
+    def discover_ports(self) -> None:
+        """Open forwards for new remote listeners and close forwards for gone ones."""
+        if not self.auto_forward:
+            return
+
+        listening = self.list_remote_listening_ports()
+
+        if listening is None:
+            return
+
+        with self._stats_lock:
+            forwarded = {remote_port for remote_port, _local_port in self.ports}
+            forwarded.update(remote_port for remote_port, _local_port in self.reverse_ports)
+
+        for remote_port in sorted(listening - forwarded):
+            if is_auto_forward_allowed(remote_port, self.auto_forward):
+                self._open_auto_forward(remote_port)
+
+        for remote_port in sorted(set(self.auto_ports) - listening):
+            self._close_auto_forward(remote_port)
+
+    def _open_auto_forward(self, remote_port: int) -> None:
+        stats = PortStats(remote_port, remote_port, health=HEALTH_UP, auto=True)
+
+        try:
+            self._loop.add_forward(stats)
+        except OSError:
+            stats.local_port = 0
+
+            try:
+                self._loop.add_forward(stats)
+            except OSError as e:
+                logger.warning("Could not forward remote port %s: %s", remote_port, e)
+                return
+
+        with self._stats_lock:
+            self._stats.append(stats)
+            self.ports.append((remote_port, stats.local_port))
+            self.auto_ports[remote_port] = stats.local_port
+
+        message = f"Forwarding remote port {remote_port} to localhost:{stats.local_port}"
+        logger.info(message)
+        self._publish(notification=message)
+
+    def _close_auto_forward(self, remote_port: int) -> None:
+        with self._stats_lock:
+            local_port = self.auto_ports.pop(remote_port)
+            stats = next(s for s in self._stats if s.auto and s.remote_port == remote_port)
+            self._stats.remove(stats)
+            self.ports.remove((remote_port, local_port))
+
+        self._loop.remove_forward(stats)
+        message = f"Remote port {remote_port} closed, stopped forwarding localhost:{local_port}"
+        logger.info(message)
+        self._publish(notification=message)
+
+    def _restart_loop(self, transport: paramiko.Transport) -> None:
+        self._loop.stop()
+        loop = _ForwardingLoop(transport, self._stats_lock)
+
+        for stats in list(self._stats):
+            if stats.reverse:
+                continue
 
             try:
-                self.tunnel.stop()
-            except (BaseSSHTunnelForwarderError, OSError) as e:
-                logger.warning("Error stopping tunnels: %s", e)
+                loop.add_forward(stats)
+            except OSError as e:
+                logger.warning("Could not restore forwarding on port %s: %s", stats.local_port, e)
+
+        loop.start()
+        self._loop = loop
+
+    def _request_reverse_forwards(self, transport: paramiko.Transport) -> None:
+        for stats in self._stats:
+            if stats.reverse:
+                transport.request_port_forward(
+                    "localhost", stats.remote_port, handler=self._handle_reverse_channel
+                )
+
+    def _handle_reverse_channel(
+        self,
+        channel: paramiko.Channel,
+        origin: tuple[str, int],
+        server: tuple[str, int],
+    ) -> None:
+        loop = self._loop
+
+        with self._stats_lock:
+            stats = next(
+                (s for s in self._stats if s.reverse and s.remote_port == server[1]),
+                None,
+            )
+
+        if loop is None or stats is None:
+            channel.close()
+            return
+
+        loop.add_reverse_connection(channel, stats)
+
+    def _publish(self, notification: str | None = None) -> None:
+        if self._status_callback is None:
+            return
+
+        payload: dict[str, Any] = {"status": self.status, "stats": self.get_stats()}
+
+        if notification:
+            payload["notification"] = notification
+
+        try:
+            self._status_callback(payload)
+        except Exception as e:
+            logger.debug("Port forwarding status callback failed: %s", e)
+
+    def _get_transport(self) -> paramiko.Transport | None:
+        if self.ssh_manager is None or self.ssh_manager.client is None:
+            return None
+
+        transport = self.ssh_manager.client.get_transport()
+
+        if transport is None or not transport.is_active():
+            return None
+
+        return transport
+
+    def _monitor(self) -> None:
+        last_probe: float | None = None
+        last_discovery: float | None = None
+
+        while not self._monitor_stop.is_set():
+            now = time.monotonic()
+            probe_due = (
+                last_probe is None or now - last_probe >= PORTFORWARD_HEALTH_PROBE_INTERVAL_SECONDS
+            )
+
+            loop_error = self._loop.error if self._loop is not None else None
+
+            if loop_error is not None:
+                self.status = "failed"
+                self._publish(notification=f"Port forwarding failed: {loop_error}")
+
+            if (
+                loop_error is not None
+                or self._get_transport() is None
+                or (probe_due and not self.check_liveness())
+            ):
+                if not self.reconnect():
+                    return
+
+                continue
+
+            if self.auto_forward and (
+                last_discovery is None or now - last_discovery >= AUTO_FORWARD_POLL_INTERVAL_SECONDS
+            ):
+                self.discover_ports()
+                last_discovery = now
+
+            if probe_due:
+                self.probe_ports()
+                last_probe = now
+
+            self._publish()
+            self._monitor_stop.wait(PORTFORWARD_STATS_INTERVAL_SECONDS)
+
+    def stop_all_tunnels(self) -> None:
+        """Stop forwarding and close the shared SSH transport."""
+        if self._loop is None and self.ssh_manager is None:
+            return
+
+        for remote_port, _local_port in self.ports:
+            logger.info("Stopping SSH tunnel for port %s...", remote_port)
+
+        for remote_port, _local_port in self.reverse_ports:
+            logger.info("Stopping reverse SSH tunnel for port %s...", remote_port)
+
+        if self.socks_proxy:
+            logger.info("Stopping SOCKS5 proxy on port %s...", self.socks_proxy)
+
+        self._monitor_stop.set()
+
+        if self._monitor_thread is not None:
+            self._monitor_thread.join(timeout=PORTFORWARD_CHANNEL_OPEN_TIMEOUT_SECONDS)
+            self._monitor_thread = None
+
+        try:
+            if self._loop is not None:
+                self._loop.stop()
+
+            if self.ssh_manager is not None:
+                self.ssh_manager.close()
+        except (paramiko.SSHException, OSError) as e:
+            logger.warning("Error stopping tunnels: %s", e)
 
-            self.tunnel = None
-            self.ports = []
+        self._loop = None
+        self.ssh_manager = None
+        self.ports = []
+        self.reverse_ports = []
+        self.socks_proxy = None
+        self.auto_ports = {}
+        self.status = "inactive"
+        self._stats = []
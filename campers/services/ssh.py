@@ -2,6 +2,7 @@
 
 import contextlib
 import inspect
+import json
 import logging
 import os
 import re
@@ -12,7 +13,9 @@ import sys
 import termios
 import time
 import tty
+from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Any
 
 import paramiko
 from paramiko.channel import Channel, ChannelFile
@@ -26,6 +29,7 @@ from campers.constants import (
     SENSITIVE_PATTERNS,
     SSH_RETRY_DELAYS,
 )
+from campers.core.tracing import traced
 from campers.providers import get_provider
 
 logger = logging.getLogger(__name__)
@@ -275,6 +279,7 @@ class SSHManager:
         self.client: paramiko.SSHClient | None = None
         self._active_channel: Channel | None = None
 
+    @traced("ssh.connect", "ssh")
     def connect(self, max_retries: int = 10) -> None:
         """Establish SSH connection with retry logic.
 
@@ -543,6 +548,65 @@ class SSHManager:
         self.validate_command_length(command)
         return self._execute_with_streaming(command)
 
+    def execute_with_input(
+        self,
+        command: str,
+        input_data: str,
+        line_callback: Callable[[str], None] | None = None,
+    ) -> tuple[int, str]:
+        """Execute command with data on stdin and capture its stdout.
+
+        Runs without a PTY so stdin can be closed to signal end of input and
+        stdout stays free of terminal control sequences. The command length is
+        not validated, which lets internal helpers ship small scripts inline.
+
+        Parameters
+        ----------
+        command : str
+            Raw command to execute
+        input_data : str
+            Data written to the command's stdin before it is closed
+        line_callback : Callable[[str], None] | None
+            Called with each stdout line as it arrives (default: log it)
+
+        Returns
+        -------
+        tuple[int, str]
+            Command exit code and the complete stdout
+
+        Raises
+        ------
+        RuntimeError
+            If SSH connection is not established
+        """
+        if not self.client:
+            raise RuntimeError("SSH connection not established")
+
+        if line_callback is None:
+            line_callback = logging.info
+
+        stdin, stdout, stderr = self.client.exec_command(command)
+        lines = []
+
+        try:
+            stdin.write(input_data)
+            stdin.flush()
+            stdin.channel.shutdown_write()
+
+            for line in iter(stdout.readline, ""):
+                line = line.rstrip("\n")
+                lines.append(line)
+                line_callback(line)
+
+            for err_line in stderr.readlines():
+                logging.warning(err_line.rstrip("\n"))
+
+            return stdout.channel.recv_exit_status(), "\n".join(lines)
+        finally:
+            stdin.close()
+            stdout.close()
+            stderr.close()
+
     def filter_environment_variables(
         self,
         env_filter: list[str] | None,
@@ -722,3 +786,68 @@ class SSHManager:
 
         session = InteractiveSession(channel)
         return session.run()
+
+
+def read_remote_json(ssh_manager: SSHManager, path: str, warning: str) -> dict[str, Any]:
+    """Read a JSON object kept in a file on the instance.
+
+    Parameters
+    ----------
+    ssh_manager : SSHManager
+        Connected SSH manager
+    path : str
+        Remote file path, may start with ~
+    warning : str
+        Message logged with the error when the file cannot be read
+
+    Returns
+    -------
+    dict[str, Any]
+        The stored object, empty if the file is missing or unreadable
+    """
+    try:
+        _exit_code, output = ssh_manager.execute_with_input(
+            f"cat {path} 2>/dev/null || true",
+            "",
+            line_callback=lambda _line: None,
+        )
+        data = json.loads(output) if output.strip() else {}
+    except (RuntimeError, OSError, paramiko.SSHException, ValueError) as e:
+        logger.warning("%s: %s", warning, e)
+        return {}
+
+    return data if isinstance(data, dict) else {}
+
+
+def write_remote_json(
+    ssh_manager: SSHManager, path: str, data: dict[str, Any], warning: str
+) -> None:
+    """Replace a file on the instance with a JSON object, creating its directory.
+
+    Failures are logged rather than raised, since callers only lose a cache.
+
+    Parameters
+    ----------
+    ssh_manager : SSHManager
+        Connected SSH manager
+    path : str
+        Remote file path, may start with ~
+    data : dict[str, Any]
+        Object to store
+    warning : str
+        Message logged with the error when the file cannot be written
+    """
+    directory = path.rsplit("/", 1)[0]
+
+    try:
+        exit_code, _output = ssh_manager.execute_with_input(
+            f"mkdir -p {directory} && cat > {path}",
+            json.dumps(data),
+            line_callback=lambda _line: None,
+        )
+    except (RuntimeError, OSError, paramiko.SSHException) as e:
+        logger.warning("%s: %s", warning, e)
+        return
+
+    if exit_code != 0:
+        logger.warning("%s: exit code %s", warning, exit_code)
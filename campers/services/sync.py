@@ -2,6 +2,8 @@
 
 import contextlib
 import fcntl
+import hashlib
+import json
 import logging
 import os
 import re
@@ -10,19 +12,72 @@ import subprocess
 import tempfile
 import time
 from pathlib import Path
+from typing import Any
 
 from campers.constants import (
+    MUTAGEN_CONTROL_TIMEOUT_SECONDS,
+    MUTAGEN_ENDPOINTS_LABEL,
+    MUTAGEN_HOST_LABEL,
     SSH_CONFIG_CONNECT_TIMEOUT,
     SSH_CONFIG_SERVER_ALIVE_COUNT,
     SSH_CONFIG_SERVER_ALIVE_INTERVAL,
+    SSH_HOST_ALIAS_PREFIX,
+    SYNC_FLUSH_TIMEOUT_SECONDS,
     SYNC_STATUS_CHECK_TIMEOUT_SECONDS,
     SYNC_STATUS_POLL_INTERVAL_SECONDS,
 )
+from campers.core.tracing import traced
 from campers.services.validation import validate_port
 
 logger = logging.getLogger(__name__)
 
 
+def build_host_alias(unique_id: str) -> str:
+    """Build the stable SSH host alias for an instance.
+
+    Parameters
+    ----------
+    unique_id : str
+        Unique identifier assigned to the instance at launch
+
+    Returns
+    -------
+    str
+        Host alias in the form ``campers-<unique_id>``
+    """
+    return f"{SSH_HOST_ALIAS_PREFIX}-{unique_id}"
+
+
+def build_session_fingerprint(**endpoints: Any) -> str:
+    """Build the fingerprint a sync session is labelled with.
+
+    Parameters
+    ----------
+    **endpoints : Any
+        JSON-serializable description of the session: its paths, SSH user
+        and port, and any option that shapes the replica
+
+    Returns
+    -------
+    str
+        Short hex digest, valid as a Mutagen label value
+    """
+    payload = json.dumps(endpoints, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def get_campers_ssh_config_path() -> Path:
+    """Return the path of the campers-managed SSH config file.
+
+    Returns
+    -------
+    Path
+        Path to ``$CAMPERS_DIR/ssh/config``
+    """
+    campers_dir = Path(os.environ.get("CAMPERS_DIR", str(Path.home() / ".campers")))
+    return campers_dir / "ssh" / "config"
+
+
 class MutagenManager:
     """Manages Mutagen bidirectional file synchronization.
 
@@ -38,10 +93,24 @@ class MutagenManager:
         Remove any existing session from crashed previous run
     create_sync_session(...)
         Create new Mutagen sync session with specified configuration
+    create_pull_session(...)
+        Create one-way session replicating a remote path locally
+    session_exists(session_name: str)
+        Check whether a sync session is known to the Mutagen daemon
+    update_host_address(host_alias: str, host: str)
+        Point an existing SSH host alias at a new address
+    pause_session(session_name: str)
+        Pause a sync session while keeping its cached state
+    resume_session(session_name: str)
+        Resume a previously paused sync session
     wait_for_initial_sync(session_name: str, timeout: int = 300)
         Wait for initial sync to complete (reach "watching" state)
+    flush_session(session_name: str, timeout: float = 60)
+        Force a full synchronization cycle and wait for it to finish
     terminate_session(session_name: str)
         Terminate and remove sync session
+    terminate_host_sessions(host_alias: str)
+        Terminate every sync session labelled with a host alias
     """
 
     def _update_ssh_config_atomic(self, config_path: Path, include_line: str) -> None:
@@ -175,6 +244,59 @@ class MutagenManager:
         with contextlib.suppress(OSError):
             lock_path.unlink()
 
+    def _set_host_address(self, config_path: Path, host: str, address: str) -> bool:
+        """Atomically rewrite the HostName of a host entry with file locking.
+
+        Parameters
+        ----------
+        config_path : Path
+            Path to SSH config file to update
+        host : str
+            Host alias whose entry should be updated
+        address : str
+            New address written to the HostName line
+
+        Returns
+        -------
+        bool
+            True if the host entry exists, False otherwise
+        """
+        if not config_path.exists():
+            return False
+
+        lock_path = config_path.with_suffix(".lock")
+        found = False
+
+        with open(lock_path, "w") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                content = config_path.read_text()
+                block_pattern = rf"\nHost {re.escape(host)}\n(    [^\n]+\n)*"
+                match = re.search(block_pattern, content)
+
+                if match:
+                    found = True
+                    block = match.group(0)
+                    updated_block = re.sub(
+                        r"(?m)^    HostName [^\n]+$",
+                        lambda _: f"    HostName {address}",
+                        block,
+                    )
+
+                    if updated_block != block:
+                        config_path.write_text(
+                            content[: match.start()] + updated_block + content[match.end() :]
+                        )
+                        logger.debug("Updated HostName of %s to %s", host, address)
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+        with contextlib.suppress(OSError):
+            lock_path.unlink()
+
+        return found
+
+    @traced("mutagen.check_mutagen_installed", "mutagen")
     def check_mutagen_installed(self) -> None:
         """Check if mutagen is installed locally.
 
@@ -223,6 +345,7 @@ class MutagenManager:
                 "Visit: https://github.com/mutagen-io/mutagen"
             ) from e
 
+    @traced("mutagen.cleanup_orphaned_session", "mutagen")
     def cleanup_orphaned_session(self, session_name: str) -> None:
         """Clean up orphaned session if it exists from previous crashed run.
 
@@ -247,6 +370,7 @@ class MutagenManager:
         except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError) as e:
             logger.warning("Failed to cleanup orphaned session %s: %s", session_name, e)
 
+    @traced("mutagen.create_sync_session", "mutagen")
     def create_sync_session(
         self,
         session_name: str,
@@ -259,6 +383,8 @@ class MutagenManager:
         include_vcs: bool = False,
         ssh_wrapper_dir: str | None = None,
         ssh_port: int = 22,
+        host_alias: str | None = None,
+        fingerprint: str | None = None,
     ) -> None:
         """Create Mutagen sync session.
 
@@ -284,28 +410,31 @@ class MutagenManager:
             Directory to create SSH wrapper script in
         ssh_port : int
             SSH port for remote host (default: 22)
+        host_alias : str | None
+            Stable SSH host alias (e.g., campers-abc123). When provided the
+            session URL targets the alias and only its HostName tracks host,
+            so the session survives instance restarts with a new IP.
+        fingerprint : str | None
+            Fingerprint from build_session_fingerprint to label the session with
 
         Raises
         ------
         RuntimeError
             If session creation fails
+
+        Notes
+        -----
+        If an entry for host_alias already exists in the campers SSH config,
+        only its HostName line is rewritten.
         """
-        cmd = [
-            "mutagen",
-            "sync",
-            "create",
-            "--name",
-            session_name,
-            "--sync-mode",
-            "two-way-resolved",
-        ]
+        options = ["--sync-mode", "two-way-resolved"]
 
         if ignore_patterns:
             for pattern in ignore_patterns:
-                cmd.extend(["--ignore", pattern])
+                options.extend(["--ignore", pattern])
 
         if not include_vcs:
-            cmd.extend(
+            options.extend(
                 [
                     "--ignore",
                     ".git",
@@ -316,17 +445,185 @@ class MutagenManager:
                 ]
             )
 
+        self._create_session(
+            session_name=session_name,
+            options=options,
+            local_path=local_path,
+            remote_path=remote_path,
+            host=host,
+            key_file=key_file,
+            username=username,
+            ssh_wrapper_dir=ssh_wrapper_dir,
+            ssh_port=ssh_port,
+            host_alias=host_alias,
+            fingerprint=fingerprint,
+        )
+
+    @traced("mutagen.create_pull_session", "mutagen")
+    def create_pull_session(
+        self,
+        session_name: str,
+        remote_path: str,
+        local_path: str,
+        host: str,
+        key_file: str,
+        username: str,
+        ignore_patterns: list[str] | None = None,
+        max_file_size: str | int | None = None,
+        scan_interval: int | None = None,
+        ssh_wrapper_dir: str | None = None,
+        ssh_port: int = 22,
+        host_alias: str | None = None,
+        fingerprint: str | None = None,
+    ) -> None:
+        """Create one-way Mutagen session replicating a remote path locally.
+
+        The remote endpoint is the source of truth, so remote outputs such as
+        checkpoints or logs are mirrored locally without taking part in the
+        two-way conflict resolution of the code sync sessions.
+
+        Parameters
+        ----------
+        session_name : str
+            Unique name for sync session (e.g., campers-abc123-pull-0)
+        remote_path : str
+            Remote directory path on EC2 instance to pull from
+        local_path : str
+            Local directory path receiving the replica
+        host : str
+            Remote host IP address
+        key_file : str
+            Path to SSH private key file
+        username : str
+            SSH username (e.g., ubuntu)
+        ignore_patterns : list[str] | None
+            File patterns to exclude from the pull
+        max_file_size : str | int | None
+            Largest file to transfer (e.g., "500MB"); larger files are skipped
+        scan_interval : int | None
+            Seconds between remote polling scans; when set, filesystem watching
+            on the remote is replaced by low-frequency polling
+        ssh_wrapper_dir : str | None
+            Directory to create SSH key copy in
+        ssh_port : int
+            SSH port for remote host (default: 22)
+        host_alias : str | None
+            Stable SSH host alias (e.g., campers-abc123)
+        fingerprint : str | None
+            Fingerprint from build_session_fingerprint to label the session with
+
+        Raises
+        ------
+        RuntimeError
+            If session creation fails
+        """
+        options = ["--sync-mode", "one-way-replica"]
+
+        if ignore_patterns:
+            for pattern in ignore_patterns:
+                options.extend(["--ignore", pattern])
+
+        if max_file_size is not None:
+            options.append(f"--max-staging-file-size={max_file_size}")
+
+        if scan_interval is not None:
+            options.extend(
+                [
+                    "--watch-mode-alpha=force-poll",
+                    f"--watch-polling-interval-alpha={scan_interval}",
+                ]
+            )
+
+        self._create_session(
+            session_name=session_name,
+            options=options,
+            local_path=local_path,
+            remote_path=remote_path,
+            host=host,
+            key_file=key_file,
+            username=username,
+            ssh_wrapper_dir=ssh_wrapper_dir,
+            ssh_port=ssh_port,
+            host_alias=host_alias,
+            fingerprint=fingerprint,
+            remote_is_alpha=True,
+        )
+
+    def _create_session(
+        self,
+        session_name: str,
+        options: list[str],
+        local_path: str,
+        remote_path: str,
+        host: str,
+        key_file: str,
+        username: str,
+        ssh_wrapper_dir: str | None,
+        ssh_port: int,
+        host_alias: str | None,
+        fingerprint: str | None = None,
+        remote_is_alpha: bool = False,
+    ) -> None:
+        """Write SSH access for a session and run mutagen sync create.
+
+        Parameters
+        ----------
+        session_name : str
+            Unique name for sync session
+        options : list[str]
+            Mode-specific mutagen sync create options
+        local_path : str
+            Local directory path
+        remote_path : str
+            Remote directory path
+        host : str
+            Remote host IP address
+        key_file : str
+            Path to SSH private key file
+        username : str
+            SSH username
+        ssh_wrapper_dir : str | None
+            Directory to create SSH key copy in
+        ssh_port : int
+            SSH port for remote host
+        host_alias : str | None
+            Stable SSH host alias
+        fingerprint : str | None
+            Fingerprint of the session endpoints
+        remote_is_alpha : bool
+            Use the remote endpoint as alpha (source) instead of beta
+
+        Raises
+        ------
+        RuntimeError
+            If session creation fails
+        """
+        cmd = ["mutagen", "sync", "create", "--name", session_name, *options]
+
         if not re.match(r"^[a-zA-Z0-9._-]+$", username):
             raise ValueError(f"Invalid SSH username: {username}")
 
         if not re.match(r"^[\w.-]+$", host):
             raise ValueError(f"Invalid host: {host}")
 
+        ssh_host = host_alias or host
+
+        if not re.match(r"^[\w.-]+$", ssh_host):
+            raise ValueError(f"Invalid host alias: {ssh_host}")
+
+        if host_alias:
+            cmd.extend(["--label", f"{MUTAGEN_HOST_LABEL}={host_alias}"])
+
+        if fingerprint:
+            cmd.extend(["--label", f"{MUTAGEN_ENDPOINTS_LABEL}={fingerprint}"])
+
         local = str(Path(local_path).expanduser().resolve())
-        remote = f"{username}@{host}:{remote_path}"
+        remote = f"{username}@{ssh_host}:{remote_path}"
 
-        cmd.append(local)
-        cmd.append(remote)
+        if remote_is_alpha:
+            cmd.extend([remote, local])
+        else:
+            cmd.extend([local, remote])
 
         key_path = str(Path(key_file).expanduser().resolve())
 
@@ -364,7 +661,7 @@ class MutagenManager:
             f.write(key_content)
 
         host_config = f"""
-Host {host}
+Host {ssh_host}
     HostName {host}
     Port {ssh_port}
     User {username}
@@ -379,8 +676,7 @@ Host {host}
         user_ssh_config = Path.home() / ".ssh" / "config"
         user_ssh_config.parent.mkdir(parents=True, exist_ok=True)
 
-        campers_dir = Path(os.environ.get("CAMPERS_DIR", str(Path.home() / ".campers")))
-        campers_ssh_config = campers_dir / "ssh" / "config"
+        campers_ssh_config = get_campers_ssh_config_path()
         campers_ssh_config.parent.mkdir(parents=True, exist_ok=True)
 
         master_include_line = f"Include {campers_ssh_config}"
@@ -388,12 +684,14 @@ Host {host}
         try:
             try:
                 self._update_ssh_config_atomic(user_ssh_config, master_include_line)
-                self._add_host_to_ssh_config(campers_ssh_config, host, host_config)
+                self._add_host_to_ssh_config(campers_ssh_config, ssh_host, host_config)
+                if host_alias:
+                    self._set_host_address(campers_ssh_config, host_alias, host)
             except (PermissionError, OSError) as e:
                 logger.error("Failed to update SSH config: %s", e)
                 raise RuntimeError(f"Failed to update SSH config at {user_ssh_config}: {e}") from e
 
-            logger.debug("SSH config for host %s:\n%s", host, host_config.strip())
+            logger.debug("SSH config for host %s:\n%s", ssh_host, host_config.strip())
 
             ssh_path = shutil.which("ssh")
             if not ssh_path:
@@ -407,7 +705,7 @@ Host {host}
                 "IdentitiesOnly=yes",
                 "-i",
                 str(temp_key_path.resolve()),
-                f"{username}@{host}",
+                f"{username}@{ssh_host}",
                 "echo",
                 "SSH_OK",
             ]
@@ -485,6 +783,150 @@ Host {host}
                 temp_key_path.unlink()
             raise
 
+    def session_exists(self, session_name: str) -> bool:
+        """Check whether a sync session exists in the Mutagen daemon.
+
+        Parameters
+        ----------
+        session_name : str
+            Name of sync session to look up
+
+        Returns
+        -------
+        bool
+            True if Mutagen lists the session, False otherwise or on error
+        """
+        try:
+            result = subprocess.run(
+                ["mutagen", "sync", "list", session_name],
+                capture_output=True,
+                timeout=SYNC_STATUS_CHECK_TIMEOUT_SECONDS,
+            )
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError) as e:
+            logger.debug("Failed to look up Mutagen session %s: %s", session_name, e)
+            return False
+
+        return result.returncode == 0
+
+    def session_matches(self, session_name: str, fingerprint: str) -> bool:
+        """Check whether a sync session was created with the given endpoints.
+
+        Parameters
+        ----------
+        session_name : str
+            Name of sync session to look up
+        fingerprint : str
+            Fingerprint from build_session_fingerprint for the current endpoints
+
+        Returns
+        -------
+        bool
+            True if the session carries the fingerprint label, False if it
+            differs, is missing, or on error
+        """
+        try:
+            result = subprocess.run(
+                [
+                    "mutagen",
+                    "sync",
+                    "list",
+                    "--label-selector",
+                    f"{MUTAGEN_ENDPOINTS_LABEL}={fingerprint}",
+                ],
+                capture_output=True,
+                text=True,
+                timeout=SYNC_STATUS_CHECK_TIMEOUT_SECONDS,
+            )
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError) as e:
+            logger.debug("Failed to look up Mutagen session %s: %s", session_name, e)
+            return False
+
+        if result.returncode != 0:
+            return False
+
+        return any(line.strip() == f"Name: {session_name}" for line in result.stdout.splitlines())
+
+    def update_host_address(self, host_alias: str, host: str) -> bool:
+        """Point an existing SSH host alias at a new address.
+
+        Parameters
+        ----------
+        host_alias : str
+            Host alias written by create_sync_session (e.g., campers-abc123)
+        host : str
+            New remote host IP address or hostname
+
+        Returns
+        -------
+        bool
+            True if the alias exists and now resolves to host, False otherwise
+
+        Raises
+        ------
+        ValueError
+            If host has an invalid format
+        """
+        if not re.match(r"^[\w.-]+$", host):
+            raise ValueError(f"Invalid host: {host}")
+
+        try:
+            return self._set_host_address(get_campers_ssh_config_path(), host_alias, host)
+        except OSError as e:
+            logger.warning("Failed to update SSH config for %s: %s", host_alias, e)
+            return False
+
+    def pause_session(self, session_name: str) -> None:
+        """Pause a sync session while keeping its cached state.
+
+        Parameters
+        ----------
+        session_name : str
+            Name of session to pause
+
+        Notes
+        -----
+        Errors are logged and ignored so that stop cleanup can proceed.
+        """
+        try:
+            result = subprocess.run(
+                ["mutagen", "sync", "pause", session_name],
+                capture_output=True,
+                text=True,
+                timeout=MUTAGEN_CONTROL_TIMEOUT_SECONDS,
+            )
+            if result.returncode != 0:
+                logger.warning(
+                    "Failed to pause Mutagen session %s: %s", session_name, result.stderr
+                )
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError) as e:
+            logger.warning("Failed to pause Mutagen session %s: %s", session_name, e)
+
+    def resume_session(self, session_name: str) -> None:
+        """Resume a previously paused sync session.
+
+        Parameters
+        ----------
+        session_name : str
+            Name of session to resume
+
+        Raises
+        ------
+        RuntimeError
+            If Mutagen fails to resume the session
+        """
+        try:
+            result = subprocess.run(
+                ["mutagen", "sync", "resume", session_name],
+                capture_output=True,
+                text=True,
+                timeout=MUTAGEN_CONTROL_TIMEOUT_SECONDS,
+            )
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError) as e:
+            raise RuntimeError(f"Failed to resume Mutagen sync session: {e}") from e
+
+        if result.returncode != 0:
+            raise RuntimeError(f"Failed to resume Mutagen sync session: {result.stderr}")
+
     def get_sync_status(self, session_name: str) -> str:
         """Get the current sync status from Mutagen.
 
@@ -534,6 +976,7 @@ Host {host}
         except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError):
             return "Unknown"
 
+    @traced("mutagen.wait_for_initial_sync", "mutagen")
     def wait_for_initial_sync(self, session_name: str, timeout: int = 300) -> None:
         """Wait for Mutagen initial sync to complete.
 
@@ -571,6 +1014,54 @@ Host {host}
             f"Mutagen sync timed out after {timeout} seconds. Initial sync did not complete."
         )
 
+    @traced("mutagen.flush_session", "mutagen")
+    def flush_session(
+        self, session_name: str, timeout: float = SYNC_FLUSH_TIMEOUT_SECONDS
+    ) -> float:
+        """Force a synchronization cycle and wait for it to complete.
+
+        Unlike polling for the "watching" state, a flush guarantees that every
+        local change made before the call has been propagated to the remote.
+
+        Parameters
+        ----------
+        session_name : str
+            Name of sync session to flush
+        timeout : float
+            Maximum time in seconds to wait for the flush
+
+        Returns
+        -------
+        float
+            Time in seconds the flush took
+
+        Raises
+        ------
+        RuntimeError
+            If the flush fails or does not complete within timeout
+        """
+        start_time = time.monotonic()
+
+        try:
+            result = subprocess.run(
+                ["mutagen", "sync", "flush", session_name],
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+        except subprocess.TimeoutExpired as e:
+            raise RuntimeError(
+                f"Mutagen sync flush timed out after {timeout:.0f} seconds for {session_name}"
+            ) from e
+        except (subprocess.SubprocessError, OSError) as e:
+            raise RuntimeError(f"Failed to flush Mutagen sync session: {e}") from e
+
+        if result.returncode != 0:
+            raise RuntimeError(f"Failed to flush Mutagen sync session: {result.stderr}")
+
+        return time.monotonic() - start_time
+
+    @traced("mutagen.terminate_session", "mutagen")
     def terminate_session(
         self,
         session_name: str,
@@ -611,8 +1102,7 @@ Host {host}
         except OSError as e:
             logger.warning("Failed to remove SSH key file: %s", e)
 
-        campers_dir = Path(os.environ.get("CAMPERS_DIR", str(Path.home() / ".campers")))
-        campers_ssh_config = campers_dir / "ssh" / "config"
+        campers_ssh_config = get_campers_ssh_config_path()
 
         if host:
             try:
@@ -622,6 +1112,58 @@ Host {host}
 
         self._cleanup_ssh_include_if_empty(campers_ssh_config)
 
+    def terminate_host_sessions(self, host_alias: str, ssh_wrapper_dir: str | None = None) -> None:
+        """Terminate every sync session labelled with a host alias.
+
+        Used when an instance is destroyed outside of a run, so that sessions
+        paused by an earlier stop do not outlive it, nor do their SSH key copies.
+
+        Parameters
+        ----------
+        host_alias : str
+            Host alias the sessions were created with
+        ssh_wrapper_dir : str | None
+            Directory where the SSH keys of the sessions were created
+        """
+        try:
+            subprocess.run(
+                [
+                    "mutagen",
+                    "sync",
+                    "terminate",
+                    "--label-selector",
+                    f"{MUTAGEN_HOST_LABEL}={host_alias}",
+                ],
+                capture_output=True,
+                timeout=MUTAGEN_CONTROL_TIMEOUT_SECONDS,
+            )
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError) as e:
+            logger.warning("Failed to terminate Mutagen sessions for %s: %s", host_alias, e)
+
+        if ssh_wrapper_dir is None:
+            ssh_wrapper_dir = tempfile.gettempdir()
+
+        key_name = re.compile(rf"campers-key-{re.escape(host_alias)}-(pull-)?\d+\.pem")
+
+        for temp_key_path in Path(ssh_wrapper_dir).glob(f"campers-key-{host_alias}-*.pem"):
+            if not key_name.fullmatch(temp_key_path.name):
+                continue
+
+            try:
+                temp_key_path.unlink()
+                logger.debug("Removed SSH key file: %s", temp_key_path)
+            except OSError as e:
+                logger.warning("Failed to remove SSH key file: %s", e)
+
+        campers_ssh_config = get_campers_ssh_config_path()
+
+        try:
+            self._remove_host_from_ssh_config(campers_ssh_config, host_alias)
+        except OSError as e:
+            logger.warning("Failed to cleanup SSH config: %s", e)
+
+        self._cleanup_ssh_include_if_empty(campers_ssh_config)
+
     def _cleanup_ssh_include_if_empty(self, campers_ssh_config: Path) -> None:
         """Clean up empty campers SSH config file.
 
@@ -18,13 +18,17 @@ from textual.widgets import Static
 
 from campers.constants import (
     CTRL_C_DOUBLE_PRESS_THRESHOLD_SECONDS,
+    DEFAULT_MARKET,
+    DEFAULT_PROVIDER,
     DEFAULT_SSH_USERNAME,
     MAX_UPDATES_PER_TICK,
     TUI_STATUS_UPDATE_PROCESSING_DELAY,
     TUI_UPDATE_INTERVAL,
     UPTIME_UPDATE_INTERVAL_SECONDS,
 )
+from campers.core.costs import CostMeter
 from campers.logging import StreamFormatter, TuiLogHandler, TuiLogMessage
+from campers.providers import get_provider
 from campers.providers.exceptions import ProviderCredentialsError
 from campers.tui import widgets
 from campers.tui.exit_modal import ExitModal
@@ -42,6 +46,100 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def format_byte_count(count: int) -> str:
+    """Format a byte count with a binary unit suffix.
+
+    Parameters
+    ----------
+    count : int
+        Number of bytes
+
+    Returns
+    -------
+    str
+        Human readable size such as '512B' or '1.5MB'
+    """
+    if count < 1024:
+        return f"{count}B"
+
+    size = count / 1024
+
+    for unit in ("KB", "MB"):
+        if size < 1024:
+            return f"{size:.1f}{unit}"
+        size /= 1024
+
+    return f"{size:.1f}GB"
+
+
+def format_port_stats(stats: dict[str, Any]) -> str:
+    """Format the counters of one forwarded port for the status widget.
+
+    Parameters
+    ----------
+    stats : dict[str, Any]
+        Port counters as produced by PortForwardManager.get_stats()
+
+    Returns
+    -------
+    str
+        Summary such as '8888 -> 8888 up, 1/2 conns, 1.2MB in / 40.0KB out, 12ms',
+        with '<-' instead of '->' for reverse forwards and 'SOCKS 1080' for the
+        SOCKS proxy
+    """
+    if stats.get("socks"):
+        label = f"SOCKS {stats['local_port']}"
+    elif stats.get("reverse"):
+        label = f"{stats['remote_port']} <- {stats['local_port']}"
+    else:
+        label = f"{stats['remote_port']} -> {stats['local_port']}"
+
+    text = (
+        f"{label} {stats['health']}, "
+        f"{stats['active_connections']}/{stats['connections']} conns, "
+        f"{format_byte_count(stats['bytes_in'])} in / "
+        f"{format_byte_count(stats['bytes_out'])} out"
+    )
+
+    if stats.get("first_byte_latency_ms") is not None:
+        text += f", {stats['first_byte_latency_ms']:.0f}ms"
+
+    if stats.get("auto"):
+        text += " (auto)"
+
+    return text
+
+
+def format_ansible_progress(progress: dict[str, Any]) -> str:
+    """Format an Ansible progress snapshot for the provisioning widget.
+
+    Parameters
+    ----------
+    progress : dict[str, Any]
+        Progress snapshot as passed to AnsibleManager's progress_callback
+
+    Returns
+    -------
+    str
+        Summary such as 'base: task 4 Install packages, 2 ok, 1 changed' while
+        running, or 'base: done in 42.0s, 9 ok, 3 changed' once finished
+    """
+    counts = ", ".join(
+        f"{count} {status}" for status, count in progress.get("counts", {}).items() if count
+    )
+    playbook = progress.get("playbook", "")
+    status = progress.get("status")
+
+    if status == "done":
+        text = f"{playbook}: done in {progress.get('seconds', 0.0):.1f}s"
+    elif status == "failed":
+        text = f"{playbook}: failed at {progress.get('task') or 'start'}"
+    else:
+        text = f"{playbook}: task {progress.get('tasks', 0)} {progress.get('task') or ''}".rstrip()
+
+    return f"{text}, {counts}" if counts else text
+
+
 class CampersTUI(App):
     """Textual TUI application for campers.
 
@@ -104,6 +202,8 @@ class CampersTUI(App):
         self.original_handlers: list[logging.Handler] = []
         self.worker_exit_code = 0
         self.instance_start_time: datetime | None = None
+        self.cost_meter: CostMeter | None = None
+        self._cost_meter_requested = False
         self.last_ctrl_c_time: float = 0.0
         self.log_widget: SelectableLog | None = None
         self.fatal_error_message: str | None = None
@@ -128,12 +228,14 @@ class CampersTUI(App):
             yield LabeledValue("SSH", "loading...", id=widgets.WidgetID.SSH)
             yield LabeledValue("Status", "launching...", id=widgets.WidgetID.STATUS)
             yield LabeledValue("Uptime", "0s", id=widgets.WidgetID.UPTIME)
+            yield LabeledValue("Cost", "calculating...", id=widgets.WidgetID.COST)
             yield LabeledValue("Instance Type", "loading...", id=widgets.WidgetID.INSTANCE_TYPE)
             yield LabeledValue("Region", "loading...", id=widgets.WidgetID.REGION)
             yield LabeledValue("Camp Name", "loading...", id=widgets.WidgetID.CAMP_NAME)
             yield LabeledValue("Command", "loading...", id=widgets.WidgetID.COMMAND)
             yield LabeledValue("File sync", "Not syncing", id=widgets.WidgetID.MUTAGEN)
             yield LabeledValue("Port forwarding", "none", id=widgets.WidgetID.PORTFORWARD)
+            yield LabeledValue("Provisioning", "none", id=widgets.WidgetID.ANSIBLE)
             yield Static("", id=widgets.WidgetID.PUBLIC_PORTS, classes="hidden")
         with Container(id="log-panel"):
             yield SelectableLog()
@@ -264,6 +366,8 @@ class CampersTUI(App):
                     self.update_mutagen_status(payload)
                 elif update_type == "portforward_status":
                     self.update_portforward_status(payload)
+                elif update_type == "ansible_progress":
+                    self.update_ansible_progress(payload)
                 elif update_type == "cleanup_event":
                     self.handle_cleanup_event(payload)
 
@@ -299,13 +403,65 @@ class CampersTUI(App):
         except (ValueError, AttributeError) as e:
             logging.error("Failed to update uptime widget: %s", e)
 
+        if self.cost_meter is None:
+            return
+
+        session_cost = self.cost_meter.cost()
+        cost_str = f"this session: ${session_cost:.2f}" if session_cost is not None else "N/A"
+
+        try:
+            self.query_one(f"#{widgets.WidgetID.COST}", LabeledValue).value = cost_str
+        except (ValueError, AttributeError) as e:
+            logging.error("Failed to update cost widget: %s", e)
+
+    def start_cost_meter(self, launch_time: datetime, market: str = DEFAULT_MARKET) -> None:
+        """Look up the instance's rates and start accruing its session cost.
+
+        Runs in a worker thread because the rates may need Pricing API calls.
+
+        Parameters
+        ----------
+        launch_time : datetime
+            When the instance entered the running state
+        market : str
+            Market the instance runs in; spot instances accrue the current
+            spot rate
+        """
+        config = getattr(self.campers, "_merged_config_prop", {})
+        instance_type = config.get("instance_type")
+        region = config.get("region")
+        hourly_rate = None
+        storage_rate = None
+
+        if instance_type and region:
+            pricing_service = get_provider(DEFAULT_PROVIDER)["pricing_service"]()
+
+            try:
+                if pricing_service.pricing_available:
+                    if market == "spot":
+                        hourly_rate = pricing_service.get_spot_price(instance_type, region)
+                    else:
+                        hourly_rate = pricing_service.get_instance_price(instance_type, region)
+
+                    storage_rate = pricing_service.get_storage_price(region)
+            finally:
+                pricing_service.close()
+
+        self.cost_meter = CostMeter(
+            running_since=launch_time,
+            hourly_rate=hourly_rate,
+            storage_rate=storage_rate,
+            volume_size_gb=config.get("disk_size") or 0,
+        )
+
     def update_status(self, payload: dict[str, Any]) -> None:
         """Update status widget from status update event.
 
         Parameters
         ----------
         payload : dict[str, Any]
-            Status update payload containing 'status' field
+            Status update payload containing 'status' field and an optional
+            'notification' message, e.g. a spot interruption warning
         """
         if "status" in payload:
             status = payload["status"]
@@ -315,6 +471,9 @@ class CampersTUI(App):
             except (ValueError, AttributeError) as e:
                 logging.error("Failed to update status widget: %s", e)
 
+        if payload.get("notification"):
+            self.notify(payload["notification"], severity="warning", timeout=120)
+
     def update_mutagen_status(self, payload: dict[str, Any]) -> None:
         """Update mutagen widget from mutagen status event.
 
@@ -349,10 +508,20 @@ class CampersTUI(App):
         Parameters
         ----------
         payload : dict[str, Any]
-            Dictionary containing 'ports' list of (remote, local) tuples and 'status' string
+            Dictionary containing 'ports' list of (remote, local) tuples, 'status'
+            string and, once traffic is measured, a 'stats' list with one dictionary
+            of counters per forwarded port. An optional 'notification' message
+            announces automatically opened or closed forwards and reconnects.
         """
+        if payload.get("notification"):
+            self.notify(payload["notification"])
+
+        stats = payload.get("stats")
         ports = payload.get("ports", [])
-        if ports:
+
+        if stats:
+            value = ", ".join(format_port_stats(port_stats) for port_stats in stats)
+        elif ports:
             port_strings = []
             for p in ports:
                 if isinstance(p, (list, tuple)) and len(p) == 2:
@@ -360,16 +529,36 @@ class CampersTUI(App):
                     port_strings.append(f"{remote_port} -> {local_port}")
                 else:
                     port_strings.append(f"{p} -> {p}")
-            port_str = ", ".join(port_strings)
-            text = f"Port forwarding: {port_str}"
+            value = ", ".join(port_strings)
         else:
-            text = "Port forwarding: none"
+            value = "none"
+
+        if payload.get("status") == "reconnecting":
+            value = f"reconnecting... {value}"
+        elif payload.get("status") == "failed":
+            value = f"failed, restarting... {value}"
 
         try:
-            self.query_one(f"#{widgets.WidgetID.PORTFORWARD}").update(text)
+            self.query_one(f"#{widgets.WidgetID.PORTFORWARD}", LabeledValue).value = value
         except (ValueError, AttributeError) as e:
             logging.error("Failed to update portforward widget: %s", e)
 
+    def update_ansible_progress(self, payload: dict[str, Any]) -> None:
+        """Update provisioning widget from an Ansible progress snapshot.
+
+        Parameters
+        ----------
+        payload : dict[str, Any]
+            Progress snapshot with 'playbook', 'status', current 'task', number
+            of 'tasks' started and result 'counts' per status
+        """
+        try:
+            self.query_one(
+                f"#{widgets.WidgetID.ANSIBLE}", LabeledValue
+            ).value = format_ansible_progress(payload)
+        except (ValueError, AttributeError) as e:
+            logging.error("Failed to update provisioning widget: %s", e)
+
     def handle_cleanup_event(self, payload: dict[str, Any]) -> None:
         """Handle cleanup event by logging to the log panel.
 
@@ -394,28 +583,22 @@ class CampersTUI(App):
 
         if "instance_type" in config:
             try:
-                widget = self.query_one(
-                    f"#{widgets.WidgetID.INSTANCE_TYPE}", LabeledValue
-                )
-                widget.value = config['instance_type']
+                widget = self.query_one(f"#{widgets.WidgetID.INSTANCE_TYPE}", LabeledValue)
+                widget.value = config["instance_type"]
             except (ValueError, AttributeError, RuntimeError) as e:
                 logging.error("Failed to update instance type widget: %s", e)
 
         if "region" in config:
             try:
-                widget = self.query_one(
-                    f"#{widgets.WidgetID.REGION}", LabeledValue
-                )
-                widget.value = config['region']
+                widget = self.query_one(f"#{widgets.WidgetID.REGION}", LabeledValue)
+                widget.value = config["region"]
             except (ValueError, AttributeError, RuntimeError) as e:
                 logging.error("Failed to update region widget: %s", e)
 
         camp_name = config.get("camp_name", "ad-hoc")
 
         try:
-            widget = self.query_one(
-                f"#{widgets.WidgetID.CAMP_NAME}", LabeledValue
-            )
+            widget = self.query_one(f"#{widgets.WidgetID.CAMP_NAME}", LabeledValue)
             widget.value = camp_name
         except (ValueError, AttributeError, RuntimeError) as e:
             logging.error("Failed to update camp name widget: %s", e)
@@ -423,9 +606,7 @@ class CampersTUI(App):
         if "command" in config:
             try:
                 cmd = config["command"]
-                widget = self.query_one(
-                    f"#{widgets.WidgetID.COMMAND}", LabeledValue
-                )
+                widget = self.query_one(f"#{widgets.WidgetID.COMMAND}", LabeledValue)
                 widget.value = cmd
             except (ValueError, AttributeError, RuntimeError) as e:
                 logging.error("Failed to update command widget: %s", e)
@@ -459,7 +640,7 @@ class CampersTUI(App):
         """
         if "state" in details:
             try:
-                self.query_one(f"#{widgets.WidgetID.STATUS}", LabeledValue).value = details['state']
+                self.query_one(f"#{widgets.WidgetID.STATUS}", LabeledValue).value = details["state"]
             except (ValueError, AttributeError, RuntimeError) as e:
                 logging.error("Failed to update status widget: %s", e)
 
@@ -469,6 +650,16 @@ class CampersTUI(App):
             if hasattr(launch_time, "replace"):
                 self.instance_start_time = launch_time.replace(tzinfo=None)
 
+            if isinstance(launch_time, datetime) and not self._cost_meter_requested:
+                self._cost_meter_requested = True
+                self.run_worker(
+                    lambda: self.start_cost_meter(
+                        launch_time, details.get("market", DEFAULT_MARKET)
+                    ),
+                    thread=True,
+                    exit_on_error=False,
+                )
+
         if "public_ip" in details and details["public_ip"]:
             public_ip = details["public_ip"]
             try:
@@ -642,6 +833,8 @@ class CampersTUI(App):
         """
         if event.key == "q":
             self.action_quit()
+        elif event.key == "f":
+            self.run_worker(self._run_sync_flush, thread=True, exit_on_error=False)
         elif event.key == "ctrl+c":
             current_time = time.time()
 
@@ -742,6 +935,17 @@ class CampersTUI(App):
             handle_exit_choice,
         )
 
+    def _run_sync_flush(self) -> None:
+        """Flush Mutagen sync sessions on demand in a worker thread."""
+        if self.campers._cleanup_in_progress:
+            return
+
+        logging.info("Flushing file sync...")
+        elapsed = self.campers._run_executor_prop.flush_file_sync(self._update_queue)
+
+        if elapsed is None:
+            logging.info("No active file sync sessions to flush")
+
     def _run_cleanup(self) -> None:
         """Run cleanup in worker thread to keep TUI responsive."""
         if hasattr(self.campers, "_resources") and "ssh_manager" in self.campers._resources:
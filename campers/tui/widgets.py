@@ -13,4 +13,5 @@ class WidgetID:
     COMMAND = "command-widget"
     MUTAGEN = "mutagen-widget"
     PORTFORWARD = "portforward-widget"
+    ANSIBLE = "ansible-widget"
     PUBLIC_PORTS = "public-ports-widget"
@@ -11,6 +11,7 @@ class WidgetID:
     """Constants for TUI widget identifiers."""
 
     UPTIME = "uptime-widget"
+    COST = "cost-widget"
     STATUS = "status-widget"
     SSH = "ssh-widget"
     INSTANCE_TYPE = "instance-type-widget"
@@ -19,6 +20,7 @@ class WidgetID:
     COMMAND = "command-widget"
     MUTAGEN = "mutagen-widget"
     PORTFORWARD = "portforward-widget"
+    ANSIBLE = "ansible-widget"
     PUBLIC_PORTS = "public-ports-widget"
 
 
@@ -11,8 +11,6 @@ from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
-from rich.console import Console
-
 from campers.constants import (
     DEFAULT_NAME_COLUMN_WIDTH,
     SECONDS_PER_DAY,
@@ -319,6 +317,8 @@ def status_spinner(
             stop_event.set()
             update_thread.join(timeout=1.0)
     else:
+        from rich.console import Console
+
         console = Console()
         status_handle = console.status(f"{message}...", spinner="dots")
 
@@ -0,0 +1 @@
+"""Benchmarks run on demand rather than as part of the unit test suite."""
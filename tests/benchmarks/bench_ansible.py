@@ -0,0 +1,68 @@
+"""Compare Ansible run times with and without the campers speed profile.
+
+Runs ``ansible_benchmark.yml`` against a running camp three times: with
+Ansible's defaults, with the speed profile and an empty fact cache, and with
+the speed profile once facts are cached and the SSH master connection is open.
+
+Run with ``uv run python -m tests.benchmarks.bench_ansible --host IP --key PEM``.
+The host, key and user are shown by ``campers info``.
+"""
+
+import argparse
+import shutil
+import time
+from pathlib import Path
+
+from campers.services.ansible import AnsibleManager, get_ansible_dir, resolve_ansible_settings
+
+PLAYBOOK = Path(__file__).with_name("ansible_benchmark.yml")
+
+
+def timed_run(manager: AnsibleManager, inventory: Path, ansible_cfg: Path | None) -> float:
+    """Run the benchmark playbook and return its duration in seconds."""
+    start = time.perf_counter()
+    manager._run_ansible_playbook(inventory=inventory, playbook=PLAYBOOK, ansible_cfg=ansible_cfg)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", required=True)
+    parser.add_argument("--key", required=True)
+    parser.add_argument("--user", default="ubuntu")
+    parser.add_argument("--port", type=int, default=22)
+    parser.add_argument("--strategy", default="linear")
+    args = parser.parse_args()
+
+    manager = AnsibleManager()
+    cache_key = f"bench-{args.host}"
+    fact_cache = get_ansible_dir() / "facts" / cache_key
+
+    try:
+        inventory = manager._generate_inventory(
+            host=args.host, user=args.user, key_file=args.key, port=args.port
+        )
+        profile_cfg = manager._generate_ansible_cfg(
+            settings=resolve_ansible_settings({"strategy": args.strategy}), cache_key=cache_key
+        )
+        shutil.rmtree(fact_cache, ignore_errors=True)
+
+        results = {
+            "defaults": timed_run(manager, inventory, None),
+            "profile (cold)": timed_run(manager, inventory, profile_cfg),
+            "profile (warm)": timed_run(manager, inventory, profile_cfg),
+        }
+    finally:
+        manager._cleanup_temp_files()
+        shutil.rmtree(fact_cache, ignore_errors=True)
+
+    baseline = results["defaults"]
+    print(f"{'run':<16}{'seconds':>10}{'speedup':>10}")
+
+    for name, seconds in results.items():
+        print(f"{name:<16}{seconds:>10.1f}{baseline / seconds:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""Compare port forwarding throughput of PortForwardManager and sshtunnel.
+
+Both forwarders connect to the same in-process SSH server, which relays
+forwarded channels to a local echo server. Two workloads are measured: one
+bulk transfer over a single connection, and many concurrent small transfers.
+
+Run with ``uv run python -m tests.benchmarks.bench_portforward``.
+"""
+
+import argparse
+import logging
+import socket
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from sshtunnel import SSHTunnelForwarder
+
+from campers.services.portforward import PortForwardManager
+from tests.unit.fakes.local_ssh_server import LocalSSHServer
+
+MIB = 1024 * 1024
+TRANSFER_TIMEOUT_SECONDS = 30
+
+
+def start_echo_server() -> int:
+    """Start a threaded echo server on localhost.
+
+    Returns
+    -------
+    int
+        Port the echo server listens on
+    """
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(socket.SOMAXCONN)
+
+    def echo(conn: socket.socket) -> None:
+        with conn:
+            while data := conn.recv(65536):
+                conn.sendall(data)
+
+    def accept() -> None:
+        while True:
+            conn, _ = listener.accept()
+            threading.Thread(target=echo, args=(conn,), daemon=True).start()
+
+    threading.Thread(target=accept, daemon=True).start()
+    return listener.getsockname()[1]
+
+
+def free_port() -> int:
+    """Return a currently unused local port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def echo_transfer(port: int, size: int) -> None:
+    """Send size bytes through the forwarded port and read the echo back.
+
+    The connection is not half-closed, because sshtunnel drops data still in
+    flight when the local side shuts down writing.
+
+    Parameters
+    ----------
+    port : int
+        Local forwarded port
+    size : int
+        Number of bytes to send
+    """
+    payload = b"\0" * size
+
+    with socket.create_connection(("localhost", port), timeout=TRANSFER_TIMEOUT_SECONDS) as conn:
+        writer = threading.Thread(target=conn.sendall, args=(payload,))
+        writer.start()
+        received = 0
+
+        while received < size and (data := conn.recv(65536)):
+            received += len(data)
+
+        writer.join()
+
+    if received != size:
+        raise RuntimeError(f"Expected {size} echoed bytes, received {received}")
+
+
+def try_echo_transfer(port: int, size: int) -> bool:
+    """Run echo_transfer and report whether it succeeded."""
+    try:
+        echo_transfer(port, size)
+    except (OSError, RuntimeError):
+        return False
+
+    return True
+
+
+def measure(port: int, bulk_bytes: int, connections: int, per_connection: int) -> tuple:
+    """Run both workloads against a forwarded port.
+
+    Returns
+    -------
+    tuple
+        Bulk throughput in MiB/s, concurrent workload duration in seconds, and
+        the number of concurrent connections that failed
+    """
+    start = time.perf_counter()
+    echo_transfer(port, bulk_bytes)
+    bulk_rate = 2 * bulk_bytes / MIB / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=connections) as pool:
+        results = list(
+            pool.map(lambda _: try_echo_transfer(port, per_connection), range(connections))
+        )
+
+    return bulk_rate, time.perf_counter() - start, results.count(False)
+
+
+def with_native(server: LocalSSHServer, echo_port: int, run: Callable[[int], tuple]) -> tuple:
+    """Measure through PortForwardManager."""
+    local_port = free_port()
+    manager = PortForwardManager()
+    manager.create_tunnels(
+        [(echo_port, local_port)], "127.0.0.1", server.key_file, "bench", server.port
+    )
+
+    try:
+        return run(local_port)
+    finally:
+        manager.stop_all_tunnels()
+
+
+def with_sshtunnel(server: LocalSSHServer, echo_port: int, run: Callable[[int], tuple]) -> tuple:
+    """Measure through sshtunnel's SSHTunnelForwarder."""
+    local_port = free_port()
+    tunnel = SSHTunnelForwarder(
+        ssh_address_or_host=("127.0.0.1", server.port),
+        ssh_username="bench",
+        ssh_pkey=server.key_file,
+        remote_bind_address=("localhost", echo_port),
+        local_bind_address=("localhost", local_port),
+    )
+    tunnel.skip_tunnel_checkup = True
+    tunnel.start()
+
+    try:
+        return run(local_port)
+    finally:
+        tunnel.stop()
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bulk-mib", type=int, default=64)
+    parser.add_argument("--connections", type=int, default=200)
+    parser.add_argument("--per-connection-kib", type=int, default=256)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    def run(port: int) -> tuple:
+        return measure(port, args.bulk_mib * MIB, args.connections, args.per_connection_kib * 1024)
+
+    with tempfile.TemporaryDirectory() as key_dir:
+        server = LocalSSHServer(Path(key_dir)).start()
+        echo_port = start_echo_server()
+
+        try:
+            results = {
+                "campers": with_native(server, echo_port, run),
+                "sshtunnel": with_sshtunnel(server, echo_port, run),
+            }
+        finally:
+            server.stop()
+
+    print(f"{'forwarder':<12}{'bulk MiB/s':>12}{f'{args.connections} conns (s)':>20}{'failed':>8}")
+
+    for name, (bulk_rate, concurrent_seconds, failed) in results.items():
+        print(f"{name:<12}{bulk_rate:>12.1f}{concurrent_seconds:>20.2f}{failed:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Measure the import time of the campers CLI entry point against its budget.
+
+Commands like `campers list` and `campers exec` are run in loops by scripts
+and agents, so the import cost of the entry point is budgeted. Wall-clock
+timings vary with machine load, so this runs on demand rather than in the
+unit suite, which only checks that heavy dependencies stay unloaded. Each
+sample uses a fresh interpreter and the median is compared to the budget.
+
+Run with ``uv run python -m tests.benchmarks.bench_startup``.
+"""
+
+import argparse
+import statistics
+import sys
+
+from tests.unit.test_startup import run_python
+
+IMPORT_BUDGET_MS = 400
+"""Budget for `import campers.__main__`, cumulative -X importtime."""
+
+
+def cumulative_import_ms(code: str) -> float:
+    """Return the total import time in ms reported by -X importtime.
+
+    Parameters
+    ----------
+    code : str
+        Python code run in a fresh interpreter
+
+    Returns
+    -------
+    float
+        Sum of the cumulative times of top-level imports
+    """
+    result = run_python(code, "-X", "importtime")
+    total_us = 0
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        _, cumulative, name = line[len("import time:") :].split("|")
+
+        if not name.startswith("  "):
+            total_us += int(cumulative)
+
+    return total_us / 1000
+
+
+def main() -> None:
+    """Sample the entry point import time and exit non-zero over budget."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    args = parser.parse_args()
+
+    samples = [cumulative_import_ms("import campers.__main__") for _ in range(args.samples)]
+    median = statistics.median(samples)
+
+    print(f"import campers.__main__: median {median:.0f} ms, budget {args.budget_ms:.0f} ms")
+
+    if median > args.budget_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -87,6 +87,66 @@ def disable_mutagen_sync() -> Generator[None, None, None]:
         os.environ.pop("CAMPERS_DISABLE_MUTAGEN", None)
 
 
+@pytest.fixture(autouse=True)
+def disable_run_history() -> Generator[None, None, None]:
+    """Keep unit test runs out of the user's run history and cost ledger.
+
+    Yields
+    ------
+    None
+        Control back to test with run history and cost ledger disabled
+    """
+    switches = ("CAMPERS_DISABLE_HISTORY", "CAMPERS_DISABLE_COST_LEDGER")
+    originals = {name: os.environ.get(name) for name in switches}
+    os.environ.update(dict.fromkeys(switches, "1"))
+
+    yield
+
+    for name, original in originals.items():
+        if original is not None:
+            os.environ[name] = original
+        else:
+            os.environ.pop(name, None)
+
+
+@pytest.fixture(autouse=True)
+def disable_pricing_store() -> Generator[None, None, None]:
+    """Keep unit tests from reading or writing the user's price store.
+
+    Yields
+    ------
+    None
+        Control back to test with the persistent price store disabled
+    """
+    original = os.environ.get("CAMPERS_DISABLE_PRICING_CACHE")
+    os.environ["CAMPERS_DISABLE_PRICING_CACHE"] = "1"
+
+    yield
+
+    if original is not None:
+        os.environ["CAMPERS_DISABLE_PRICING_CACHE"] = original
+    else:
+        os.environ.pop("CAMPERS_DISABLE_PRICING_CACHE", None)
+
+
+@pytest.fixture(autouse=True)
+def clear_client_pool() -> Generator[None, None, None]:
+    """Drop pooled boto3 clients so patched ``boto3.client`` mocks do not leak.
+
+    Yields
+    ------
+    None
+        Control back to test with an empty client pool
+    """
+    from campers.providers.aws.client_factory import AWSClientFactory
+
+    AWSClientFactory.clear()
+
+    yield
+
+    AWSClientFactory.clear()
+
+
 @pytest.fixture(scope="session")
 def campers_module() -> Any:
     """Load campers package as a module.
@@ -237,13 +297,14 @@ def mock_ssh_manager(campers_module):
     Returns
     -------
     MagicMock
-        Mock SSHManager with connect and execute_command methods
+        Mock SSHManager with connect and execute methods
     """
     with patch.object(campers_module, "SSHManager") as MockSSHManager:
         mock_manager = MagicMock()
         mock_manager.connect.return_value = None
         mock_manager.execute_command.return_value = 0
         mock_manager.execute_command_raw.return_value = 0
+        mock_manager.execute_with_input.return_value = (0, "")
         mock_manager.close.return_value = None
         MockSSHManager.return_value = mock_manager
         yield mock_manager
@@ -38,6 +38,7 @@ class FakeEC2Manager:
         self.key_pairs: dict[str, str] = {}
         self.security_groups: dict[str, dict[str, Any]] = {}
         self.all_managers = all_managers
+        self.cache_volumes: list[dict[str, Any]] = []
 
     def validate_region(self, region: str) -> bool:
         """Validate if a region is available for this provider.
@@ -201,6 +202,24 @@ class FakeEC2Manager:
                 )
         return instances_list
 
+    def list_cache_volumes(self, region_filter: str | None = None) -> list[dict[str, Any]]:
+        """List fake cache volumes across regions.
+
+        Parameters
+        ----------
+        region_filter : str | None
+            Optional region filter. If None, lists volumes from all regions.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            List of fake cache volume details
+        """
+        if region_filter is None and self.all_managers:
+            return [v for m in self.all_managers.values() for v in m.cache_volumes]
+
+        return list(self.cache_volumes)
+
     def find_instances_by_name_or_id(
         self, name_or_id: str, region_filter: str | None = None
     ) -> list[dict[str, Any]]:
@@ -0,0 +1,249 @@
+"""In-process SSH server for exercising real paramiko transports in tests."""
+
+import functools
+import logging
+import selectors
+import socket
+import subprocess
+import threading
+from pathlib import Path
+
+import paramiko
+
+logger = logging.getLogger(__name__)
+
+
+@functools.cache
+def _host_key() -> paramiko.RSAKey:
+    """Generate the server host key once per test session."""
+    return paramiko.RSAKey.generate(1024)
+
+
+def relay(channel: paramiko.Channel, sock: socket.socket) -> None:
+    """Copy bytes between a channel and a socket until both sides finish.
+
+    Parameters
+    ----------
+    channel : paramiko.Channel
+        SSH channel side of the relay
+    sock : socket.socket
+        TCP socket side of the relay
+    """
+    selector = selectors.DefaultSelector()
+    selector.register(channel, selectors.EVENT_READ)
+    selector.register(sock, selectors.EVENT_READ)
+
+    try:
+        while selector.get_map():
+            for key, _ in selector.select(1.0):
+                source = key.fileobj
+                data = source.recv(65536)
+                target = sock if source is channel else channel
+
+                if data:
+                    target.sendall(data)
+                    continue
+
+                selector.unregister(source)
+
+                if target is channel:
+                    channel.shutdown_write()
+                else:
+                    sock.shutdown(socket.SHUT_WR)
+    except (OSError, EOFError):
+        pass
+    finally:
+        selector.close()
+        channel.close()
+        sock.close()
+
+
+class _ServerInterface(paramiko.ServerInterface):
+    """Accept any public key and allow sessions, direct-tcpip and tcpip-forward."""
+
+    def __init__(self, server: "LocalSSHServer") -> None:
+        self.server = server
+        self.transport: paramiko.Transport | None = None
+        self.forward_listeners: dict[int, socket.socket] = {}
+
+    def get_allowed_auths(self, username: str) -> str:
+        return "publickey"
+
+    def check_auth_publickey(self, username: str, key: paramiko.PKey) -> int:
+        return paramiko.AUTH_SUCCESSFUL
+
+    def check_channel_request(self, kind: str, chanid: int) -> int:
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+    def check_channel_direct_tcpip_request(
+        self, chanid: int, origin: tuple[str, int], destination: tuple[str, int]
+    ) -> int:
+        self.server.direct_requests.append(destination)
+
+        try:
+            sock = socket.create_connection(destination, timeout=2)
+        except OSError:
+            return paramiko.OPEN_FAILED_CONNECT_FAILED
+
+        sock.settimeout(None)
+        self.server.pending_sockets[chanid] = sock
+        return paramiko.OPEN_SUCCEEDED
+
+    def check_port_forward_request(self, address: str, port: int) -> int | bool:
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+        try:
+            listener.bind(("127.0.0.1", port))
+        except OSError:
+            listener.close()
+            return False
+
+        listener.listen(16)
+        port = listener.getsockname()[1]
+        self.forward_listeners[port] = listener
+        threading.Thread(
+            target=self._accept_forwarded, args=(listener, address, port), daemon=True
+        ).start()
+        return port
+
+    def cancel_port_forward_request(self, address: str, port: int) -> None:
+        listener = self.forward_listeners.pop(port, None)
+
+        if listener is not None:
+            listener.close()
+
+    def _accept_forwarded(self, listener: socket.socket, address: str, port: int) -> None:
+        listener.settimeout(0.5)
+
+        while self.transport.is_active():
+            try:
+                sock, origin = listener.accept()
+            except TimeoutError:
+                continue
+            except OSError:
+                return
+
+            sock.settimeout(None)
+
+            try:
+                channel = self.transport.open_forwarded_tcpip_channel(origin, (address, port))
+            except (paramiko.SSHException, EOFError):
+                sock.close()
+                continue
+
+            threading.Thread(target=relay, args=(channel, sock), daemon=True).start()
+
+        listener.close()
+
+    def check_channel_exec_request(self, channel: paramiko.Channel, command: bytes) -> bool:
+        threading.Thread(
+            target=self._run_command, args=(channel, command.decode()), daemon=True
+        ).start()
+        return True
+
+    def _run_command(self, channel: paramiko.Channel, command: str) -> None:
+        result = self.server.exec_handler(command)
+        channel.sendall(result.stdout)
+        channel.sendall_stderr(result.stderr)
+        channel.send_exit_status(result.returncode)
+        channel.close()
+
+
+def run_locally(command: str) -> subprocess.CompletedProcess:
+    """Run an exec request with the local shell.
+
+    Parameters
+    ----------
+    command : str
+        Command received from the SSH client
+
+    Returns
+    -------
+    subprocess.CompletedProcess
+        Completed process with bytes stdout and stderr
+    """
+    return subprocess.run(command, shell=True, capture_output=True, timeout=30)
+
+
+class LocalSSHServer:
+    """SSH server bound to localhost that forwards channels to local sockets.
+
+    Parameters
+    ----------
+    key_dir : Path
+        Directory where the client private key file is written
+
+    Attributes
+    ----------
+    port : int
+        Port the server listens on
+    key_file : str
+        Path to a private key accepted by the server
+    direct_requests : list[tuple[str, int]]
+        Destinations of every direct-tcpip channel request received
+    exec_handler : Callable[[str], subprocess.CompletedProcess]
+        Function answering exec requests, running them locally by default
+    """
+
+    def __init__(self, key_dir: Path) -> None:
+        self.key_file = str(key_dir / "client.pem")
+        paramiko.RSAKey.generate(1024).write_private_key_file(self.key_file)
+        self.direct_requests: list[tuple[str, int]] = []
+        self.pending_sockets: dict[int, socket.socket] = {}
+        self.exec_handler = run_locally
+        self.transports: list[paramiko.Transport] = []
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind(("127.0.0.1", 0))
+        self._listener.listen(16)
+        self.port = self._listener.getsockname()[1]
+        self._stopped = threading.Event()
+
+    def start(self) -> "LocalSSHServer":
+        """Start accepting SSH clients in a background thread.
+
+        Returns
+        -------
+        LocalSSHServer
+            This server, for chaining
+        """
+        threading.Thread(target=self._accept_clients, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and drop every client transport."""
+        self._stopped.set()
+        self._listener.close()
+
+        for transport in self.transports:
+            transport.close()
+
+    def _accept_clients(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                client, _ = self._listener.accept()
+            except OSError:
+                return
+
+            transport = paramiko.Transport(client)
+            transport.add_server_key(_host_key())
+            interface = _ServerInterface(self)
+            interface.transport = transport
+            transport.start_server(server=interface)
+            self.transports.append(transport)
+            threading.Thread(target=self._serve, args=(transport,), daemon=True).start()
+
+    def _serve(self, transport: paramiko.Transport) -> None:
+        while transport.is_active() and not self._stopped.is_set():
+            channel = transport.accept(0.5)
+
+            if channel is None:
+                continue
+
+            sock = self.pending_sockets.pop(channel.get_id(), None)
+
+            if sock is not None:
+                threading.Thread(target=relay, args=(channel, sock), daemon=True).start()
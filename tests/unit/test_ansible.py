@@ -1,12 +1,23 @@
 """Unit tests for Ansible manager."""
 
+import json
+import shutil
 from pathlib import Path
 from typing import Any
 from unittest import mock
 
 import pytest
 
-from campers.services.ansible import AnsibleManager
+from campers.constants import ANSIBLE_EVENT_PREFIX, ANSIBLE_MARKER_FILE
+from campers.services.ansible import (
+    AnsibleManager,
+    parse_ansible_event,
+    playbook_hash,
+    resolve_ansible_settings,
+    slowest_tasks,
+)
+from campers.services.ansible_plugins import campers_events
+from campers.services.ssh import read_remote_json
 
 
 class TestAnsibleManagerInstallationCheck:
@@ -455,3 +466,338 @@ class TestAnsibleManagerIntegration:
             assert captured_inventory_content is not None
             assert "ansible_user=ec2-user" in captured_inventory_content
             assert "ansible_port=2222" in captured_inventory_content
+
+
+class TestAnsibleManagerPlaybookMarkers:
+    """Test skipping of playbooks unchanged since their last successful run."""
+
+    PLAYBOOKS = {
+        "base": [{"hosts": "all", "tasks": [{"name": "Install git", "apt": {"name": "git"}}]}],
+        "webapp": [{"hosts": "all", "tasks": []}],
+    }
+
+    def run_playbooks(
+        self, markers: dict[str, Any] | None, reprovision: bool = False
+    ) -> tuple[dict[str, Any], list[str], mock.Mock]:
+        """Run both playbooks against an SSH manager holding the given markers."""
+        manager = AnsibleManager()
+        ssh_manager = mock.Mock()
+        ssh_manager.execute_with_input.return_value = (0, json.dumps(markers) if markers else "")
+        executed = []
+
+        def fake_popen(cmd: list[str], **kwargs: Any) -> mock.Mock:
+            executed.extend(name for name in self.PLAYBOOKS if f"playbook-{name}-" in cmd[3])
+            process = mock.Mock()
+            process.stdout = []
+            process.returncode = 0
+            return process
+
+        with (
+            mock.patch("shutil.which", return_value="/usr/bin/ansible-playbook"),
+            mock.patch("subprocess.Popen", side_effect=fake_popen),
+        ):
+            summary = manager.execute_playbooks(
+                playbook_names=["base", "webapp"],
+                playbooks_config=self.PLAYBOOKS,
+                instance_ip="10.0.0.1",
+                ssh_key_file="/path/to/key.pem",
+                ssh_manager=ssh_manager,
+                reprovision=reprovision,
+            )
+
+        return summary, executed, ssh_manager
+
+    def test_playbook_hash_ignores_key_order(self) -> None:
+        """Test the hash depends on content, not on mapping order."""
+        assert playbook_hash([{"hosts": "all", "become": True}]) == playbook_hash(
+            [{"become": True, "hosts": "all"}]
+        )
+        assert playbook_hash([{"hosts": "all"}]) != playbook_hash([{"hosts": "web"}])
+
+    def test_runs_all_and_records_markers_on_first_run(self) -> None:
+        """Test every playbook runs and its hash is recorded on the instance."""
+        summary, executed, ssh_manager = self.run_playbooks(markers=None)
+
+        assert executed == ["base", "webapp"]
+        assert summary["ran"] == ["base", "webapp"]
+        assert summary["skipped"] == []
+        command, data = ssh_manager.execute_with_input.call_args[0]
+        assert "cat > ~/.campers/playbooks.json" in command
+        recorded = json.loads(data)
+        assert recorded["base"]["hash"] == playbook_hash(self.PLAYBOOKS["base"])
+        assert recorded["webapp"]["hash"] == playbook_hash(self.PLAYBOOKS["webapp"])
+
+    def test_skips_unchanged_playbooks(self) -> None:
+        """Test playbooks whose marker matches are skipped and time saved is reported."""
+        markers = {
+            "base": {"hash": playbook_hash(self.PLAYBOOKS["base"]), "seconds": 120.0},
+            "webapp": {"hash": "outdated", "seconds": 30.0},
+        }
+
+        summary, executed, _ssh_manager = self.run_playbooks(markers)
+
+        assert executed == ["webapp"]
+        assert summary["skipped"] == ["base"]
+        assert summary["ran"] == ["webapp"]
+        assert summary["seconds_saved"] == 120.0
+
+    def test_reprovision_runs_unchanged_playbooks(self) -> None:
+        """Test reprovision ignores matching markers."""
+        markers = {
+            name: {"hash": playbook_hash(playbook), "seconds": 10.0}
+            for name, playbook in self.PLAYBOOKS.items()
+        }
+
+        summary, executed, _ssh_manager = self.run_playbooks(markers, reprovision=True)
+
+        assert executed == ["base", "webapp"]
+        assert summary["skipped"] == []
+
+    def test_unreadable_markers_run_all_playbooks(self) -> None:
+        """Test a corrupt marker file is ignored instead of failing provisioning."""
+        ssh_manager = mock.Mock()
+        ssh_manager.execute_with_input.return_value = (0, "not json")
+
+        assert read_remote_json(ssh_manager, ANSIBLE_MARKER_FILE, "unreadable") == {}
+
+
+class TestAnsibleManagerStop:
+    """Test stopping provisioning from another thread."""
+
+    def test_stop_terminates_running_playbook(self) -> None:
+        """Test stop terminates a running ansible-playbook process."""
+        manager = AnsibleManager()
+        manager._process = mock.Mock()
+        manager._process.poll.return_value = None
+
+        manager.stop()
+
+        manager._process.terminate.assert_called_once()
+
+    def test_stopped_manager_runs_no_playbooks(self) -> None:
+        """Test no playbook starts once provisioning was stopped."""
+        manager = AnsibleManager()
+        manager.stop()
+
+        with (
+            mock.patch("shutil.which", return_value="/usr/bin/ansible-playbook"),
+            mock.patch("subprocess.Popen") as popen,
+            pytest.raises(RuntimeError, match="stopped"),
+        ):
+            manager.execute_playbooks(
+                playbook_names=["base"],
+                playbooks_config={"base": [{"hosts": "all", "tasks": []}]},
+                instance_ip="10.0.0.1",
+                ssh_key_file="/path/to/key.pem",
+            )
+
+        popen.assert_not_called()
+
+
+class TestAnsibleManagerSpeedProfile:
+    """Test the managed ansible.cfg generated from the ansible camp section."""
+
+    def read_cfg(self, section: dict[str, Any] | None) -> str:
+        """Generate a cfg for the section and return its content."""
+        manager = AnsibleManager()
+        cfg = manager._generate_ansible_cfg(resolve_ansible_settings(section), "i-123")
+
+        try:
+            return cfg.read_text()
+        finally:
+            manager._cleanup_temp_files()
+
+    def test_resolve_ansible_settings_merges_over_defaults(self) -> None:
+        """Test configured keys override defaults and missing keys keep them."""
+        settings = resolve_ansible_settings({"forks": 20})
+
+        assert settings["forks"] == 20
+        assert settings["strategy"] == "linear"
+        assert settings["pipelining"] is True
+        assert resolve_ansible_settings(None)["control_persist"] == 60
+
+    def test_default_profile(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """Test the defaults enable pipelining, ControlPersist and a per-instance fact cache."""
+        monkeypatch.setenv("CAMPERS_DIR", str(tmp_path))
+        content = self.read_cfg(None)
+
+        assert "strategy = linear" in content
+        assert "pipelining = True" in content
+        assert "ControlPersist=60s" in content
+        assert f"control_path_dir = {tmp_path / 'ansible' / 'cp'}" in content
+        assert "gathering = smart" in content
+        assert f"fact_caching_connection = {tmp_path / 'ansible' / 'facts' / 'i-123'}" in content
+
+    def test_configured_profile(self) -> None:
+        """Test strategy, forks, fact caching and ControlPersist follow the section."""
+        content = self.read_cfg(
+            {"strategy": "free", "forks": 10, "fact_caching": False, "control_persist": 0}
+        )
+
+        assert "strategy = free" in content
+        assert "forks = 10" in content
+        assert "fact_caching" not in content
+        assert "ControlMaster=no" in content
+        assert "ControlPersist" not in content
+
+    def test_execute_playbooks_passes_ansible_config(self) -> None:
+        """Test ansible-playbook runs with ANSIBLE_CONFIG pointing at the managed cfg."""
+        manager = AnsibleManager()
+        captured = {}
+
+        def fake_popen(cmd: list[str], **kwargs: Any) -> mock.Mock:
+            captured["env"] = kwargs["env"]
+            captured["cfg"] = Path(kwargs["env"]["ANSIBLE_CONFIG"]).read_text()
+            process = mock.Mock()
+            process.stdout = []
+            process.returncode = 0
+            return process
+
+        with (
+            mock.patch("shutil.which", return_value="/usr/bin/ansible-playbook"),
+            mock.patch("subprocess.Popen", side_effect=fake_popen),
+        ):
+            manager.execute_playbooks(
+                playbook_names=["base"],
+                playbooks_config={"base": [{"hosts": "all", "tasks": []}]},
+                instance_ip="10.0.0.1",
+                ssh_key_file="/path/to/key.pem",
+                ansible_settings={"forks": 8},
+                cache_key="i-abc",
+            )
+
+        assert "forks = 8" in captured["cfg"]
+        assert "i-abc" in captured["cfg"]
+        assert not Path(captured["env"]["ANSIBLE_CONFIG"]).exists()
+
+
+class TestAnsibleManagerProgressEvents:
+    """Test parsing of campers_events callback output into progress and timings."""
+
+    @staticmethod
+    def event_line(**event: Any) -> str:
+        """Render an event as the callback plugin prints it."""
+        return ANSIBLE_EVENT_PREFIX + json.dumps(event) + "\n"
+
+    def run_with_output(self, lines: list[str], returncode: int = 0) -> tuple:
+        """Run a playbook whose output is the given lines, collecting progress."""
+        manager = AnsibleManager()
+        process = mock.Mock()
+        process.stdout = lines
+        process.returncode = returncode
+        progress = []
+
+        with mock.patch("subprocess.Popen", return_value=process):
+            manager._run_ansible_playbook(
+                inventory=Path("/tmp/inventory.ini"),
+                playbook=Path("/tmp/playbook.yml"),
+                playbook_name="base",
+                progress_callback=progress.append,
+            )
+
+        return manager, progress
+
+    def test_parse_ansible_event(self) -> None:
+        """Test only prefixed JSON objects are treated as events."""
+        assert campers_events.EVENT_PREFIX == ANSIBLE_EVENT_PREFIX
+        assert parse_ansible_event(ANSIBLE_EVENT_PREFIX + '{"event": "task_start"}') == {
+            "event": "task_start"
+        }
+        assert parse_ansible_event("[WARNING]: something") is None
+        assert parse_ansible_event(ANSIBLE_EVENT_PREFIX + "{broken") is None
+        assert parse_ansible_event(ANSIBLE_EVENT_PREFIX + "[1, 2]") is None
+
+    def test_events_update_progress_and_timings(self) -> None:
+        """Test task events produce progress snapshots and per-task timings."""
+        lines = [
+            self.event_line(event="task_start", task="Install packages"),
+            self.event_line(
+                event="task_result",
+                task="Install packages",
+                host="ec2instance",
+                status="changed",
+                duration=12.5,
+            ),
+            "[WARNING]: plain output line\n",
+            self.event_line(event="task_start", task="Check optional"),
+            self.event_line(
+                event="task_result",
+                task="Check optional",
+                host="ec2instance",
+                status="failed",
+                ignored=True,
+                duration=0.5,
+                msg="non-zero return code",
+            ),
+        ]
+
+        manager, progress = self.run_with_output(lines)
+
+        assert [snapshot["task"] for snapshot in progress[:2]] == ["Install packages"] * 2
+        assert progress[1]["counts"]["changed"] == 1
+        assert progress[-1]["status"] == "done"
+        assert progress[-1]["tasks"] == 2
+        assert progress[-1]["counts"]["ignored"] == 1
+        assert [(t.task, t.status, t.seconds) for t in manager.task_timings] == [
+            ("Install packages", "changed", 12.5),
+            ("Check optional", "ignored", 0.5),
+        ]
+        assert slowest_tasks(manager.task_timings, count=1) == manager.task_timings[:1]
+
+    def test_failed_task_message_in_error(self) -> None:
+        """Test the failure message of a task is part of the raised error."""
+        lines = [
+            self.event_line(event="task_start", task="Install packages"),
+            self.event_line(
+                event="task_result",
+                task="Install packages",
+                host="ec2instance",
+                status="failed",
+                duration=1.0,
+                msg="No package matching 'gti' is available",
+            ),
+        ]
+
+        with pytest.raises(RuntimeError, match="No package matching 'gti'"):
+            self.run_with_output(lines, returncode=2)
+
+    @pytest.mark.skipif(
+        shutil.which("ansible-playbook") is None, reason="ansible-playbook not installed"
+    )
+    def test_callback_plugin_emits_events(self, tmp_path: Path) -> None:
+        """Test a real ansible-playbook run through the managed cfg emits parsed events."""
+        manager = AnsibleManager()
+        inventory = tmp_path / "inventory.ini"
+        inventory.write_text(
+            "[all]\nlocalhost ansible_connection=local ansible_python_interpreter=auto_silent\n"
+        )
+        playbook = tmp_path / "playbook.yml"
+        playbook.write_text(
+            "- hosts: all\n"
+            "  gather_facts: false\n"
+            "  tasks:\n"
+            "    - name: Say hello\n"
+            "      ansible.builtin.debug:\n"
+            "        msg: hello\n"
+            "    - name: Never runs\n"
+            "      ansible.builtin.debug:\n"
+            "        msg: skipped\n"
+            "      when: false\n"
+        )
+        progress = []
+
+        with mock.patch.dict("os.environ", {"CAMPERS_DIR": str(tmp_path)}):
+            cfg = manager._generate_ansible_cfg(resolve_ansible_settings(None), "local")
+
+            try:
+                manager._run_ansible_playbook(
+                    inventory, playbook, ansible_cfg=cfg, progress_callback=progress.append
+                )
+            finally:
+                manager._cleanup_temp_files()
+
+        assert [(t.task, t.status) for t in manager.task_timings] == [
+            ("Say hello", "ok"),
+            ("Never runs", "skipped"),
+        ]
+        assert progress[-1]["status"] == "done"
@@ -0,0 +1,146 @@
+"""Unit tests for AWS API call accounting."""
+
+import json
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import patch
+
+import boto3
+import pytest
+from botocore.awsrequest import AWSResponse
+from botocore.config import Config
+
+from campers.cli.main import pop_api_stats_flag
+from campers.core.api_stats import (
+    ApiCall,
+    ApiCallRecorder,
+    format_api_stats,
+    start_api_accounting,
+    stop_api_accounting,
+)
+from campers.providers.aws.instrumentation import install_api_hooks
+
+EMPTY_DESCRIBE = b'<DescribeInstancesResponse xmlns="http://ec2.amazonaws.com/doc/2016-11-15/"/>'
+THROTTLED = (
+    b"<Response><Errors><Error><Code>RequestLimitExceeded</Code>"
+    b"<Message>Request limit exceeded.</Message></Error></Errors></Response>"
+)
+
+
+class RawBody:
+    """Minimal urllib3 response stand-in for AWSResponse."""
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+
+    def stream(self, **kwargs: object) -> list[bytes]:
+        return [self.body]
+
+
+@pytest.fixture
+def recorder() -> Generator[ApiCallRecorder, None, None]:
+    """Activate API call accounting for the duration of a test.
+
+    Yields
+    ------
+    ApiCallRecorder
+        The active recorder
+    """
+    active = start_api_accounting()
+    yield active
+    stop_api_accounting()
+
+
+def make_client(responses: list[tuple[int, bytes]]) -> object:
+    """Create an instrumented EC2 client answering with canned responses."""
+    session = boto3.Session(
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+        region_name="eu-west-1",
+    )
+    install_api_hooks(session)
+    client = session.client("ec2", config=Config(retries={"max_attempts": 3, "mode": "standard"}))
+    pending = list(responses)
+
+    def respond(request: object, **kwargs: object) -> AWSResponse:
+        status, body = pending.pop(0)
+        return AWSResponse(request.url, status, {}, RawBody(body))
+
+    client.meta.events.register("before-send", respond)
+    return client
+
+
+def test_hooks_record_successful_call(recorder: ApiCallRecorder) -> None:
+    """Test a call is recorded with its operation, region and latency."""
+    make_client([(200, EMPTY_DESCRIBE)]).describe_instances()
+
+    [call] = recorder.calls
+    assert (call.service, call.operation, call.region) == ("ec2", "DescribeInstances", "eu-west-1")
+    assert call.seconds > 0
+    assert (call.retries, call.throttles, call.error) == (0, 0, "")
+
+
+def test_hooks_count_throttled_retries(recorder: ApiCallRecorder) -> None:
+    """Test throttled attempts retried by botocore are counted."""
+    client = make_client([(503, THROTTLED), (200, EMPTY_DESCRIBE)])
+
+    with patch("botocore.endpoint.time.sleep"):
+        client.describe_instances()
+
+    [call] = recorder.calls
+    assert (call.retries, call.throttles, call.error) == (1, 1, "")
+
+
+def test_summary_aggregates_per_operation_and_region(tmp_path: Path) -> None:
+    """Test the summary table and the persisted JSON line."""
+    recorder = ApiCallRecorder()
+    recorder.record(ApiCall("ec2", "DescribeInstances", "us-east-1", 0.2))
+    recorder.record(ApiCall("ec2", "DescribeInstances", "us-east-1", 0.4, retries=2, throttles=2))
+    recorder.record(ApiCall("pricing", "GetProducts", "us-east-1", 1.5, error="AccessDenied"))
+
+    table = format_api_stats(recorder).splitlines()
+
+    assert table[0] == "API calls: 3 calls, 2.1s, 2 retries, 2 throttled"
+    assert table[2].split() == [
+        "pricing.GetProducts",
+        "us-east-1",
+        "1",
+        "1.50s",
+        "1.50s",
+        "0",
+        "0",
+        "1",
+    ]
+    assert table[3].split() == [
+        "ec2.DescribeInstances",
+        "us-east-1",
+        "2",
+        "0.60s",
+        "0.40s",
+        "2",
+        "2",
+        "0",
+    ]
+
+    history = tmp_path / "stats" / "api.jsonl"
+    recorder.append_to(history, "list")
+    recorder.append_to(history, "list")
+    records = [json.loads(line) for line in history.read_text().splitlines()]
+
+    assert len(records) == 2
+    assert records[0]["command"] == "list"
+    assert records[0]["operations"][1]["calls"] == 2
+
+
+@pytest.mark.parametrize(
+    ("argv", "expected", "remaining"),
+    [
+        (["campers", "list"], False, ["campers", "list"]),
+        (["campers", "--api-stats", "list"], True, ["campers", "list"]),
+        (["campers", "list", "--api-stats=~/api.jsonl"], "~/api.jsonl", ["campers", "list"]),
+    ],
+)
+def test_pop_api_stats_flag(argv: list[str], expected: bool | str, remaining: list[str]) -> None:
+    """Test the global flag is removed before Fire parses the command line."""
+    assert pop_api_stats_flag(argv) == expected
+    assert argv == remaining
@@ -312,3 +312,194 @@ def test_public_ports_widget_shown_on_instance_details_with_public_ip(
         "Public IP: 52.29.99.159 | URLs: http://52.29.99.159:8888"
     )
     public_ports_widget.remove_class.assert_called_with("hidden")
+
+
+def test_f_key_starts_sync_flush_worker(tui_app):
+    """Test pressing 'f' flushes file sync in a worker thread.
+
+    Parameters
+    ----------
+    tui_app : CampersTUI
+        TUI app instance
+    """
+    from campers.tui.app import CampersTUI
+
+    tui_app.on_key = CampersTUI.on_key.__get__(tui_app)
+
+    tui_app.on_key(Mock(key="f"))
+
+    tui_app.run_worker.assert_called_once_with(
+        tui_app._run_sync_flush, thread=True, exit_on_error=False
+    )
+
+
+def test_update_portforward_status_shows_port_stats(tui_app):
+    """Test port counters are rendered in the port forwarding widget.
+
+    Parameters
+    ----------
+    tui_app : CampersTUI
+        TUI app instance
+    """
+    from campers.tui.app import CampersTUI
+    from campers.tui.widgets.labeled_value import LabeledValue
+
+    tui_app.update_portforward_status = CampersTUI.update_portforward_status.__get__(tui_app)
+    mock_widget = Mock(spec=LabeledValue)
+    tui_app.query_one = Mock(return_value=mock_widget)
+
+    tui_app.update_portforward_status(
+        {
+            "ports": [(8888, 8888)],
+            "status": "active",
+            "stats": [
+                {
+                    "remote_port": 8888,
+                    "local_port": 8888,
+                    "connections": 3,
+                    "active_connections": 1,
+                    "failed_connections": 0,
+                    "bytes_in": 1536 * 1024,
+                    "bytes_out": 512,
+                    "first_byte_latency_ms": 12.4,
+                    "health": "up",
+                }
+            ],
+        }
+    )
+
+    tui_app.query_one.assert_called_once_with("#portforward-widget", LabeledValue)
+    assert mock_widget.value == "8888 -> 8888 up, 1/3 conns, 1.5MB in / 512B out, 12ms"
+
+
+def test_update_portforward_status_shows_reconnecting(tui_app):
+    """Test a lost forwarding connection is shown while it is re-established.
+
+    Parameters
+    ----------
+    tui_app : CampersTUI
+        TUI app instance
+    """
+    from campers.tui.app import CampersTUI
+    from campers.tui.widgets.labeled_value import LabeledValue
+
+    tui_app.update_portforward_status = CampersTUI.update_portforward_status.__get__(tui_app)
+    tui_app.notify = Mock()
+    mock_widget = Mock(spec=LabeledValue)
+    tui_app.query_one = Mock(return_value=mock_widget)
+
+    tui_app.update_portforward_status(
+        {
+            "ports": [(8888, 8888)],
+            "status": "reconnecting",
+            "notification": "Port forwarding connection lost, reconnecting",
+        }
+    )
+
+    tui_app.notify.assert_called_once_with("Port forwarding connection lost, reconnecting")
+    assert mock_widget.value == "reconnecting... 8888 -> 8888"
+
+
+def test_update_status_warns_of_spot_interruption(tui_app):
+    """Test a spot interruption notice updates the status and raises a warning.
+
+    Parameters
+    ----------
+    tui_app : CampersTUI
+        TUI app instance
+    """
+    from campers.tui.app import CampersTUI
+    from campers.tui.widgets.labeled_value import LabeledValue
+
+    tui_app.update_status = CampersTUI.update_status.__get__(tui_app)
+    tui_app.notify = Mock()
+    mock_widget = Mock(spec=LabeledValue)
+    tui_app.query_one = Mock(return_value=mock_widget)
+
+    tui_app.update_status(
+        {
+            "status": "interrupted at 12:34:56",
+            "notification": "Spot interruption: instance will stop at 12:34:56",
+        }
+    )
+
+    assert mock_widget.value == "interrupted at 12:34:56"
+    tui_app.notify.assert_called_once_with(
+        "Spot interruption: instance will stop at 12:34:56", severity="warning", timeout=120
+    )
+
+
+def test_update_portforward_status_notifies_auto_forward(tui_app):
+    """Test automatically opened forwards raise a notification and are marked.
+
+    Parameters
+    ----------
+    tui_app : CampersTUI
+        TUI app instance
+    """
+    from campers.tui.app import CampersTUI
+    from campers.tui.widgets.labeled_value import LabeledValue
+
+    tui_app.update_portforward_status = CampersTUI.update_portforward_status.__get__(tui_app)
+    tui_app.notify = Mock()
+    mock_widget = Mock(spec=LabeledValue)
+    tui_app.query_one = Mock(return_value=mock_widget)
+
+    tui_app.update_portforward_status(
+        {
+            "ports": [(5173, 5173)],
+            "status": "active",
+            "notification": "Forwarding remote port 5173 to localhost:5173",
+            "stats": [
+                {
+                    "remote_port": 5173,
+                    "local_port": 5173,
+                    "connections": 0,
+                    "active_connections": 0,
+                    "failed_connections": 0,
+                    "bytes_in": 0,
+                    "bytes_out": 0,
+                    "first_byte_latency_ms": None,
+                    "health": "up",
+                    "auto": True,
+                }
+            ],
+        }
+    )
+
+    tui_app.notify.assert_called_once_with("Forwarding remote port 5173 to localhost:5173")
+    assert mock_widget.value == "5173 -> 5173 up, 0/0 conns, 0B in / 0B out (auto)"
+
+
+def test_update_ansible_progress_shows_running_and_done(tui_app):
+    """Test the provisioning widget follows the running task and final counts.
+
+    Parameters
+    ----------
+    tui_app : CampersTUI
+        TUI app instance
+    """
+    from campers.tui.app import CampersTUI
+    from campers.tui.widgets.labeled_value import LabeledValue
+
+    tui_app.update_ansible_progress = CampersTUI.update_ansible_progress.__get__(tui_app)
+    mock_widget = Mock(spec=LabeledValue)
+    tui_app.query_one = Mock(return_value=mock_widget)
+    progress = {
+        "playbook": "base",
+        "status": "running",
+        "task": "Install packages",
+        "tasks": 4,
+        "counts": {"ok": 2, "changed": 1, "failed": 0},
+    }
+
+    tui_app.update_ansible_progress(progress)
+
+    tui_app.query_one.assert_called_once_with("#ansible-widget", LabeledValue)
+    assert mock_widget.value == "base: task 4 Install packages, 2 ok, 1 changed"
+
+    tui_app.update_ansible_progress(
+        {**progress, "status": "done", "seconds": 42.0, "counts": {"ok": 9, "changed": 3}}
+    )
+
+    assert mock_widget.value == "base: done in 42.0s, 9 ok, 3 changed"
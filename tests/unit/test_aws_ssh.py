@@ -0,0 +1,134 @@
+"""Unit tests for AWS SSH connection tag resolution."""
+
+from collections.abc import Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from campers.providers.aws.ssh import (
+    SSHTags,
+    forget_ssh_tags,
+    get_aws_ssh_connection_info,
+    resolve_ssh_tags,
+)
+
+HARNESS_TAGS = [
+    {"Key": "CampersSSHHost", "Value": "localhost"},
+    {"Key": "CampersSSHPort", "Value": "2222"},
+    {"Key": "CampersSSHUsername", "Value": "ubuntu"},
+    {"Key": "CampersSSHKeyFile", "Value": "/tmp/key.pem"},
+]
+
+
+def _response(tags: list[dict[str, str]]) -> dict:
+    return {"Reservations": [{"Instances": [{"InstanceId": "i-123", "Tags": tags}]}]}
+
+
+@pytest.fixture
+def ec2_client(monkeypatch: pytest.MonkeyPatch) -> Generator[MagicMock, None, None]:
+    """Patch the pooled EC2 client and skip retry sleeps."""
+    monkeypatch.setenv("AWS_ENDPOINT_URL", "http://localhost:4566")
+    client = MagicMock()
+    forget_ssh_tags()
+
+    with (
+        patch("campers.providers.aws.ssh.AWSClientFactory") as mock_factory,
+        patch("campers.providers.aws.ssh.time.sleep"),
+    ):
+        mock_factory.return_value.get_client.return_value = client
+        yield client
+
+    forget_ssh_tags()
+
+
+def test_resolve_ssh_tags_uses_single_describe_call(ec2_client: MagicMock) -> None:
+    """All SSH tags come from one describe_instances call."""
+    ec2_client.describe_instances.return_value = _response(HARNESS_TAGS)
+
+    tags = resolve_ssh_tags("i-123")
+
+    assert tags == SSHTags(host="localhost", port=2222, username="ubuntu", key_file="/tmp/key.pem")
+    assert ec2_client.describe_instances.call_count == 1
+
+
+def test_resolve_ssh_tags_caches_per_instance(ec2_client: MagicMock) -> None:
+    """Complete tags are cached until forgotten."""
+    ec2_client.describe_instances.return_value = _response(HARNESS_TAGS)
+
+    resolve_ssh_tags("i-123")
+    resolve_ssh_tags("i-123")
+    assert ec2_client.describe_instances.call_count == 1
+
+    forget_ssh_tags("i-123")
+    resolve_ssh_tags("i-123")
+    assert ec2_client.describe_instances.call_count == 2
+
+
+def test_resolve_ssh_tags_retries_only_while_required_tags_missing(
+    ec2_client: MagicMock,
+) -> None:
+    """Retries stop once host and port appear; optional tags are not awaited."""
+    ec2_client.describe_instances.side_effect = [
+        _response([]),
+        _response([{"Key": "CampersSSHHost", "Value": "localhost"}]),
+        _response(
+            [
+                {"Key": "CampersSSHHost", "Value": "localhost"},
+                {"Key": "CampersSSHPort", "Value": "2222"},
+            ]
+        ),
+    ]
+
+    tags = resolve_ssh_tags("i-123")
+
+    assert tags.host == "localhost"
+    assert tags.port == 2222
+    assert tags.username is None
+    assert ec2_client.describe_instances.call_count == 3
+
+
+def test_resolve_ssh_tags_gives_up_after_max_attempts(ec2_client: MagicMock) -> None:
+    """Incomplete tags are returned, and not cached, after the retry budget."""
+    ec2_client.describe_instances.return_value = _response(
+        [{"Key": "CampersSSHPort", "Value": "not-a-port"}]
+    )
+
+    with patch("campers.providers.aws.ssh.TAG_FETCH_RETRY_MAX", 3):
+        tags = resolve_ssh_tags("i-123")
+        resolve_ssh_tags("i-123")
+
+    assert tags == SSHTags()
+    assert ec2_client.describe_instances.call_count == 6
+
+
+def test_resolve_ssh_tags_survives_api_errors(ec2_client: MagicMock) -> None:
+    """Transient describe failures are retried."""
+    ec2_client.describe_instances.side_effect = [
+        RuntimeError("throttled"),
+        _response(HARNESS_TAGS),
+    ]
+
+    assert resolve_ssh_tags("i-123").port == 2222
+
+
+def test_get_aws_ssh_connection_info_prefers_harness_tags(ec2_client: MagicMock) -> None:
+    """Harness tags override the public IP and key file."""
+    ec2_client.describe_instances.return_value = _response(HARNESS_TAGS)
+
+    info = get_aws_ssh_connection_info("i-123", "203.0.113.5", "/home/key.pem")
+
+    assert (info.host, info.port, info.username) == ("localhost", 2222, "ubuntu")
+    assert info.key_file == "/tmp/key.pem"
+
+
+def test_get_aws_ssh_connection_info_uses_public_ip_without_endpoint(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Real AWS skips tag lookup entirely."""
+    monkeypatch.delenv("AWS_ENDPOINT_URL", raising=False)
+
+    with patch("campers.providers.aws.ssh.resolve_ssh_tags") as mock_resolve:
+        info = get_aws_ssh_connection_info("i-123", "203.0.113.5", "/home/key.pem")
+
+    mock_resolve.assert_not_called()
+    assert (info.host, info.port) == ("203.0.113.5", 22)
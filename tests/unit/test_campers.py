@@ -87,6 +87,7 @@ def test_run_executes_setup_script_before_command(campers_module) -> None:
         mock_get_provider.return_value = {"compute": mock_ec2}
 
         mock_ssh_instance = MagicMock()
+        mock_ssh_instance.execute_with_input.return_value = (0, "")
         mock_ssh_instance.filter_environment_variables.return_value = {}
         mock_ssh_instance.connect.return_value = None
         mock_ssh_instance.build_command_with_env.side_effect = lambda cmd, env: cmd
@@ -232,6 +233,7 @@ def test_run_only_setup_script_no_command(campers_module) -> None:
         mock_get_provider.return_value = {"compute": mock_ec2}
 
         mock_ssh_instance = MagicMock()
+        mock_ssh_instance.execute_with_input.return_value = (0, "")
         mock_ssh_instance.filter_environment_variables.return_value = {}
         mock_ssh_instance.connect.return_value = None
         mock_ssh_instance.build_command_with_env.side_effect = lambda cmd, env: cmd
@@ -535,7 +537,7 @@ cd src"""
 
 def test_run_with_port_forwarding_creates_tunnels(campers_module) -> None:
     """Test that run() creates port forwarding tunnels when ports configured."""
-    from unittest.mock import MagicMock, patch
+    from unittest.mock import ANY, MagicMock, patch
 
     campers_instance = campers_module()
     campers_instance._config_loader = MagicMock()
@@ -590,6 +592,10 @@ def test_run_with_port_forwarding_creates_tunnels(campers_module) -> None:
             key_file="/tmp/test.pem",
             username="ubuntu",
             ssh_port=22,
+            status_callback=ANY,
+            auto_forward=None,
+            reverse_ports=[],
+            socks_proxy=None,
         )
         mock_portforward_instance.stop_all_tunnels.assert_called_once()
         assert result["instance_id"] == "i-test123"
@@ -771,8 +777,8 @@ def test_run_port_forwarding_with_startup_script(campers_module) -> None:
         campers_instance._mutagen_manager_factory = lambda: mock_mutagen_instance
 
         mock_portforward_instance = MagicMock()
-        mock_portforward_instance.create_tunnels.side_effect = (
-            lambda **kwargs: execution_order.append("port_forward")
+        mock_portforward_instance.create_tunnels.side_effect = lambda **kwargs: (
+            execution_order.append("port_forward")
         )
         mock_portforward.return_value = mock_portforward_instance
         campers_instance._portforward_manager_factory = lambda: mock_portforward_instance
@@ -903,6 +909,7 @@ def test_run_forwards_env_to_setup_script(campers_module) -> None:
         mock_get_provider.return_value = {"compute": mock_ec2}
 
         mock_ssh_instance = MagicMock()
+        mock_ssh_instance.execute_with_input.return_value = (0, "")
         mock_ssh_instance.filter_environment_variables.return_value = {"AWS_REGION": "us-west-2"}
         mock_ssh_instance.build_command_with_env.return_value = (
             "export AWS_REGION='us-west-2' && aws s3 cp s3://bucket/setup.sh ."
@@ -1103,8 +1110,8 @@ def test_cleanup_resources_executes_in_correct_order(campers_module) -> None:
     cleanup_order = []
 
     mock_portforward.stop_all_tunnels.side_effect = lambda: cleanup_order.append("portforward")
-    mock_mutagen.terminate_session.side_effect = (
-        lambda name, ssh_wrapper_dir=None, host=None: cleanup_order.append("mutagen")
+    mock_mutagen.terminate_session.side_effect = lambda name, ssh_wrapper_dir=None, host=None: (
+        cleanup_order.append("mutagen")
     )
     mock_ssh.close.side_effect = lambda: cleanup_order.append("ssh")
     mock_ec2.terminate_instance.side_effect = lambda id: cleanup_order.append("ec2")
@@ -1510,6 +1517,60 @@ def test_list_command_filtered_region(campers_module, aws_credentials, caplog) -
     assert "i-test1" in output
 
 
+def test_list_command_prices_spot_instances(campers_module, aws_credentials, caplog) -> None:
+    """Test list command prices spot instances at the spot rate of their zone."""
+    import logging
+    from datetime import datetime
+    from unittest.mock import MagicMock, patch
+
+    from campers.providers.aws.pricing import calculate_monthly_cost
+
+    campers_instance = campers_module()
+
+    mock_ec2_manager = MagicMock()
+    mock_ec2_manager.list_instances.return_value = [
+        {
+            "instance_id": "i-spot1",
+            "camp_config": "train",
+            "state": "running",
+            "region": "us-east-1",
+            "availability_zone": "us-east-1b",
+            "instance_type": "t3.medium",
+            "market": "spot",
+            "launch_time": datetime.now(UTC),
+            "owner": "test-user",
+        }
+    ]
+    mock_ec2_manager.list_cache_volumes.return_value = []
+    mock_ec2_manager.get_volume_size.return_value = 50
+    mock_ec2_class = MagicMock(return_value=mock_ec2_manager)
+
+    mock_pricing_service = MagicMock()
+    mock_pricing_service.pricing_available = True
+    mock_pricing_service.get_spot_hourly_rate.return_value = 0.0125
+
+    with (
+        caplog.at_level(logging.INFO),
+        patch("campers.providers.aws.compute.EC2Manager", mock_ec2_class),
+        patch("campers_cli.get_provider", return_value={"compute": mock_ec2_class}),
+        patch("campers.lifecycle.get_user_identity", return_value="test-user"),
+        patch(
+            "campers.lifecycle.LifecycleManager._get_pricing_service_and_functions",
+            return_value=(
+                MagicMock(return_value=mock_pricing_service),
+                calculate_monthly_cost,
+                lambda cost: f"${cost:.2f}/month",
+            ),
+        ),
+    ):
+        campers_instance.list(region="us-east-1")
+
+    mock_pricing_service.get_spot_hourly_rate.assert_called_once_with(
+        "t3.medium", "us-east-1", "us-east-1b"
+    )
+    assert "$9.00/month (spot)" in caplog.text
+
+
 def test_list_command_no_instances(campers_module, aws_credentials, caplog) -> None:
     """Test list command displays message when no instances exist."""
     import logging
@@ -1533,6 +1594,58 @@ def test_list_command_no_instances(campers_module, aws_credentials, caplog) -> N
     assert "No campers-managed instances found" in output
 
 
+def test_list_command_shows_cache_volumes(campers_module, aws_credentials, caplog) -> None:
+    """Test list command shows detached cache volumes with size and cost."""
+    import logging
+    from unittest.mock import MagicMock, patch
+
+    campers_instance = campers_module()
+
+    mock_ec2_manager = MagicMock()
+    mock_ec2_manager.list_instances.return_value = []
+    mock_ec2_manager.list_cache_volumes.return_value = [
+        {
+            "volume_id": "vol-0cache",
+            "camp_config": "jupyter-lab",
+            "owner": "test-user",
+            "size": 100,
+            "state": "available",
+            "availability_zone": "us-east-1a",
+            "region": "us-east-1",
+            "instance_id": None,
+        }
+    ]
+    mock_ec2_class = MagicMock(return_value=mock_ec2_manager)
+
+    mock_pricing_service = MagicMock()
+    mock_pricing_service.pricing_available = True
+    mock_pricing_service.get_ebs_storage_rate.return_value = 0.08
+
+    with (
+        caplog.at_level(logging.INFO),
+        patch("campers.providers.aws.compute.EC2Manager", mock_ec2_class),
+        patch("campers_cli.get_provider", return_value={"compute": mock_ec2_class}),
+        patch("campers.lifecycle.get_user_identity", return_value="test-user"),
+        patch(
+            "campers.lifecycle.LifecycleManager._get_pricing_service_and_functions",
+            return_value=(
+                MagicMock(return_value=mock_pricing_service),
+                MagicMock(),
+                lambda cost: f"${cost:.2f}/month",
+            ),
+        ),
+    ):
+        campers_instance.list()
+
+    output = caplog.text
+    assert "No campers-managed instances found" not in output
+    assert "Cache volumes:" in output
+    assert "vol-0cache" in output
+    assert "100GB" in output
+    assert "$8.00/month" in output
+    assert "INSTANCE-ID" not in output
+
+
 def test_list_command_no_credentials(campers_module, caplog) -> None:
     """Test list command handles missing cloud provider credentials."""
     import logging
@@ -2509,3 +2622,61 @@ def test_launch_succeeds_when_instance_has_no_region_field(campers_module) -> No
             result = campers_instance.run("test-camp")
 
         assert result["instance_id"] == "i-test123"
+
+
+def test_run_with_profile_writes_trace_and_summary(campers_module, tmp_path, capsys) -> None:
+    """Test run(profile=path) writes a Chrome trace and prints the phase summary."""
+    import json
+    from unittest.mock import MagicMock, patch
+
+    campers_instance = campers_module()
+    campers_instance._config_loader = MagicMock()
+    campers_instance._config_loader.load_config.return_value = {"defaults": {}}
+    campers_instance._config_loader.get_camp_config.return_value = {
+        "region": "us-east-1",
+        "instance_type": "t3.medium",
+        "setup_script": "echo setup",
+        "command": "echo command",
+    }
+    campers_instance._config_loader.validate_config.return_value = None
+
+    mock_instance_details = {
+        "instance_id": "i-test123",
+        "public_ip": "203.0.113.1",
+        "state": "running",
+        "key_file": "/tmp/test.pem",
+        "security_group_id": "sg-test123",
+        "unique_id": "test123",
+    }
+    trace_path = tmp_path / "trace.json"
+
+    with (
+        patch("campers.providers.aws.compute.EC2Manager") as mock_ec2,
+        patch("campers_cli.get_provider") as mock_get_provider,
+    ):
+        mock_ec2_instance = MagicMock()
+        mock_ec2_instance.find_instances_by_name_or_id.return_value = []
+        mock_ec2_instance.launch_instance.return_value = mock_instance_details
+        mock_ec2.return_value = mock_ec2_instance
+        mock_get_provider.return_value = {"compute": mock_ec2}
+
+        mock_ssh_instance = MagicMock()
+        mock_ssh_instance.execute_with_input.return_value = (0, "")
+        mock_ssh_instance.filter_environment_variables.return_value = {}
+        mock_ssh_instance.build_command_with_env.side_effect = lambda cmd, env: cmd
+        mock_ssh_instance.execute_command.return_value = 0
+        campers_instance._ssh_manager_factory = lambda **kwargs: mock_ssh_instance
+
+        campers_instance.run(profile=str(trace_path))
+
+    trace = json.loads(trace_path.read_text())
+    phases = {
+        event["name"]
+        for event in trace["traceEvents"]
+        if event["ph"] == "X" and event["cat"] == "phase"
+    }
+
+    assert {"config", "provision", "ssh", "setup_script", "command"} <= phases
+    stderr = capsys.readouterr().err
+    assert "provision" in stderr
+    assert f"Trace written to {trace_path}" in stderr
@@ -0,0 +1,102 @@
+"""Unit tests for the pooled AWS client factory."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+from campers.providers.aws.client_factory import AWSClientFactory, default_client_config
+from campers.providers.aws.constants import BOTO3_MAX_POOL_CONNECTIONS
+
+
+def test_get_client_reuses_client_for_same_service_and_region() -> None:
+    """Repeated lookups return the same pooled client."""
+    with patch("boto3.client", side_effect=lambda *a, **k: MagicMock()) as mock_client:
+        first = AWSClientFactory().get_client("ec2", region_name="us-east-1")
+        second = AWSClientFactory().get_client("ec2", region_name="us-east-1")
+
+    assert first is second
+    assert mock_client.call_count == 1
+
+
+def test_get_client_separates_regions_and_endpoints() -> None:
+    """Clients are keyed by region and endpoint URL."""
+    with patch("boto3.client", side_effect=lambda *a, **k: MagicMock()):
+        factory = AWSClientFactory()
+        east = factory.get_client("ec2", region_name="us-east-1")
+        west = factory.get_client("ec2", region_name="us-west-2")
+        local = factory.get_client(
+            "ec2", region_name="us-east-1", endpoint_url="http://localhost:5000"
+        )
+
+    assert len({id(east), id(west), id(local)}) == 3
+
+
+def test_get_client_applies_pool_config() -> None:
+    """Pooled clients are built with the shared connection pool settings."""
+    with patch("boto3.client", return_value=MagicMock()) as mock_client:
+        AWSClientFactory().get_client("pricing", region_name="us-east-1")
+
+    config = mock_client.call_args.kwargs["config"]
+    assert config.max_pool_connections == BOTO3_MAX_POOL_CONNECTIONS
+    assert default_client_config().retries["mode"] == "adaptive"
+
+
+def test_get_client_with_custom_config_is_not_pooled() -> None:
+    """A caller-supplied config bypasses the pool."""
+    with patch("boto3.client", side_effect=lambda *a, **k: MagicMock()):
+        factory = AWSClientFactory()
+        first = factory.get_client("ec2", region_name="us-east-1", config=MagicMock())
+        second = factory.get_client("ec2", region_name="us-east-1")
+
+    assert first is not second
+
+
+def test_get_client_is_shared_across_threads() -> None:
+    """Concurrent first lookups build a single client."""
+    results = []
+
+    with patch("boto3.client", side_effect=lambda *a, **k: MagicMock()) as mock_client:
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    AWSClientFactory().get_client("ec2", region_name="eu-west-1")
+                )
+            )
+            for _ in range(8)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+    assert mock_client.call_count == 1
+    assert all(client is results[0] for client in results)
+
+
+def test_get_resource_is_cached_per_thread() -> None:
+    """Resources are not shared between threads."""
+    results = []
+
+    with patch("boto3.resource", side_effect=lambda *a, **k: MagicMock()):
+        factory = AWSClientFactory()
+        main = factory.get_resource("ec2", region_name="us-east-1")
+        worker = threading.Thread(
+            target=lambda: results.append(factory.get_resource("ec2", region_name="us-east-1"))
+        )
+        worker.start()
+        worker.join()
+
+        assert factory.get_resource("ec2", region_name="us-east-1") is main
+
+    assert results[0] is not main
+
+
+def test_clear_drops_pooled_clients() -> None:
+    """After clear() a new client is built."""
+    with patch("boto3.client", side_effect=lambda *a, **k: MagicMock()):
+        first = AWSClientFactory().get_client("sts", region_name="us-east-1")
+        AWSClientFactory.clear()
+        second = AWSClientFactory().get_client("sts", region_name="us-east-1")
+
+    assert first is not second
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Any
 
 import pytest
 import yaml
@@ -301,6 +302,245 @@ class TestConfigLoader:
         loader = ConfigLoader()
         loader.validate_config(config)
 
+    def test_validate_config_pull_paths_valid(self) -> None:
+        config = {
+            "region": "us-east-1",
+            "instance_type": "t3.medium",
+            "disk_size": 50,
+            "pull_paths": [
+                {
+                    "remote": "~/project/checkpoints",
+                    "local": "./checkpoints",
+                    "ignore": ["*.tmp"],
+                    "max_file_size": "2GB",
+                    "scan_interval": 60,
+                }
+            ],
+        }
+
+        loader = ConfigLoader()
+        loader.validate_config(config)
+
+    def test_validate_config_pull_paths_missing_local(self) -> None:
+        config = {
+            "region": "us-east-1",
+            "instance_type": "t3.medium",
+            "disk_size": 50,
+            "pull_paths": [{"remote": "~/project/logs"}],
+        }
+
+        loader = ConfigLoader()
+
+        with pytest.raises(
+            ValueError,
+            match="pull_paths entry must have both 'local' and 'remote' keys",
+        ):
+            loader.validate_config(config)
+
+    def test_validate_config_pull_paths_invalid_scan_interval(self) -> None:
+        config = {
+            "region": "us-east-1",
+            "instance_type": "t3.medium",
+            "disk_size": 50,
+            "pull_paths": [{"remote": "~/logs", "local": "./logs", "scan_interval": 0}],
+        }
+
+        loader = ConfigLoader()
+
+        with pytest.raises(ValueError, match="scan_interval must be a positive integer"):
+            loader.validate_config(config)
+
+    def test_validate_config_pull_paths_invalid_max_file_size(self) -> None:
+        config = {
+            "region": "us-east-1",
+            "instance_type": "t3.medium",
+            "disk_size": 50,
+            "pull_paths": [{"remote": "~/logs", "local": "./logs", "max_file_size": "huge"}],
+        }
+
+        loader = ConfigLoader()
+
+        with pytest.raises(ValueError, match="max_file_size must be a size"):
+            loader.validate_config(config)
+
+    def test_validate_config_datasets_valid(self) -> None:
+        config = {
+            "region": "us-east-1",
+            "instance_type": "t3.medium",
+            "disk_size": 50,
+            "dataset_concurrency": 16,
+            "datasets": [{"source": "s3://my-bucket/imagenet/", "target": "~/data/imagenet"}],
+        }
+
+        loader = ConfigLoader()
+        loader.validate_config(config)
+
+    def test_validate_config_datasets_requires_s3_source(self) -> None:
+        config = {
+            "region": "us-east-1",
+            "instance_type": "t3.medium",
+            "disk_size": 50,
+            "datasets": [{"source": "https://example.com/data", "target": "~/data"}],
+        }
+
+        loader = ConfigLoader()
+
+        with pytest.raises(ValueError, match="datasets source must be an s3:// URI"):
+            loader.validate_config(config)
+
+    def test_validate_config_datasets_missing_target(self) -> None:
+        config = {
+            "region": "us-east-1",
+            "instance_type": "t3.medium",
+            "disk_size": 50,
+            "datasets": [{"source": "s3://my-bucket/data"}],
+        }
+
+        loader = ConfigLoader()
+
+        with pytest.raises(
+            ValueError,
+            match="datasets entry must have both 'source' and 'target' keys",
+        ):
+            loader.validate_config(config)
+
+    def test_validate_config_cache_volume_valid(self) -> None:
+        config = {
+            "region": "us-east-1",
+            "instance_type": "t3.medium",
+            "disk_size": 50,
+            "cache_volume": {"size": 200, "mount": "/mnt/cache"},
+        }
+
+        loader = ConfigLoader()
+        loader.validate_config(config)
+        loader.validate_config({**config, "cache_volume": 100})
+
+    def test_validate_config_cache_volume_invalid_size(self) -> None:
+        config = {
+            "region": "us-east-1",
+            "instance_type": "t3.medium",
+            "disk_size": 50,
+            "cache_volume": {"mount": "/mnt/cache"},
+        }
+
+        loader = ConfigLoader()
+
+        with pytest.raises(ValueError, match="cache_volume must be a size in GB"):
+            loader.validate_config(config)
+
+    def test_validate_config_cache_volume_relative_mount(self) -> None:
+        config = {
+            "region": "us-east-1",
+            "instance_type": "t3.medium",
+            "disk_size": 50,
+            "cache_volume": {"size": 100, "mount": "cache"},
+        }
+
+        loader = ConfigLoader()
+
+        with pytest.raises(ValueError, match="mount must be an absolute path"):
+            loader.validate_config(config)
+
+    def test_validate_config_market(self) -> None:
+        config = {
+            "region": "us-east-1",
+            "instance_type": "t3.medium",
+            "disk_size": 50,
+            "market": "spot-with-fallback",
+        }
+
+        loader = ConfigLoader()
+        loader.validate_config(config)
+
+        with pytest.raises(ValueError, match="market must be one of: on-demand, spot"):
+            loader.validate_config({**config, "market": "reserved"})
+
+    def test_validate_config_reverse_ports_valid(self) -> None:
+        config = {
+            "region": "us-east-1",
+            "instance_type": "t3.medium",
+            "disk_size": 50,
+            "reverse_ports": [5432, "9229:9230"],
+        }
+
+        loader = ConfigLoader()
+        loader.validate_config(config)
+
+    @pytest.mark.parametrize(
+        ("reverse_ports", "message"),
+        [
+            (5432, "reverse_ports must be a list"),
+            (["5432:70000"], "ports entries must be between 1 and 65535"),
+            (["db"], "Invalid port: db"),
+        ],
+    )
+    def test_validate_config_reverse_ports_invalid(
+        self, reverse_ports: object, message: str
+    ) -> None:
+        config = {
+            "region": "us-east-1",
+            "instance_type": "t3.medium",
+            "disk_size": 50,
+            "reverse_ports": reverse_ports,
+        }
+
+        loader = ConfigLoader()
+
+        with pytest.raises(ValueError, match=message):
+            loader.validate_config(config)
+
+    @pytest.mark.parametrize("socks_proxy", [0, "1080", True, 70000])
+    def test_validate_config_socks_proxy_invalid(self, socks_proxy: object) -> None:
+        config = {
+            "region": "us-east-1",
+            "instance_type": "t3.medium",
+            "disk_size": 50,
+            "socks_proxy": socks_proxy,
+        }
+
+        loader = ConfigLoader()
+
+        with pytest.raises(ValueError, match="socks_proxy must be a local port number"):
+            loader.validate_config(config)
+
+        loader.validate_config({**config, "socks_proxy": 1080})
+
+    def test_validate_config_auto_forward_valid(self) -> None:
+        config = {
+            "region": "us-east-1",
+            "instance_type": "t3.medium",
+            "disk_size": 50,
+            "auto_forward": {"allow": ["8000-8999", 5173], "deny": [8080]},
+        }
+
+        loader = ConfigLoader()
+        loader.validate_config(config)
+        loader.validate_config({**config, "auto_forward": True})
+
+    @pytest.mark.parametrize(
+        ("auto_forward", "message"),
+        [
+            ("yes", "auto_forward must be a boolean or a dictionary"),
+            ({"only": [8888]}, "Unknown auto_forward keys: only"),
+            ({"allow": 8888}, "auto_forward allow must be a list"),
+            ({"deny": ["9000-8000"]}, "Lower bound exceeds upper bound"),
+            ({"allow": ["80-70000"]}, "Port must be between 1 and 65535"),
+        ],
+    )
+    def test_validate_config_auto_forward_invalid(self, auto_forward: object, message: str) -> None:
+        config = {
+            "region": "us-east-1",
+            "instance_type": "t3.medium",
+            "disk_size": 50,
+            "auto_forward": auto_forward,
+        }
+
+        loader = ConfigLoader()
+
+        with pytest.raises(ValueError, match=message):
+            loader.validate_config(config)
+
     def test_get_camp_config_with_built_in_defaults(self) -> None:
         config = {"defaults": {}}
 
@@ -1364,6 +1604,40 @@ class TestConfigLoaderVariableSubstitution:
 
         assert "ansible_playbook must be a string" in str(exc_info.value)
 
+    def test_ansible_settings_valid(self) -> None:
+        config = {
+            "region": "us-east-1",
+            "instance_type": "t3.medium",
+            "disk_size": 50,
+            "ansible": {"strategy": "free", "forks": 10, "pipelining": False, "control_persist": 0},
+        }
+
+        loader = ConfigLoader()
+        loader.validate_config(config)
+
+    @pytest.mark.parametrize(
+        ("settings", "message"),
+        [
+            ("fast", "ansible must be a dictionary"),
+            ({"mitogen": True}, "Unknown ansible settings: mitogen"),
+            ({"strategy": "debug"}, "ansible strategy must be one of: linear, free"),
+            ({"pipelining": "yes"}, "ansible pipelining must be a boolean"),
+            ({"forks": 0}, "ansible forks must be an integer >= 1"),
+            ({"control_persist": -1}, "ansible control_persist must be an integer >= 0"),
+        ],
+    )
+    def test_ansible_settings_invalid(self, settings: Any, message: str) -> None:
+        config = {
+            "region": "us-east-1",
+            "instance_type": "t3.medium",
+            "disk_size": 50,
+            "ansible": settings,
+        }
+
+        loader = ConfigLoader()
+        with pytest.raises(ValueError, match=message):
+            loader.validate_config(config)
+
     def test_public_ports_default_is_empty_list(self) -> None:
         loader = ConfigLoader()
         config = loader.load_config("/nonexistent/path/campers.yaml")
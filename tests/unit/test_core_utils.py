@@ -1,6 +1,6 @@
 """Tests for campers.core.utils utility functions."""
 
-from campers.core.utils import get_instance_id
+from campers.core.utils import get_instance_id, normalize_cache_volume_config
 
 
 class TestGetInstanceId:
@@ -56,3 +56,20 @@ class TestGetInstanceId:
         instance_details = {"InstanceId": "0", "instance_id": "i-fallback"}
         result = get_instance_id(instance_details)
         assert result == "0"
+
+
+class TestNormalizeCacheVolumeConfig:
+    """Tests for normalize_cache_volume_config function."""
+
+    def test_size_shorthand_uses_default_mount(self) -> None:
+        """Test an integer is treated as the size with the default mount."""
+        assert normalize_cache_volume_config(100) == {"size": 100, "mount": "/mnt/cache"}
+
+    def test_dictionary_keeps_custom_mount(self) -> None:
+        """Test a dictionary keeps its mount point."""
+        result = normalize_cache_volume_config({"size": 50, "mount": "/cache"})
+        assert result == {"size": 50, "mount": "/cache"}
+
+    def test_returns_none_when_not_configured(self) -> None:
+        """Test None is returned when no cache volume is configured."""
+        assert normalize_cache_volume_config(None) is None
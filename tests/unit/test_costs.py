@@ -0,0 +1,336 @@
+"""Unit tests for cost accrual and the cost ledger behind `campers costs`."""
+
+import json
+import logging
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from campers.core.costs import (
+    CostMeter,
+    Interval,
+    accrued_cost,
+    build_intervals,
+    current_states,
+    load_transitions,
+    log_costs,
+    record_transition,
+    split_by_week,
+    summarize_costs,
+)
+
+MONDAY = datetime(2026, 10, 12, tzinfo=UTC)
+
+
+class FakePricing:
+    """Pricing provider with fixed rates for t3.medium and EBS in us-east-1."""
+
+    pricing_available = True
+
+    def get_instance_price(self, instance_type: str, region: str) -> float | None:
+        """Return $0.10/hour for t3.medium in us-east-1."""
+        return 0.10 if (instance_type, region) == ("t3.medium", "us-east-1") else None
+
+    def get_spot_price(
+        self, instance_type: str, region: str, availability_zone: str | None = None
+    ) -> float | None:
+        """Return $0.03/hour spot for t3.medium in us-east-1."""
+        return 0.03 if (instance_type, region) == ("t3.medium", "us-east-1") else None
+
+    def get_storage_price(self, region: str) -> float:
+        """Return $0.072 per GB-month, i.e. $0.0001 per GB-hour."""
+        return 0.072
+
+
+@pytest.fixture
+def ledger(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Enable the ledger and return its path inside the test's directory."""
+    monkeypatch.setenv("CAMPERS_DIR", str(tmp_path))
+    monkeypatch.delenv("CAMPERS_DISABLE_COST_LEDGER")
+    return tmp_path / "history" / "costs.jsonl"
+
+
+def transition(instance_id: str, state: str, hours: float, **attributes: Any) -> dict[str, Any]:
+    """Build a transition `hours` after MONDAY."""
+    return {
+        "instance_id": instance_id,
+        "state": state,
+        "at": MONDAY + timedelta(hours=hours),
+        **attributes,
+    }
+
+
+def test_record_and_load_transitions(ledger: Path) -> None:
+    """Test transitions round-trip through the ledger with aware timestamps."""
+    record_transition(
+        "i-1", "running", at=datetime(2026, 10, 12, 9, 0), camp="dev", owner=None, volume=3
+    )
+    record_transition("i-1", "stopped")
+    ledger.open("a").write("not json\n")
+
+    first, second = load_transitions()
+
+    assert first == {
+        "instance_id": "i-1",
+        "state": "running",
+        "at": datetime(2026, 10, 12, 9, 0, tzinfo=UTC),
+        "camp": "dev",
+    }
+    assert second["state"] == "stopped"
+    assert second["at"].tzinfo is not None
+
+
+def test_ledger_disabled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test CAMPERS_DISABLE_COST_LEDGER=1 keeps the ledger from being written."""
+    monkeypatch.setenv("CAMPERS_DIR", str(tmp_path))
+
+    record_transition("i-1", "running")
+
+    assert not (tmp_path / "history").exists()
+
+
+def test_ledger_ignores_history_switch(ledger: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test disabling the run history keeps recording the ledger."""
+    monkeypatch.setenv("CAMPERS_DISABLE_HISTORY", "1")
+
+    record_transition("i-1", "running")
+
+    assert [t["instance_id"] for t in load_transitions()] == ["i-1"]
+
+
+def test_build_intervals_follows_state_changes() -> None:
+    """Test intervals span between transitions and inherit earlier attributes."""
+    transitions = [
+        transition("i-1", "stopped", 10),
+        transition("i-1", "running", 0, camp="dev", volume_size_gb=100),
+        transition("i-1", "running", 30, instance_type="t3.large"),
+        transition("i-1", "terminated", 40),
+        transition("i-2", "running", 45, camp="other"),
+    ]
+
+    intervals = build_intervals(transitions, until=MONDAY + timedelta(hours=50))
+
+    assert [(i.instance_id, i.state, i.hours) for i in intervals] == [
+        ("i-1", "running", 10.0),
+        ("i-1", "stopped", 20.0),
+        ("i-1", "running", 10.0),
+        ("i-2", "running", 5.0),
+    ]
+    assert intervals[2].attributes == {
+        "camp": "dev",
+        "volume_size_gb": 100,
+        "instance_type": "t3.large",
+    }
+
+
+def test_current_states_checks_open_instances() -> None:
+    """Test only instances left running or stopped are looked up, once per region."""
+    transitions = [
+        transition("i-1", "running", 0, region="us-east-1"),
+        transition("i-2", "running", 0, region="us-east-1"),
+        transition("i-3", "running", 0, region="eu-west-1"),
+        transition("i-3", "terminated", 5),
+        transition("i-4", "stopped", 0),
+    ]
+    listed = {"us-east-1": [{"instance_id": "i-1", "state": "stopping"}]}
+    queried = []
+
+    def list_instances(region: str) -> list[dict[str, Any]]:
+        queried.append(region)
+        return listed[region]
+
+    assert current_states(transitions, list_instances) == {"i-1": "stopped", "i-2": "terminated"}
+    assert queried == ["us-east-1"]
+
+
+def test_unverified_latest_interval_is_not_billed() -> None:
+    """Test an instance gone outside campers stops accruing at its last recorded change."""
+    transitions = [
+        transition("i-1", "running", 0, camp="dev", region="us-east-1"),
+        transition("i-1", "stopped", 10),
+        transition("i-2", "running", 0, camp="dev", region="us-east-1"),
+    ]
+
+    intervals = build_intervals(
+        transitions,
+        until=MONDAY + timedelta(days=30),
+        states={"i-1": "terminated", "i-2": "running"},
+    )
+    rows = summarize_costs(intervals, None)
+
+    assert [(i.instance_id, i.state, i.verified) for i in intervals] == [
+        ("i-1", "running", True),
+        ("i-1", "stopped", False),
+        ("i-2", "running", True),
+    ]
+    assert rows[(date(2026, 10, 12), "dev", "unknown")]["stopped_hours"] == 0
+    assert rows[(date(2026, 10, 12), "dev", "unknown")]["verified"] is False
+    assert rows[(date(2026, 11, 2), "dev", "unknown")]["verified"] is True
+
+
+def test_split_by_week_at_monday_midnight() -> None:
+    """Test intervals crossing Monday 00:00 UTC are split into weeks."""
+    interval = Interval(
+        "i-1", "running", MONDAY - timedelta(hours=6), MONDAY + timedelta(days=8), {}
+    )
+
+    pieces = split_by_week(interval)
+
+    assert [(p.start, p.end) for p in pieces] == [
+        (MONDAY - timedelta(hours=6), MONDAY),
+        (MONDAY, MONDAY + timedelta(days=7)),
+        (MONDAY + timedelta(days=7), MONDAY + timedelta(days=8)),
+    ]
+
+
+def test_accrued_cost() -> None:
+    """Test running accrues compute and storage, stopped accrues storage only."""
+    assert accrued_cost("running", 10, 0.10, 0.072, 100) == pytest.approx(1.10)
+    assert accrued_cost("stopped", 10, None, 0.072, 100) == pytest.approx(0.10)
+    assert accrued_cost("running", 10, None, 0.072, 100) is None
+
+
+def test_cost_meter_accrues_since_launch() -> None:
+    """Test the live meter accrues the running rate since launch."""
+    meter = CostMeter(MONDAY, hourly_rate=0.10, storage_rate=0.072, volume_size_gb=100)
+
+    assert meter.cost(MONDAY + timedelta(hours=2)) == pytest.approx(0.22)
+    assert meter.cost(MONDAY - timedelta(hours=1)) == 0
+    assert CostMeter(MONDAY, None, 0.072, 100).cost() is None
+
+
+def test_summarize_costs_by_week_camp_and_user() -> None:
+    """Test rows are totalled per week, camp and user and honour filters."""
+    attributes = {
+        "camp": "dev",
+        "owner": "ana@example.com",
+        "region": "us-east-1",
+        "instance_type": "t3.medium",
+        "volume_size_gb": 100,
+    }
+    intervals = [
+        Interval(
+            "i-1", "running", MONDAY - timedelta(hours=2), MONDAY + timedelta(hours=8), attributes
+        ),
+        Interval(
+            "i-2",
+            "stopped",
+            MONDAY,
+            MONDAY + timedelta(hours=10),
+            {**attributes, "camp": "gpu", "owner": "bo@example.com"},
+        ),
+        Interval("i-3", "running", MONDAY, MONDAY + timedelta(hours=1), {"camp": "dev"}),
+    ]
+
+    rows = summarize_costs(intervals, FakePricing())
+
+    previous_week = date(2026, 10, 5)
+    this_week = date(2026, 10, 12)
+    assert rows[(previous_week, "dev", "ana@example.com")]["cost"] == pytest.approx(0.22)
+    assert rows[(this_week, "dev", "ana@example.com")]["running_hours"] == pytest.approx(8)
+    assert rows[(this_week, "dev", "ana@example.com")]["cost"] == pytest.approx(0.88)
+    assert rows[(this_week, "gpu", "bo@example.com")]["stopped_hours"] == pytest.approx(10)
+    assert rows[(this_week, "gpu", "bo@example.com")]["cost"] == pytest.approx(0.10)
+    assert rows[(this_week, "dev", "unknown")]["complete"] is False
+
+    filtered = summarize_costs(
+        intervals, FakePricing(), camp_name="dev", user="ana@example.com", since=this_week
+    )
+    assert list(filtered) == [(this_week, "dev", "ana@example.com")]
+
+
+def test_summarize_costs_prices_spot_hours_at_spot_rate() -> None:
+    """Test intervals recorded with market spot accrue the spot rate."""
+    attributes = {
+        "camp": "train",
+        "region": "us-east-1",
+        "instance_type": "t3.medium",
+        "volume_size_gb": 0,
+        "market": "spot",
+    }
+    intervals = [Interval("i-1", "running", MONDAY, MONDAY + timedelta(hours=10), attributes)]
+
+    rows = summarize_costs(intervals, FakePricing())
+
+    assert rows[(date(2026, 10, 12), "train", "unknown")]["cost"] == pytest.approx(0.30)
+
+
+def test_log_costs_table(ledger: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """Test `campers costs` prints one row per week, camp and user with a total."""
+    now = datetime.now(UTC)
+    record_transition(
+        "i-1",
+        "running",
+        at=now - timedelta(hours=2),
+        camp="dev",
+        owner="ana@example.com",
+        region="us-east-1",
+        instance_type="t3.medium",
+        volume_size_gb=0,
+    )
+    record_transition("i-1", "stopped", at=now - timedelta(hours=1))
+
+    with caplog.at_level(logging.INFO):
+        log_costs(FakePricing())
+
+    lines = caplog.text.splitlines()
+    assert any("dev" in line and "ana@example.com" in line for line in lines)
+    assert "Total: $0.10" in caplog.text
+
+
+def test_log_costs_without_ledger(ledger: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """Test an empty ledger is reported plainly."""
+    with caplog.at_level(logging.INFO):
+        log_costs(None)
+
+    assert "No recorded instance costs found" in caplog.text
+
+
+def test_run_and_cleanup_record_transitions(campers: Any, write_config: Any, ledger: Path) -> None:
+    """Test a run records its instance running and the exit cleanup records it stopped."""
+    write_config({"defaults": {"region": "us-east-1", "command": "echo hi", "on_exit": "stop"}})
+
+    campers.run()
+
+    states = [json.loads(line) for line in ledger.open()]
+    assert states[0]["instance_id"] == "i-1234567890abcdef0"
+    assert states[0]["state"] == "running"
+    assert states[0]["region"] == "us-east-1"
+    assert [state["state"] for state in states[1:]] in ([], ["stopped"], ["terminated"])
+
+
+def test_log_costs_marks_unverified_rows(ledger: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """Test `campers costs` flags instances the provider no longer lists."""
+    now = datetime.now(UTC)
+    record_transition("i-1", "running", at=now - timedelta(hours=2), region="us-east-1")
+
+    with caplog.at_level(logging.INFO):
+        log_costs(FakePricing(), list_instances=lambda region: [])
+
+    assert "$0.00?" in caplog.text
+    assert "changed state outside campers" in caplog.text
+
+
+def test_costs_command_checks_instances_with_provider(
+    campers: Any,
+    campers_module: Any,
+    mock_ec2_manager: Any,
+    ledger: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test `campers costs` looks up the recorded instances before billing them."""
+    pricing = FakePricing()
+    pricing.close = lambda: None
+    campers_module.get_provider.return_value["pricing_service"] = lambda: pricing
+    mock_ec2_manager.list_instances.return_value = []
+    record_transition(
+        "i-1", "running", at=datetime.now(UTC) - timedelta(hours=1), region="us-east-1"
+    )
+
+    with caplog.at_level(logging.INFO):
+        campers.costs()
+
+    mock_ec2_manager.list_instances.assert_called_once_with(region_filter="us-east-1")
+    assert "changed state outside campers" in caplog.text
@@ -0,0 +1,273 @@
+"""Tests for S3 dataset planning and on-instance staging."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from campers.providers.aws.datasets import S3DatasetPlanner, parse_s3_uri
+from campers.services import dataset_stager
+from campers.services.datasets import DatasetManager, parse_stager_summary
+
+OBJECTS = {
+    "/train/a.bin": bytes(range(256)) * 40,
+    "/train/b.bin": b"campers" * 10,
+}
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Serve OBJECTS with HTTP Range support, counting requests per path.
+
+    Paths in `truncate` get one chunked response cut off mid-chunk.
+    """
+
+    requests: list[str] = []
+    truncate: set[str] = set()
+
+    def do_GET(self) -> None:  # noqa: N802
+        body = OBJECTS.get(self.path)
+        RangeHandler.requests.append(self.path)
+
+        if body is None:
+            self.send_error(404)
+            return
+
+        range_header = self.headers.get("Range")
+        if range_header:
+            start, end = (int(v) for v in range_header.split("=")[1].split("-"))
+            body = body[start : end + 1]
+            self.send_response(206)
+        else:
+            self.send_response(200)
+
+        if self.path in RangeHandler.truncate:
+            RangeHandler.truncate.discard(self.path)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(body), body[: len(body) // 2]))
+            self.close_connection = True
+            return
+
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def object_server():
+    """Run a local HTTP server standing in for pre-signed S3 URLs.
+
+    Yields
+    ------
+    str
+        Base URL of the server
+    """
+    RangeHandler.requests = []
+    RangeHandler.truncate = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+
+    server.shutdown()
+    server.server_close()
+
+
+def make_plan(base_url: str, target: str, etag_override: str | None = None) -> dict:
+    """Build a stager plan for OBJECTS served by object_server."""
+    return {
+        "concurrency": 4,
+        "part_size": 1000,
+        "datasets": [
+            {
+                "target": target,
+                "objects": [
+                    {
+                        "path": path.lstrip("/"),
+                        "url": f"{base_url}{path}",
+                        "size": len(body),
+                        "etag": etag_override or hashlib.md5(body).hexdigest(),
+                    }
+                    for path, body in OBJECTS.items()
+                ],
+            }
+        ],
+    }
+
+
+def test_parse_s3_uri() -> None:
+    assert parse_s3_uri("s3://bucket/path/to/data") == ("bucket", "path/to/data")
+    assert parse_s3_uri("s3://bucket") == ("bucket", "")
+
+    with pytest.raises(ValueError, match="s3:// URI"):
+        parse_s3_uri("gs://bucket/data")
+
+
+def test_planner_lists_prefix_and_presigns_urls() -> None:
+    with mock_aws():
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket="datasets-bucket")
+        s3.put_object(Bucket="datasets-bucket", Key="imagenet/train/a.bin", Body=b"abc")
+        s3.put_object(Bucket="datasets-bucket", Key="imagenet/val/b.bin", Body=b"defg")
+        s3.put_object(Bucket="datasets-bucket", Key="other/c.bin", Body=b"x")
+
+        planner = S3DatasetPlanner("us-east-1", client_factory=boto3.client)
+        plan = planner.build_plan(
+            [{"source": "s3://datasets-bucket/imagenet", "target": "~/data"}],
+            concurrency=8,
+            part_size=1024,
+        )
+
+    objects = plan["datasets"][0]["objects"]
+    assert plan["concurrency"] == 8
+    assert plan["datasets"][0]["target"] == "~/data"
+    assert sorted(o["path"] for o in objects) == ["train/a.bin", "val/b.bin"]
+    assert all("Signature" in o["url"] or "X-Amz-Signature" in o["url"] for o in objects)
+    assert {o["path"]: o["etag"] for o in objects}["train/a.bin"] == hashlib.md5(b"abc").hexdigest()
+
+
+def test_planner_single_object_and_missing_source() -> None:
+    with mock_aws():
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket="datasets-bucket")
+        s3.put_object(Bucket="datasets-bucket", Key="weights/model.pt", Body=b"weights")
+
+        planner = S3DatasetPlanner("us-east-1", client_factory=boto3.client)
+        objects = planner.list_objects("s3://datasets-bucket/weights/model.pt")
+
+        with pytest.raises(ValueError, match="No objects found"):
+            planner.list_objects("s3://datasets-bucket/missing/")
+
+    assert [(o["path"], o["size"]) for o in objects] == [("model.pt", 7)]
+
+
+def test_stager_downloads_in_parts_and_skips_unchanged(object_server, tmp_path) -> None:
+    target = tmp_path / "data"
+    plan = make_plan(object_server, str(target))
+
+    summary = dataset_stager.stage(plan)
+
+    assert summary["downloaded"] == 2
+    assert summary["failed"] == []
+    assert (target / "train" / "a.bin").read_bytes() == OBJECTS["/train/a.bin"]
+    assert (target / "train" / "b.bin").read_bytes() == OBJECTS["/train/b.bin"]
+    assert RangeHandler.requests.count("/train/a.bin") == 11
+
+    manifest = json.loads((target / dataset_stager.MANIFEST_NAME).read_text())
+    assert set(manifest) == {"train/a.bin", "train/b.bin"}
+
+    RangeHandler.requests = []
+    summary = dataset_stager.stage(plan)
+
+    assert summary["downloaded"] == 0
+    assert summary["skipped"] == 2
+    assert RangeHandler.requests == []
+
+
+def test_stager_rejects_checksum_mismatch(object_server, tmp_path) -> None:
+    target = tmp_path / "data"
+    plan = make_plan(object_server, str(target), etag_override="0" * 32)
+
+    summary = dataset_stager.stage(plan)
+
+    assert sorted(summary["failed"]) == ["train/a.bin", "train/b.bin"]
+    assert not (target / "train" / "a.bin").exists()
+
+
+def test_stager_rejects_paths_outside_target(object_server, tmp_path) -> None:
+    plan = make_plan(object_server, str(tmp_path / "data"))
+    plan["datasets"][0]["objects"][0]["path"] = "../escape.bin"
+
+    summary = dataset_stager.stage(plan)
+
+    assert summary["failed"] == ["../escape.bin"]
+    assert not (tmp_path / "escape.bin").exists()
+
+
+def test_stager_retries_truncated_response(object_server, tmp_path) -> None:
+    target = tmp_path / "data"
+    plan = make_plan(object_server, str(target))
+    RangeHandler.truncate = {"/train/b.bin"}
+
+    summary = dataset_stager.stage(plan)
+
+    assert summary["failed"] == []
+    assert (target / "train" / "b.bin").read_bytes() == OBJECTS["/train/b.bin"]
+    assert RangeHandler.requests.count("/train/b.bin") == 2
+
+
+def test_download_object_waits_for_parts_before_closing(monkeypatch, tmp_path) -> None:
+    running = []
+    writes = []
+
+    def fetch_range(url: str, fd: int, start: int, end: int) -> None:
+        if start == 0:
+            raise OSError("range 0-999 failed")
+
+        running.append(start)
+        time.sleep(0.2)
+        writes.append(os.fstat(fd).st_size)
+        running.remove(start)
+
+    monkeypatch.setattr(dataset_stager, "_fetch_range", fetch_range)
+    obj = {"path": "a.bin", "url": "http://unused", "size": 10000, "etag": "x-2"}
+
+    with ThreadPoolExecutor(max_workers=3) as part_pool:
+        with pytest.raises(OSError, match="range 0-999"):
+            dataset_stager.download_object(obj, str(tmp_path / "a.bin"), 1000, part_pool)
+
+        assert running == []
+
+    assert writes and all(size == 10000 for size in writes)
+    assert len(writes) < 9
+
+
+def test_dataset_manager_runs_stager_over_ssh() -> None:
+    planner = Mock()
+    planner.build_plan.return_value = {"datasets": []}
+    ssh_manager = Mock()
+    summary = {"downloaded": 3, "skipped": 1, "bytes": 42, "failed": [], "seconds": 1.5}
+    ssh_manager.execute_with_input.return_value = (
+        0,
+        f"staged x\n{dataset_stager.SUMMARY_PREFIX}{json.dumps(summary)}",
+    )
+
+    result = DatasetManager(planner).stage(
+        ssh_manager, [{"source": "s3://b/k", "target": "~/d"}], concurrency=2, part_size=10
+    )
+
+    assert result == summary
+    planner.build_plan.assert_called_once_with([{"source": "s3://b/k", "target": "~/d"}], 2, 10)
+    command, input_data = ssh_manager.execute_with_input.call_args.args
+    assert command.startswith("python3 -c ")
+    assert json.loads(input_data) == {"datasets": []}
+
+
+def test_dataset_manager_raises_on_failed_objects() -> None:
+    planner = Mock()
+    planner.build_plan.return_value = {"datasets": []}
+    ssh_manager = Mock()
+    summary = {"downloaded": 0, "skipped": 0, "bytes": 0, "failed": ["a.bin"], "seconds": 1}
+    ssh_manager.execute_with_input.return_value = (
+        1,
+        f"{dataset_stager.SUMMARY_PREFIX}{json.dumps(summary)}",
+    )
+
+    with pytest.raises(RuntimeError, match="failed for 1 object"):
+        DatasetManager(planner).stage(ssh_manager, [{"source": "s3://b/k", "target": "~/d"}])
+
+
+def test_parse_stager_summary_missing() -> None:
+    assert parse_stager_summary("Traceback (most recent call last):") is None
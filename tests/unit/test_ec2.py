@@ -2,7 +2,7 @@ import os
 import time
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 from botocore.exceptions import ClientError
@@ -1215,3 +1215,117 @@ def test_start_instance_returns_none_key_file_when_unique_id_missing(
     result = ec2_manager.start_instance(instance_id)
 
     assert result["key_file"] is None
+
+
+def test_launch_spot_instance(ec2_manager, cleanup_keys, registered_ami):
+    """Verify market: spot launches a persistent spot instance that stops on interruption."""
+    config = {
+        "instance_type": "t3.micro",
+        "disk_size": 20,
+        "region": "us-east-1",
+        "camp_name": "test-spot",
+        "ami": {"image_id": registered_ami},
+        "market": "spot",
+    }
+    original_create_instances = ec2_manager.ec2_resource.create_instances
+
+    with patch.object(
+        ec2_manager.ec2_resource, "create_instances", side_effect=original_create_instances
+    ) as create_instances:
+        result = ec2_manager.launch_instance(config)
+        cleanup_keys.append(result["key_file"])
+
+    market_options = create_instances.call_args.kwargs["InstanceMarketOptions"]
+    assert market_options["SpotOptions"]["InstanceInterruptionBehavior"] == "stop"
+    assert result["market"] == "spot"
+
+    [listed] = ec2_manager.list_instances(region_filter="us-east-1")
+    assert listed["market"] == "spot"
+    assert listed["availability_zone"].startswith("us-east-1")
+
+
+def test_launch_spot_with_fallback_uses_on_demand(ec2_manager, cleanup_keys, registered_ami):
+    """Verify spot-with-fallback launches on-demand when spot capacity is unavailable."""
+    from campers.providers.exceptions import ProviderAPIError
+
+    config = {
+        "instance_type": "t3.micro",
+        "disk_size": 20,
+        "region": "us-east-1",
+        "camp_name": "test-fallback",
+        "ami": {"image_id": registered_ami},
+        "market": "spot-with-fallback",
+    }
+    original_create_instances = ec2_manager.ec2_resource.create_instances
+
+    def create_instances(**kwargs):
+        if "InstanceMarketOptions" in kwargs:
+            raise ClientError(
+                {"Error": {"Code": "InsufficientInstanceCapacity", "Message": "no capacity"}},
+                "RunInstances",
+            )
+
+        return original_create_instances(**kwargs)
+
+    with patch.object(ec2_manager.ec2_resource, "create_instances", side_effect=create_instances):
+        result = ec2_manager.launch_instance(config)
+        cleanup_keys.append(result["key_file"])
+
+        config["market"] = "spot"
+
+        with pytest.raises(ProviderAPIError, match="InsufficientInstanceCapacity"):
+            ec2_manager.launch_instance(config)
+
+    assert result["market"] == "on-demand"
+
+
+def test_cancel_spot_request(ec2_manager):
+    """Verify the persistent spot request is cancelled so EC2 does not replace the instance."""
+    response = ec2_manager.ec2_client.request_spot_instances(
+        Type="persistent",
+        LaunchSpecification={"ImageId": "ami-12345678", "InstanceType": "t3.micro"},
+    )
+    request_id = response["SpotInstanceRequests"][0]["SpotInstanceRequestId"]
+
+    ec2_manager._cancel_spot_request(None)
+    ec2_manager._cancel_spot_request(request_id)
+
+    requests = ec2_manager.ec2_client.describe_spot_instance_requests()["SpotInstanceRequests"]
+    assert not [
+        r
+        for r in requests
+        if r["SpotInstanceRequestId"] == request_id and r["State"] != "cancelled"
+    ]
+
+
+def test_rollback_terminates_when_spot_cancel_fails(ec2_manager):
+    """Verify a failed spot request cancel does not leak the instance during rollback."""
+    instance = Mock(spot_instance_request_id="sir-12345678")
+    error = ClientError(
+        {"Error": {"Code": "UnauthorizedOperation", "Message": "denied"}},
+        "CancelSpotInstanceRequests",
+    )
+
+    with patch.object(ec2_manager.ec2_client, "cancel_spot_instance_requests", side_effect=error):
+        ec2_manager._rollback_resources({"instance": instance})
+
+    instance.terminate.assert_called_once()
+
+
+def test_terminate_instance_when_spot_cancel_fails(ec2_manager):
+    """Verify destroy still terminates a spot instance whose request cannot be cancelled."""
+    instance = Mock(spot_instance_request_id="sir-12345678", tags=[], security_groups=[])
+    error = ClientError(
+        {"Error": {"Code": "UnauthorizedOperation", "Message": "denied"}},
+        "CancelSpotInstanceRequests",
+    )
+
+    with (
+        patch.object(ec2_manager, "ec2_resource") as ec2_resource,
+        patch.object(ec2_manager.ec2_client, "cancel_spot_instance_requests", side_effect=error),
+        patch.object(ec2_manager.ec2_client, "get_waiter"),
+    ):
+        ec2_resource.Instance.return_value = instance
+        ec2_manager.terminate_instance("i-1234567890abcdef0")
+
+    instance.terminate.assert_called_once()
@@ -0,0 +1,134 @@
+"""Unit tests for the run history behind `campers stats`."""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from campers.core.history import (
+    append_run,
+    find_regressions,
+    format_stats,
+    group_runs,
+    load_runs,
+    log_stats,
+    percentile,
+)
+
+
+def make_run(
+    index: int, ssh_ready: float, ami: str = "ami-old", reused: bool = False
+) -> dict[str, Any]:
+    """Build a run record reaching ssh_ready after the given number of seconds."""
+    return {
+        "started_at": f"2026-10-{index + 1:02d}T09:00:00",
+        "camp": "dev",
+        "instance_type": "t3.medium",
+        "region": "us-east-1",
+        "ami": ami,
+        "reused": reused,
+        "outcome": "completed",
+        "total": ssh_ready + 20.0,
+        "milestones": {"launch": 2.0, "running": 30.0, "ssh_ready": ssh_ready},
+    }
+
+
+def test_percentile_interpolates() -> None:
+    """Test percentiles interpolate between neighbouring samples."""
+    assert percentile([10.0, 20.0, 30.0, 40.0], 50) == 25.0
+    assert percentile([10.0, 20.0, 30.0, 40.0], 90) == pytest.approx(37.0)
+    assert percentile([5.0], 90) == 5.0
+
+
+def test_regression_attributed_to_ami_change() -> None:
+    """Test a slowdown starting with a new AMI names the AMI change."""
+    runs = [make_run(i, 60.0) for i in range(4)]
+    runs += [make_run(i, 120.0, ami="ami-new") for i in range(4, 8)]
+
+    findings = find_regressions(runs)
+
+    assert findings == [
+        "time to ssh_ready p90 2.0x slower since ami changed (ami-old -> ami-new): 60s -> 120s"
+    ]
+
+
+def test_regression_reported_as_recent_trend() -> None:
+    """Test a slowdown without an attribute change is reported as a trend."""
+    runs = [make_run(i, 60.0) for i in range(5)] + [make_run(i, 100.0) for i in range(5, 10)]
+
+    assert find_regressions(runs) == [
+        "time to ssh_ready p50 1.7x slower over the last 5 runs: 60s -> 100s"
+    ]
+
+
+def test_no_regression_with_too_few_runs() -> None:
+    """Test comparisons need STATS_MIN_SAMPLES runs on each side."""
+    runs = [make_run(i, 60.0) for i in range(4)] + [make_run(4, 300.0, ami="ami-new")]
+
+    assert find_regressions(runs) == []
+
+
+def test_history_round_trip_and_grouping(tmp_path: Path) -> None:
+    """Test runs are appended, filtered by camp, sorted and grouped by reuse."""
+    path = tmp_path / "history" / "runs.jsonl"
+    append_run(make_run(2, 70.0, reused=True), path)
+    append_run(make_run(1, 60.0), path)
+    append_run({**make_run(3, 65.0), "camp": "other"}, path)
+
+    with path.open("a") as f:
+        f.write("not json\n")
+
+    runs = load_runs("dev", path)
+
+    assert [run["milestones"]["ssh_ready"] for run in runs] == [60.0, 70.0]
+    assert list(group_runs(runs)) == [("dev", False), ("dev", True)]
+
+
+def test_load_runs_orders_by_instant(tmp_path: Path) -> None:
+    """Test runs are ordered by start time across UTC offsets, not as strings."""
+    path = tmp_path / "history" / "runs.jsonl"
+    append_run({**make_run(0, 60.0), "started_at": "2026-10-18T09:30:00+02:00"}, path)
+    append_run({**make_run(1, 70.0), "started_at": "2026-10-18T08:00:00+00:00"}, path)
+
+    runs = load_runs("dev", path)
+
+    assert [run["milestones"]["ssh_ready"] for run in runs] == [60.0, 70.0]
+
+
+def test_format_stats_rows() -> None:
+    """Test the table lists reached milestones and the run total."""
+    runs = [make_run(i, 60.0 + i) for i in range(3)]
+    runs[-1]["total"] = None
+
+    lines = format_stats(runs)
+
+    assert lines[0].split() == ["Milestone", "Runs", "p50", "p90", "Max", "Recent", "p50"]
+    assert lines[3].split() == ["ssh_ready", "3", "61.0s", "61.8s", "62.0s", "61.0s"]
+    assert lines[4].split() == ["total", "2", "80.5s", "80.9s", "81.0s", "80.5s"]
+
+
+def test_log_stats_without_history(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """Test a missing history file is reported rather than raising."""
+    with caplog.at_level(logging.INFO):
+        log_stats("dev", tmp_path / "missing.jsonl")
+
+    assert "No run history found for camp 'dev'" in caplog.text
+
+
+def test_run_records_milestones(
+    campers: Any, write_config: Any, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a completed run appends its milestones to the history."""
+    monkeypatch.setenv("CAMPERS_DIR", str(tmp_path))
+    monkeypatch.delenv("CAMPERS_DISABLE_HISTORY")
+    write_config({"defaults": {"region": "us-east-1", "command": "echo hi"}})
+
+    campers.run()
+
+    [record] = [json.loads(line) for line in (tmp_path / "history" / "runs.jsonl").open()]
+    assert record["outcome"] == "completed"
+    assert record["region"] == "us-east-1"
+    assert list(record["milestones"]) == ["launch", "running", "ssh_ready", "command_start"]
+    assert record["total"] >= record["milestones"]["command_start"]
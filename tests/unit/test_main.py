@@ -3,7 +3,7 @@
 import logging
 import signal
 from datetime import UTC, datetime, timedelta
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 
 class TestCleanupLogging:
@@ -228,9 +228,7 @@ class TestCleanupOrder:
         )
 
         mock_mutagen = MagicMock()
-        mock_mutagen.terminate_session.side_effect = (
-            lambda name, ssh_wrapper_dir=None, host=None: cleanup_sequence.append("mutagen")
-        )
+        mock_mutagen.pause_session.side_effect = lambda name: cleanup_sequence.append("mutagen")
 
         mock_ssh = MagicMock()
         mock_ssh.close.side_effect = lambda: cleanup_sequence.append("ssh")
@@ -268,8 +266,8 @@ class TestCleanupOrder:
         )
 
         mock_mutagen = MagicMock()
-        mock_mutagen.terminate_session.side_effect = (
-            lambda name, ssh_wrapper_dir=None, host=None: cleanup_sequence.append("mutagen")
+        mock_mutagen.terminate_session.side_effect = lambda name, ssh_wrapper_dir=None, host=None: (
+            cleanup_sequence.append("mutagen")
         )
 
         mock_ssh = MagicMock()
@@ -309,9 +307,7 @@ class TestErrorResilience:
         mock_portforward.stop_all_tunnels.side_effect = RuntimeError("Port forward error")
 
         mock_mutagen = MagicMock()
-        mock_mutagen.terminate_session.side_effect = (
-            lambda name, ssh_wrapper_dir=None, host=None: cleanup_sequence.append("mutagen")
-        )
+        mock_mutagen.pause_session.side_effect = lambda name: cleanup_sequence.append("mutagen")
 
         mock_ssh = MagicMock()
         mock_ssh.close.side_effect = lambda: cleanup_sequence.append("ssh")
@@ -351,7 +347,7 @@ class TestErrorResilience:
         )
 
         mock_mutagen = MagicMock()
-        mock_mutagen.terminate_session.side_effect = RuntimeError("Mutagen error")
+        mock_mutagen.pause_session.side_effect = RuntimeError("Mutagen error")
 
         mock_ssh = MagicMock()
         mock_ssh.close.side_effect = lambda: cleanup_sequence.append("ssh")
@@ -391,9 +387,7 @@ class TestErrorResilience:
         )
 
         mock_mutagen = MagicMock()
-        mock_mutagen.terminate_session.side_effect = (
-            lambda name, ssh_wrapper_dir=None, host=None: cleanup_sequence.append("mutagen")
-        )
+        mock_mutagen.pause_session.side_effect = lambda name: cleanup_sequence.append("mutagen")
 
         mock_ssh = MagicMock()
         mock_ssh.close.side_effect = RuntimeError("SSH error")
@@ -431,7 +425,7 @@ class TestErrorResilience:
         mock_portforward.stop_all_tunnels.side_effect = RuntimeError("Port forward error")
 
         mock_mutagen = MagicMock()
-        mock_mutagen.terminate_session.side_effect = RuntimeError("Mutagen error")
+        mock_mutagen.pause_session.side_effect = RuntimeError("Mutagen error")
 
         mock_ssh = MagicMock()
         mock_ssh.close.side_effect = RuntimeError("SSH error")
@@ -555,13 +549,12 @@ class TestMultipleSessionCleanup:
         cleanup_sequence = []
 
         mock_mutagen = MagicMock()
-        mock_mutagen.terminate_session.side_effect = (
-            lambda name, ssh_wrapper_dir=None, host=None: cleanup_sequence.append(name)
+        mock_mutagen.terminate_session.side_effect = lambda name, ssh_wrapper_dir=None, host=None: (
+            cleanup_sequence.append(name)
         )
 
         mock_ec2 = MagicMock()
-        mock_ec2.stop_instance.side_effect = lambda id: cleanup_sequence.append("ec2")
-        mock_ec2.get_volume_size.return_value = 50
+        mock_ec2.terminate_instance.side_effect = lambda id: cleanup_sequence.append("ec2")
 
         campers._resources = {
             "mutagen_mgr": mock_mutagen,
@@ -570,7 +563,7 @@ class TestMultipleSessionCleanup:
             "compute_provider": mock_ec2,
         }
 
-        campers._stop_instance_cleanup()
+        campers._terminate_instance_cleanup()
 
         assert "session-0" in cleanup_sequence
         assert "session-1" in cleanup_sequence
@@ -596,8 +589,7 @@ class TestMultipleSessionCleanup:
         mock_mutagen.terminate_session.side_effect = terminate_with_error
 
         mock_ec2 = MagicMock()
-        mock_ec2.stop_instance.side_effect = lambda id: None
-        mock_ec2.get_volume_size.return_value = 50
+        mock_ec2.terminate_instance.side_effect = lambda id: None
 
         campers._resources = {
             "mutagen_mgr": mock_mutagen,
@@ -606,11 +598,11 @@ class TestMultipleSessionCleanup:
             "compute_provider": mock_ec2,
         }
 
-        campers._stop_instance_cleanup()
+        campers._terminate_instance_cleanup()
 
         assert "session-0" in terminated_sessions
         assert "session-2" in terminated_sessions
-        assert mock_ec2.stop_instance.called
+        assert mock_ec2.terminate_instance.called
 
     def test_cleanup_with_multiple_sessions_and_all_fail(self, campers, caplog):
         """Verify resilience when all session terminations fail.
@@ -626,8 +618,7 @@ class TestMultipleSessionCleanup:
         mock_mutagen.terminate_session.side_effect = RuntimeError("Session termination failed")
 
         mock_ec2 = MagicMock()
-        mock_ec2.stop_instance.side_effect = lambda id: None
-        mock_ec2.get_volume_size.return_value = 50
+        mock_ec2.terminate_instance.side_effect = lambda id: None
 
         campers._resources = {
             "mutagen_mgr": mock_mutagen,
@@ -637,10 +628,10 @@ class TestMultipleSessionCleanup:
         }
 
         with caplog.at_level(logging.INFO):
-            campers._stop_instance_cleanup()
+            campers._terminate_instance_cleanup()
 
         assert any("Cleanup completed with 2 errors" in record.message for record in caplog.records)
-        assert mock_ec2.stop_instance.called
+        assert mock_ec2.terminate_instance.called
 
     def test_cleanup_uses_plural_session_names_when_available(self, campers):
         """Verify cleanup uses mutagen_session_names (plural) when available.
@@ -653,13 +644,12 @@ class TestMultipleSessionCleanup:
         terminated_sessions = []
 
         mock_mutagen = MagicMock()
-        mock_mutagen.terminate_session.side_effect = (
-            lambda name, ssh_wrapper_dir=None, host=None: terminated_sessions.append(name)
+        mock_mutagen.terminate_session.side_effect = lambda name, ssh_wrapper_dir=None, host=None: (
+            terminated_sessions.append(name)
         )
 
         mock_ec2 = MagicMock()
-        mock_ec2.stop_instance.side_effect = lambda id: None
-        mock_ec2.get_volume_size.return_value = 50
+        mock_ec2.terminate_instance.side_effect = lambda id: None
 
         campers._resources = {
             "mutagen_mgr": mock_mutagen,
@@ -669,7 +659,7 @@ class TestMultipleSessionCleanup:
             "compute_provider": mock_ec2,
         }
 
-        campers._stop_instance_cleanup()
+        campers._terminate_instance_cleanup()
 
         assert "new-session-1" in terminated_sessions
         assert "new-session-2" in terminated_sessions
@@ -686,13 +676,12 @@ class TestMultipleSessionCleanup:
         terminated_sessions = []
 
         mock_mutagen = MagicMock()
-        mock_mutagen.terminate_session.side_effect = (
-            lambda name, ssh_wrapper_dir=None, host=None: terminated_sessions.append(name)
+        mock_mutagen.terminate_session.side_effect = lambda name, ssh_wrapper_dir=None, host=None: (
+            terminated_sessions.append(name)
         )
 
         mock_ec2 = MagicMock()
-        mock_ec2.stop_instance.side_effect = lambda id: None
-        mock_ec2.get_volume_size.return_value = 50
+        mock_ec2.terminate_instance.side_effect = lambda id: None
 
         campers._resources = {
             "mutagen_mgr": mock_mutagen,
@@ -701,10 +690,59 @@ class TestMultipleSessionCleanup:
             "compute_provider": mock_ec2,
         }
 
-        campers._stop_instance_cleanup()
+        campers._terminate_instance_cleanup()
 
         assert "fallback-session" in terminated_sessions
 
+    def test_stop_pauses_all_sessions(self, campers):
+        """Verify stop pauses every Mutagen session instead of terminating it.
+
+        Parameters
+        ----------
+        campers : Campers
+            Campers instance
+        """
+        mock_mutagen = MagicMock()
+
+        mock_ec2 = MagicMock()
+        mock_ec2.get_volume_size.return_value = 50
+
+        campers._resources = {
+            "mutagen_mgr": mock_mutagen,
+            "mutagen_session_names": ["session-0", "session-1"],
+            "instance_details": {"instance_id": "i-test", "unique_id": "abc"},
+            "compute_provider": mock_ec2,
+        }
+
+        campers._stop_instance_cleanup()
+
+        assert [c.args[0] for c in mock_mutagen.pause_session.call_args_list] == [
+            "session-0",
+            "session-1",
+        ]
+        mock_mutagen.terminate_session.assert_not_called()
+
+    def test_terminate_removes_host_alias(self, campers):
+        """Verify terminate passes the instance host alias for SSH config cleanup.
+
+        Parameters
+        ----------
+        campers : Campers
+            Campers instance
+        """
+        mock_mutagen = MagicMock()
+
+        campers._resources = {
+            "mutagen_mgr": mock_mutagen,
+            "mutagen_session_names": ["session-0"],
+            "instance_details": {"instance_id": "i-test", "unique_id": "abc"},
+            "compute_provider": MagicMock(),
+        }
+
+        campers._terminate_instance_cleanup()
+
+        assert mock_mutagen.terminate_session.call_args.kwargs["host"] == "campers-abc"
+
 
 class TestUptimeCalculation:
     """Test uptime calculation in CampersTUI."""
@@ -760,3 +798,53 @@ class TestUptimeCalculation:
 
         queried_widget = campers_tui.query_one("#uptime-widget")
         assert queried_widget.update.call_count == 0
+
+    def test_update_uptime_shows_session_cost(self, campers_tui):
+        """Verify the cost widget shows the cost accrued since launch.
+
+        Parameters
+        ----------
+        campers_tui : CampersTUI
+            CampersTUI instance
+        """
+        from campers.core.costs import CostMeter
+
+        launch_time = datetime.now(UTC) - timedelta(hours=2)
+        campers_tui.instance_start_time = launch_time.replace(tzinfo=None)
+        campers_tui.cost_meter = CostMeter(launch_time, 1.5, 0.0, 0)
+        widgets = {"#uptime-widget": MagicMock(), "#cost-widget": MagicMock()}
+        campers_tui.query_one = MagicMock(side_effect=lambda selector, *_: widgets[selector])
+
+        campers_tui.update_uptime()
+
+        assert widgets["#cost-widget"].value == "this session: $3.00"
+
+    def test_start_cost_meter_uses_run_rates(self, campers_tui):
+        """Verify the cost meter is priced from the run's instance type and region.
+
+        Parameters
+        ----------
+        campers_tui : CampersTUI
+            CampersTUI instance
+        """
+        pricing_service = MagicMock(pricing_available=True)
+        pricing_service.get_instance_price.return_value = 0.1
+        pricing_service.get_storage_price.return_value = 0.08
+        campers_tui.campers._merged_config_prop = {
+            "instance_type": "t3.medium",
+            "region": "us-east-1",
+            "disk_size": 50,
+        }
+        launch_time = datetime.now(UTC)
+
+        with patch(
+            "campers.tui.app.get_provider",
+            return_value={"pricing_service": MagicMock(return_value=pricing_service)},
+        ):
+            campers_tui.start_cost_meter(launch_time)
+
+        pricing_service.get_instance_price.assert_called_once_with("t3.medium", "us-east-1")
+        pricing_service.close.assert_called_once()
+        assert campers_tui.cost_meter.hourly_rate == 0.1
+        assert campers_tui.cost_meter.storage_rate == 0.08
+        assert campers_tui.cost_meter.volume_size_gb == 50
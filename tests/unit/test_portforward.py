@@ -1,474 +1,728 @@
 """Unit tests for SSH port forwarding functionality."""
 
+import contextlib
+import socket
+import subprocess
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from unittest.mock import MagicMock, call, patch
 
 import paramiko
 import pytest
-from sshtunnel import BaseSSHTunnelForwarderError
 
-from campers.services.portforward import PortForwardManager
+from campers.services.portforward import (
+    PortForwardManager,
+    PortInUseError,
+    is_auto_forward_allowed,
+    parse_listening_ports,
+    parse_socks_greeting,
+    parse_socks_request,
+)
+from tests.unit.fakes.local_ssh_server import LocalSSHServer
 
 
 @pytest.fixture
-def port_forward_manager() -> PortForwardManager:
+def port_forward_manager() -> Iterator[PortForwardManager]:
     """Create PortForwardManager instance for testing.
 
-    Returns
-    -------
+    Yields
+    ------
     PortForwardManager
-        Fresh port forward manager instance
+        Fresh port forward manager instance, stopped after the test
     """
-    return PortForwardManager()
+    manager = PortForwardManager()
+    yield manager
+    manager.stop_all_tunnels()
+
+
+@pytest.fixture
+def ssh_server(tmp_path: Path) -> Iterator[LocalSSHServer]:
+    """Start an in-process SSH server.
+
+    Yields
+    ------
+    LocalSSHServer
+        Running server accepting the generated client key
+    """
+    server = LocalSSHServer(tmp_path).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def echo_port() -> Iterator[int]:
+    """Start a local echo server standing in for a service on the instance.
+
+    Yields
+    ------
+    int
+        Port the echo server listens on
+    """
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(socket.SOMAXCONN)
+
+    def echo(conn: socket.socket) -> None:
+        with conn:
+            while data := conn.recv(65536):
+                conn.sendall(data)
+
+    def accept() -> None:
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            threading.Thread(target=echo, args=(conn,), daemon=True).start()
+
+    threading.Thread(target=accept, daemon=True).start()
+    yield listener.getsockname()[1]
+    listener.close()
+
+
+def free_port() -> int:
+    """Return a local port that is currently unused."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def echo_round_trip(port: int, payload: bytes) -> bytes:
+    """Send payload through a forwarded port and return everything echoed back."""
+    with socket.create_connection(("localhost", port), timeout=10) as conn:
+        writer = threading.Thread(
+            target=lambda: (conn.sendall(payload), conn.shutdown(socket.SHUT_WR))
+        )
+        writer.start()
+        received = bytearray()
+
+        while data := conn.recv(65536):
+            received += data
+
+        writer.join()
+
+    return bytes(received)
+
+
+def wait_for(predicate, timeout: float = 5.0) -> None:
+    """Poll until predicate returns True or fail the test."""
+    deadline = time.monotonic() + timeout
+
+    while not predicate():
+        if time.monotonic() > deadline:
+            pytest.fail("Condition not reached in time")
+        time.sleep(0.02)
+
+
+def start_forwarding(
+    manager: PortForwardManager, server: LocalSSHServer, remote_port: int, **kwargs
+) -> int:
+    """Forward a free local port to remote_port through the test server."""
+    local_port = free_port()
+    manager.create_tunnels(
+        ports=[(remote_port, local_port)],
+        host="127.0.0.1",
+        key_file=server.key_file,
+        username="ubuntu",
+        ssh_port=server.port,
+        **kwargs,
+    )
+    return local_port
 
 
 def test_port_forward_manager_initialization() -> None:
-    """Test PortForwardManager initialization creates empty tunnel and ports."""
+    """Test PortForwardManager initialization creates no connection and no ports."""
     manager = PortForwardManager()
 
-    assert manager.tunnel is None
+    assert manager.ssh_manager is None
     assert manager.ports == []
+    assert manager.get_stats() == []
 
 
-@patch("campers.services.portforward.PortForwardManager.validate_key_file")
-@patch("campers.services.portforward.validate_port")
-@patch("campers.services.portforward.logger")
-@patch("campers.services.portforward.SSHTunnelForwarder")
-def test_create_tunnels_success_single_port(
-    mock_tunnel_forwarder: MagicMock,
-    mock_logger: MagicMock,
-    mock_validate_port: MagicMock,
-    mock_validate_key_file: MagicMock,
-    port_forward_manager: PortForwardManager,
+def test_forwards_traffic_and_counts_bytes(
+    port_forward_manager: PortForwardManager, ssh_server: LocalSSHServer, echo_port: int
 ) -> None:
-    """Test successful creation of single SSH tunnel."""
-    mock_tunnel = MagicMock()
-    mock_tunnel.is_active = True
-    mock_tunnel_forwarder.return_value = mock_tunnel
+    """Test data is relayed both ways and counted per port."""
+    local_port = start_forwarding(port_forward_manager, ssh_server, echo_port)
+    payload = bytes(range(256)) * 8192
 
-    port_forward_manager.create_tunnels(
-        ports=[(8888, 8888)],
-        host="203.0.113.1",
-        key_file="/tmp/test.pem",
-        username="ubuntu",
-    )
+    assert echo_round_trip(local_port, payload) == payload
 
-    assert mock_validate_port.call_count == 2
-    mock_validate_key_file.assert_called_once_with("/tmp/test.pem")
-    mock_tunnel_forwarder.assert_called_once_with(
-        ssh_address_or_host=("203.0.113.1", 22),
-        ssh_username="ubuntu",
-        ssh_pkey="/tmp/test.pem",
-        remote_bind_addresses=[("localhost", 8888)],
-        local_bind_addresses=[("localhost", 8888)],
-    )
-    mock_tunnel.start.assert_called_once()
-    assert port_forward_manager.tunnel == mock_tunnel
-    assert port_forward_manager.ports == [(8888, 8888)]
+    wait_for(lambda: port_forward_manager.get_stats()[0]["active_connections"] == 0)
+    stats = port_forward_manager.get_stats()[0]
+    assert stats["remote_port"] == echo_port
+    assert stats["local_port"] == local_port
+    assert stats["connections"] == 1
+    assert stats["bytes_out"] == len(payload)
+    assert stats["bytes_in"] == len(payload)
+    assert stats["first_byte_latency_ms"] is not None
+    assert ("localhost", echo_port) in ssh_server.direct_requests
 
 
-@patch("campers.services.portforward.PortForwardManager.validate_key_file")
-@patch("campers.services.portforward.validate_port")
-@patch("campers.services.portforward.logger")
-@patch("campers.services.portforward.SSHTunnelForwarder")
-def test_create_tunnels_success_multiple_ports(
-    mock_tunnel_forwarder: MagicMock,
-    mock_logger: MagicMock,
-    mock_validate_port: MagicMock,
-    mock_validate_key_file: MagicMock,
-    port_forward_manager: PortForwardManager,
+def test_many_concurrent_connections_share_one_transport(
+    port_forward_manager: PortForwardManager, ssh_server: LocalSSHServer, echo_port: int
+) -> None:
+    """Test hundreds of concurrent connections are relayed over one SSH connection."""
+    local_port = start_forwarding(port_forward_manager, ssh_server, echo_port)
+    payload = b"campers" * 1000
+
+    with ThreadPoolExecutor(max_workers=100) as pool:
+        results = list(pool.map(lambda _: echo_round_trip(local_port, payload), range(200)))
+
+    assert all(result == payload for result in results)
+    assert len(ssh_server.transports) == 1
+    wait_for(lambda: port_forward_manager.get_stats()[0]["active_connections"] == 0)
+    assert port_forward_manager.get_stats()[0]["connections"] == 200
+
+
+def test_unreachable_remote_port_counts_failed_connection(
+    port_forward_manager: PortForwardManager, ssh_server: LocalSSHServer
 ) -> None:
-    """Test successful creation of multiple SSH tunnels with single forwarder."""
-    mock_tunnel = MagicMock()
-    mock_tunnel.is_active = True
-    mock_tunnel_forwarder.return_value = mock_tunnel
+    """Test a refused remote connection closes the local socket and is counted."""
+    local_port = start_forwarding(port_forward_manager, ssh_server, free_port())
+
+    with (
+        socket.create_connection(("localhost", local_port), timeout=10) as conn,
+        contextlib.suppress(ConnectionResetError),
+    ):
+        assert conn.recv(1) == b""
 
+    wait_for(lambda: port_forward_manager.get_stats()[0]["failed_connections"] == 1)
+    assert port_forward_manager.get_stats()[0]["active_connections"] == 0
+
+
+def test_probe_ports_reports_health(
+    port_forward_manager: PortForwardManager, ssh_server: LocalSSHServer, echo_port: int
+) -> None:
+    """Test the active probe marks listening and closed remote ports."""
+    closed_port = free_port()
     port_forward_manager.create_tunnels(
-        ports=[(8888, 8888), (8889, 8889), (8890, 8890)],
-        host="203.0.113.1",
-        key_file="/tmp/test.pem",
-        username="ubuntu",
+        ports=[(echo_port, free_port()), (closed_port, free_port())],
+        host="127.0.0.1",
+        key_file=ssh_server.key_file,
+        ssh_port=ssh_server.port,
     )
 
-    assert mock_validate_port.call_count == 6
-    mock_validate_key_file.assert_called_once_with("/tmp/test.pem")
+    port_forward_manager.probe_ports()
 
-    mock_tunnel_forwarder.assert_called_once()
-    call_kwargs = mock_tunnel_forwarder.call_args[1]
-    assert call_kwargs["remote_bind_addresses"] == [
-        ("localhost", 8888),
-        ("localhost", 8889),
-        ("localhost", 8890),
-    ]
-    assert call_kwargs["local_bind_addresses"] == [
-        ("localhost", 8888),
-        ("localhost", 8889),
-        ("localhost", 8890),
-    ]
+    health = {s["remote_port"]: s["health"] for s in port_forward_manager.get_stats()}
+    assert health == {echo_port: "up", closed_port: "down"}
 
-    mock_tunnel.start.assert_called_once()
 
-    assert port_forward_manager.tunnel == mock_tunnel
-    assert port_forward_manager.ports == [(8888, 8888), (8889, 8889), (8890, 8890)]
+def test_status_callback_receives_snapshots(
+    port_forward_manager: PortForwardManager, ssh_server: LocalSSHServer, echo_port: int
+) -> None:
+    """Test the status callback is called with probed counters."""
+    payloads = []
 
-    expected_info_calls = [
-        call("Creating SSH tunnel for port %s...", 8888),
-        call("Creating SSH tunnel for port %s...", 8889),
-        call("Creating SSH tunnel for port %s...", 8890),
-        call("SSH tunnel established: localhost:%s -> remote:%s", 8888, 8888),
-        call("SSH tunnel established: localhost:%s -> remote:%s", 8889, 8889),
-        call("SSH tunnel established: localhost:%s -> remote:%s", 8890, 8890),
+    start_forwarding(port_forward_manager, ssh_server, echo_port, status_callback=payloads.append)
+
+    wait_for(lambda: bool(payloads))
+    assert payloads[0]["status"] == "active"
+    assert payloads[0]["stats"][0]["remote_port"] == echo_port
+    assert payloads[0]["stats"][0]["health"] == "up"
+
+
+def proc_net_tcp(*listeners: tuple[str, int]) -> str:
+    """Render /proc/net/tcp content with one LISTEN row per (address, port)."""
+    header = "  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt\n"
+    rows = [
+        f"   {i}: {address}:{port:04X} 00000000:0000 0A 00000000:00000000 00:00000000 00000000\n"
+        for i, (address, port) in enumerate(listeners)
     ]
-    assert mock_logger.info.call_args_list == expected_info_calls
+    return header + "".join(rows)
 
 
-@patch("campers.services.portforward.PortForwardManager.validate_key_file")
-@patch("campers.services.portforward.validate_port")
-@patch("campers.services.portforward.logger")
-@patch("campers.services.portforward.SSHTunnelForwarder")
-def test_create_tunnels_default_username(
-    mock_tunnel_forwarder: MagicMock,
-    mock_logger: MagicMock,
-    mock_validate_port: MagicMock,
-    mock_validate_key_file: MagicMock,
+def test_parse_listening_ports_keeps_loopback_and_wildcard() -> None:
+    """Test only listening sockets reachable through localhost are reported."""
+    content = proc_net_tcp(("00000000", 8888), ("0100007F", 6006), ("0A00020F", 9000))
+    content += "   3: 0100007F:1F40 0100007F:D431 01 00000000:00000000 00:00000000 00000000\n"
+    content += (
+        "   0: 00000000000000000000000000000000:1538 "
+        "00000000000000000000000000000000:0000 0A 00000000:00000000 00:00000000 00000000\n"
+    )
+
+    assert parse_listening_ports(content) == {8888, 6006, 5432}
+
+
+@pytest.mark.parametrize(
+    ("port", "rules", "expected"),
+    [
+        (8888, {"allow": None, "deny": []}, True),
+        (631, {"allow": None, "deny": []}, False),
+        (22, {"allow": [(1, 65535)], "deny": []}, False),
+        (631, {"allow": [(600, 700)], "deny": []}, True),
+        (9000, {"allow": [(8000, 8999)], "deny": []}, False),
+        (8500, {"allow": [(8000, 8999)], "deny": [(8500, 8500)]}, False),
+    ],
+)
+def test_is_auto_forward_allowed(port: int, rules: dict, expected: bool) -> None:
+    """Test allow and deny rules for automatically forwarded ports."""
+    assert is_auto_forward_allowed(port, rules) is expected
+
+
+def test_auto_forward_follows_remote_listeners(
     port_forward_manager: PortForwardManager,
+    ssh_server: LocalSSHServer,
+    echo_port: int,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """Test tunnel creation uses default username when not specified."""
-    mock_tunnel = MagicMock()
-    mock_tunnel.is_active = True
-    mock_tunnel_forwarder.return_value = mock_tunnel
+    """Test remote listeners are forwarded when they appear and dropped when they go."""
+    monkeypatch.setattr("campers.services.portforward.AUTO_FORWARD_POLL_INTERVAL_SECONDS", 0)
+    monkeypatch.setattr("campers.services.portforward.PORTFORWARD_STATS_INTERVAL_SECONDS", 0.05)
+    listeners = [("0100007F", echo_port)]
+    ssh_server.exec_handler = lambda command: subprocess.CompletedProcess(
+        command, 0, proc_net_tcp(*listeners).encode(), b""
+    )
+    payloads = []
 
     port_forward_manager.create_tunnels(
-        ports=[(8888, 8888)],
-        host="203.0.113.1",
-        key_file="/tmp/test.pem",
+        ports=[],
+        host="127.0.0.1",
+        key_file=ssh_server.key_file,
+        ssh_port=ssh_server.port,
+        status_callback=payloads.append,
+        auto_forward={"allow": None, "deny": []},
     )
 
-    call_kwargs = mock_tunnel_forwarder.call_args[1]
-    assert call_kwargs["ssh_username"] == "ubuntu"
+    wait_for(lambda: echo_port in port_forward_manager.auto_ports)
+    local_port = port_forward_manager.auto_ports[echo_port]
+    assert local_port != echo_port
+    assert echo_round_trip(local_port, b"auto") == b"auto"
+    assert any("notification" in payload for payload in payloads)
 
+    listeners.clear()
 
-@patch("campers.services.portforward.PortForwardManager.validate_key_file")
-@patch("campers.services.portforward.validate_port")
-@patch("campers.services.portforward.logger")
-@patch("campers.services.portforward.SSHTunnelForwarder")
-def test_create_tunnels_failure_raises_runtime_error(
-    mock_tunnel_forwarder: MagicMock,
-    mock_logger: MagicMock,
-    mock_validate_port: MagicMock,
-    mock_validate_key_file: MagicMock,
+    wait_for(lambda: not port_forward_manager.auto_ports)
+    assert port_forward_manager.ports == []
+    assert port_forward_manager.get_stats() == []
+
+
+def test_reconnects_on_same_local_port_after_connection_loss(
     port_forward_manager: PortForwardManager,
+    ssh_server: LocalSSHServer,
+    echo_port: int,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """Test tunnel creation failure raises RuntimeError."""
-    mock_tunnel_forwarder.side_effect = OSError("Port already in use")
+    """Test a dropped SSH connection is re-established without changing local ports."""
+    monkeypatch.setattr("campers.services.portforward.PORTFORWARD_STATS_INTERVAL_SECONDS", 0.05)
+    monkeypatch.setattr("campers.services.portforward.SSH_RETRY_DELAYS", [0.01])
+    payloads = []
+    local_port = start_forwarding(
+        port_forward_manager, ssh_server, echo_port, status_callback=payloads.append
+    )
+    assert echo_round_trip(local_port, b"before") == b"before"
 
-    with pytest.raises(RuntimeError, match=r"Failed to create SSH tunnels"):
-        port_forward_manager.create_tunnels(
-            ports=[(8888, 8888), (8889, 8889)],
-            host="203.0.113.1",
-            key_file="/tmp/test.pem",
+    connect = port_forward_manager.ssh_manager.connect
+    failures = iter([ConnectionError("network down")] * 2)
+
+    def flaky_connect(max_retries: int) -> None:
+        error = next(failures, None)
+        if error:
+            raise error
+        connect(max_retries=max_retries)
+
+    port_forward_manager.ssh_manager.connect = flaky_connect
+    old_transport = port_forward_manager.ssh_manager.client.get_transport()
+
+    for transport in ssh_server.transports:
+        transport.close()
+
+    wait_for(
+        lambda: (
+            port_forward_manager.status == "active"
+            and port_forward_manager.ssh_manager.client.get_transport() is not old_transport
         )
+    )
 
-    assert port_forward_manager.tunnel is None
-    assert port_forward_manager.ports == []
+    assert echo_round_trip(local_port, b"after") == b"after"
+    assert port_forward_manager.ports == [(echo_port, local_port)]
+    statuses = [payload["status"] for payload in payloads]
+    assert "reconnecting" in statuses
+    assert statuses[-1] == "active"
+    assert [p["notification"] for p in payloads if "notification" in p] == [
+        "Port forwarding connection lost, reconnecting",
+        "Port forwarding reconnected",
+    ]
 
 
-@patch("campers.services.portforward.PortForwardManager.validate_key_file")
-@patch("campers.services.portforward.validate_port")
-@patch("campers.services.portforward.logger")
-@patch("campers.services.portforward.SSHTunnelForwarder")
-def test_create_tunnels_start_failure_raises_runtime_error(
-    mock_tunnel_forwarder: MagicMock,
-    mock_logger: MagicMock,
-    mock_validate_port: MagicMock,
-    mock_validate_key_file: MagicMock,
+def test_restarts_forwarding_after_loop_failure(
     port_forward_manager: PortForwardManager,
+    ssh_server: LocalSSHServer,
+    echo_port: int,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """Test tunnel start failure raises RuntimeError."""
-    mock_tunnel = MagicMock()
-    mock_tunnel.start.side_effect = paramiko.SSHException("Connection failed")
-    mock_tunnel_forwarder.return_value = mock_tunnel
+    """Test a failed forwarding loop is reported and replaced on the same local port."""
+    monkeypatch.setattr("campers.services.portforward.PORTFORWARD_STATS_INTERVAL_SECONDS", 0.05)
+    payloads = []
+    local_port = start_forwarding(
+        port_forward_manager, ssh_server, echo_port, status_callback=payloads.append
+    )
+    failed_loop = port_forward_manager._loop
 
-    with pytest.raises(RuntimeError, match=r"Failed to create SSH tunnels"):
-        port_forward_manager.create_tunnels(
-            ports=[(8888, 8888), (8889, 8889)],
-            host="203.0.113.1",
-            key_file="/tmp/test.pem",
+    def fail() -> None:
+        raise RuntimeError("selector broke")
+
+    failed_loop.call_soon(fail)
+
+    wait_for(
+        lambda: (
+            port_forward_manager.status == "active"
+            and port_forward_manager._loop is not failed_loop
         )
+    )
 
-    assert port_forward_manager.tunnel is None
-    assert port_forward_manager.ports == []
+    assert echo_round_trip(local_port, b"after") == b"after"
+    statuses = [payload["status"] for payload in payloads]
+    assert "failed" in statuses
+    assert statuses[-1] == "active"
+    assert "Port forwarding failed: selector broke" in [
+        p["notification"] for p in payloads if "notification" in p
+    ]
 
 
-@patch("campers.services.portforward.PortForwardManager.validate_key_file")
-@patch("campers.services.portforward.validate_port")
-@patch("campers.services.portforward.logger")
-@patch("campers.services.portforward.SSHTunnelForwarder")
-def test_create_tunnels_empty_port_list(
-    mock_tunnel_forwarder: MagicMock,
-    mock_logger: MagicMock,
-    mock_validate_port: MagicMock,
-    mock_validate_key_file: MagicMock,
-    port_forward_manager: PortForwardManager,
+def test_check_liveness_fails_on_closed_transport(
+    port_forward_manager: PortForwardManager, ssh_server: LocalSSHServer, echo_port: int
 ) -> None:
-    """Test that creating tunnels with empty port list returns early."""
+    """Test the liveness check tells a live transport from a closed one."""
+    start_forwarding(port_forward_manager, ssh_server, echo_port)
+
+    assert port_forward_manager.check_liveness() is True
+
+    port_forward_manager.ssh_manager.client.get_transport().close()
+
+    assert port_forward_manager.check_liveness() is False
+
+
+def test_reverse_ports_relay_remote_connections_to_local_service(
+    port_forward_manager: PortForwardManager, ssh_server: LocalSSHServer, echo_port: int
+) -> None:
+    """Test connections to a reverse-forwarded remote port reach the local service."""
+    remote_port = free_port()
+
     port_forward_manager.create_tunnels(
         ports=[],
-        host="203.0.113.1",
-        key_file="/tmp/test.pem",
+        host="127.0.0.1",
+        key_file=ssh_server.key_file,
+        ssh_port=ssh_server.port,
+        reverse_ports=[(remote_port, echo_port)],
     )
 
-    mock_tunnel_forwarder.assert_not_called()
-    assert port_forward_manager.tunnel is None
-    assert port_forward_manager.ports == []
+    assert echo_round_trip(remote_port, b"local service") == b"local service"
 
+    port_forward_manager.probe_ports()
+    stats = port_forward_manager.get_stats()[0]
+    assert stats["reverse"] is True
+    assert stats["connections"] == 1
+    assert stats["bytes_in"] == stats["bytes_out"] == len(b"local service")
+    assert stats["first_byte_latency_ms"] is None
+    assert stats["health"] == "up"
 
-@patch("campers.services.portforward.logger")
-def test_stop_all_tunnels_success(
-    mock_logger: MagicMock, port_forward_manager: PortForwardManager
+
+def test_reverse_ports_count_unreachable_local_service(
+    port_forward_manager: PortForwardManager, ssh_server: LocalSSHServer
 ) -> None:
-    """Test stopping all tunnels successfully."""
-    mock_tunnel = MagicMock()
+    """Test remote connections fail and are counted when nothing listens locally."""
+    remote_port = free_port()
 
-    port_forward_manager.tunnel = mock_tunnel
-    port_forward_manager.ports = [(8888, 8888), (8889, 8889)]
+    port_forward_manager.create_tunnels(
+        ports=[],
+        host="127.0.0.1",
+        key_file=ssh_server.key_file,
+        ssh_port=ssh_server.port,
+        reverse_ports=[(remote_port, free_port())],
+    )
 
-    port_forward_manager.stop_all_tunnels()
+    with (
+        socket.create_connection(("localhost", remote_port), timeout=5) as conn,
+        contextlib.suppress(ConnectionResetError),
+    ):
+        assert conn.recv(1) == b""
 
-    mock_tunnel.stop.assert_called_once()
+    wait_for(lambda: port_forward_manager.get_stats()[0]["failed_connections"] == 1)
+    assert port_forward_manager.get_stats()[0]["active_connections"] == 0
 
-    assert port_forward_manager.tunnel is None
-    assert port_forward_manager.ports == []
 
-    expected_info_calls = [
-        call("Stopping SSH tunnel for port %s...", 8888),
-        call("Stopping SSH tunnel for port %s...", 8889),
-    ]
-    assert mock_logger.info.call_args_list == expected_info_calls
+def socks_connect(proxy_port: int, address_type: int, host: bytes, port: int) -> socket.socket:
+    """Open a SOCKS5 CONNECT through the proxy and return the socket after the reply."""
+    conn = socket.create_connection(("localhost", proxy_port), timeout=10)
+    conn.sendall(b"\x05\x01\x00")
+    assert conn.recv(2) == b"\x05\x00"
 
+    if address_type == 3:
+        host = bytes([len(host)]) + host
 
-@patch("campers.services.portforward.logger")
-def test_stop_all_tunnels_handles_exceptions(
-    mock_logger: MagicMock, port_forward_manager: PortForwardManager
-) -> None:
-    """Test stop_all_tunnels continues even if tunnel stop fails."""
-    mock_tunnel = MagicMock()
-    mock_tunnel.stop.side_effect = OSError("Stop failed")
+    conn.sendall(bytes([5, 1, 0, address_type]) + host + port.to_bytes(2, "big"))
+    return conn
 
-    port_forward_manager.tunnel = mock_tunnel
-    port_forward_manager.ports = [(8888, 8888)]
 
-    port_forward_manager.stop_all_tunnels()
+def start_socks_proxy(manager: PortForwardManager, server: LocalSSHServer) -> int:
+    """Start the SOCKS5 proxy on a free local port through the test server."""
+    proxy_port = free_port()
+    manager.create_tunnels(
+        ports=[],
+        host="127.0.0.1",
+        key_file=server.key_file,
+        ssh_port=server.port,
+        socks_proxy=proxy_port,
+    )
+    return proxy_port
 
-    mock_tunnel.stop.assert_called_once()
 
-    assert port_forward_manager.tunnel is None
-    assert port_forward_manager.ports == []
+@pytest.mark.parametrize(
+    ("address_type", "host"),
+    [(1, socket.inet_aton("127.0.0.1")), (3, b"localhost")],
+)
+def test_socks_proxy_connects_through_instance(
+    port_forward_manager: PortForwardManager,
+    ssh_server: LocalSSHServer,
+    echo_port: int,
+    address_type: int,
+    host: bytes,
+) -> None:
+    """Test SOCKS5 CONNECT requests open channels to the requested destination."""
+    proxy_port = start_socks_proxy(port_forward_manager, ssh_server)
 
-    mock_logger.warning.assert_called_once()
-    args, kwargs = mock_logger.warning.call_args
-    assert args[0] == "Error stopping tunnels: %s"
-    assert isinstance(args[1], OSError)
+    with socks_connect(proxy_port, address_type, host, echo_port) as conn:
+        assert conn.recv(10)[:2] == b"\x05\x00"
+        conn.sendall(b"via socks")
+        assert conn.recv(64) == b"via socks"
 
+    assert ssh_server.direct_requests[-1][1] == echo_port
+    stats = port_forward_manager.get_stats()[0]
+    assert stats["socks"] is True
+    assert stats["bytes_out"] == stats["bytes_in"] == len(b"via socks")
 
-@patch("campers.services.portforward.logger")
-def test_stop_all_tunnels_empty_state(
-    mock_logger: MagicMock, port_forward_manager: PortForwardManager
+
+def test_socks_proxy_relays_hundreds_of_connections(
+    port_forward_manager: PortForwardManager, ssh_server: LocalSSHServer, echo_port: int
 ) -> None:
-    """Test stopping all tunnels when no tunnels exist."""
-    port_forward_manager.tunnel = None
-    port_forward_manager.ports = []
+    """Test the SOCKS5 proxy serves many concurrent connections over one transport."""
+    proxy_port = start_socks_proxy(port_forward_manager, ssh_server)
 
-    port_forward_manager.stop_all_tunnels()
+    def round_trip(index: int) -> bytes:
+        payload = f"connection {index}".encode()
 
-    assert port_forward_manager.tunnel is None
-    assert port_forward_manager.ports == []
-    mock_logger.info.assert_not_called()
+        with socks_connect(proxy_port, 1, socket.inet_aton("127.0.0.1"), echo_port) as conn:
+            assert conn.recv(10)[:2] == b"\x05\x00"
+            conn.sendall(payload)
+            received = bytearray()
 
+            while len(received) < len(payload):
+                received += conn.recv(64)
 
-@patch("campers.services.portforward.PortForwardManager.validate_key_file")
-@patch("campers.services.portforward.validate_port")
-@patch("campers.services.portforward.logger")
-@patch("campers.services.portforward.SSHTunnelForwarder")
-def test_create_tunnels_localhost_binding(
-    mock_tunnel_forwarder: MagicMock,
-    mock_logger: MagicMock,
-    mock_validate_port: MagicMock,
-    mock_validate_key_file: MagicMock,
-    port_forward_manager: PortForwardManager,
-) -> None:
-    """Test tunnel binds to localhost only for security."""
-    mock_tunnel = MagicMock()
-    mock_tunnel.is_active = True
-    mock_tunnel_forwarder.return_value = mock_tunnel
-
-    port_forward_manager.create_tunnels(
-        ports=[(8888, 8888)],
-        host="203.0.113.1",
-        key_file="/tmp/test.pem",
-    )
+        return bytes(received)
 
-    call_kwargs = mock_tunnel_forwarder.call_args[1]
+    with ThreadPoolExecutor(max_workers=200) as pool:
+        results = list(pool.map(round_trip, range(200)))
 
-    assert call_kwargs["local_bind_addresses"] == [("localhost", 8888)]
-    assert call_kwargs["remote_bind_addresses"] == [("localhost", 8888)]
+    assert results == [f"connection {i}".encode() for i in range(200)]
+    assert len(ssh_server.transports) == 1
+    assert port_forward_manager.get_stats()[0]["connections"] == 200
 
 
-@patch("campers.services.portforward.PortForwardManager.validate_key_file")
-@patch("campers.services.portforward.validate_port")
-@patch("campers.services.portforward.logger")
-@patch("campers.services.portforward.SSHTunnelForwarder")
-def test_create_tunnels_custom_ssh_port(
-    mock_tunnel_forwarder: MagicMock,
-    mock_logger: MagicMock,
-    mock_validate_port: MagicMock,
-    mock_validate_key_file: MagicMock,
-    port_forward_manager: PortForwardManager,
+def test_socks_proxy_reports_unreachable_destination(
+    port_forward_manager: PortForwardManager, ssh_server: LocalSSHServer
 ) -> None:
-    """Test tunnel creation with custom SSH port."""
-    mock_tunnel = MagicMock()
-    mock_tunnel.is_active = True
-    mock_tunnel_forwarder.return_value = mock_tunnel
+    """Test a destination the instance cannot reach gets a SOCKS failure reply."""
+    proxy_port = start_socks_proxy(port_forward_manager, ssh_server)
 
-    port_forward_manager.create_tunnels(
-        ports=[(8888, 8888)],
-        host="203.0.113.1",
-        key_file="/tmp/test.pem",
-        ssh_port=2222,
-    )
+    with socks_connect(proxy_port, 1, socket.inet_aton("127.0.0.1"), free_port()) as conn:
+        assert conn.recv(10)[:2] == b"\x05\x04"
 
-    call_kwargs = mock_tunnel_forwarder.call_args[1]
-    assert call_kwargs["ssh_address_or_host"] == ("203.0.113.1", 2222)
+    wait_for(lambda: port_forward_manager.get_stats()[0]["failed_connections"] == 1)
 
 
-@patch("campers.services.portforward.logger")
-def test_stop_all_tunnels_multiple_times_idempotent(
-    mock_logger: MagicMock, port_forward_manager: PortForwardManager
+def test_parse_socks_messages() -> None:
+    """Test SOCKS5 greeting and request parsing, including partial messages."""
+    assert parse_socks_greeting(b"\x05") is None
+    assert parse_socks_greeting(b"\x05\x02\x00\x02") == ({0, 2}, 4)
+
+    with pytest.raises(ValueError, match="Unsupported SOCKS version"):
+        parse_socks_greeting(b"\x04\x01\x00")
+
+    request = b"\x05\x01\x00\x03\x09localhost\x1f\x90"
+    assert parse_socks_request(request[:-1]) is None
+    assert parse_socks_request(request + b"extra") == (1, 3, "localhost", 8080, len(request))
+    ipv6 = b"\x05\x01\x00\x04" + socket.inet_pton(socket.AF_INET6, "::1") + b"\x00\x50"
+    assert parse_socks_request(ipv6) == (1, 4, "::1", 80, 22)
+    assert parse_socks_request(b"\x05\x01\x00\x09\x00") == (1, 9, "", 0, 5)
+
+
+def test_stop_all_tunnels_releases_local_port(
+    port_forward_manager: PortForwardManager, ssh_server: LocalSSHServer, echo_port: int
 ) -> None:
-    """Test calling stop_all_tunnels() multiple times is idempotent."""
-    mock_tunnel = MagicMock()
-    port_forward_manager.tunnel = mock_tunnel
-    port_forward_manager.ports = [(8888, 8888)]
+    """Test stopping closes the listener and the shared transport."""
+    local_port = start_forwarding(port_forward_manager, ssh_server, echo_port)
+    transport = port_forward_manager.ssh_manager.client.get_transport()
 
     port_forward_manager.stop_all_tunnels()
-    assert port_forward_manager.tunnel is None
-    assert port_forward_manager.ports == []
 
-    port_forward_manager.stop_all_tunnels()
-    assert port_forward_manager.tunnel is None
+    assert port_forward_manager.ssh_manager is None
     assert port_forward_manager.ports == []
+    assert not transport.is_active()
 
-    mock_tunnel.stop.assert_called_once()
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        assert sock.connect_ex(("localhost", local_port)) != 0
 
 
 @patch("campers.services.portforward.PortForwardManager.validate_key_file")
 @patch("campers.services.portforward.validate_port")
 @patch("campers.services.portforward.logger")
-@patch("campers.services.portforward.SSHTunnelForwarder")
-def test_port_already_in_use_error(
-    mock_tunnel_forwarder: MagicMock,
+@patch("campers.services.portforward.SSHManager")
+def test_create_tunnels_connects_with_credentials(
+    mock_ssh_manager: MagicMock,
     mock_logger: MagicMock,
     mock_validate_port: MagicMock,
     mock_validate_key_file: MagicMock,
     port_forward_manager: PortForwardManager,
 ) -> None:
-    """Test port already in use error handling."""
-    mock_tunnel_forwarder.side_effect = OSError("Address already in use")
+    """Test the shared SSH connection uses the requested host, key and user."""
+    local_port = free_port()
 
-    with pytest.raises(RuntimeError, match=r"Failed to create SSH tunnels"):
-        port_forward_manager.create_tunnels(
-            ports=[(8888, 8888)],
-            host="203.0.113.1",
-            key_file="/tmp/test.pem",
-        )
+    port_forward_manager.create_tunnels(
+        ports=[(8888, local_port)],
+        host="203.0.113.1",
+        key_file="/tmp/test.pem",
+        ssh_port=2222,
+    )
 
-    assert port_forward_manager.tunnel is None
-    assert port_forward_manager.ports == []
+    assert mock_validate_port.call_count == 2
+    mock_validate_key_file.assert_called_once_with("/tmp/test.pem")
+    mock_ssh_manager.assert_called_once_with(
+        host="203.0.113.1", key_file="/tmp/test.pem", username="ubuntu", port=2222
+    )
+    mock_ssh_manager.return_value.connect.assert_called_once()
+    assert port_forward_manager.ports == [(8888, local_port)]
+    assert mock_logger.info.call_args_list[:2] == [
+        call("Creating SSH tunnel for port %s...", 8888),
+        call("SSH tunnel established: localhost:%s -> remote:%s", local_port, 8888),
+    ]
 
 
+@pytest.mark.parametrize(
+    "error",
+    [
+        ConnectionError("Failed to establish SSH connection"),
+        paramiko.SSHException("Authentication failed"),
+        OSError("Network unreachable"),
+    ],
+)
 @patch("campers.services.portforward.PortForwardManager.validate_key_file")
-@patch("campers.services.portforward.validate_port")
 @patch("campers.services.portforward.logger")
-@patch("campers.services.portforward.SSHTunnelForwarder")
-def test_authentication_failure_invalid_key(
-    mock_tunnel_forwarder: MagicMock,
+@patch("campers.services.portforward.SSHManager")
+def test_create_tunnels_failure_raises_runtime_error(
+    mock_ssh_manager: MagicMock,
     mock_logger: MagicMock,
-    mock_validate_port: MagicMock,
     mock_validate_key_file: MagicMock,
+    error: Exception,
     port_forward_manager: PortForwardManager,
 ) -> None:
-    """Test authentication failure with invalid key file."""
-    mock_tunnel_forwarder.side_effect = paramiko.SSHException("Authentication failed")
+    """Test connection failures raise RuntimeError and leave no state behind."""
+    mock_ssh_manager.return_value.connect.side_effect = error
 
     with pytest.raises(RuntimeError, match=r"Failed to create SSH tunnels"):
         port_forward_manager.create_tunnels(
-            ports=[(8888, 8888)],
+            ports=[(8888, free_port())],
             host="203.0.113.1",
             key_file="/tmp/test.pem",
         )
 
-    assert port_forward_manager.tunnel is None
+    mock_ssh_manager.return_value.close.assert_called_once()
+    assert port_forward_manager.ssh_manager is None
     assert port_forward_manager.ports == []
 
 
-@patch("campers.services.portforward.PortForwardManager.validate_key_file")
-@patch("campers.services.portforward.validate_port")
-@patch("campers.services.portforward.logger")
-@patch("campers.services.portforward.SSHTunnelForwarder")
-def test_sshtunnel_base_error_handling(
-    mock_tunnel_forwarder: MagicMock,
-    mock_logger: MagicMock,
-    mock_validate_port: MagicMock,
-    mock_validate_key_file: MagicMock,
-    port_forward_manager: PortForwardManager,
+@patch("campers.services.portforward.SSHManager")
+def test_create_tunnels_empty_port_list(
+    mock_ssh_manager: MagicMock, port_forward_manager: PortForwardManager
 ) -> None:
-    """Test handling of BaseSSHTunnelForwarderError."""
-    mock_tunnel_forwarder.side_effect = BaseSSHTunnelForwarderError("SSH tunnel error")
+    """Test that creating tunnels with empty port list returns early."""
+    port_forward_manager.create_tunnels(
+        ports=[],
+        host="203.0.113.1",
+        key_file="/tmp/test.pem",
+    )
 
-    with pytest.raises(RuntimeError, match=r"Failed to create SSH tunnels"):
+    mock_ssh_manager.assert_not_called()
+    assert port_forward_manager.ssh_manager is None
+    assert port_forward_manager.ports == []
+
+
+@patch("campers.services.portforward.is_port_in_use", return_value=True)
+@patch("campers.services.portforward.SSHManager")
+def test_port_already_in_use_error(
+    mock_ssh_manager: MagicMock,
+    mock_is_port_in_use: MagicMock,
+    port_forward_manager: PortForwardManager,
+) -> None:
+    """Test an occupied local port is reported before connecting."""
+    with pytest.raises(PortInUseError, match=r"Port 8888 is already in use"):
         port_forward_manager.create_tunnels(
             ports=[(8888, 8888)],
             host="203.0.113.1",
             key_file="/tmp/test.pem",
         )
 
-    assert port_forward_manager.tunnel is None
-    assert port_forward_manager.ports == []
+    mock_ssh_manager.assert_not_called()
 
 
-@patch("campers.services.portforward.is_port_in_use", return_value=False)
-@patch("campers.services.portforward.PortForwardManager.validate_key_file")
-@patch("campers.services.portforward.validate_port")
-@patch("campers.services.portforward.logger")
-@patch("campers.services.portforward.SSHTunnelForwarder")
-def test_create_tunnels_multiple_ports_different_values(
-    mock_tunnel_forwarder: MagicMock,
-    mock_logger: MagicMock,
-    mock_validate_port: MagicMock,
-    mock_validate_key_file: MagicMock,
-    mock_is_port_in_use: MagicMock,
-    port_forward_manager: PortForwardManager,
+@patch.dict("os.environ", {"CAMPERS_TEST_MODE": "1"})
+@patch("campers.services.portforward.SSHManager")
+def test_create_tunnels_test_mode_skips_connection(
+    mock_ssh_manager: MagicMock, port_forward_manager: PortForwardManager
 ) -> None:
-    """Test creating tunnels with different port values."""
-    mock_tunnel = MagicMock()
-    mock_tunnel.is_active = True
-    mock_tunnel_forwarder.return_value = mock_tunnel
+    """Test mock mode records ports and stats without connecting."""
+    local_port = free_port()
 
     port_forward_manager.create_tunnels(
-        ports=[(8080, 8080), (5000, 5000), (9000, 9000)],
+        ports=[(8888, local_port)],
         host="203.0.113.1",
         key_file="/tmp/test.pem",
     )
 
-    call_kwargs = mock_tunnel_forwarder.call_args[1]
-    assert call_kwargs["remote_bind_addresses"] == [
-        ("localhost", 8080),
-        ("localhost", 5000),
-        ("localhost", 9000),
-    ]
-    assert call_kwargs["local_bind_addresses"] == [
-        ("localhost", 8080),
-        ("localhost", 5000),
-        ("localhost", 9000),
-    ]
+    mock_ssh_manager.assert_not_called()
+    assert port_forward_manager.ports == [(8888, local_port)]
+    assert port_forward_manager.get_stats()[0]["health"] == "unknown"
 
-    assert port_forward_manager.ports == [(8080, 8080), (5000, 5000), (9000, 9000)]
+
+@patch("campers.services.portforward.logger")
+def test_stop_all_tunnels_handles_exceptions(
+    mock_logger: MagicMock, port_forward_manager: PortForwardManager
+) -> None:
+    """Test stop_all_tunnels continues even if closing the connection fails."""
+    mock_ssh_manager = MagicMock()
+    mock_ssh_manager.close.side_effect = OSError("Stop failed")
+
+    port_forward_manager.ssh_manager = mock_ssh_manager
+    port_forward_manager.ports = [(8888, 8888)]
+
+    port_forward_manager.stop_all_tunnels()
+
+    mock_ssh_manager.close.assert_called_once()
+    assert port_forward_manager.ssh_manager is None
+    assert port_forward_manager.ports == []
+    assert mock_logger.info.call_args_list == [call("Stopping SSH tunnel for port %s...", 8888)]
+    args, _ = mock_logger.warning.call_args
+    assert args[0] == "Error stopping tunnels: %s"
+    assert isinstance(args[1], OSError)
+
+
+@patch("campers.services.portforward.logger")
+def test_stop_all_tunnels_multiple_times_idempotent(
+    mock_logger: MagicMock, port_forward_manager: PortForwardManager
+) -> None:
+    """Test calling stop_all_tunnels() multiple times is idempotent."""
+    mock_ssh_manager = MagicMock()
+    port_forward_manager.ssh_manager = mock_ssh_manager
+    port_forward_manager.ports = [(8888, 8888)]
+
+    port_forward_manager.stop_all_tunnels()
+    port_forward_manager.stop_all_tunnels()
+
+    mock_ssh_manager.close.assert_called_once()
+    assert port_forward_manager.ssh_manager is None
+    assert port_forward_manager.ports == []
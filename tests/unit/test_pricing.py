@@ -6,7 +6,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 from botocore.config import Config
-from botocore.exceptions import ClientError
+from botocore.exceptions import ClientError, EndpointConnectionError
 
 from campers.providers.aws.pricing import (
     PricingCache,
@@ -301,6 +301,56 @@ class TestPricingService:
         assert rate2 == 0.08
         mock_pricing.get_products.assert_called_once()
 
+    @patch("boto3.client")
+    def test_get_spot_hourly_rate_lowest_zone(self, mock_boto_client: Mock) -> None:
+        """Test spot rate is the lowest current zone price and is cached."""
+        mock_ec2 = Mock()
+        mock_ec2.describe_spot_price_history.return_value = {
+            "SpotPriceHistory": [
+                {"AvailabilityZone": "us-east-1a", "SpotPrice": "0.0150"},
+                {"AvailabilityZone": "us-east-1b", "SpotPrice": "0.0125"},
+            ]
+        }
+        mock_boto_client.return_value = mock_ec2
+
+        service = PricingService(use_cache=True)
+
+        assert service.get_spot_hourly_rate("t3.medium", "us-east-1") == 0.0125
+        assert service.get_spot_price("t3.medium", "us-east-1") == 0.0125
+        mock_ec2.describe_spot_price_history.assert_called_once()
+        call_kwargs = mock_ec2.describe_spot_price_history.call_args.kwargs
+        assert call_kwargs["InstanceTypes"] == ["t3.medium"]
+        assert "AvailabilityZone" not in call_kwargs
+
+        service.get_spot_hourly_rate("t3.medium", "us-east-1", "us-east-1b")
+
+        zone_kwargs = mock_ec2.describe_spot_price_history.call_args.kwargs
+        assert zone_kwargs["AvailabilityZone"] == "us-east-1b"
+
+    @patch("boto3.client")
+    def test_get_spot_hourly_rate_unavailable(self, mock_boto_client: Mock) -> None:
+        """Test spot rate is None without published prices, on API errors or offline."""
+        mock_ec2 = Mock()
+        mock_ec2.describe_spot_price_history.return_value = {"SpotPriceHistory": []}
+        mock_boto_client.return_value = mock_ec2
+
+        service = PricingService(use_cache=True)
+
+        assert service.get_spot_hourly_rate("t3.medium", "us-east-1") is None
+
+        mock_ec2.describe_spot_price_history.side_effect = ClientError(
+            {"Error": {"Code": "UnauthorizedOperation", "Message": "denied"}},
+            "DescribeSpotPriceHistory",
+        )
+
+        assert service.get_spot_hourly_rate("t3.large", "us-east-1") is None
+
+        mock_ec2.describe_spot_price_history.side_effect = EndpointConnectionError(
+            endpoint_url="https://ec2.us-east-1.amazonaws.com"
+        )
+
+        assert service.get_spot_hourly_rate("t3.xlarge", "us-east-1") is None
+
 
 class TestCalculateMonthlyCost:
     """Tests for calculate_monthly_cost helper function."""
@@ -400,6 +450,27 @@ class TestCalculateMonthlyCost:
         assert cost == pytest.approx(0.0416 * 24 * 30)
         mock_service.get_ec2_hourly_rate.assert_called_once()
 
+    def test_spot_instance_cost(self) -> None:
+        """Test running spot instances are priced at the spot rate of their zone."""
+        mock_service = Mock()
+        mock_service.get_spot_hourly_rate.return_value = 0.0125
+
+        cost = calculate_monthly_cost(
+            instance_type="t3.medium",
+            region="us-east-1",
+            state="running",
+            volume_size_gb=50,
+            pricing_service=mock_service,
+            market="spot",
+            availability_zone="us-east-1b",
+        )
+
+        assert cost == pytest.approx(0.0125 * 24 * 30)
+        mock_service.get_spot_hourly_rate.assert_called_once_with(
+            "t3.medium", "us-east-1", "us-east-1b"
+        )
+        mock_service.get_ec2_hourly_rate.assert_not_called()
+
 
 class TestFormatCost:
     """Tests for format_cost helper function."""
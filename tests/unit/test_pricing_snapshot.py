@@ -0,0 +1,216 @@
+"""Tests for offline price snapshots and the PricingService fallback to them."""
+
+import struct
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from botocore.exceptions import ClientError, NoCredentialsError
+
+from campers.providers.aws.pricing import PricingService
+from campers.providers.aws.pricing_snapshot import (
+    HEADER,
+    PricingSnapshot,
+    import_snapshot,
+    write_snapshot,
+)
+from campers.providers.aws.pricing_store import PricingStore
+
+
+@pytest.fixture
+def snapshot_path(tmp_path: Path) -> Path:
+    """Return a snapshot path inside the test's temporary directory."""
+    return tmp_path / "prices.snapshot"
+
+
+def test_round_trip(snapshot_path: Path) -> None:
+    """Test every written price is found and unknown keys are not."""
+    prices = [("ec2", "us-east-1", f"t3.size{i}", i / 1000) for i in range(500)]
+    prices.append(("ebs", "eu-west-1", "gp3", 0.088))
+
+    assert write_snapshot(prices, snapshot_path) == 501
+
+    snapshot = PricingSnapshot.open(snapshot_path)
+
+    try:
+        assert snapshot.price_count == 501
+        assert all(snapshot.lookup(*price[:3]) == price[3] for price in prices)
+        assert snapshot.lookup("ebs", "eu-west-1", "gp3") == 0.088
+        assert snapshot.lookup("ebs", "us-east-1", "gp3") is None
+        assert snapshot.lookup("ec2", "us-east-1", "t3.size500") is None
+    finally:
+        snapshot.close()
+
+
+def test_empty_snapshot_and_oversized_keys(snapshot_path: Path) -> None:
+    """Test keys wider than a slot are skipped and an empty table answers None."""
+    assert write_snapshot([("ec2", "us-east-1", "x" * 64, 1.0)], snapshot_path) == 0
+
+    snapshot = PricingSnapshot.open(snapshot_path)
+
+    try:
+        assert snapshot.lookup("ec2", "us-east-1", "t3.medium") is None
+        assert snapshot.lookup("ec2", "us-east-1", "x" * 64) is None
+    finally:
+        snapshot.close()
+
+
+def test_open_missing_file(snapshot_path: Path) -> None:
+    """Test a missing snapshot is reported as absent rather than an error."""
+    assert PricingSnapshot.open(snapshot_path) is None
+
+
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        (b"not a snapshot", "truncated"),
+        (HEADER.pack(b"SOMETHNG", 1, 48, 1, 0, 0.0) + bytes(56), "Not a campers"),
+        (HEADER.pack(b"CMPPRICE", 99, 48, 1, 0, 0.0) + bytes(56), "version 99"),
+        (HEADER.pack(b"CMPPRICE", 1, 48, 4, 0, 0.0) + bytes(56), "truncated"),
+    ],
+)
+def test_open_rejects_invalid_files(snapshot_path: Path, content: bytes, message: str) -> None:
+    """Test files that are not complete snapshots of this version are rejected."""
+    snapshot_path.write_bytes(content)
+
+    with pytest.raises(ValueError, match=message):
+        PricingSnapshot.open(snapshot_path)
+
+
+def test_import_installs_copy(snapshot_path: Path, tmp_path: Path) -> None:
+    """Test import validates the source and installs a copy."""
+    installed = tmp_path / "cache" / "pricing.snapshot"
+    write_snapshot([("ec2", "us-east-1", "t3.medium", 0.0416)], snapshot_path)
+
+    snapshot = import_snapshot(snapshot_path, installed)
+    snapshot.close()
+    snapshot_path.unlink()
+
+    reopened = PricingSnapshot.open(installed)
+
+    try:
+        assert reopened.lookup("ec2", "us-east-1", "t3.medium") == 0.0416
+    finally:
+        reopened.close()
+
+
+def test_import_rejects_invalid_source(snapshot_path: Path, tmp_path: Path) -> None:
+    """Test an invalid or missing source leaves the installed snapshot untouched."""
+    installed = tmp_path / "cache" / "pricing.snapshot"
+    snapshot_path.write_bytes(struct.pack("<d", 1.0) * 8)
+
+    with pytest.raises(ValueError):
+        import_snapshot(snapshot_path, installed)
+
+    with pytest.raises(FileNotFoundError):
+        import_snapshot(tmp_path / "missing.snapshot", installed)
+
+    assert not installed.exists()
+
+
+def test_failed_write_removes_temp_file(snapshot_path: Path) -> None:
+    """Test a write that cannot replace the snapshot leaves no temporary file behind."""
+    with patch("os.replace", side_effect=OSError("disk full")), pytest.raises(OSError):
+        write_snapshot([("ec2", "us-east-1", "t3.medium", 0.0416)], snapshot_path)
+
+    assert list(snapshot_path.parent.iterdir()) == []
+
+
+class TestPricingServiceSnapshot:
+    """Tests for PricingService exporting and falling back to snapshots."""
+
+    @patch("boto3.client")
+    def test_falls_back_without_pricing_api(
+        self, mock_boto_client: Mock, snapshot_path: Path
+    ) -> None:
+        """Test prices come from the snapshot when the Pricing API cannot be reached."""
+        mock_boto_client.side_effect = NoCredentialsError()
+        write_snapshot(
+            [("ec2", "us-east-1", "t3.medium", 0.0416), ("ebs", "us-east-1", "gp3", 0.08)],
+            snapshot_path,
+        )
+
+        service = PricingService(snapshot=PricingSnapshot.open(snapshot_path))
+
+        try:
+            assert service.pricing_available is True
+            assert service.get_ec2_hourly_rate("t3.medium", "us-east-1") == 0.0416
+            assert service.get_ebs_storage_rate("us-east-1") == 0.08
+            assert service.get_ec2_hourly_rate("t3.medium", "us-east-1", "Windows") is None
+        finally:
+            service.close()
+
+    @patch("boto3.client")
+    def test_falls_back_when_api_call_fails(
+        self, mock_boto_client: Mock, snapshot_path: Path
+    ) -> None:
+        """Test API errors such as LocalStack's unsupported service use the snapshot."""
+        mock_pricing = Mock()
+        mock_pricing.get_products.side_effect = ClientError(
+            {"Error": {"Code": "InternalFailure", "Message": "not implemented"}}, "GetProducts"
+        )
+        mock_boto_client.return_value = mock_pricing
+        write_snapshot([("ec2", "us-east-1", "t3.medium", 0.0416)], snapshot_path)
+
+        service = PricingService(snapshot=PricingSnapshot.open(snapshot_path))
+
+        try:
+            assert service.get_ec2_hourly_rate("t3.medium", "us-east-1") == 0.0416
+        finally:
+            service.close()
+
+    @patch("boto3.client")
+    def test_unreadable_snapshot_is_ignored(
+        self,
+        mock_boto_client: Mock,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test a snapshot path that cannot be read is logged instead of raised."""
+        monkeypatch.setenv("CAMPERS_DIR", str(tmp_path))
+        monkeypatch.delenv("CAMPERS_DISABLE_PRICING_CACHE")
+        (tmp_path / "cache" / "pricing.snapshot").mkdir(parents=True)
+
+        service = PricingService()
+
+        assert service.snapshot is None
+        assert "Ignoring imported price snapshot" in caplog.text
+        service.close()
+
+    @patch("boto3.client")
+    def test_export_stored_prices(
+        self, mock_boto_client: Mock, snapshot_path: Path, tmp_path: Path
+    ) -> None:
+        """Test export writes the price store and refuses an empty one."""
+        store = PricingStore(tmp_path / "pricing.json")
+        service = PricingService(store=store)
+
+        with pytest.raises(ValueError, match="prefetch"):
+            service.export_snapshot(snapshot_path)
+
+        store.put_region("us-east-1", {"ec2": {"t3.medium": 0.0416}, "ebs": {"gp3": 0.08}})
+
+        assert service.export_snapshot(snapshot_path) == 2
+
+        snapshot = PricingSnapshot.open(snapshot_path)
+
+        try:
+            assert snapshot.lookup("ebs", "us-east-1", "gp3") == 0.08
+        finally:
+            snapshot.close()
+
+    def test_falls_back_when_endpoint_unreachable(
+        self, aws_credentials: None, snapshot_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test an air-gapped Pricing API endpoint answers from the snapshot."""
+        monkeypatch.setenv("AWS_ENDPOINT_URL", "http://127.0.0.1:9")
+        write_snapshot([("ec2", "us-east-1", "t3.medium", 0.0416)], snapshot_path)
+
+        service = PricingService(snapshot=PricingSnapshot.open(snapshot_path))
+
+        try:
+            assert service.pricing_client is not None
+            assert service.get_ec2_hourly_rate("t3.medium", "us-east-1") == 0.0416
+        finally:
+            service.close()
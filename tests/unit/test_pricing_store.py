@@ -0,0 +1,283 @@
+"""Tests for the persistent AWS price store and its use by PricingService."""
+
+import json
+import multiprocessing
+import time
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from campers.providers.aws.pricing import PricingService
+from campers.providers.aws.pricing_store import PricingStore, StoredRate
+from campers.providers.exceptions import ProviderAPIError
+
+
+def price_item(rate: str, **attributes: str) -> str:
+    """Build a Price List API item with the given attributes and USD rate."""
+    return json.dumps(
+        {
+            "product": {"attributes": attributes},
+            "terms": {
+                "OnDemand": {"OFFER": {"priceDimensions": {"DIM": {"pricePerUnit": {"USD": rate}}}}}
+            },
+        }
+    )
+
+
+def put_prices(path: Path, prefix: str, count: int) -> None:
+    """Store `count` distinct EC2 prices from a separate process."""
+    store = PricingStore(path)
+
+    for i in range(count):
+        store.put("ec2", "us-east-1", f"{prefix}.{i}", 0.01)
+
+
+@pytest.fixture
+def store_path(tmp_path: Path) -> Path:
+    """Return a price store path inside the test's temporary directory."""
+    return tmp_path / "cache" / "pricing.json"
+
+
+class TestPricingStore:
+    """Tests for PricingStore."""
+
+    def test_put_and_lookup_across_instances(self, store_path: Path) -> None:
+        """Test stored prices are read back by another store on the same file."""
+        PricingStore(store_path).put("ec2", "us-east-1", "t3.medium", 0.0416)
+
+        stored = PricingStore(store_path).lookup("ec2", "us-east-1", "t3.medium")
+
+        assert stored == StoredRate(0.0416, True)
+        assert PricingStore(store_path).lookup("ebs", "us-east-1", "gp3") is None
+
+    def test_entries_past_ttl_are_stale(self, store_path: Path) -> None:
+        """Test entries older than the TTL are returned but flagged stale."""
+        store = PricingStore(store_path, ttl_seconds=0)
+        store.put("ebs", "us-east-1", "gp3", 0.08)
+
+        assert store.lookup("ebs", "us-east-1", "gp3") == StoredRate(0.08, False)
+
+    def test_unsupported_version_is_ignored(self, store_path: Path) -> None:
+        """Test a store written by another format version is treated as empty."""
+        store_path.parent.mkdir(parents=True)
+        store_path.write_text(
+            json.dumps({"version": 0, "regions": {"us-east-1": {"ec2": {"t3.medium": [1.0, 0]}}}})
+        )
+
+        assert PricingStore(store_path).lookup("ec2", "us-east-1", "t3.medium") is None
+
+    def test_put_merges_concurrent_writes(self, store_path: Path) -> None:
+        """Test a put keeps prices written by another process since the file was read."""
+        first = PricingStore(store_path)
+        second = PricingStore(store_path)
+
+        first.put("ec2", "us-east-1", "t3.medium", 0.0416)
+        second.put("ec2", "us-east-1", "t3.large", 0.0832)
+
+        reloaded = PricingStore(store_path)
+        assert reloaded.lookup("ec2", "us-east-1", "t3.medium") == StoredRate(0.0416, True)
+        assert reloaded.lookup("ec2", "us-east-1", "t3.large") == StoredRate(0.0832, True)
+
+    def test_put_keeps_entries_of_concurrent_processes(self, store_path: Path) -> None:
+        """Test processes writing at the same time keep each other's new entries."""
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(target=put_prices, args=(store_path, f"w{n}", 25)) for n in range(4)
+        ]
+
+        for worker in workers:
+            worker.start()
+
+        for worker in workers:
+            worker.join(timeout=30)
+
+        reloaded = PricingStore(store_path)
+        assert all(
+            reloaded.lookup("ec2", "us-east-1", f"w{n}.{i}") is not None
+            for n in range(4)
+            for i in range(25)
+        )
+
+    def test_failed_write_removes_temp_file(self, store_path: Path) -> None:
+        """Test a write that cannot replace the index leaves no temporary file behind."""
+        store = PricingStore(store_path)
+
+        with patch("os.replace", side_effect=OSError("disk full")):
+            store.put("ec2", "us-east-1", "t3.medium", 0.0416)
+
+        assert not list(store_path.parent.glob(".pricing-*"))
+        assert PricingStore(store_path).lookup("ec2", "us-east-1", "t3.medium") is None
+
+    def test_prefetched_region_answers_unknown_types(self, store_path: Path) -> None:
+        """Test types missing from a fresh prefetch are known to have no price."""
+        store = PricingStore(store_path)
+        store.put_region("us-east-1", {"ec2": {"t3.medium": 0.0416}, "ebs": {"gp3": 0.08}})
+
+        assert store.lookup("ec2", "us-east-1", "t3.medium") == StoredRate(0.0416, True)
+        assert store.lookup("ec2", "us-east-1", "x9.huge") == StoredRate(None, True)
+        assert store.lookup("ec2", "eu-west-1", "t3.medium") is None
+
+    def test_stale_regions(self, store_path: Path) -> None:
+        """Test regions never prefetched or prefetched past the TTL need a prefetch."""
+        store = PricingStore(store_path)
+        store.put_region("us-east-1", {"ec2": {}, "ebs": {}})
+        store.put("ec2", "eu-west-1", "t3.medium", 0.0456)
+
+        assert store.stale_regions(["us-east-1", "eu-west-1"]) == ["eu-west-1"]
+
+        store.ttl_seconds = 0
+        assert store.stale_regions(["us-east-1"]) == ["us-east-1"]
+
+
+class TestPricingServiceStore:
+    """Tests for PricingService reading and filling the price store."""
+
+    @patch("boto3.client")
+    def test_fresh_stored_rate_skips_api(self, mock_boto_client: Mock, store_path: Path) -> None:
+        """Test a fresh stored rate is returned without a Pricing API call."""
+        mock_pricing = Mock()
+        mock_boto_client.return_value = mock_pricing
+        PricingStore(store_path).put("ec2", "us-east-1", "t3.medium", 0.0416)
+
+        service = PricingService(store=PricingStore(store_path))
+
+        assert service.get_ec2_hourly_rate("t3.medium", "us-east-1") == 0.0416
+        mock_pricing.get_products.assert_not_called()
+
+    @patch("boto3.client")
+    def test_cold_lookup_is_stored(self, mock_boto_client: Mock, store_path: Path) -> None:
+        """Test a rate fetched from the API is written to the store."""
+        mock_pricing = Mock()
+        mock_pricing.get_products.return_value = {"PriceList": [price_item("0.08")]}
+        mock_boto_client.return_value = mock_pricing
+
+        service = PricingService(store=PricingStore(store_path))
+
+        assert service.get_ebs_storage_rate("us-east-1", "gp3") == 0.08
+        assert PricingStore(store_path).lookup("ebs", "us-east-1", "gp3") == StoredRate(0.08, True)
+
+    @patch("boto3.client")
+    def test_non_linux_rates_are_not_stored(self, mock_boto_client: Mock, store_path: Path) -> None:
+        """Test only Linux instance rates, which prefetch covers, use the store."""
+        mock_pricing = Mock()
+        mock_pricing.get_products.return_value = {"PriceList": [price_item("0.0736")]}
+        mock_boto_client.return_value = mock_pricing
+
+        service = PricingService(store=PricingStore(store_path))
+        service.get_ec2_hourly_rate("t3.medium", "us-east-1", operating_system="Windows")
+
+        assert PricingStore(store_path).lookup("ec2", "us-east-1", "t3.medium") is None
+
+    @patch("boto3.client")
+    def test_stale_rate_returned_while_refreshing(
+        self, mock_boto_client: Mock, store_path: Path
+    ) -> None:
+        """Test a stale rate is returned at once and refreshed in the background."""
+        mock_pricing = Mock()
+
+        def slow_get_products(**kwargs: object) -> dict:
+            time.sleep(0.2)
+            return {"PriceList": [price_item("0.05")]}
+
+        mock_pricing.get_products.side_effect = slow_get_products
+        mock_boto_client.return_value = mock_pricing
+        PricingStore(store_path).put("ec2", "us-east-1", "t3.medium", 0.0416)
+
+        service = PricingService(store=PricingStore(store_path, ttl_seconds=0))
+        started = time.monotonic()
+        rate = service.get_ec2_hourly_rate("t3.medium", "us-east-1")
+
+        assert rate == 0.0416
+        assert time.monotonic() - started < 0.2
+
+        service.close()
+
+        assert PricingStore(store_path).lookup("ec2", "us-east-1", "t3.medium").rate == 0.05
+
+    @patch("boto3.client")
+    def test_prefetch_pages_through_region(self, mock_boto_client: Mock, store_path: Path) -> None:
+        """Test prefetch indexes every page and keeps the first rate per type.
+
+        No productFamily filter is sent, so bare metal types, listed under
+        'Compute Instance (bare metal)', are stored like any other.
+        """
+        mock_pricing = Mock()
+        ec2_pages = [
+            {"PriceList": [price_item("0.0416", instanceType="t3.medium")]},
+            {
+                "PriceList": [
+                    price_item("0.0832", instanceType="t3.large"),
+                    price_item("9.99", instanceType="t3.medium"),
+                ]
+            },
+        ]
+        ebs_pages = [{"PriceList": [price_item("0.08", volumeApiName="gp3")]}]
+        mock_pricing.get_paginator.return_value.paginate.side_effect = [ec2_pages, ebs_pages]
+        mock_boto_client.return_value = mock_pricing
+
+        service = PricingService(store=PricingStore(store_path))
+        counts = service.prefetch(["us-east-1", "ap-unknown-1"])
+
+        assert counts == {"us-east-1": 3}
+        store = PricingStore(store_path)
+        assert store.lookup("ec2", "us-east-1", "t3.medium").rate == 0.0416
+        assert store.lookup("ec2", "us-east-1", "t3.large").rate == 0.0832
+        assert store.lookup("ebs", "us-east-1", "gp3").rate == 0.08
+        assert store.lookup("ebs", "us-east-1", "io2") == StoredRate(None, True)
+
+        first_call = mock_pricing.get_paginator.return_value.paginate.call_args_list[0]
+        assert first_call.kwargs["PaginationConfig"] == {"PageSize": 100}
+        assert {"Type": "TERM_MATCH", "Field": "operatingSystem", "Value": "Linux"} in (
+            first_call.kwargs["Filters"]
+        )
+        assert all(f["Field"] != "productFamily" for f in first_call.kwargs["Filters"])
+
+    @patch("boto3.client")
+    def test_prefetch_api_error(self, mock_boto_client: Mock, store_path: Path) -> None:
+        """Test Pricing API errors during prefetch surface as ProviderAPIError."""
+        mock_pricing = Mock()
+        mock_pricing.get_paginator.return_value.paginate.side_effect = ClientError(
+            {"Error": {"Code": "AccessDeniedException", "Message": "denied"}}, "GetProducts"
+        )
+        mock_boto_client.return_value = mock_pricing
+
+        service = PricingService(store=PricingStore(store_path))
+
+        with pytest.raises(ProviderAPIError) as exc_info:
+            service.prefetch(["us-east-1"])
+
+        assert exc_info.value.error_code == "AccessDeniedException"
+        assert PricingStore(store_path).stale_regions(["us-east-1"]) == ["us-east-1"]
+
+
+def test_lifecycle_prefetch_skips_fresh_regions(store_path: Path) -> None:
+    """Test `campers pricing prefetch` only fetches configured regions that are stale."""
+    from campers.lifecycle import LifecycleManager
+
+    config_loader = Mock()
+    config_loader.BUILT_IN_DEFAULTS = {"region": "us-east-1"}
+    config_loader.load_config.return_value = {
+        "defaults": {"region": "us-west-2"},
+        "camps": {"a": {"region": "eu-west-1"}, "b": {}, "c": {"region": "us-west-2"}},
+    }
+    store = PricingStore(store_path)
+    store.put_region("eu-west-1", {"ec2": {}, "ebs": {}})
+    service = Mock(pricing_available=True, store=store)
+    service.prefetch.return_value = {"us-west-2": 2}
+    manager = LifecycleManager(config_loader, Mock(), Mock())
+
+    with patch.object(
+        manager,
+        "_get_pricing_service_and_functions",
+        return_value=(Mock(return_value=service), Mock(), Mock()),
+    ):
+        manager.prefetch_pricing()
+        manager.prefetch_pricing(force=True)
+
+    assert [call.args[0] for call in service.prefetch.call_args_list] == [
+        ["us-west-2"],
+        ["us-west-2", "eu-west-1"],
+    ]
+    assert service.close.call_count == 2
@@ -1,12 +1,14 @@
 """Unit tests for RunExecutor."""
 
+import json
 import queue
 import threading
 from unittest.mock import Mock, patch
 
 import pytest
 
-from campers.core.run_executor import RunExecutor
+from campers.core.run_executor import RunExecutor, parse_interruption_notice, setup_script_hash
+from campers.core.scheduler import PhaseScheduler
 
 
 @pytest.fixture
@@ -303,3 +305,517 @@ def test_phase_file_sync_timeout_warning(run_executor, cleanup_in_progress_gette
                 update_queue=update_queue,
             )
         assert "Mutagen sync timed out" in str(exc_info.value)
+
+
+def test_phase_file_sync_resumes_paused_session_on_reused_instance(run_executor):
+    """Test a paused session is resumed via its host alias instead of recreated.
+
+    Parameters
+    ----------
+    run_executor : RunExecutor
+        RunExecutor instance
+    """
+    mutagen_mgr = Mock()
+    mutagen_mgr.session_exists = Mock(return_value=True)
+    mutagen_mgr.update_host_address = Mock(return_value=True)
+    mutagen_mgr.get_sync_status = Mock(return_value="Watching for changes")
+
+    merged_config = {"sync_paths": [{"local": "/local", "remote": "/remote"}]}
+    instance_details = {
+        "unique_id": "test-id",
+        "key_file": "/path/to/key",
+        "public_ip": "192.168.1.2",
+        "reused": True,
+    }
+
+    run_executor._phase_file_sync(
+        merged_config=merged_config,
+        instance_details=instance_details,
+        mutagen_mgr=mutagen_mgr,
+        ssh_host="192.168.1.2",
+        ssh_port=22,
+        disable_mutagen=False,
+        update_queue=queue.Queue(),
+    )
+
+    mutagen_mgr.update_host_address.assert_called_once_with("campers-test-id", "192.168.1.2")
+    mutagen_mgr.resume_session.assert_called_once_with("campers-test-id-0")
+    mutagen_mgr.cleanup_orphaned_session.assert_not_called()
+    mutagen_mgr.create_sync_session.assert_not_called()
+    assert run_executor.resources["mutagen_session_names"] == ["campers-test-id-0"]
+
+
+def test_phase_file_sync_recreates_session_when_endpoints_change(run_executor):
+    """Test a paused session created for other endpoints is recreated, not resumed.
+
+    Parameters
+    ----------
+    run_executor : RunExecutor
+        RunExecutor instance
+    """
+    mutagen_mgr = Mock()
+    mutagen_mgr.session_exists = Mock(return_value=True)
+    mutagen_mgr.session_matches = Mock(return_value=False)
+    mutagen_mgr.get_sync_status = Mock(return_value="Watching for changes")
+
+    merged_config = {"sync_paths": [{"local": "/local", "remote": "/remote"}]}
+    instance_details = {
+        "unique_id": "test-id",
+        "key_file": "/path/to/key",
+        "public_ip": "192.168.1.2",
+        "reused": True,
+    }
+
+    run_executor._phase_file_sync(
+        merged_config=merged_config,
+        instance_details=instance_details,
+        mutagen_mgr=mutagen_mgr,
+        ssh_host="192.168.1.2",
+        ssh_port=22,
+        disable_mutagen=False,
+        update_queue=queue.Queue(),
+    )
+
+    fingerprint = mutagen_mgr.session_matches.call_args.args[1]
+    mutagen_mgr.resume_session.assert_not_called()
+    mutagen_mgr.cleanup_orphaned_session.assert_called_once_with("campers-test-id-0")
+    assert mutagen_mgr.create_sync_session.call_args.kwargs["fingerprint"] == fingerprint
+
+    merged_config["sync_paths"][0]["remote"] = "/elsewhere"
+    run_executor._phase_file_sync(
+        merged_config=merged_config,
+        instance_details=instance_details,
+        mutagen_mgr=mutagen_mgr,
+        ssh_host="192.168.1.2",
+        ssh_port=22,
+        disable_mutagen=False,
+        update_queue=queue.Queue(),
+    )
+
+    assert mutagen_mgr.session_matches.call_args.args[1] != fingerprint
+
+
+def test_phase_file_sync_recreates_session_when_resume_fails(run_executor):
+    """Test a session that cannot be resumed is terminated and recreated.
+
+    Parameters
+    ----------
+    run_executor : RunExecutor
+        RunExecutor instance
+    """
+    mutagen_mgr = Mock()
+    mutagen_mgr.session_exists = Mock(return_value=True)
+    mutagen_mgr.update_host_address = Mock(return_value=True)
+    mutagen_mgr.resume_session = Mock(side_effect=RuntimeError("resume failed"))
+    mutagen_mgr.get_sync_status = Mock(return_value="Watching for changes")
+
+    merged_config = {"sync_paths": [{"local": "/local", "remote": "/remote"}]}
+    instance_details = {
+        "unique_id": "test-id",
+        "key_file": "/path/to/key",
+        "public_ip": "192.168.1.2",
+        "reused": True,
+    }
+
+    run_executor._phase_file_sync(
+        merged_config=merged_config,
+        instance_details=instance_details,
+        mutagen_mgr=mutagen_mgr,
+        ssh_host="192.168.1.2",
+        ssh_port=22,
+        disable_mutagen=False,
+        update_queue=queue.Queue(),
+    )
+
+    mutagen_mgr.cleanup_orphaned_session.assert_called_once_with("campers-test-id-0")
+    create_kwargs = mutagen_mgr.create_sync_session.call_args.kwargs
+    assert create_kwargs["host"] == "192.168.1.2"
+    assert create_kwargs["host_alias"] == "campers-test-id"
+
+
+def test_flush_file_sync_flushes_active_sessions(run_executor):
+    """Test flush barrier flushes every active session and reports timing.
+
+    Parameters
+    ----------
+    run_executor : RunExecutor
+        RunExecutor instance
+    """
+    mutagen_mgr = Mock()
+    mutagen_mgr.flush_session = Mock(side_effect=[0.1, RuntimeError("flush failed")])
+    run_executor.resources["mutagen_mgr"] = mutagen_mgr
+    run_executor.resources["mutagen_session_names"] = ["campers-a-0", "campers-a-1"]
+    update_queue = queue.Queue()
+
+    elapsed = run_executor.flush_file_sync(update_queue)
+
+    assert elapsed is not None
+    flushed = [c.args[0] for c in mutagen_mgr.flush_session.call_args_list]
+    assert flushed == ["campers-a-0", "campers-a-1"]
+
+    messages = []
+    while not update_queue.empty():
+        messages.append(update_queue.get())
+
+    assert messages[0]["payload"]["status_text"] == "flushing"
+    assert messages[-1]["payload"]["flush_seconds"] == elapsed
+
+
+def test_flush_file_sync_without_sessions(run_executor):
+    """Test flush barrier is a no-op when no sync sessions are active.
+
+    Parameters
+    ----------
+    run_executor : RunExecutor
+        RunExecutor instance
+    """
+    assert run_executor.flush_file_sync(queue.Queue()) is None
+
+
+def test_phase_file_sync_starts_pull_sessions_without_waiting(run_executor):
+    """Test pull_paths create one-way sessions that are not awaited.
+
+    Parameters
+    ----------
+    run_executor : RunExecutor
+        RunExecutor instance
+    """
+    mutagen_mgr = Mock()
+    mutagen_mgr.get_sync_status = Mock(return_value="Watching for changes")
+
+    merged_config = {
+        "sync_paths": [{"local": "/local", "remote": "/remote"}],
+        "pull_paths": [{"local": "./out", "remote": "~/out", "scan_interval": 120}],
+    }
+    instance_details = {
+        "unique_id": "test-id",
+        "key_file": "/path/to/key",
+        "public_ip": "192.168.1.1",
+    }
+
+    run_executor._phase_file_sync(
+        merged_config=merged_config,
+        instance_details=instance_details,
+        mutagen_mgr=mutagen_mgr,
+        ssh_host="192.168.1.1",
+        ssh_port=22,
+        disable_mutagen=False,
+        update_queue=queue.Queue(),
+    )
+
+    pull_kwargs = mutagen_mgr.create_pull_session.call_args.kwargs
+    assert pull_kwargs["session_name"] == "campers-test-id-pull-0"
+    assert pull_kwargs["remote_path"] == "~/out"
+    assert pull_kwargs["scan_interval"] == 120
+    mutagen_mgr.get_sync_status.assert_called_once_with("campers-test-id-0")
+    assert run_executor.resources["mutagen_session_names"] == ["campers-test-id-0"]
+    assert run_executor.resources["mutagen_pull_session_names"] == ["campers-test-id-pull-0"]
+
+
+def test_dataset_staging_runs_in_background_and_reports(run_executor, ssh_manager_factory):
+    """Test datasets are staged on a separate SSH connection and awaited.
+
+    Parameters
+    ----------
+    run_executor : RunExecutor
+        RunExecutor instance
+    ssh_manager_factory : Mock
+        Mock SSH manager factory
+    """
+    ssh_manager = Mock(host="192.168.1.1", key_file="/key", username="ubuntu", port=22)
+    planner_class = Mock()
+    summary = {"downloaded": 2, "skipped": 1, "bytes": 2048, "failed": [], "seconds": 0.5}
+    merged_config = {
+        "region": "us-east-1",
+        "datasets": [{"source": "s3://bucket/data", "target": "~/data"}],
+        "dataset_concurrency": 4,
+    }
+
+    with (
+        patch(
+            "campers.core.run_executor.get_provider",
+            return_value={"dataset_planner": lambda: planner_class},
+        ),
+        patch("campers.core.run_executor.DatasetManager") as dataset_manager_class,
+    ):
+        dataset_manager_class.return_value.stage.return_value = summary
+        staging = run_executor._start_dataset_staging(merged_config, ssh_manager)
+        run_executor._wait_for_dataset_staging(staging)
+
+    planner_class.assert_called_once_with(region="us-east-1")
+    ssh_manager_factory.assert_called_once_with(
+        host="192.168.1.1", key_file="/key", username="ubuntu", port=22
+    )
+    staging_ssh = ssh_manager_factory.return_value
+    stage_call = dataset_manager_class.return_value.stage.call_args
+    assert stage_call.args[0] is staging_ssh
+    assert stage_call.kwargs["concurrency"] == 4
+    staging_ssh.close.assert_called_once()
+    assert staging["summary"] == summary
+
+
+def test_dataset_staging_failure_aborts_before_scripts(run_executor):
+    """Test a failed dataset download surfaces as a RuntimeError.
+
+    Parameters
+    ----------
+    run_executor : RunExecutor
+        RunExecutor instance
+    """
+    ssh_manager = Mock(host="192.168.1.1", key_file="/key", username="ubuntu", port=22)
+    merged_config = {
+        "region": "us-east-1",
+        "datasets": [{"source": "s3://bucket/data", "target": "~/data"}],
+    }
+
+    with (
+        patch(
+            "campers.core.run_executor.get_provider",
+            return_value={"dataset_planner": lambda: Mock()},
+        ),
+        patch("campers.core.run_executor.DatasetManager") as dataset_manager_class,
+    ):
+        dataset_manager_class.return_value.stage.side_effect = RuntimeError("checksum mismatch")
+        staging = run_executor._start_dataset_staging(merged_config, ssh_manager)
+
+        with pytest.raises(RuntimeError, match="Dataset staging failed: checksum mismatch"):
+            run_executor._wait_for_dataset_staging(staging)
+
+
+def test_dataset_staging_skipped_without_datasets(run_executor):
+    """Test no staging thread is started when no datasets are configured.
+
+    Parameters
+    ----------
+    run_executor : RunExecutor
+        RunExecutor instance
+    """
+    assert run_executor._start_dataset_staging({"region": "us-east-1"}, Mock()) is None
+    run_executor._wait_for_dataset_staging(None)
+
+
+def test_wait_for_cache_volume_polls_mount_point(run_executor):
+    """Test the executor waits for the cache volume mount before continuing.
+
+    Parameters
+    ----------
+    run_executor : RunExecutor
+        RunExecutor instance
+    """
+    ssh_manager = Mock()
+    ssh_manager.execute_command.return_value = 0
+
+    run_executor._wait_for_cache_volume(
+        {"cache_volume": {"size": 50, "mount": "/cache"}}, ssh_manager
+    )
+    run_executor._wait_for_cache_volume({}, ssh_manager)
+
+    command = ssh_manager.execute_command.call_args.args[0]
+    assert ssh_manager.execute_command.call_count == 1
+    assert command.startswith("timeout ")
+    assert "mountpoint -q /cache" in command
+
+
+def test_setup_script_hash_tracks_referenced_env_vars():
+    """Test the setup_script hash changes only with referenced env var values."""
+    script = "pip install -r requirements.txt --index-url $PIP_INDEX_URL"
+
+    assert setup_script_hash(script, {"PIP_INDEX_URL": "a"}) != setup_script_hash(
+        script, {"PIP_INDEX_URL": "b"}
+    )
+    assert setup_script_hash(script, {"PIP_INDEX_URL": "a", "OTHER": "1"}) == (
+        setup_script_hash(script, {"PIP_INDEX_URL": "a", "OTHER": "2"})
+    )
+    assert setup_script_hash("echo ${TOKEN:-none}", {"TOKEN": "x"}) != setup_script_hash(
+        "echo ${TOKEN:-none}", {}
+    )
+
+
+@pytest.mark.parametrize(
+    ("marker_matches", "rerun_setup", "runs"),
+    [(False, False, True), (True, False, False), (True, True, True)],
+)
+def test_setup_script_runs_once_per_hash(run_executor, marker_matches, rerun_setup, runs):
+    """Test setup_script is skipped when its marker matches unless rerun is forced.
+
+    Parameters
+    ----------
+    run_executor : RunExecutor
+        RunExecutor instance
+    marker_matches : bool
+        Whether the instance holds a marker for the current script
+    rerun_setup : bool
+        Value of the rerun_setup flag
+    runs : bool
+        Whether the script is expected to run
+    """
+    script = "git clone $REPO_URL"
+    env_vars = {"REPO_URL": "https://example.com/repo.git"}
+    marker = {"hash": setup_script_hash(script, env_vars) if marker_matches else "old"}
+    ssh_manager = Mock()
+    ssh_manager.execute_with_input.return_value = (0, json.dumps({**marker, "seconds": 30.0}))
+    ssh_manager.build_command_with_env.side_effect = lambda command, env: command
+    ssh_manager.execute_command.return_value = 0
+
+    run_executor._phase_setup_script({"setup_script": script}, ssh_manager, env_vars, rerun_setup)
+
+    assert ssh_manager.execute_command.called == runs
+
+    if runs:
+        command, data = ssh_manager.execute_with_input.call_args.args
+        assert "cat > ~/.campers/setup_script.json" in command
+        assert json.loads(data)["hash"] == setup_script_hash(script, env_vars)
+    else:
+        assert ssh_manager.execute_with_input.call_count == 1
+
+
+def test_failed_setup_script_records_no_marker(run_executor):
+    """Test a failing setup_script leaves the marker untouched so it runs again.
+
+    Parameters
+    ----------
+    run_executor : RunExecutor
+        RunExecutor instance
+    """
+    ssh_manager = Mock()
+    ssh_manager.execute_with_input.return_value = (0, "")
+    ssh_manager.execute_command.return_value = 1
+
+    with pytest.raises(RuntimeError, match="Setup script failed"):
+        run_executor._phase_setup_script({"setup_script": "false"}, ssh_manager, {})
+
+    assert ssh_manager.execute_with_input.call_count == 1
+
+
+def test_phases_stop_when_a_sibling_fails(run_executor):
+    """Test phases see a stop request once the scheduler is stopping.
+
+    Parameters
+    ----------
+    run_executor : RunExecutor
+        RunExecutor instance
+    """
+    ssh_manager = Mock()
+    run_executor._scheduler = PhaseScheduler([], cancelled=lambda: False)
+    run_executor._ansible_mgr = Mock()
+
+    assert run_executor._stop_requested() is False
+
+    run_executor._scheduler.stopping.set()
+    run_executor._stop_ansible()
+    run_executor._phase_setup_script({"setup_script": "make"}, ssh_manager, {})
+
+    assert run_executor._stop_requested() is True
+    run_executor._ansible_mgr.stop.assert_called_once()
+    ssh_manager.execute_command.assert_not_called()
+
+
+def test_pull_paths_require_mutagen_before_launch(run_executor):
+    """Test a camp with only pull_paths checks for Mutagen before launching.
+
+    Parameters
+    ----------
+    run_executor : RunExecutor
+        RunExecutor instance
+    """
+    mutagen_mgr = Mock()
+    mutagen_mgr.check_mutagen_installed.side_effect = RuntimeError("Mutagen is not installed")
+    merged_config = {"pull_paths": [{"local": "./out", "remote": "~/out"}]}
+
+    with pytest.raises(RuntimeError, match="Mutagen is not installed"):
+        run_executor._phase_instance_provision(merged_config, mutagen_mgr, None)
+
+    run_executor.compute_provider_factory.assert_not_called()
+
+
+def test_parse_interruption_notice():
+    """Test interruption notices parse to an action and an aware time."""
+    notice = parse_interruption_notice('{"action": "stop", "time": "2026-10-18T12:34:56Z"}')
+
+    assert notice["action"] == "stop"
+    assert notice["time"].isoformat() == "2026-10-18T12:34:56+00:00"
+    assert parse_interruption_notice("") is None
+    assert parse_interruption_notice('{"action": "stop"}') is None
+
+
+def test_interruption_watch_warns_and_flushes(run_executor):
+    """Test a spot interruption notice is shown in the TUI and flushes file sync.
+
+    Parameters
+    ----------
+    run_executor : RunExecutor
+        RunExecutor instance
+    """
+    compute_provider = Mock()
+    compute_provider.interruption_watch_command.return_value = "watch"
+    ssh_manager = Mock()
+    ssh_manager.execute_with_input.return_value = (
+        0,
+        '{"action": "stop", "time": "2026-10-18T12:34:56Z"}',
+    )
+    update_queue = queue.Queue()
+
+    with patch.object(run_executor, "flush_file_sync") as flush_file_sync:
+        thread = run_executor._start_interruption_watch(
+            {"market": "spot"}, compute_provider, ssh_manager, update_queue
+        )
+        thread.join(timeout=5)
+
+    assert ssh_manager.execute_with_input.call_args.args[0] == "watch"
+    payload = update_queue.get_nowait()["payload"]
+    assert payload["status"].startswith("interrupted at")
+    assert "Spot interruption: instance will stop" in payload["notification"]
+    flush_file_sync.assert_called_once_with(update_queue)
+
+
+def test_interruption_watch_only_for_spot(run_executor):
+    """Test on-demand instances are not watched for interruptions.
+
+    Parameters
+    ----------
+    run_executor : RunExecutor
+        RunExecutor instance
+    """
+    ssh_manager = Mock()
+
+    assert (
+        run_executor._start_interruption_watch(
+            {"market": "on-demand"}, Mock(), ssh_manager, queue.Queue()
+        )
+        is None
+    )
+    ssh_manager.execute_with_input.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("configured", "actual", "drift"),
+    [
+        ("spot", "on-demand", True),
+        ("on-demand", "spot", True),
+        ("spot-with-fallback", "on-demand", False),
+    ],
+)
+def test_config_drift_detects_market(run_executor, caplog, configured, actual, drift):
+    """Test drift checks compare the configured market with the instance's.
+
+    Parameters
+    ----------
+    run_executor : RunExecutor
+        RunExecutor instance
+    caplog : pytest.LogCaptureFixture
+        Log capture fixture
+    configured : str
+        Configured market
+    actual : str
+        Market of the existing instance
+    drift : bool
+        Whether drift is expected
+    """
+    compute_provider = Mock()
+    compute_provider.get_volume_size.return_value = None
+
+    run_executor._check_config_drift(
+        {"instance_id": "i-1", "market": actual}, {"market": configured}, compute_provider
+    )
+
+    assert (f"market: config={configured}, actual={actual}" in caplog.text) == drift
@@ -0,0 +1,172 @@
+"""Unit tests for the phase scheduler."""
+
+import threading
+import time
+
+import pytest
+
+from campers.core.scheduler import Phase, PhaseScheduler, PhaseTiming, format_critical_path
+
+
+def never_cancelled() -> bool:
+    return False
+
+
+def test_independent_phases_run_concurrently() -> None:
+    """Test phases sharing only a dependency overlap in time."""
+    barrier = threading.Barrier(2, timeout=5)
+    order = []
+
+    scheduler = PhaseScheduler(
+        [
+            Phase("ssh", lambda: order.append("ssh")),
+            Phase("ansible", barrier.wait, ("ssh",)),
+            Phase("port_forwarding", barrier.wait, ("ssh",)),
+            Phase("command", lambda: order.append("command"), ("ansible", "port_forwarding")),
+        ],
+        cancelled=never_cancelled,
+    )
+
+    assert scheduler.run() is True
+    assert order == ["ssh", "command"]
+    assert scheduler.timings["command"].start >= scheduler.timings["ansible"].end
+
+
+def test_sequential_phase_runs_in_calling_thread() -> None:
+    """Test a phase with nothing else runnable runs without a worker thread."""
+    threads = []
+    scheduler = PhaseScheduler(
+        [Phase("only", lambda: threads.append(threading.current_thread()))],
+        cancelled=never_cancelled,
+    )
+
+    scheduler.run()
+
+    assert threads == [threading.current_thread()]
+
+
+@pytest.mark.parametrize(
+    ("phases", "message"),
+    [
+        ([Phase("a", print), Phase("a", print)], "Duplicate phase: a"),
+        ([Phase("a", print, ("missing",))], "unknown phase"),
+        ([Phase("a", print, ("b",)), Phase("b", print, ("a",))], "cycle"),
+    ],
+)
+def test_invalid_graphs_are_rejected(phases: list[Phase], message: str) -> None:
+    """Test duplicate names, unknown dependencies and cycles raise ValueError."""
+    with pytest.raises(ValueError, match=message):
+        PhaseScheduler(phases, cancelled=never_cancelled)
+
+
+def test_failure_stops_dependent_phases() -> None:
+    """Test a failing phase is re-raised and its dependents never start."""
+    started = []
+
+    def fail() -> None:
+        raise RuntimeError("Setup script failed with exit code: 1")
+
+    scheduler = PhaseScheduler(
+        [
+            Phase("setup_script", fail),
+            Phase("command", lambda: started.append("command"), ("setup_script",)),
+        ],
+        cancelled=never_cancelled,
+    )
+
+    with pytest.raises(RuntimeError, match="Setup script failed"):
+        scheduler.run()
+
+    assert started == []
+
+
+def test_cancellation_stops_scheduling() -> None:
+    """Test no phase starts once the cancellation callback returns True."""
+    cancelled = threading.Event()
+    started = []
+
+    scheduler = PhaseScheduler(
+        [
+            Phase("ssh", cancelled.set),
+            Phase("file_sync", lambda: started.append("file_sync"), ("ssh",)),
+        ],
+        cancelled=cancelled.is_set,
+    )
+
+    assert scheduler.run() is False
+    assert started == []
+
+
+def test_cancellation_while_waiting_returns() -> None:
+    """Test the scheduler stops running phases and returns once cancelled."""
+    cancelled = threading.Event()
+    stopped = []
+
+    def slow() -> None:
+        cancelled.set()
+        scheduler.stopping.wait(5)
+        stopped.append("ansible")
+
+    scheduler = PhaseScheduler(
+        [Phase("ansible", slow), Phase("port_forwarding", lambda: None)],
+        cancelled=cancelled.is_set,
+    )
+
+    start = time.monotonic()
+    assert scheduler.run() is False
+    assert time.monotonic() - start < 2
+    assert stopped == ["ansible"]
+
+
+def test_failure_stops_and_joins_running_phases() -> None:
+    """Test a failure interrupts running siblings before it propagates."""
+    release = threading.Event()
+    finished = []
+
+    def fail() -> None:
+        raise RuntimeError("dataset staging failed")
+
+    def playbook() -> None:
+        release.wait(5)
+        finished.append("ansible")
+
+    scheduler = PhaseScheduler(
+        [
+            Phase("datasets", fail),
+            Phase("ansible", playbook, stop=release.set),
+        ],
+        cancelled=never_cancelled,
+    )
+
+    start = time.monotonic()
+
+    with pytest.raises(RuntimeError, match="dataset staging failed"):
+        scheduler.run()
+
+    assert time.monotonic() - start < 2
+    assert finished == ["ansible"]
+    assert scheduler.stopping.is_set()
+
+
+def test_critical_path_follows_latest_dependency() -> None:
+    """Test the critical path walks back through the dependency finishing last."""
+    scheduler = PhaseScheduler(
+        [
+            Phase("ssh", print),
+            Phase("file_sync", print, ("ssh",)),
+            Phase("ansible", print, ("ssh",)),
+            Phase("command", print, ("file_sync", "ansible")),
+        ],
+        cancelled=never_cancelled,
+    )
+    scheduler.timings = {
+        "ssh": PhaseTiming("ssh", 0.0, 3.0),
+        "file_sync": PhaseTiming("file_sync", 3.0, 10.0),
+        "ansible": PhaseTiming("ansible", 3.0, 95.0),
+        "command": PhaseTiming("command", 95.0, 96.5),
+    }
+
+    path = scheduler.critical_path()
+
+    assert [timing.name for timing in path] == ["ssh", "ansible", "command"]
+    assert format_critical_path(path) == "ssh 3.0s -> ansible 92.0s -> command 1.5s (96.5s)"
@@ -0,0 +1,82 @@
+"""Tests for spot market helpers and the interruption watch command."""
+
+import os
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from campers.providers.aws.spot import build_interruption_watch_command, instance_market
+
+
+def fake_curl(bin_dir: Path, body: str) -> dict[str, str]:
+    """Install a curl stub printing `body` and failing when it is empty."""
+    bin_dir.mkdir()
+    curl = bin_dir / "curl"
+    curl.write_text(f"#!/bin/sh\n[ -n '{body}' ] || exit 22\nprintf '%s' '{body}'\n")
+    curl.chmod(0o755)
+    return {**os.environ, "PATH": f"{bin_dir}{os.pathsep}{os.environ['PATH']}"}
+
+
+def is_running(pid: int) -> bool:
+    """Return whether a process exists and has not exited into a zombie."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+
+    if not Path("/proc/self").exists():
+        return True
+
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text()
+    except FileNotFoundError:
+        return False
+
+    return stat.rsplit(")", 1)[1].split()[0] != "Z"
+
+
+def test_instance_market() -> None:
+    """Test the instance lifecycle maps to the configured market names."""
+    assert instance_market({"InstanceLifecycle": "spot"}) == "spot"
+    assert instance_market({}) == "on-demand"
+
+
+def test_watch_prints_notice(tmp_path: Path) -> None:
+    """Test the watch prints the instance-action document and exits."""
+    notice = '{"action": "stop", "time": "2026-10-18T12:00:00Z"}'
+    env = fake_curl(tmp_path / "bin", notice)
+
+    result = subprocess.run(
+        ["bash", "-c", build_interruption_watch_command(1)],
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=10,
+    )
+
+    assert result.returncode == 0
+    assert result.stdout.strip().endswith(notice)
+
+
+def test_watch_exits_with_its_session(tmp_path: Path) -> None:
+    """Test the watch stops polling once the session that started it is gone."""
+    env = fake_curl(tmp_path / "bin", "")
+    pid_file = tmp_path / "watch.pid"
+    session = subprocess.Popen(
+        ["bash", "-c", 'bash -c "$1" & echo $! > "$2"; sleep 0.5', "session"]
+        + [build_interruption_watch_command(1), str(pid_file)],
+        env=env,
+    )
+    session.wait(timeout=10)
+    watch_pid = int(pid_file.read_text())
+
+    deadline = time.monotonic() + 5
+
+    while time.monotonic() < deadline and is_running(watch_pid):
+        time.sleep(0.1)
+
+    if is_running(watch_pid):
+        os.kill(watch_pid, 9)
+        pytest.fail("interruption watch outlived its session")
@@ -481,6 +481,38 @@ def test_execute_command_raw_exceeds_max_length(ssh_manager: SSHManager) -> None
     assert f"exceeds maximum of {MAX_COMMAND_LENGTH} characters" in str(exc_info.value)
 
 
+def test_execute_with_input_sends_stdin_and_captures_output(ssh_manager: SSHManager) -> None:
+    """Test stdin is written and closed and stdout lines are captured."""
+    mock_client = MagicMock()
+    ssh_manager.client = mock_client
+
+    mock_stdin = MagicMock()
+    mock_stdout = MagicMock()
+    mock_stderr = MagicMock()
+    mock_stdout.readline.side_effect = ["first\n", "second\n", ""]
+    mock_stdout.channel.recv_exit_status.return_value = 0
+    mock_stderr.readlines.return_value = []
+    mock_client.exec_command.return_value = (mock_stdin, mock_stdout, mock_stderr)
+
+    seen = []
+    exit_code, output = ssh_manager.execute_with_input(
+        "python3 -c 'x' " + "a" * MAX_COMMAND_LENGTH, '{"plan": 1}', line_callback=seen.append
+    )
+
+    assert exit_code == 0
+    assert output == "first\nsecond"
+    assert seen == ["first", "second"]
+    mock_stdin.write.assert_called_once_with('{"plan": 1}')
+    mock_stdin.channel.shutdown_write.assert_called_once()
+    assert "get_pty" not in mock_client.exec_command.call_args.kwargs
+
+
+def test_execute_with_input_without_connection(ssh_manager: SSHManager) -> None:
+    """Test execute_with_input requires an established connection."""
+    with pytest.raises(RuntimeError, match="SSH connection not established"):
+        ssh_manager.execute_with_input("cat", "data")
+
+
 @patch.dict(
     "os.environ",
     {
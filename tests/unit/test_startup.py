@@ -0,0 +1,94 @@
+"""Startup checks for the campers CLI.
+
+Commands like `campers list` and `campers exec` are run in loops by scripts
+and agents, so they must not import SDKs, SSH or the TUI they do not use.
+Each check runs in a fresh interpreter because the test process has already
+imported everything. The wall-clock import budget is measured separately by
+tests/benchmarks/bench_startup.py.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from campers.providers import LazyImport, get_provider
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+
+HEAVY_MODULES = ("boto3", "botocore", "paramiko", "sshtunnel", "textual", "omegaconf", "yaml")
+"""Dependencies that only specific commands may import."""
+
+
+def run_python(code: str, *args: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter from the repository root."""
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT), "PAGER": "cat"}
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        env=env,
+        timeout=60,
+    )
+
+
+def loaded_heavy_modules(argv: list[str]) -> list[str]:
+    """Return the heavy modules imported by running the CLI with argv."""
+    code = (
+        "import json, sys\n"
+        f"sys.argv = ['campers', *{argv!r}]\n"
+        "from campers.__main__ import main\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]), file=sys.stderr)\n"
+    )
+    result = run_python(code)
+    return json.loads(result.stderr.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("argv", [["--help"], ["run", "--help"], ["validate"], ["stats"]])
+def test_light_commands_skip_heavy_dependencies(
+    argv: list[str], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test help, validate and stats start without SDKs, SSH or the TUI."""
+    monkeypatch.setenv("CAMPERS_DIR", str(tmp_path))
+    loaded = set(loaded_heavy_modules(argv))
+
+    if argv == ["validate"]:
+        loaded -= {"omegaconf", "yaml"}
+
+    assert not loaded
+
+
+def test_list_does_not_import_ssh_or_tui() -> None:
+    """Test importing the entry point for list loads neither paramiko nor Textual."""
+    code = (
+        "import sys\n"
+        "import campers.__main__\n"
+        "from campers.providers import get_provider\n"
+        "get_provider('aws')['compute']\n"
+        "print(sorted(m for m in ('paramiko', 'textual') if m in sys.modules))\n"
+    )
+    assert run_python(code).stdout.strip() == "[]"
+
+
+def test_provider_registry_resolves_lazily() -> None:
+    """Test registry entries are imported on access and cached."""
+    provider = get_provider("aws")
+    provider["test_lazy"] = LazyImport("campers.providers.aws.pricing:format_cost")
+
+    try:
+        format_cost = provider["test_lazy"]
+
+        assert callable(format_cost)
+        assert provider.get("test_lazy") is format_cost
+        assert dict.__getitem__(provider, "test_lazy") is format_cost
+        assert provider.get("missing", "default") == "default"
+    finally:
+        del provider["test_lazy"]
@@ -1,11 +1,12 @@
 """Tests for Mutagen sync management."""
 
 import subprocess
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from campers.services.sync import MutagenManager
+from campers.services.sync import MutagenManager, build_session_fingerprint
 
 
 @pytest.fixture
@@ -405,3 +406,217 @@ def test_get_sync_status_no_status_line(mutagen_manager) -> None:
         status = mutagen_manager.get_sync_status("campers-123")
 
         assert status == "Unknown"
+
+
+def test_create_sync_session_with_host_alias(mutagen_manager, temp_ssh_setup) -> None:
+    """Test session URL and SSH config entry use the stable host alias."""
+    import os
+    from pathlib import Path
+
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0)
+
+        mutagen_manager.create_sync_session(
+            session_name="campers-abc-0",
+            local_path="~/myproject",
+            remote_path="~/myproject",
+            host="203.0.113.1",
+            key_file=temp_ssh_setup["key_file"],
+            username="ubuntu",
+            ssh_wrapper_dir=temp_ssh_setup["ssh_dir"],
+            host_alias="campers-abc",
+        )
+
+        call_args_list = [call[0][0] for call in mock_run.call_args_list]
+        mutagen_cmd = next((cmd for cmd in call_args_list if cmd[0] == "mutagen"), None)
+
+    assert mutagen_cmd[-1] == "ubuntu@campers-abc:~/myproject"
+    assert "campers-host=campers-abc" in mutagen_cmd
+
+    config = (Path(os.environ["CAMPERS_DIR"]) / "ssh" / "config").read_text()
+    assert "Host campers-abc\n    HostName 203.0.113.1\n" in config
+
+
+def test_create_sync_session_labels_fingerprint(mutagen_manager, temp_ssh_setup) -> None:
+    """Test the session is labelled with the fingerprint of its endpoints."""
+    fingerprint = build_session_fingerprint(local="/a", remote="/b")
+
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0)
+
+        mutagen_manager.create_sync_session(
+            session_name="campers-abc-0",
+            local_path="~/myproject",
+            remote_path="~/myproject",
+            host="203.0.113.1",
+            key_file=temp_ssh_setup["key_file"],
+            username="ubuntu",
+            ssh_wrapper_dir=temp_ssh_setup["ssh_dir"],
+            host_alias="campers-abc",
+            fingerprint=fingerprint,
+        )
+
+        mutagen_cmd = next(
+            call[0][0] for call in mock_run.call_args_list if call[0][0][0] == "mutagen"
+        )
+
+    assert f"campers-endpoints={fingerprint}" in mutagen_cmd
+    assert fingerprint == build_session_fingerprint(remote="/b", local="/a")
+    assert fingerprint != build_session_fingerprint(local="/a", remote="/c")
+
+
+def test_session_matches_selects_by_fingerprint(mutagen_manager) -> None:
+    """Test a session only matches when listed under its fingerprint label."""
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(
+            returncode=0, stdout="Name: campers-abc-0\nIdentifier: sync_x\n"
+        )
+
+        assert mutagen_manager.session_matches("campers-abc-0", "f00d") is True
+        assert mutagen_manager.session_matches("campers-abc-1", "f00d") is False
+        assert mock_run.call_args[0][0] == [
+            "mutagen",
+            "sync",
+            "list",
+            "--label-selector",
+            "campers-endpoints=f00d",
+        ]
+
+
+def test_update_host_address_rewrites_only_hostname(mutagen_manager, temp_ssh_setup) -> None:
+    """Test restarting an instance only rewrites HostName of its alias."""
+    import os
+    from pathlib import Path
+
+    config_path = Path(os.environ["CAMPERS_DIR"]) / "ssh" / "config"
+    config_path.parent.mkdir(parents=True)
+    config_path.write_text(
+        "\nHost campers-abc\n    HostName 203.0.113.1\n    Port 22\n"
+        "\nHost campers-def\n    HostName 203.0.113.9\n    Port 22\n"
+    )
+
+    assert mutagen_manager.update_host_address("campers-abc", "198.51.100.7") is True
+
+    assert config_path.read_text() == (
+        "\nHost campers-abc\n    HostName 198.51.100.7\n    Port 22\n"
+        "\nHost campers-def\n    HostName 203.0.113.9\n    Port 22\n"
+    )
+
+
+def test_update_host_address_missing_alias(mutagen_manager, temp_ssh_setup) -> None:
+    """Test updating an unknown alias reports that it must be recreated."""
+    assert mutagen_manager.update_host_address("campers-missing", "198.51.100.7") is False
+
+
+def test_pause_session(mutagen_manager) -> None:
+    """Test pausing a session keeps it instead of terminating it."""
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0)
+
+        mutagen_manager.pause_session("campers-abc-0")
+
+        mock_run.assert_called_once_with(
+            ["mutagen", "sync", "pause", "campers-abc-0"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+
+
+def test_resume_session_failure(mutagen_manager) -> None:
+    """Test resume failure raises so the caller can recreate the session."""
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=1, stderr="unable to connect")
+
+        with pytest.raises(RuntimeError, match="Failed to resume Mutagen sync session"):
+            mutagen_manager.resume_session("campers-abc-0")
+
+
+def test_terminate_host_sessions_uses_label_selector(mutagen_manager, temp_ssh_setup) -> None:
+    """Test all sessions of an alias are terminated with one label selector."""
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0)
+
+        mutagen_manager.terminate_host_sessions("campers-abc")
+
+        mock_run.assert_called_once_with(
+            ["mutagen", "sync", "terminate", "--label-selector", "campers-host=campers-abc"],
+            capture_output=True,
+            timeout=30,
+        )
+
+
+def test_terminate_host_sessions_removes_key_copies(mutagen_manager, temp_ssh_setup) -> None:
+    """Test the SSH key copies of the alias sessions are deleted, and only those."""
+    ssh_dir = Path(temp_ssh_setup["ssh_dir"])
+    names = ["campers-abc-0", "campers-abc-pull-0", "campers-abcd-0", "campers-abc-other"]
+
+    for name in names:
+        (ssh_dir / f"campers-key-{name}.pem").write_text("key")
+
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0)
+
+        mutagen_manager.terminate_host_sessions("campers-abc", ssh_wrapper_dir=str(ssh_dir))
+
+    assert sorted(path.name for path in ssh_dir.glob("campers-key-*")) == [
+        "campers-key-campers-abc-other.pem",
+        "campers-key-campers-abcd-0.pem",
+    ]
+
+
+def test_flush_session_success(mutagen_manager) -> None:
+    """Test flushing a session returns the measured flush time."""
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0)
+
+        elapsed = mutagen_manager.flush_session("campers-abc-0", timeout=5)
+
+        mock_run.assert_called_once_with(
+            ["mutagen", "sync", "flush", "campers-abc-0"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        assert elapsed >= 0
+
+
+def test_flush_session_timeout(mutagen_manager) -> None:
+    """Test flush timeout is reported as RuntimeError."""
+    with (
+        patch("subprocess.run", side_effect=subprocess.TimeoutExpired("mutagen", 5)),
+        pytest.raises(RuntimeError, match="flush timed out"),
+    ):
+        mutagen_manager.flush_session("campers-abc-0", timeout=5)
+
+
+def test_create_pull_session_one_way_from_remote(mutagen_manager, temp_ssh_setup) -> None:
+    """Test pull sessions replicate remote to local with their own limits."""
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0)
+
+        mutagen_manager.create_pull_session(
+            session_name="campers-abc-pull-0",
+            remote_path="~/project/checkpoints",
+            local_path=str(temp_ssh_setup["ssh_dir"]),
+            host="203.0.113.1",
+            key_file=temp_ssh_setup["key_file"],
+            username="ubuntu",
+            ignore_patterns=["*.tmp"],
+            max_file_size="2GB",
+            scan_interval=60,
+            ssh_wrapper_dir=temp_ssh_setup["ssh_dir"],
+            host_alias="campers-abc",
+        )
+
+        call_args_list = [call[0][0] for call in mock_run.call_args_list]
+        mutagen_cmd = next((cmd for cmd in call_args_list if cmd[0] == "mutagen"), None)
+
+    assert mutagen_cmd[mutagen_cmd.index("--sync-mode") + 1] == "one-way-replica"
+    assert "*.tmp" in mutagen_cmd
+    assert ".git" not in mutagen_cmd
+    assert "--max-staging-file-size=2GB" in mutagen_cmd
+    assert "--watch-mode-alpha=force-poll" in mutagen_cmd
+    assert "--watch-polling-interval-alpha=60" in mutagen_cmd
+    assert mutagen_cmd[-2] == "ubuntu@campers-abc:~/project/checkpoints"
+    assert mutagen_cmd[-1] == temp_ssh_setup["ssh_dir"]
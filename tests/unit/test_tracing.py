@@ -0,0 +1,144 @@
+"""Unit tests for span tracing and the AWS API call hooks."""
+
+import threading
+import time
+from collections.abc import Generator
+
+import boto3
+import pytest
+from botocore.awsrequest import AWSResponse
+
+from campers.core.tracing import (
+    Span,
+    Tracer,
+    format_profile_summary,
+    get_tracer,
+    span,
+    start_tracing,
+    stop_tracing,
+    traced,
+)
+from campers.providers.aws.instrumentation import install_api_hooks
+
+
+@pytest.fixture
+def tracer() -> Generator[Tracer, None, None]:
+    """Activate a tracer for the duration of a test.
+
+    Yields
+    ------
+    Tracer
+        The active tracer
+    """
+    active = start_tracing()
+    yield active
+    stop_tracing()
+
+
+def test_span_is_noop_without_tracer() -> None:
+    """Test span() and traced() run the code without recording when tracing is off."""
+    assert get_tracer() is None
+
+    with span("config", "phase") as args:
+        args["ignored"] = True
+
+    assert traced("noop", "test")(lambda: 42)() == 42
+
+
+def test_nested_spans_export_as_chrome_trace(tracer: Tracer) -> None:
+    """Test nested spans become complete events with microsecond timing."""
+    with span("ansible", "phase"), span("ansible.base", "ansible", hosts=1):
+        time.sleep(0.01)
+
+    trace = tracer.to_chrome_trace()
+    complete = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    metadata = [event for event in trace["traceEvents"] if event["ph"] == "M"]
+
+    assert [event["name"] for event in complete] == ["ansible", "ansible.base"]
+    outer, inner = complete
+    assert inner["dur"] >= 10_000
+    assert outer["ts"] <= inner["ts"]
+    assert outer["ts"] + outer["dur"] >= inner["ts"] + inner["dur"]
+    assert inner["args"] == {"hosts": "1"}
+    assert metadata[0]["name"] == "thread_name"
+    assert metadata[0]["tid"] == inner["tid"]
+
+
+def test_span_records_error_and_reraises(tracer: Tracer) -> None:
+    """Test a failing block is recorded with the exception type."""
+
+    @traced("ssh.connect", "ssh")
+    def connect() -> None:
+        raise ConnectionError("refused")
+
+    with pytest.raises(ConnectionError):
+        connect()
+
+    assert tracer.spans[0].name == "ssh.connect"
+    assert tracer.spans[0].args["error"] == "ConnectionError"
+
+
+def test_profile_summary_lists_phases_and_categories() -> None:
+    """Test the summary shows per-phase wall time and per-category totals."""
+    tracer = Tracer()
+    tracer.spans = [
+        Span("provision", "phase", 0.0, 40.0, 1),
+        Span("ec2.RunInstances", "aws", 1.0, 2.5, 1),
+        Span("ec2.DescribeInstances", "aws", 3.0, 3.5, 1),
+        Span("ansible", "phase", 40.0, 100.0, 1),
+    ]
+
+    summary = format_profile_summary(tracer, top=1)
+    lines = summary.splitlines()
+
+    assert lines[1].split() == ["provision", "0.0s", "40.0s", "40%"]
+    assert lines[2].split() == ["ansible", "40.0s", "60.0s", "60%"]
+    assert lines[3].split() == ["Total", "100.0s"]
+    assert ["aws", "2", "2.0s"] in [line.split() for line in lines]
+    assert lines[-1].split() == ["ec2.RunInstances", "1.0s", "1.5s"]
+
+
+def test_profile_summary_reads_spans_under_lock() -> None:
+    """Test the summary waits for threads that are still recording spans."""
+    tracer = Tracer()
+    tracer.spans = [Span("provision", "phase", 0.0, 1.0, 1)]
+    summaries = []
+
+    with tracer._lock:
+        reader = threading.Thread(target=lambda: summaries.append(format_profile_summary(tracer)))
+        reader.start()
+        reader.join(timeout=0.2)
+
+        assert reader.is_alive()
+
+    reader.join(timeout=5)
+
+    assert "provision" in summaries[0]
+
+
+def test_aws_hooks_record_api_calls(tracer: Tracer) -> None:
+    """Test the botocore hooks turn each API call into an 'aws' span."""
+    session = boto3.Session(
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+        region_name="us-east-1",
+    )
+    install_api_hooks(session)
+    install_api_hooks(session)
+    client = session.client("ec2")
+    body = b'<DescribeInstancesResponse xmlns="http://ec2.amazonaws.com/doc/2016-11-15/"/>'
+
+    class RawBody:
+        def stream(self, **kwargs: object) -> list[bytes]:
+            return [body]
+
+    client.meta.events.register(
+        "before-send",
+        lambda request, **kwargs: AWSResponse(request.url, 200, {}, RawBody()),
+    )
+    client.describe_instances()
+
+    assert len(tracer.spans) == 1
+    assert tracer.spans[0].name == "ec2.DescribeInstances"
+    assert tracer.spans[0].category == "aws"
+    assert tracer.spans[0].args["region"] == "us-east-1"
@@ -0,0 +1,210 @@
+"""Tests for persistent EBS cache volumes."""
+
+from unittest.mock import Mock, patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from campers.providers.aws.compute import EC2Manager
+from campers.providers.aws.volumes import CacheVolumeManager, build_mount_script
+
+
+@pytest.fixture
+def ec2_client():
+    """Create a moto-backed EC2 client.
+
+    Yields
+    ------
+    Any
+        Boto3 EC2 client inside a mock_aws context
+    """
+    with mock_aws():
+        yield boto3.client("ec2", region_name="us-east-1")
+
+
+@pytest.fixture
+def volume_manager(ec2_client):
+    """Create CacheVolumeManager backed by moto.
+
+    Returns
+    -------
+    CacheVolumeManager
+        Volume manager for us-east-1
+    """
+    return CacheVolumeManager(ec2_client, "us-east-1")
+
+
+def test_create_and_find_volumes(volume_manager) -> None:
+    volume = volume_manager.create_volume("jupyter", "alice@example.com", "us-east-1a", 100)
+    volume_manager.create_volume("other", "alice@example.com", "us-east-1a", 20)
+
+    volumes = volume_manager.find_volumes("jupyter")
+
+    assert [v["volume_id"] for v in volumes] == [volume["volume_id"]]
+    assert volumes[0]["size"] == 100
+    assert volumes[0]["state"] == "available"
+    assert volumes[0]["owner"] == "alice@example.com"
+    assert volumes[0]["availability_zone"] == "us-east-1a"
+    assert len(volume_manager.find_volumes()) == 2
+
+
+def test_select_availability_zone(volume_manager) -> None:
+    zone = volume_manager.select_availability_zone("t3.medium")
+
+    assert zone.startswith("us-east-1")
+
+
+def test_attach_and_find_attached(volume_manager, ec2_client) -> None:
+    image_id = ec2_client.register_image(
+        Name="test-ami", RootDeviceName="/dev/sda1", VirtualizationType="hvm"
+    )["ImageId"]
+    instance_id = ec2_client.run_instances(
+        ImageId=image_id,
+        MinCount=1,
+        MaxCount=1,
+        Placement={"AvailabilityZone": "us-east-1a"},
+    )["Instances"][0]["InstanceId"]
+    volume = volume_manager.create_volume("jupyter", "alice@example.com", "us-east-1a", 50)
+
+    volume_manager.attach_volume(volume["volume_id"], instance_id)
+
+    assert volume_manager.find_attached_volume_ids(instance_id) == [volume["volume_id"]]
+    attached = volume_manager.find_volumes("jupyter")[0]
+    assert attached["state"] == "in-use"
+    assert attached["instance_id"] == instance_id
+
+
+def test_build_mount_script_quotes_values() -> None:
+    script = build_mount_script("vol-0abc123", "/mnt/my cache", "ubuntu")
+
+    assert script.startswith("#!/bin/bash")
+    assert "SERIAL=vol0abc123" in script
+    assert "MOUNT_POINT='/mnt/my cache'" in script
+    assert "mkfs.ext4" in script
+    assert "nofail" in script
+
+
+@pytest.fixture
+def ec2_manager() -> EC2Manager:
+    """Create EC2Manager with a mocked cache volume manager.
+
+    Returns
+    -------
+    EC2Manager
+        EC2Manager whose volume_manager is a Mock
+    """
+    manager = EC2Manager(
+        region="us-east-1", boto3_client_factory=Mock(), boto3_resource_factory=Mock()
+    )
+    manager.volume_manager = Mock()
+    return manager
+
+
+def launch_resources() -> dict:
+    """Build prepared launch resources for cache volume tests."""
+    return {"camp_name": "jupyter", "owner": "alice@example.com", "instance_type": "t3.medium"}
+
+
+def test_prepare_cache_volume_reuses_detached_volume(ec2_manager) -> None:
+    ec2_manager.volume_manager.find_volumes.return_value = [
+        {
+            "volume_id": "vol-1",
+            "owner": "alice@example.com",
+            "state": "available",
+            "size": 100,
+            "availability_zone": "us-east-1b",
+        },
+        {
+            "volume_id": "vol-2",
+            "owner": "bob@example.com",
+            "state": "available",
+            "size": 500,
+            "availability_zone": "us-east-1c",
+        },
+    ]
+    resources = launch_resources()
+
+    volume = ec2_manager._prepare_cache_volume({"size": 100, "mount": "/mnt/cache"}, resources)
+
+    assert volume["volume_id"] == "vol-1"
+    assert "created_cache_volume_id" not in resources
+    ec2_manager.volume_manager.create_volume.assert_not_called()
+
+
+def test_prepare_cache_volume_skips_volume_in_use(ec2_manager) -> None:
+    ec2_manager.volume_manager.find_volumes.return_value = [
+        {
+            "volume_id": "vol-1",
+            "owner": "alice@example.com",
+            "state": "in-use",
+            "size": 100,
+            "availability_zone": "us-east-1b",
+            "instance_id": "i-other",
+        }
+    ]
+
+    volume = ec2_manager._prepare_cache_volume(
+        {"size": 100, "mount": "/mnt/cache"}, launch_resources()
+    )
+
+    assert volume is None
+    ec2_manager.volume_manager.create_volume.assert_not_called()
+
+
+def test_prepare_cache_volume_creates_new_volume(ec2_manager) -> None:
+    ec2_manager.volume_manager.find_volumes.return_value = []
+    ec2_manager.volume_manager.select_availability_zone.return_value = "us-east-1a"
+    ec2_manager.volume_manager.create_volume.return_value = {
+        "volume_id": "vol-new",
+        "size": 200,
+        "availability_zone": "us-east-1a",
+    }
+    resources = launch_resources()
+
+    volume = ec2_manager._prepare_cache_volume({"size": 200, "mount": "/mnt/cache"}, resources)
+
+    assert volume["volume_id"] == "vol-new"
+    assert resources["created_cache_volume_id"] == "vol-new"
+    ec2_manager.volume_manager.create_volume.assert_called_once_with(
+        "jupyter", "alice@example.com", "us-east-1a", 200
+    )
+
+
+def test_launch_places_instance_with_cache_volume(ec2_manager) -> None:
+    instance = Mock(id="i-123", public_ip_address="203.0.113.5", state={"Name": "running"})
+    ec2_manager.ec2_resource.create_instances.return_value = [instance]
+    resources = {
+        **launch_resources(),
+        "ami_id": "ami-1",
+        "key_name": "campers-abc",
+        "key_file": "/keys/abc.pem",
+        "sg_id": "sg-1",
+        "disk_size": 50,
+        "unique_id": "abc",
+        "instance_tag_name": "campers-abc",
+    }
+    cache_volume = {"volume_id": "vol-1", "availability_zone": "us-east-1b"}
+
+    with patch.object(ec2_manager, "_prepare_cache_volume", return_value=cache_volume):
+        details = ec2_manager._launch_ec2_instance(
+            {"cache_volume": 100, "ssh_username": "ubuntu"}, resources
+        )
+
+    launch_kwargs = ec2_manager.ec2_resource.create_instances.call_args.kwargs
+    assert launch_kwargs["Placement"] == {"AvailabilityZone": "us-east-1b"}
+    assert "SERIAL=vol1" in launch_kwargs["UserData"]
+    ec2_manager.volume_manager.attach_volume.assert_called_once_with("vol-1", "i-123")
+    assert details["cache_volume_id"] == "vol-1"
+
+
+def test_terminate_waits_for_cache_volume_detach(ec2_manager) -> None:
+    instance = Mock(tags=[], security_groups=[])
+    ec2_manager.ec2_resource.Instance.return_value = instance
+    ec2_manager.volume_manager.find_attached_volume_ids.return_value = ["vol-1"]
+
+    ec2_manager.terminate_instance("i-123")
+
+    instance.terminate.assert_called_once()
+    ec2_manager.volume_manager.wait_until_detached.assert_called_once_with(["vol-1"])
+    ec2_manager.volume_manager.delete_volume.assert_not_called()